@@ -0,0 +1,119 @@
+# uv run python scratch/benchmark_strip_html.py [PATH ...]
+"""
+Benchmark strip_html_tags() against the previous regex implementation.
+
+Inputs default to the opinion in scratch/courtlistener_opinion_html_text.json.
+Each PATH may be:
+    - a JSON file with an "html_with_citations" field (an opinion endpoint
+      response, or a list/"results" page of them)
+    - an .html file
+    - a cassette directory recorded with `ingest scotus --record DIR`, whose
+      opinion responses are all benchmarked
+"""
+
+import base64
+import gzip
+import html
+import json
+import re
+import statistics
+import sys
+import timeit
+from pathlib import Path
+
+from governmentreporter.apis.court_listener import strip_html_tags
+
+DEFAULT_INPUT = Path(__file__).parent / "courtlistener_opinion_html_text.json"
+REPEAT = 7
+
+
+def legacy_strip_html_tags(html_text: str) -> str:
+    """The implementation strip_html_tags() replaced (unescape + 2 regexes)."""
+    if not html_text:
+        return ""
+    text = html.unescape(html_text)
+    text = re.sub(r"<[^>]+>", "", text)
+    text = re.sub(r"\s+", " ", text)
+    return text.strip()
+
+
+def opinions_from_json(data):
+    """Yield html_with_citations bodies from an API response."""
+    if isinstance(data, dict):
+        if data.get("html_with_citations"):
+            yield data["html_with_citations"]
+        data = data.get("results", [])
+    if isinstance(data, list):
+        for item in data:
+            if isinstance(item, dict) and item.get("html_with_citations"):
+                yield item["html_with_citations"]
+
+
+def opinions_from_cassette(directory: Path):
+    """Yield html_with_citations bodies from recorded interactions."""
+    for path in sorted(directory.glob("*.json")):
+        response = json.loads(path.read_text(encoding="utf-8"))["response"]
+        body = base64.b64decode(response["body"])
+        headers = {k.lower(): v for k, v in response["headers"]}
+        if headers.get("content-encoding") == "gzip":
+            body = gzip.decompress(body)
+        try:
+            yield from opinions_from_json(json.loads(body))
+        except ValueError:
+            continue
+
+
+def load_opinions(paths):
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from (
+                (f"{path.name}#{i}", h)
+                for i, h in enumerate(opinions_from_cassette(path))
+            )
+        elif path.suffix == ".json":
+            data = json.loads(path.read_text(encoding="utf-8"))
+            yield from (
+                (f"{path.name}#{i}", h) for i, h in enumerate(opinions_from_json(data))
+            )
+        else:
+            yield path.name, path.read_text(encoding="utf-8")
+
+
+def best_ms(func, text):
+    """Best of REPEAT timings, in milliseconds per call."""
+    timer = timeit.Timer(lambda: func(text))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number * 1000
+
+
+def main():
+    paths = sys.argv[1:] or [DEFAULT_INPUT]
+    opinions = list(load_opinions(paths))
+    if not opinions:
+        print("No opinions with html_with_citations found")
+        return 1
+
+    print(
+        f"{'opinion':<40} {'KB':>7} {'legacy ms':>10} {'new ms':>8} {'speedup':>8} {'paragraphs':>10}"
+    )
+    print("-" * 88)
+    speedups = []
+    for name, body in opinions:
+        legacy = best_ms(legacy_strip_html_tags, body)
+        new = best_ms(strip_html_tags, body)
+        paragraphs = strip_html_tags(body).count("\n\n") + 1
+        speedups.append(legacy / new)
+        print(
+            f"{name[:40]:<40} {len(body) / 1024:>7.1f} {legacy:>10.2f} {new:>8.2f} "
+            f"{legacy / new:>7.2f}x {paragraphs:>10}"
+        )
+
+    print("-" * 88)
+    print(
+        f"{len(opinions)} opinions, median speedup {statistics.median(speedups):.2f}x"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
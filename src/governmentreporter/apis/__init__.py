@@ -16,6 +16,8 @@ The module follows object-oriented design principles with:
 Available API Clients:
     - CourtListenerClient: Access to Supreme Court opinions via CourtListener API
     - FederalRegisterClient: Access to Executive Orders via Federal Register API
+    - AsyncCourtListenerClient / AsyncFederalRegisterClient: asyncio variants
+      that fetch many documents concurrently with bounded parallelism
 
 Usage Example:
     from governmentreporter.apis import CourtListenerClient
@@ -47,7 +49,12 @@ Python Learning Notes:
     - Re-exports: Makes submodule classes available at package level
 """
 
-from .court_listener import CourtListenerClient
-from .federal_register import FederalRegisterClient
+from .court_listener import AsyncCourtListenerClient, CourtListenerClient
+from .federal_register import AsyncFederalRegisterClient, FederalRegisterClient
 
-__all__ = ["CourtListenerClient", "FederalRegisterClient"]
+__all__ = [
+    "CourtListenerClient",
+    "FederalRegisterClient",
+    "AsyncCourtListenerClient",
+    "AsyncFederalRegisterClient",
+]
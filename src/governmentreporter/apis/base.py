@@ -9,15 +9,20 @@ and predictable for consuming code.
 Key Components:
     - Document: Standardized data class for representing government documents
     - GovernmentAPIClient: Abstract base class defining the API client interface
+      and owning the pooled HTTP connection used by every subclass
+    - AsyncGovernmentAPIClient: asyncio counterpart built on httpx.AsyncClient
+      with a semaphore bounding the number of in-flight requests
 
 Design Patterns:
     - Abstract Base Class (ABC): Enforces implementation of required methods
     - Template Method: Common initialization logic with customization points
     - Data Class: Immutable, type-safe document representation
+    - Context Manager: Clients own a long-lived connection pool that is released
+      with close() or by using the client in a 'with' block
 
 This module serves as the foundation for:
-    - CourtListenerClient (court_listener.py)
-    - FederalRegisterClient (federal_register.py)
+    - CourtListenerClient and AsyncCourtListenerClient (court_listener.py)
+    - FederalRegisterClient and AsyncFederalRegisterClient (federal_register.py)
     - Future API client implementations
 
 Python Learning Notes:
@@ -28,9 +33,18 @@ Python Learning Notes:
     - Optional[T]: Indicates a value can be of type T or None
 """
 
+import asyncio
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Union
+from urllib.parse import urlparse
+
+import httpx
+
+from .cassette import AsyncCassetteTransport, Cassette, CassetteTransport
+from .http_cache import AsyncCachingTransport, CachingTransport, HTTPCache
+from .rate_limit import TokenBucket, get_rate_limiter
 
 
 @dataclass
@@ -131,8 +145,27 @@ class GovernmentAPIClient(ABC):
     Common functionality provided:
         - API key management
         - Date format validation
-        - Rate limiting configuration
+        - Rate limiting via a token bucket shared per API host
         - Standard initialization
+        - A pooled, keep-alive HTTP client shared by every request the
+          client makes (see the http_client property)
+        - Explicit close() and context manager lifecycle
+
+    Connection Pooling:
+        Each client lazily creates a single httpx.Client on first use and reuses
+        it until close() is called. Reusing the pool means consecutive requests
+        to the same host share TCP connections (and TLS sessions), so a bulk
+        backfill of thousands of opinions only pays the handshake cost once per
+        pooled connection instead of once per request. HTTP/2 is enabled by
+        default so multiple requests can be multiplexed over one connection.
+        httpx.Client is safe to share between threads.
+
+    Rate Limiting:
+        Requests draw from a TokenBucket shared by every client for the same
+        host (see rate_limit.py). The bucket refills at 1 / rate_limit_delay
+        tokens per second and holds up to _get_rate_limit_burst() tokens, so
+        requests spaced further apart than the delay never wait, and 429
+        responses with Retry-After slow the whole host down adaptively.
 
     Integration Points:
         - Subclassed by CourtListenerClient and FederalRegisterClient
@@ -146,7 +179,28 @@ class GovernmentAPIClient(ABC):
         - Instance attributes: Set in __init__ for each object
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Defaults for the pooled HTTP client. Subclasses and callers may override
+    # them per instance via the constructor arguments.
+    DEFAULT_TIMEOUT = 30.0
+    DEFAULT_MAX_CONNECTIONS = 10
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 5
+    DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+    # Regexes for URLs whose responses may be stored in an HTTPCache. Only
+    # single-document endpoints belong here; listing and search results
+    # change as new documents are published.
+    CACHEABLE_URL_PATTERNS: List[str] = []
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        http2: bool = True,
+        http_cache: Optional[HTTPCache] = None,
+        cassette: Optional[Cassette] = None,
+    ):
         """
         Initialize the government API client.
 
@@ -164,10 +218,41 @@ class GovernmentAPIClient(ABC):
                                    while others don't (Federal Register).
                                    Defaults to None for public APIs.
 
+            timeout (Optional[float]): Default timeout in seconds for requests
+                                      made through the pooled client.
+                                      Defaults to DEFAULT_TIMEOUT (30 seconds).
+
+            max_connections (Optional[int]): Maximum number of concurrent
+                                            connections in the pool.
+                                            Defaults to DEFAULT_MAX_CONNECTIONS.
+
+            max_keepalive_connections (Optional[int]): Maximum number of idle
+                                                      connections kept alive for reuse.
+                                                      Defaults to DEFAULT_MAX_KEEPALIVE_CONNECTIONS.
+
+            http2 (bool): Whether to negotiate HTTP/2 with servers that support it.
+                         Defaults to True.
+
+            http_cache (Optional[HTTPCache]): On-disk response cache. When set,
+                                             responses from URLs matching
+                                             CACHEABLE_URL_PATTERNS are stored and
+                                             revalidated instead of redownloaded.
+
+            cassette (Optional[Cassette]): Record every response to, or replay
+                                          every response from, a cassette
+                                          directory. Replay never touches the
+                                          network and skips rate limiting.
+
         Attributes Set:
             self.api_key: Stores the API key for use in requests
             self.base_url: Base URL for API endpoints (from _get_base_url())
             self.rate_limit_delay: Delay between requests in seconds (from _get_rate_limit_delay())
+            self.timeout: Default request timeout for the pooled client
+            self.limits: httpx.Limits describing the connection pool
+            self.http2: Whether HTTP/2 is enabled for the pooled client
+            self.rate_limiter: TokenBucket shared by all clients for this host
+            self.http_cache: Optional response cache used by the pooled client
+            self.cassette: Optional record/replay cassette
 
         Example:
             # With API key (for CourtListener)
@@ -186,6 +271,149 @@ class GovernmentAPIClient(ABC):
         self.base_url = self._get_base_url()
         self.rate_limit_delay = self._get_rate_limit_delay()
 
+        # Pooled HTTP client configuration; the client itself is created lazily
+        self.timeout = timeout if timeout is not None else self.DEFAULT_TIMEOUT
+        self.limits = httpx.Limits(
+            max_connections=max_connections or self.DEFAULT_MAX_CONNECTIONS,
+            max_keepalive_connections=(
+                max_keepalive_connections or self.DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=self.DEFAULT_KEEPALIVE_EXPIRY,
+        )
+        self.http2 = http2
+        self.http_cache = http_cache
+        self.cassette = cassette
+        self._http_client: Optional[httpx.Client] = None
+
+        self.rate_limiter: TokenBucket = _host_rate_limiter(
+            self.base_url,
+            self.rate_limit_delay,
+            self._get_rate_limit_burst(),
+            replay=cassette is not None and cassette.replaying,
+        )
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """
+        Return the pooled HTTP client, creating it on first access.
+
+        All requests made by the client go through this single httpx.Client so
+        that connections are kept alive and reused across calls. The client is
+        created lazily so that constructing an API client is cheap (and makes
+        no network connections) until a request is actually made.
+
+        Returns:
+            httpx.Client: Long-lived client configured with this instance's
+                         timeout, pool limits and HTTP/2 setting.
+
+        Example:
+            client = FederalRegisterClient()
+            response = client.http_client.get(url, headers=client.headers)
+
+        Python Learning Notes:
+            - @property: Exposes a method as a read-only attribute
+            - Lazy initialization: Expensive resources created only when needed
+        """
+        if self._http_client is None:
+            self._http_client = self._create_http_client()
+        return self._http_client
+
+    def _create_http_client(self) -> httpx.Client:
+        """
+        Build the pooled httpx.Client used for all requests.
+
+        Subclasses can override this to customize the transport (for example
+        to add caching or request recording) while keeping pooling behavior.
+
+        Returns:
+            httpx.Client: New client with keep-alive pooling enabled.
+        """
+        transport: Optional[httpx.BaseTransport] = None
+        if self.cassette is not None or self.http_cache is not None:
+            transport = httpx.HTTPTransport(limits=self.limits, http2=self.http2)
+            if self.http_cache is not None:
+                transport = CachingTransport(
+                    transport, self.http_cache, self.CACHEABLE_URL_PATTERNS
+                )
+            # The cassette is outermost so a recording captures every response
+            # the client saw, including cache hits, and replay needs neither
+            if self.cassette is not None:
+                transport = CassetteTransport(
+                    self.cassette, None if self.cassette.replaying else transport
+                )
+
+        return httpx.Client(
+            timeout=self.timeout,
+            limits=self.limits,
+            http2=self.http2,
+            transport=transport,
+        )
+
+    def _rate_limited_get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Wait for the host's rate limiter, then GET a URL on the pooled client.
+
+        The response is reported back to the limiter so 429 responses (and
+        their Retry-After header) slow down every client sharing the host.
+        Requests the HTTP cache answers without contacting the server skip
+        the limiter, so a cached re-run is not paced like a fresh one.
+        Callers remain responsible for raise_for_status().
+
+        Args:
+            url (str): Absolute URL to request.
+            **kwargs: Passed through to httpx.Client.get (params, timeout, ...).
+
+        Returns:
+            httpx.Response: The response, successful or not.
+        """
+        if not _fresh_in_cache(
+            self.http_client,
+            self.http_cache,
+            self.CACHEABLE_URL_PATTERNS,
+            url,
+            kwargs.get("params"),
+        ):
+            self.rate_limiter.acquire()
+        response = self.http_client.get(url, headers=self.headers, **kwargs)
+        self.rate_limiter.observe(response)
+        return response
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP client and release its connections.
+
+        Safe to call multiple times. A closed client transparently creates a
+        new pool if it is used again afterwards.
+
+        Example:
+            client = CourtListenerClient()
+            try:
+                doc = client.get_document("9973155")
+            finally:
+                client.close()
+        """
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+
+    def __enter__(self) -> "GovernmentAPIClient":
+        """
+        Enter a 'with' block, returning the client itself.
+
+        Example:
+            with CourtListenerClient() as client:
+                doc = client.get_document("9973155")
+            # Connections are released here
+
+        Python Learning Notes:
+            - __enter__/__exit__: Implement the context manager protocol
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the pooled HTTP client when leaving a 'with' block."""
+        self.close()
+
     @abstractmethod
     def _get_base_url(self) -> str:
         """
@@ -244,6 +472,21 @@ class GovernmentAPIClient(ABC):
         """
         pass
 
+    def _get_rate_limit_burst(self) -> int:
+        """
+        Return how many requests may be sent back-to-back after an idle period.
+
+        Together with _get_rate_limit_delay() this defines the host's token
+        bucket: budget left unused while the client is idle accumulates up to
+        this many requests and is spent without waiting. The default of 1
+        means an idle client never waits, but bursts are paced at the delay.
+
+        Returns:
+            int: Token bucket capacity. Subclasses override this when the
+                 provider's quota allows bursts.
+        """
+        return 1
+
     @abstractmethod
     def search_documents(
         self,
@@ -468,3 +711,309 @@ class GovernmentAPIClient(ABC):
             datetime.strptime(date_str, "%Y-%m-%d")
         except ValueError as e:
             raise ValueError(f"Invalid date '{date_str}': {str(e)}") from e
+
+
+def _host_rate_limiter(
+    base_url: str, delay: float, burst: int, replay: bool = False
+) -> TokenBucket:
+    """
+    Return the shared rate limiter for the host of base_url.
+
+    Args:
+        base_url (str): API base URL; its host keys the shared bucket.
+        delay (float): Steady-state seconds between requests.
+        burst (int): Token bucket capacity.
+        replay (bool): If True, return a private, effectively unlimited
+                       bucket: replayed responses never reach the provider.
+
+    Returns:
+        TokenBucket: Limiter shared by every client for the host.
+    """
+    host = urlparse(base_url).netloc or base_url
+    if replay:
+        return TokenBucket(
+            rate=1_000_000.0, capacity=1_000_000, name=f"{host} (replay)"
+        )
+    # A non-positive delay means "unthrottled"; model it as a very fast bucket
+    rate = 1.0 / delay if delay and delay > 0 else 1_000_000.0
+    return get_rate_limiter(host, rate=rate, capacity=burst)
+
+
+def _fresh_in_cache(
+    http_client: Union[httpx.Client, httpx.AsyncClient],
+    http_cache: Optional[HTTPCache],
+    cacheable: Iterable[Union[str, Pattern]],
+    url: str,
+    params: Any = None,
+) -> bool:
+    """
+    Whether a GET would be answered by the HTTP cache without a request.
+
+    The URL is built by the client exactly as the request will be, so the
+    lookup uses the same cache key as CachingTransport.
+
+    Args:
+        http_client: Client that will send the request.
+        http_cache (Optional[HTTPCache]): The client's response cache, if any.
+        cacheable (Iterable[Union[str, Pattern]]): URL regexes eligible for
+                                                   caching.
+        url (str): Absolute URL to request.
+        params (Any): Query parameters, as passed to httpx.
+
+    Returns:
+        bool: True if the URL is cacheable and has a fresh cache entry.
+    """
+    if http_cache is None:
+        return False
+    full_url = str(http_client.build_request("GET", url, params=params).url)
+    if not any(re.search(pattern, full_url) for pattern in cacheable):
+        return False
+    return http_cache.has_fresh("GET", full_url)
+
+
+class AsyncGovernmentAPIClient(ABC):
+    """
+    Abstract base class for asyncio-native government API clients.
+
+    This is the async counterpart of GovernmentAPIClient. It owns a pooled
+    httpx.AsyncClient and a semaphore that bounds how many requests may be in
+    flight at once, so callers can overlap dozens of document fetches with
+    asyncio.gather() instead of serializing them behind time.sleep().
+
+    Request pacing uses the same per-host TokenBucket as the sync clients, so
+    sync and async clients share one budget. Waiting happens with
+    asyncio.sleep(), and the response latency of one request overlaps with
+    the others.
+
+    Subclasses must implement:
+        - _get_base_url(): Return the API's base URL
+        - _get_rate_limit_delay(): Return the steady-state delay between requests
+        - get_document(): Retrieve a specific document (async)
+        - get_document_text(): Get plain text content (async)
+
+    Common functionality provided:
+        - Lazily created, pooled httpx.AsyncClient (HTTP/2, keep-alive)
+        - Semaphore-bounded concurrency via max_concurrency
+        - _get(): Rate-limited, concurrency-limited GET helper
+        - aclose() and async context manager lifecycle
+        - Date format validation shared with GovernmentAPIClient
+
+    Example:
+        async with AsyncFederalRegisterClient(max_concurrency=10) as client:
+            texts = await asyncio.gather(
+                *(client.get_document_text(num) for num in document_numbers)
+            )
+
+    Python Learning Notes:
+        - async def: Defines a coroutine that must be awaited
+        - asyncio.Semaphore: Limits how many coroutines enter a block at once
+        - async with: Asynchronous context manager protocol
+    """
+
+    DEFAULT_TIMEOUT = GovernmentAPIClient.DEFAULT_TIMEOUT
+    DEFAULT_MAX_CONNECTIONS = GovernmentAPIClient.DEFAULT_MAX_CONNECTIONS
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS = (
+        GovernmentAPIClient.DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    )
+    DEFAULT_KEEPALIVE_EXPIRY = GovernmentAPIClient.DEFAULT_KEEPALIVE_EXPIRY
+    DEFAULT_MAX_CONCURRENCY = 10
+    CACHEABLE_URL_PATTERNS: List[str] = []
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        http2: bool = True,
+        http_cache: Optional[HTTPCache] = None,
+        cassette: Optional[Cassette] = None,
+    ):
+        """
+        Initialize the async government API client.
+
+        Args:
+            api_key (Optional[str]): API key for authenticated endpoints.
+            max_concurrency (Optional[int]): Maximum number of requests allowed
+                                            in flight at once. Defaults to
+                                            DEFAULT_MAX_CONCURRENCY (10).
+            timeout (Optional[float]): Default request timeout in seconds.
+            max_connections (Optional[int]): Connection pool size limit.
+                                            Defaults to max_concurrency so the
+                                            pool never becomes the bottleneck.
+            max_keepalive_connections (Optional[int]): Idle connections kept alive.
+            http2 (bool): Whether to negotiate HTTP/2. Defaults to True.
+            http_cache (Optional[HTTPCache]): On-disk response cache (see
+                                             GovernmentAPIClient).
+            cassette (Optional[Cassette]): Record/replay cassette (see
+                                          GovernmentAPIClient).
+
+        Attributes Set:
+            self.api_key, self.base_url, self.rate_limit_delay: As in
+                GovernmentAPIClient
+            self.max_concurrency: Upper bound on in-flight requests
+            self.timeout, self.limits, self.http2: Pooled client configuration
+            self.rate_limiter: TokenBucket shared by all clients for this host
+        """
+        self.api_key = api_key
+        self.base_url = self._get_base_url()
+        self.rate_limit_delay = self._get_rate_limit_delay()
+
+        self.max_concurrency = max_concurrency or self.DEFAULT_MAX_CONCURRENCY
+        self.timeout = timeout if timeout is not None else self.DEFAULT_TIMEOUT
+        self.limits = httpx.Limits(
+            max_connections=max_connections
+            or max(self.max_concurrency, self.DEFAULT_MAX_CONNECTIONS),
+            max_keepalive_connections=(
+                max_keepalive_connections or self.DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=self.DEFAULT_KEEPALIVE_EXPIRY,
+        )
+        self.http2 = http2
+        self.http_cache = http_cache
+        self.cassette = cassette
+        self.headers: Dict[str, str] = {}
+
+        self._http_client: Optional[httpx.AsyncClient] = None
+        # Created lazily so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        self.rate_limiter: TokenBucket = _host_rate_limiter(
+            self.base_url,
+            self.rate_limit_delay,
+            self._get_rate_limit_burst(),
+            replay=cassette is not None and cassette.replaying,
+        )
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """
+        Return the pooled async HTTP client, creating it on first access.
+
+        Returns:
+            httpx.AsyncClient: Long-lived client configured with this instance's
+                              timeout, pool limits and HTTP/2 setting.
+        """
+        if self._http_client is None:
+            self._http_client = self._create_http_client()
+        return self._http_client
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """
+        Build the pooled httpx.AsyncClient used for all requests.
+
+        Returns:
+            httpx.AsyncClient: New client with keep-alive pooling enabled.
+        """
+        transport: Optional[httpx.AsyncBaseTransport] = None
+        if self.cassette is not None or self.http_cache is not None:
+            transport = httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2)
+            if self.http_cache is not None:
+                transport = AsyncCachingTransport(
+                    transport, self.http_cache, self.CACHEABLE_URL_PATTERNS
+                )
+            if self.cassette is not None:
+                transport = AsyncCassetteTransport(
+                    self.cassette, None if self.cassette.replaying else transport
+                )
+
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=self.limits,
+            http2=self.http2,
+            transport=transport,
+        )
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding the number of concurrent in-flight requests."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """
+        Perform a rate-limited, concurrency-limited GET request.
+
+        Args:
+            url (str): Absolute URL to request.
+            params (Optional[Dict[str, Any]]): Query parameters.
+            timeout (Optional[float]): Per-request timeout override.
+
+        Returns:
+            httpx.Response: Response that has passed raise_for_status().
+
+        Raises:
+            httpx.HTTPStatusError: For 4xx/5xx responses.
+            httpx.RequestError: For network-related failures.
+        """
+        async with self.semaphore:
+            # Cache hits never reach the server, so they skip the rate limiter
+            if not _fresh_in_cache(
+                self.http_client,
+                self.http_cache,
+                self.CACHEABLE_URL_PATTERNS,
+                url,
+                params or None,
+            ):
+                await self.rate_limiter.acquire_async()
+            # An empty params dict would make httpx drop the query string of
+            # pagination "next" URLs, so only pass params when there are some
+            kwargs: Dict[str, Any] = {"headers": self.headers, "params": params or None}
+            if timeout is not None:
+                kwargs["timeout"] = timeout
+            response = await self.http_client.get(url, **kwargs)
+            self.rate_limiter.observe(response)
+            response.raise_for_status()
+            return response
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled async HTTP client and release its connections.
+
+        Safe to call multiple times.
+        """
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def __aenter__(self) -> "AsyncGovernmentAPIClient":
+        """Enter an 'async with' block, returning the client itself."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the pooled HTTP client when leaving an 'async with' block."""
+        await self.aclose()
+
+    @abstractmethod
+    def _get_base_url(self) -> str:
+        """Return the base URL for the API (see GovernmentAPIClient)."""
+        pass
+
+    @abstractmethod
+    def _get_rate_limit_delay(self) -> float:
+        """Return the steady-state delay in seconds between requests."""
+        pass
+
+    def _get_rate_limit_burst(self) -> int:
+        """Return the token bucket capacity (see GovernmentAPIClient)."""
+        return 1
+
+    @abstractmethod
+    async def get_document(self, document_id: str) -> Document:
+        """Retrieve a specific document by its unique identifier."""
+        pass
+
+    @abstractmethod
+    async def get_document_text(self, document_id: str) -> str:
+        """Retrieve only the plain text content of a document."""
+        pass
+
+    # Date validation is identical for sync and async clients
+    validate_date_format = GovernmentAPIClient.validate_date_format
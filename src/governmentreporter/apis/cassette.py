@@ -0,0 +1,256 @@
+"""
+Record/replay "cassettes" for government API traffic.
+
+A cassette is a directory of recorded request/response pairs. In record mode
+every request an API client sends goes to the network as usual and the
+response is written to the cassette; in replay mode responses are served
+from the cassette and nothing touches the network. Replaying a recorded
+ingestion run makes throughput benchmarks and profiling of the chunking and
+payload code deterministic, and possible on an air-gapped machine.
+
+Key Components:
+    - Cassette: Directory of interactions plus the record/replay mode
+    - CassetteTransport / AsyncCassetteTransport: httpx transports that
+      record through to, or replay instead of, the network transport
+    - CassetteMissError: Raised in replay mode for an unrecorded request
+
+File Layout:
+    One JSON file per interaction, named by the SHA-256 of "METHOD URL".
+    Request headers (including Authorization) are never written to disk.
+
+Python Learning Notes:
+    - base64: Encodes binary response bodies as JSON-safe text
+    - Atomic writes: Write to a temporary file, then os.replace() it into
+      place so a crash never leaves a half-written interaction
+"""
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import httpx
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+class CassetteMissError(LookupError):
+    """Raised when replay mode has no recording for a request."""
+
+
+class Cassette:
+    """
+    A directory of recorded HTTP interactions.
+
+    Attributes:
+        directory (Path): Where interactions are stored.
+        mode (str): "record" or "replay".
+        recorded (int): Interactions written in this session.
+        replayed (int): Interactions served in this session.
+
+    Example:
+        # Record a real run
+        cassette = Cassette("./cassettes/scotus-2024", mode="record")
+        client = CourtListenerClient(cassette=cassette)
+
+        # Later, replay it with no network access
+        cassette = Cassette("./cassettes/scotus-2024", mode="replay")
+        client = CourtListenerClient(cassette=cassette)
+    """
+
+    def __init__(self, directory: Union[str, Path], mode: str):
+        """
+        Open a cassette directory.
+
+        Args:
+            directory (Union[str, Path]): Cassette directory. Created on the
+                                         first recording in record mode.
+            mode (str): RECORD ("record") or REPLAY ("replay").
+
+        Raises:
+            ValueError: If mode is unknown.
+            FileNotFoundError: If replaying from a directory that does not exist.
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Cassette mode must be 'record' or 'replay', got {mode}")
+
+        self.directory = Path(directory)
+        self.mode = mode
+        if mode == REPLAY and not self.directory.is_dir():
+            raise FileNotFoundError(f"Cassette directory not found: {self.directory}")
+
+        self.recorded = 0
+        self.replayed = 0
+        self._lock = threading.Lock()
+
+    @property
+    def replaying(self) -> bool:
+        """Whether responses are served from disk instead of the network."""
+        return self.mode == REPLAY
+
+    @staticmethod
+    def interaction_key(method: str, url: str) -> str:
+        """Return the file stem for a request (SHA-256 of "METHOD URL")."""
+        return hashlib.sha256(f"{method.upper()} {url}".encode("utf-8")).hexdigest()
+
+    def _path(self, request: httpx.Request) -> Path:
+        key = self.interaction_key(request.method, str(request.url))
+        return self.directory / f"{key}.json"
+
+    def save(self, request: httpx.Request, status_code: int, headers, body: bytes):
+        """
+        Write one interaction to the cassette atomically.
+
+        Args:
+            request (httpx.Request): The request that was sent.
+            status_code (int): Response status code.
+            headers: Response header (name, value) pairs.
+            body (bytes): Raw (still content-encoded) response body.
+        """
+        record: Dict[str, Any] = {
+            "request": {"method": request.method, "url": str(request.url)},
+            "response": {
+                "status_code": status_code,
+                "headers": [[k, v] for k, v in headers],
+                "body": base64.b64encode(body).decode("ascii"),
+            },
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(request)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(record, f)
+        os.replace(tmp, path)
+        with self._lock:
+            self.recorded += 1
+
+    def load(self, request: httpx.Request) -> httpx.Response:
+        """
+        Build the recorded response for a request.
+
+        Args:
+            request (httpx.Request): Request to answer.
+
+        Returns:
+            httpx.Response: Recorded response.
+
+        Raises:
+            CassetteMissError: If the request was never recorded.
+        """
+        path = self._path(request)
+        try:
+            with open(path, encoding="utf-8") as f:
+                record = json.load(f)
+        except FileNotFoundError:
+            raise CassetteMissError(
+                f"No recording for {request.method} {request.url} in {self.directory}"
+            ) from None
+
+        response = record["response"]
+        with self._lock:
+            self.replayed += 1
+        return httpx.Response(
+            status_code=response["status_code"],
+            headers=[(k, v) for k, v in response["headers"]],
+            stream=httpx.ByteStream(base64.b64decode(response["body"])),
+            request=request,
+            extensions={"from_cassette": True},
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the mode, directory and recorded/replayed counters."""
+        return {
+            "mode": self.mode,
+            "directory": str(self.directory),
+            "recorded": self.recorded,
+            "replayed": self.replayed,
+        }
+
+
+class CassetteTransport(httpx.BaseTransport):
+    """
+    Synchronous transport that records to or replays from a Cassette.
+
+    Args:
+        cassette (Cassette): Interaction store.
+        transport (Optional[httpx.BaseTransport]): Network transport used in
+                                                  record mode (unused in replay).
+    """
+
+    def __init__(
+        self, cassette: Cassette, transport: Optional[httpx.BaseTransport] = None
+    ):
+        self.cassette = cassette
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.cassette.replaying:
+            return self.cassette.load(request)
+
+        response = self.transport.handle_request(request)
+        try:
+            body = b"".join(response.stream)
+        finally:
+            response.close()
+        self.cassette.save(
+            request, response.status_code, response.headers.multi_items(), body
+        )
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=httpx.ByteStream(body),
+            request=request,
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        if self.transport is not None:
+            self.transport.close()
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """
+    Asynchronous counterpart of CassetteTransport.
+
+    Args:
+        cassette (Cassette): Interaction store.
+        transport (Optional[httpx.AsyncBaseTransport]): Network transport used
+                                                       in record mode.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.cassette = cassette
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.cassette.replaying:
+            return self.cassette.load(request)
+
+        response = await self.transport.handle_async_request(request)
+        try:
+            body = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        self.cassette.save(
+            request, response.status_code, response.headers.multi_items(), body
+        )
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=httpx.ByteStream(body),
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        if self.transport is not None:
+            await self.transport.aclose()
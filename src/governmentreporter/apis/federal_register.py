@@ -19,7 +19,10 @@ API Documentation:
 
 Rate Limits:
     Federal Register API has a 60 requests per minute limit.
-    This client uses 1.1 second delays to stay well under the limit.
+    Requests draw from a token bucket shared per host that refills one
+    request every 1.1 seconds and allows a burst of 5, which stays under the
+    limit while letting idle budget be spent without waiting. 429 responses
+    honor Retry-After and slow the bucket down adaptively.
 
 Data Sources:
     The Federal Register contains documents from:
@@ -40,6 +43,8 @@ Document Types Supported:
 
 Integration Points:
     - Inherits from GovernmentAPIClient (base.py)
+    - AsyncFederalRegisterClient inherits from AsyncGovernmentAPIClient for
+      concurrent, asyncio-based retrieval
     - Uses logging utilities for operation tracking (utils/)
     - Returns standardized Document objects for processing pipeline
     - Integrates with Qdrant for document storage and retrieval
@@ -49,20 +54,150 @@ Python Learning Notes:
     - Regular expressions: HTML parsing and content cleaning
     - Iterator patterns: Memory-efficient data processing
     - Exponential backoff: Robust retry strategies for network resilience
-    - Context managers: Proper resource management for HTTP connections
+    - Connection pooling: One long-lived HTTP client reused across requests
     - Logging integration: Operational visibility and debugging
 """
 
+import asyncio
 import re
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Iterator, List, Optional
+from itertools import islice
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Tuple
 
 import httpx
 from httpx import Response
 
 from ..utils import get_logger
-from .base import Document, GovernmentAPIClient
+from .base import AsyncGovernmentAPIClient, Document, GovernmentAPIClient
+from .cassette import Cassette
+from .http_cache import HTTPCache
+from .rate_limit import parse_retry_after
+
+# Fields requested when listing executive orders; full text is fetched
+# separately from raw_text_url only for orders that are processed.
+EXECUTIVE_ORDER_LIST_FIELDS = [
+    "document_number",
+    "title",
+    "executive_order_number",
+    "publication_date",
+    "signing_date",
+    "president",
+    "citation",
+    "html_url",
+    "pdf_url",
+    "full_text_xml_url",
+    "body_html_url",
+    "raw_text_url",
+    "json_url",
+    "agencies",
+]
+
+
+def _executive_order_list_params(start_date: str, end_date: str) -> Dict[str, Any]:
+    """
+    Build the /documents query parameters for executive orders in a date range.
+
+    Results are explicitly sorted oldest first, so orders arrive in signing
+    sequence and every page of the listing is cut from the same stable
+    ordering, even when several pages are fetched at once.
+
+    Args:
+        start_date (str): Earliest signing date (YYYY-MM-DD).
+        end_date (str): Latest signing date (YYYY-MM-DD).
+
+    Returns:
+        Dict[str, Any]: Query parameters starting at page 1.
+    """
+    return {
+        "conditions[type]": "PRESDOCU",
+        "conditions[presidential_document_type]": "executive_order",
+        "conditions[signing_date][gte]": start_date,
+        "conditions[signing_date][lte]": end_date,
+        "fields[]": list(EXECUTIVE_ORDER_LIST_FIELDS),
+        "order": "oldest",
+        "per_page": 100,
+        "page": 1,
+    }
+
+
+def _flatten_agency_names(order_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replace the agencies list of objects with a list of agency names, in place.
+
+    Args:
+        order_data (Dict[str, Any]): Executive order data from the API.
+
+    Returns:
+        Dict[str, Any]: The same dictionary, for convenient chaining.
+    """
+    if "agencies" in order_data and isinstance(order_data["agencies"], list):
+        order_data["agencies"] = [
+            agency.get("name", "") for agency in order_data["agencies"]
+        ]
+    return order_data
+
+
+def _clean_raw_text(text: str) -> str:
+    """
+    Extract clean text from a Federal Register raw text response.
+
+    The raw text endpoint often wraps the document in <html><pre> markup with
+    escaped entities and anchor tags; see
+    FederalRegisterClient.get_executive_order_text() for examples.
+
+    Args:
+        text (str): Response body from a raw_text_url.
+
+    Returns:
+        str: Plain text with surrounding whitespace stripped.
+    """
+    # Clean up HTML if present (the raw text often contains HTML markup)
+    if text.startswith("<html>"):
+        # Extract text between <pre> tags
+        pre_match = re.search(r"<pre>(.*?)</pre>", text, re.DOTALL)
+        if pre_match:
+            text = pre_match.group(1)
+            # Remove HTML entities
+            text = text.replace("&lt;", "<").replace("&gt;", ">")
+            text = text.replace("&amp;", "&").replace("&quot;", '"')
+            # Remove HTML anchor tags
+            text = re.sub(r"<a[^>]*>.*?</a>", "", text)
+
+    return text.strip()
+
+
+def _build_executive_order_document(
+    document_id: str, order_data: Dict[str, Any], content: str
+) -> Document:
+    """
+    Assemble an Executive Order Document from API metadata and text.
+
+    Args:
+        document_id (str): Federal Register document number.
+        order_data (Dict[str, Any]): Executive order metadata.
+        content (str): Cleaned full text (empty if unavailable).
+
+    Returns:
+        Document: Executive Order document.
+    """
+    # Use signing_date as the primary date for executive orders
+    primary_date = order_data.get("signing_date") or order_data.get(
+        "publication_date", ""
+    )
+
+    return Document(
+        id=document_id,
+        title=order_data.get("title", "Unknown Executive Order"),
+        date=primary_date,
+        type="Executive Order",
+        source="Federal Register",
+        content=content,
+        metadata=order_data,
+        url=order_data.get("html_url"),
+    )
 
 
 class FederalRegisterClient(GovernmentAPIClient):
@@ -105,9 +240,11 @@ class FederalRegisterClient(GovernmentAPIClient):
     Authentication:
         No authentication required - Federal Register API is fully public.
 
-    Thread Safety:
-        This client is not thread-safe. Each thread should use its own instance
-        to avoid sharing HTTP clients and retry state.
+    Connection Reuse:
+        All requests go through the pooled httpx.Client owned by the base class
+        (self.http_client), so metadata and raw text fetches reuse keep-alive
+        connections. Call close() or use the client as a context manager to
+        release the pool when done.
 
     Example Usage:
         >>> client = FederalRegisterClient()
@@ -128,7 +265,19 @@ class FederalRegisterClient(GovernmentAPIClient):
         - Iterator methods: yield for memory-efficient data streaming
     """
 
-    def __init__(self):
+    # Single-document metadata and raw text bodies are safe to cache; the
+    # /documents listing and search endpoint is not (note: no trailing id)
+    CACHEABLE_URL_PATTERNS = [r"/api/v1/documents/[\w-]+", r"/documents/full_text/"]
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        http2: bool = True,
+        http_cache: Optional[HTTPCache] = None,
+        cassette: Optional[Cassette] = None,
+    ):
         """
         Initialize the Federal Register client with configuration and logging.
 
@@ -149,6 +298,16 @@ class FederalRegisterClient(GovernmentAPIClient):
             - Max retries: 5 attempts for failed requests
             - Initial retry delay: 1 second with exponential backoff
 
+        Args:
+            timeout (Optional[float]): Default request timeout in seconds for the
+                                      pooled HTTP client (see GovernmentAPIClient).
+            max_connections (Optional[int]): Connection pool size limit.
+            max_keepalive_connections (Optional[int]): Idle connections kept alive.
+            http2 (bool): Whether to negotiate HTTP/2. Defaults to True.
+            http_cache (Optional[HTTPCache]): On-disk response cache for
+                                             executive order metadata and text.
+            cassette (Optional[Cassette]): Record/replay cassette for all traffic.
+
         Side Effects:
             - Sets self.logger for operation logging
             - Configures self.headers for all HTTP requests
@@ -180,7 +339,15 @@ class FederalRegisterClient(GovernmentAPIClient):
             - Instance attributes: self.attribute stores per-object data
             - Public API design: Simpler initialization without credentials
         """
-        super().__init__(api_key=None)
+        super().__init__(
+            api_key=None,
+            timeout=timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            http2=http2,
+            http_cache=http_cache,
+            cassette=cassette,
+        )
         self.logger = get_logger(__name__)
         self.headers = {
             "User-Agent": "GovernmentReporter/0.1.0",
@@ -273,6 +440,18 @@ class FederalRegisterClient(GovernmentAPIClient):
         """
         return 1.1  # Slightly over 1 second to stay well under 60/min
 
+    def _get_rate_limit_burst(self) -> int:
+        """
+        Return the token bucket capacity for the Federal Register API.
+
+        Five saved-up requests plus a steady 1 per 1.1 seconds stays under
+        60 requests in any one-minute window (5 + 60 / 1.1 < 60).
+
+        Returns:
+            int: 5 requests.
+        """
+        return 5
+
     def _make_request_with_retry(
         self, url: str, params: Optional[Dict] = None
     ) -> Response:
@@ -350,7 +529,8 @@ class FederalRegisterClient(GovernmentAPIClient):
         Python Learning Notes:
             - Exception handling: Multiple except blocks for different error types
             - Exponential backoff: delay *= 2 doubles delay each iteration
-            - Context managers: 'with httpx.Client()' for resource management
+            - Connection pooling: self.http_client reuses keep-alive connections
+            - Rate limiting: _rate_limited_get() waits for the host's token bucket
             - While loop: Continues until success or max retries reached
             - Logging integration: self.logger for operational visibility
             - Type hints: Response return type from httpx
@@ -360,19 +540,28 @@ class FederalRegisterClient(GovernmentAPIClient):
 
         while retry_count < self.max_retries:
             try:
-                with httpx.Client(timeout=30.0) as client:
-                    response = client.get(url, headers=self.headers, params=params)
-                    response.raise_for_status()
-                    return response
+                response = self._rate_limited_get(url, params=params)
+                response.raise_for_status()
+                return response
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429:  # Rate limited
                     retry_count += 1
                     if retry_count < self.max_retries:
-                        self.logger.warning(
-                            f"Rate limited. Retry {retry_count}/{self.max_retries} after {delay:.1f}s"
+                        retry_after = parse_retry_after(
+                            e.response.headers.get("Retry-After")
                         )
-                        time.sleep(delay)
-                        delay *= 2  # Exponential backoff
+                        if retry_after is not None:
+                            # The rate limiter is already blocked until then
+                            self.logger.warning(
+                                f"Rate limited. Retry {retry_count}/{self.max_retries} "
+                                f"after Retry-After {retry_after:.1f}s"
+                            )
+                        else:
+                            self.logger.warning(
+                                f"Rate limited. Retry {retry_count}/{self.max_retries} after {delay:.1f}s"
+                            )
+                            time.sleep(delay)
+                            delay *= 2  # Exponential backoff
                     else:
                         raise
                 else:
@@ -479,24 +668,14 @@ class FederalRegisterClient(GovernmentAPIClient):
             - Method chaining: Multiple string operations in sequence
         """
         response = self._make_request_with_retry(raw_text_url)
-        text = response.text
-
-        # Clean up HTML if present (the raw text often contains HTML markup)
-        if text.startswith("<html>"):
-            # Extract text between <pre> tags
-            pre_match = re.search(r"<pre>(.*?)</pre>", text, re.DOTALL)
-            if pre_match:
-                text = pre_match.group(1)
-                # Remove HTML entities
-                text = text.replace("&lt;", "<").replace("&gt;", ">")
-                text = text.replace("&amp;", "&").replace("&quot;", '"')
-                # Remove HTML anchor tags
-                text = re.sub(r"<a[^>]*>.*?</a>", "", text)
-
-        return text.strip()
+        return _clean_raw_text(response.text)
 
     def list_executive_orders(
-        self, start_date: str, end_date: str, max_results: Optional[int] = None
+        self,
+        start_date: str,
+        end_date: str,
+        max_results: Optional[int] = None,
+        max_concurrent_pages: int = 1,
     ) -> Iterator[Dict[str, Any]]:
         """
         Iterate through all executive orders within a date range with pagination support.
@@ -517,7 +696,8 @@ class FederalRegisterClient(GovernmentAPIClient):
             - Subtype: executive_order
             - Date Filter: signing_date (when president signed the order)
             - Page Size: 100 orders per request (API maximum)
-            - Ordering: Not specified (Federal Register default)
+            - Ordering: oldest first (stable across pages, so prefetched
+              pages line up with sequential paging)
 
         Args:
             start_date (str): Start date filter in YYYY-MM-DD format.
@@ -535,6 +715,13 @@ class FederalRegisterClient(GovernmentAPIClient):
                                        Useful for testing or limiting large queries.
                                        Example: 50 to get first 50 matching orders.
 
+            max_concurrent_pages (int): Number of result pages fetched in
+                                       parallel once the first page has reported
+                                       total_pages. Defaults to 1 (sequential).
+                                       Orders are yielded in the same order
+                                       either way; requests stay within the
+                                       shared rate limit.
+
         Yields:
             Dict[str, Any]: Executive order metadata dictionary containing:
                 - document_number: Federal Register document number (str)
@@ -582,7 +769,9 @@ class FederalRegisterClient(GovernmentAPIClient):
         Performance Characteristics:
             - Memory efficient: Only one order in memory at a time
             - Network efficient: Handles pagination automatically
-            - Rate limited: 1.1 second delay between requests
+            - Rate limited: Shared token bucket for the Federal Register host
+            - Prefetch: max_concurrent_pages > 1 overlaps page downloads, so
+              multi-decade backfills are bound by the rate limit, not latency
             - Resumable: Can be stopped and restarted with adjusted date ranges
 
         Date Range Considerations:
@@ -602,7 +791,7 @@ class FederalRegisterClient(GovernmentAPIClient):
             - Iterator pattern: Produces values one at a time
             - Input validation: Checks date formats before API calls
             - Pagination handling: Automatic next page processing
-            - Rate limiting: time.sleep() between requests
+            - Rate limiting: Shared token bucket paces each request
             - Progress logging: Operational visibility during long operations
         """
         # Validate date formats
@@ -610,41 +799,13 @@ class FederalRegisterClient(GovernmentAPIClient):
         self.validate_date_format(end_date)
 
         url = f"{self.base_url}/documents"
-        params = {
-            "conditions[type]": "PRESDOCU",
-            "conditions[presidential_document_type]": "executive_order",
-            "conditions[signing_date][gte]": start_date,
-            "conditions[signing_date][lte]": end_date,
-            "fields[]": [
-                "document_number",
-                "title",
-                "executive_order_number",
-                "publication_date",
-                "signing_date",
-                "president",
-                "citation",
-                "html_url",
-                "pdf_url",
-                "full_text_xml_url",
-                "body_html_url",
-                "raw_text_url",
-                "json_url",
-                "agencies",
-            ],
-            "per_page": 100,
-            "page": 1,
-        }
+        params = _executive_order_list_params(start_date, end_date)
 
         results_count = 0
 
-        while True:
-            # Rate limiting
-            time.sleep(self.rate_limit_delay)
-
-            self.logger.info(f"Fetching page {params['page']} of executive orders...")
-            response = self._make_request_with_retry(url, params)
-            data = response.json()
-
+        for current_page, total_pages, data in self._iter_executive_order_pages(
+            url, params, max_concurrent_pages
+        ):
             results = data.get("results", [])
 
             if not results:
@@ -655,33 +816,111 @@ class FederalRegisterClient(GovernmentAPIClient):
                     return
 
                 # Extract only agency names if agencies field exists
-                if "agencies" in order and isinstance(order["agencies"], list):
-                    order["agencies"] = [
-                        agency.get("name", "") for agency in order["agencies"]
-                    ]
-
-                yield order
+                yield _flatten_agency_names(order)
                 results_count += 1
 
-            # Check if there are more pages
-            total_pages = data.get("total_pages", 1)
-            current_page = params.get("page", 1)  # Get page with default
-
-            # Ensure current_page is an int for comparison and increment
-            if isinstance(current_page, str):
-                current_page = int(current_page)
-            elif not isinstance(current_page, int):
-                current_page = 1
-
             self.logger.info(
                 f"Processed page {current_page}/{total_pages}, "
                 f"total orders so far: {results_count}"
             )
 
-            if current_page >= total_pages:
-                break
+    def _fetch_executive_order_page(
+        self, url: str, params: Dict[str, Any], page: int
+    ) -> Dict[str, Any]:
+        """
+        Fetch one page of executive order search results.
 
-            params["page"] = current_page + 1
+        Args:
+            url (str): The /documents endpoint URL.
+            params (Dict[str, Any]): Base query parameters (not modified).
+            page (int): 1-based page number.
+
+        Returns:
+            Dict[str, Any]: Decoded JSON response for the page.
+        """
+        self.logger.info(f"Fetching page {page} of executive orders...")
+        response = self._make_request_with_retry(url, {**params, "page": page})
+        return response.json()
+
+    def _iter_executive_order_pages(
+        self, url: str, params: Dict[str, Any], max_concurrent_pages: int = 1
+    ) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+        """
+        Yield (page, total_pages, data) for every results page, in page order.
+
+        The first page is always fetched alone because it reports total_pages.
+        With max_concurrent_pages > 1 the remaining pages are then fetched by a
+        thread pool, keeping at most that many requests in flight. Every request
+        still goes through the shared token bucket, so concurrency only removes
+        the idle time between requests - it never exceeds the host's rate limit.
+
+        Args:
+            url (str): The /documents endpoint URL.
+            params (Dict[str, Any]): Base query parameters.
+            max_concurrent_pages (int): Pages fetched in parallel. 1 fetches
+                                       pages sequentially.
+
+        Yields:
+            Tuple[int, int, Dict[str, Any]]: Page number, total pages and the
+                                            decoded page.
+
+        Python Learning Notes:
+            - deque of futures: A sliding window; the oldest future is always
+              the next page to yield, so results come out in page order even
+              when later pages finish first
+            - try/finally in a generator: Runs when the consumer stops early
+              (e.g. max_results reached), cancelling pages not yet started
+        """
+        first_page = int(params.get("page", 1))
+        data = self._fetch_executive_order_page(url, params, first_page)
+        try:
+            total_pages = int(data.get("total_pages", 1))
+        except (TypeError, ValueError):
+            total_pages = 1
+        yield first_page, total_pages, data
+
+        remaining = range(first_page + 1, total_pages + 1)
+        if max_concurrent_pages <= 1:
+            for page in remaining:
+                yield page, total_pages, self._fetch_executive_order_page(
+                    url, params, page
+                )
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_pages, thread_name_prefix="fr-pages"
+        )
+        try:
+            pages = iter(remaining)
+            in_flight: Deque[Tuple[int, Future]] = deque()
+            for page in islice(pages, max_concurrent_pages):
+                in_flight.append(
+                    (
+                        page,
+                        executor.submit(
+                            self._fetch_executive_order_page, url, params, page
+                        ),
+                    )
+                )
+
+            while in_flight:
+                page, future = in_flight.popleft()
+                next_page = next(pages, None)
+                if next_page is not None:
+                    in_flight.append(
+                        (
+                            next_page,
+                            executor.submit(
+                                self._fetch_executive_order_page,
+                                url,
+                                params,
+                                next_page,
+                            ),
+                        )
+                    )
+                yield page, total_pages, future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def get_executive_order(self, document_number: str) -> Dict[str, Any]:
         """
@@ -766,15 +1005,8 @@ class FederalRegisterClient(GovernmentAPIClient):
         url = f"{self.base_url}/documents/{document_number}"
 
         response = self._make_request_with_retry(url)
-        order_data = response.json()
-
         # Extract only agency names if agencies field exists
-        if "agencies" in order_data and isinstance(order_data["agencies"], list):
-            order_data["agencies"] = [
-                agency.get("name", "") for agency in order_data["agencies"]
-            ]
-
-        return order_data
+        return _flatten_agency_names(response.json())
 
     def search_documents(
         self,
@@ -968,9 +1200,6 @@ class FederalRegisterClient(GovernmentAPIClient):
         if end_date:
             params["conditions[signing_date][lte]"] = end_date
 
-        # Apply rate limiting before request
-        time.sleep(self.rate_limit_delay)
-
         # Make search request with retry logic
         self.logger.info(f"Searching for executive orders with query: '{query}'")
         response = self._make_request_with_retry(url, params)
@@ -1002,9 +1231,6 @@ class FederalRegisterClient(GovernmentAPIClient):
                     self.logger.debug(
                         f"Fetching full data for document {document_number}"
                     )
-                    # Apply rate limiting between document fetches
-                    time.sleep(self.rate_limit_delay)
-
                     # Use get_document to build complete Document object
                     # This handles full text retrieval and metadata
                     document = self.get_document(document_number)
@@ -1164,21 +1390,7 @@ class FederalRegisterClient(GovernmentAPIClient):
         else:
             content = ""  # Executive orders don't have abstracts, use empty string as fallback
 
-        # Use signing_date as the primary date for executive orders
-        primary_date = order_data.get("signing_date") or order_data.get(
-            "publication_date", ""
-        )
-
-        return Document(
-            id=document_id,
-            title=order_data.get("title", "Unknown Executive Order"),
-            date=primary_date,
-            type="Executive Order",
-            source="Federal Register",
-            content=content,
-            metadata=order_data,
-            url=order_data.get("html_url"),
-        )
+        return _build_executive_order_document(document_id, order_data, content)
 
     def get_document_text(self, document_id: str) -> str:
         """
@@ -1411,3 +1623,223 @@ class FederalRegisterClient(GovernmentAPIClient):
             "subtype": order_data.get("subtype", ""),
             "type": order_data.get("type", ""),
         }
+
+
+class AsyncFederalRegisterClient(AsyncGovernmentAPIClient):
+    """
+    Asyncio client for the Federal Register API with bounded concurrency.
+
+    Mirrors FederalRegisterClient, including 429/network retry with
+    exponential backoff, but issues requests as coroutines on a pooled
+    httpx.AsyncClient. Request starts are still spaced by the 1.1 second rate
+    limit delay; what concurrency buys is that slow responses (raw text
+    documents in particular) overlap instead of adding up.
+
+    Example:
+        async with AsyncFederalRegisterClient(max_concurrency=5) as client:
+            numbers = [
+                order["document_number"]
+                async for order in client.list_executive_orders(
+                    "2024-01-01", "2024-12-31"
+                )
+            ]
+            docs = await client.get_documents(numbers)
+    """
+
+    CACHEABLE_URL_PATTERNS = FederalRegisterClient.CACHEABLE_URL_PATTERNS
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        http2: bool = True,
+        http_cache: Optional[HTTPCache] = None,
+        cassette: Optional[Cassette] = None,
+    ):
+        """
+        Initialize the async Federal Register client.
+
+        Args:
+            max_concurrency (Optional[int]): Maximum in-flight requests.
+            timeout (Optional[float]): Default request timeout in seconds.
+            max_connections (Optional[int]): Connection pool size limit.
+            max_keepalive_connections (Optional[int]): Idle connections kept alive.
+            http2 (bool): Whether to negotiate HTTP/2. Defaults to True.
+            http_cache (Optional[HTTPCache]): On-disk response cache.
+            cassette (Optional[Cassette]): Record/replay cassette.
+        """
+        super().__init__(
+            api_key=None,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            http2=http2,
+            http_cache=http_cache,
+            cassette=cassette,
+        )
+        self.logger = get_logger(__name__)
+        self.headers = {
+            "User-Agent": "GovernmentReporter/0.1.0",
+            "Accept": "application/json",
+        }
+        self.max_retries = 5
+        self.retry_delay = 1.0  # Initial delay for exponential backoff
+
+    def _get_base_url(self) -> str:
+        """Return the Federal Register API v1 base URL."""
+        return "https://www.federalregister.gov/api/v1"
+
+    def _get_rate_limit_delay(self) -> float:
+        """Return the steady-state delay between requests (1.1 seconds)."""
+        return 1.1
+
+    def _get_rate_limit_burst(self) -> int:
+        """Return the token bucket capacity (see FederalRegisterClient)."""
+        return 5
+
+    async def _make_request_with_retry(
+        self, url: str, params: Optional[Dict] = None
+    ) -> Response:
+        """
+        GET a URL, retrying 429 responses and network errors with backoff.
+
+        Args:
+            url (str): URL to request.
+            params (Optional[Dict]): Query parameters.
+
+        Returns:
+            Response: Successful response.
+
+        Raises:
+            httpx.HTTPStatusError: For non-429 errors or exhausted 429 retries.
+            httpx.RequestError: When network retries are exhausted.
+        """
+        retry_count = 0
+        delay = self.retry_delay
+
+        while retry_count < self.max_retries:
+            try:
+                return await self._get(url, params=params)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 429:
+                    raise
+                retry_count += 1
+                if retry_count >= self.max_retries:
+                    raise
+                if parse_retry_after(e.response.headers.get("Retry-After")) is not None:
+                    # The rate limiter is already blocked until Retry-After
+                    self.logger.warning(
+                        f"Rate limited. Retry {retry_count}/{self.max_retries} "
+                        "after Retry-After"
+                    )
+                    continue
+                self.logger.warning(
+                    f"Rate limited. Retry {retry_count}/{self.max_retries} after {delay:.1f}s"
+                )
+            except httpx.RequestError as e:
+                retry_count += 1
+                if retry_count >= self.max_retries:
+                    raise
+                self.logger.warning(
+                    f"Request error: {e}. Retry {retry_count}/{self.max_retries} after {delay:.1f}s"
+                )
+            await asyncio.sleep(delay)
+            delay *= 2  # Exponential backoff
+
+        raise httpx.HTTPError(f"Failed after {self.max_retries} retries")
+
+    async def get_executive_order(self, document_number: str) -> Dict[str, Any]:
+        """Fetch executive order metadata by Federal Register document number."""
+        url = f"{self.base_url}/documents/{document_number}"
+        response = await self._make_request_with_retry(url)
+        return _flatten_agency_names(response.json())
+
+    async def get_executive_order_text(self, raw_text_url: str) -> str:
+        """Fetch and clean the raw text of an executive order."""
+        response = await self._make_request_with_retry(raw_text_url)
+        return _clean_raw_text(response.text)
+
+    async def list_executive_orders(
+        self, start_date: str, end_date: str, max_results: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream executive orders signed within a date range, oldest first.
+
+        Args:
+            start_date (str): Earliest signing date (YYYY-MM-DD).
+            end_date (str): Latest signing date (YYYY-MM-DD).
+            max_results (Optional[int]): Stop after this many orders.
+
+        Yields:
+            Dict[str, Any]: Executive order metadata with agency names flattened.
+
+        Raises:
+            ValueError: If either date is not in YYYY-MM-DD format.
+        """
+        self.validate_date_format(start_date)
+        self.validate_date_format(end_date)
+
+        url = f"{self.base_url}/documents"
+        params = _executive_order_list_params(start_date, end_date)
+        results_count = 0
+
+        while True:
+            response = await self._make_request_with_retry(url, params)
+            data = response.json()
+            results = data.get("results", [])
+            if not results:
+                break
+
+            for order in results:
+                if max_results is not None and results_count >= max_results:
+                    return
+                yield _flatten_agency_names(order)
+                results_count += 1
+
+            current_page = int(params["page"])
+            if current_page >= data.get("total_pages", 1):
+                break
+            params["page"] = current_page + 1
+
+    async def get_document(self, document_id: str) -> Document:
+        """
+        Retrieve an executive order as a Document (metadata plus full text).
+
+        Args:
+            document_id (str): Federal Register document number.
+
+        Returns:
+            Document: Executive Order document.
+        """
+        order_data = await self.get_executive_order(document_id)
+
+        raw_text_url = order_data.get("raw_text_url")
+        if raw_text_url:
+            content = await self.get_executive_order_text(raw_text_url)
+        else:
+            content = ""
+
+        return _build_executive_order_document(document_id, order_data, content)
+
+    async def get_documents(self, document_ids: List[str]) -> List[Document]:
+        """
+        Fetch many executive orders concurrently, preserving input order.
+
+        Args:
+            document_ids (List[str]): Federal Register document numbers.
+
+        Returns:
+            List[Document]: Documents in the same order as document_ids.
+        """
+        return list(await asyncio.gather(*(self.get_document(d) for d in document_ids)))
+
+    async def get_document_text(self, document_id: str) -> str:
+        """Retrieve only the cleaned full text of an executive order."""
+        order_data = await self.get_executive_order(document_id)
+        raw_text_url = order_data.get("raw_text_url")
+        if raw_text_url:
+            return await self.get_executive_order_text(raw_text_url)
+        return ""
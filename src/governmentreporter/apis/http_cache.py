@@ -0,0 +1,572 @@
+"""
+Persistent on-disk HTTP response cache with conditional revalidation.
+
+Ingestion re-runs (for example after a chunking or prompt change) request the
+same opinions, clusters and executive orders again. This module keeps those
+responses on disk so a re-run either serves them locally or turns each
+refetch into a cheap conditional request answered with 304 Not Modified.
+
+Key Components:
+    - HTTPCache: SQLite-backed store. Response bodies are content-addressed
+      (keyed by SHA-256) and zlib-compressed; entries record ETag and
+      Last-Modified validators. Total body size is bounded with LRU eviction.
+    - CachingTransport / AsyncCachingTransport: httpx transports that wrap the
+      real network transport and consult the cache for cacheable GET requests.
+
+Cache Policy:
+    - Only GET requests whose URL matches one of the client's cacheable
+      patterns are cached (single documents, not listing/search endpoints,
+      whose results change as new documents are published)
+    - Only 200 responses are stored
+    - Entries with ETag/Last-Modified are revalidated with If-None-Match /
+      If-Modified-Since; a 304 is answered from the cache
+    - Entries without validators are served directly while younger than
+      max_age (forever by default: a document fetched by ID does not change)
+
+Python Learning Notes:
+    - httpx transports: The layer below httpx.Client that actually sends
+      requests; wrapping one adds behavior without touching calling code
+    - Content addressing: Identical bodies are stored once under their hash
+    - sqlite3: Standard-library embedded database, safe to share between
+      threads when access is serialized with a lock
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Union
+
+import httpx
+
+from ..utils import get_logger
+
+logger = get_logger(__name__)
+
+# Default upper bound for stored (compressed) response bodies
+DEFAULT_MAX_SIZE_BYTES = 2 * 1024**3
+
+# Eviction trims the cache to this fraction of max_size_bytes so that it does
+# not run on every single store once the cache is full
+EVICTION_TARGET_RATIO = 0.9
+
+
+class CachedResponse:
+    """
+    A response read back from the cache.
+
+    Attributes:
+        status_code (int): HTTP status code of the stored response.
+        headers (List[List[str]]): Raw response headers as name/value pairs.
+        content (bytes): Raw (still content-encoded) response body.
+        etag (Optional[str]): Stored ETag validator.
+        last_modified (Optional[str]): Stored Last-Modified validator.
+        stored_at (float): Unix timestamp when the entry was written.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: List[List[str]],
+        content: bytes,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        stored_at: float,
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+
+    @property
+    def has_validators(self) -> bool:
+        """Whether the entry can be revalidated with a conditional request."""
+        return bool(self.etag or self.last_modified)
+
+    def to_httpx(self, request: httpx.Request) -> httpx.Response:
+        """
+        Rebuild an httpx.Response for the given request.
+
+        Args:
+            request (httpx.Request): Request the response answers.
+
+        Returns:
+            httpx.Response: Response with the cached status, headers and body.
+        """
+        return httpx.Response(
+            status_code=self.status_code,
+            headers=[(k, v) for k, v in self.headers],
+            stream=httpx.ByteStream(self.content),
+            request=request,
+            extensions={"from_cache": True},
+        )
+
+
+class HTTPCache:
+    """
+    SQLite-backed, size-bounded HTTP response cache.
+
+    Storage layout (one database file in cache_dir):
+        - entries: cache key -> URL, status, headers, validators, body hash,
+          stored_at, accessed_at
+        - bodies: body hash -> zlib-compressed body, compressed size
+
+    Example:
+        cache = HTTPCache("./data/cache/http", max_size_bytes=500 * 1024**2)
+        client = CourtListenerClient(http_cache=cache)
+        ...
+        print(cache.stats())
+
+    Python Learning Notes:
+        - check_same_thread=False plus a threading.Lock lets one connection
+          serve the sync client, worker threads and the async event loop
+    """
+
+    DB_FILENAME = "http_cache.db"
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+        max_age: Optional[float] = None,
+    ):
+        """
+        Open (or create) a cache directory.
+
+        Args:
+            cache_dir (Union[str, Path]): Directory holding the cache database.
+            max_size_bytes (int): Upper bound on stored compressed body bytes.
+            max_age (Optional[float]): Seconds an entry without validators may
+                                      be served without contacting the server.
+                                      None (default) means no expiry.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.db_path = self.cache_dir / self.DB_FILENAME
+        self.max_size_bytes = max_size_bytes
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        # Opened on first use so constructing a cache touches no files
+        self._connection: Optional[sqlite3.Connection] = None
+
+        self._counters = {
+            "hits": 0,
+            "revalidated": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+        }
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Database connection, created (with its directory) on first use."""
+        if self._connection is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                str(self.db_path), check_same_thread=False, isolation_level=None
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._init_schema(self._connection)
+        return self._connection
+
+    @staticmethod
+    def _init_schema(conn: sqlite3.Connection) -> None:
+        """Create the cache tables if they do not exist."""
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                body_hash TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_accessed
+                ON entries(accessed_at);
+            CREATE TABLE IF NOT EXISTS bodies (
+                hash TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                size INTEGER NOT NULL
+            );
+            """
+        )
+
+    @staticmethod
+    def cache_key(method: str, url: str) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Full URL including query string.
+
+        Returns:
+            str: SHA-256 hex digest of "METHOD URL".
+        """
+        return hashlib.sha256(f"{method.upper()} {url}".encode("utf-8")).hexdigest()
+
+    def get(self, method: str, url: str) -> Optional[CachedResponse]:
+        """
+        Look up a cached response and mark it as recently used.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Full URL.
+
+        Returns:
+            Optional[CachedResponse]: The cached response, or None.
+        """
+        key = self.cache_key(method, url)
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT e.status_code, e.headers, e.etag, e.last_modified,
+                       e.stored_at, b.data
+                FROM entries e JOIN bodies b ON b.hash = e.body_hash
+                WHERE e.key = ?
+                """,
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+
+        status_code, headers, etag, last_modified, stored_at, data = row
+        return CachedResponse(
+            status_code=status_code,
+            headers=json.loads(headers),
+            content=zlib.decompress(data),
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=stored_at,
+        )
+
+    def put(
+        self,
+        method: str,
+        url: str,
+        status_code: int,
+        headers: Iterable[Any],
+        content: bytes,
+    ) -> None:
+        """
+        Store a response, replacing any previous entry for the request.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Full URL.
+            status_code (int): Response status code.
+            headers (Iterable[Any]): Response header (name, value) pairs.
+            content (bytes): Raw response body.
+        """
+        header_list = [[str(k), str(v)] for k, v in headers]
+        lowered = {k.lower(): v for k, v in header_list}
+        body_hash = hashlib.sha256(content).hexdigest()
+        now = time.time()
+
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM bodies WHERE hash = ?", (body_hash,)
+            ).fetchone()
+            if not exists:
+                compressed = zlib.compress(content, 6)
+                self._conn.execute(
+                    "INSERT INTO bodies (hash, data, size) VALUES (?, ?, ?)",
+                    (body_hash, compressed, len(compressed)),
+                )
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO entries
+                    (key, url, status_code, headers, etag, last_modified,
+                     body_hash, stored_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    self.cache_key(method, url),
+                    url,
+                    status_code,
+                    json.dumps(header_list),
+                    lowered.get("etag"),
+                    lowered.get("last-modified"),
+                    body_hash,
+                    now,
+                    now,
+                ),
+            )
+            self._counters["stores"] += 1
+            self._evict_locked()
+
+    def record(self, counter: str) -> None:
+        """Increment a statistics counter (hits, revalidated or misses)."""
+        with self._lock:
+            self._counters[counter] += 1
+
+    def touch(self, method: str, url: str) -> None:
+        """Refresh stored_at after a successful revalidation (304)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET stored_at = ? WHERE key = ?",
+                (time.time(), self.cache_key(method, url)),
+            )
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """
+        Whether an entry may be served without contacting the server.
+
+        Entries with validators are always revalidated; entries without
+        them are served until max_age elapses (forever when max_age is None).
+
+        Args:
+            entry (CachedResponse): Cached response.
+
+        Returns:
+            bool: True to serve directly from the cache.
+        """
+        if entry.has_validators:
+            return False
+        if self.max_age is None:
+            return True
+        return (time.time() - entry.stored_at) < self.max_age
+
+    def has_fresh(self, method: str, url: str) -> bool:
+        """
+        Whether a request would be answered from the cache alone.
+
+        Unlike get(), this reads no body and does not mark the entry as used.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Full URL.
+
+        Returns:
+            bool: True if a fresh entry (see is_fresh()) is stored.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, stored_at FROM entries WHERE key = ?",
+                (self.cache_key(method, url),),
+            ).fetchone()
+        if row is None:
+            return False
+        etag, last_modified, stored_at = row
+        return self.is_fresh(
+            CachedResponse(200, [], b"", etag, last_modified, stored_at)
+        )
+
+    def total_size(self) -> int:
+        """Return the total compressed size of stored bodies in bytes."""
+        with self._lock:
+            return self._total_size_locked()
+
+    def _total_size_locked(self) -> int:
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM bodies").fetchone()
+        return int(row[0])
+
+    def _evict_locked(self) -> None:
+        """Drop least recently used entries until under the size limit."""
+        total = self._total_size_locked()
+        if total <= self.max_size_bytes:
+            return
+
+        target = int(self.max_size_bytes * EVICTION_TARGET_RATIO)
+        cursor = self._conn.execute(
+            """
+            SELECT e.key, b.size, e.body_hash
+            FROM entries e JOIN bodies b ON b.hash = e.body_hash
+            ORDER BY e.accessed_at ASC
+            """
+        )
+        victims = []
+        freed_hashes = set()
+        for key, size, body_hash in cursor:
+            if total <= target:
+                break
+            victims.append((key,))
+            if body_hash not in freed_hashes:
+                freed_hashes.add(body_hash)
+                total -= size
+
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        # Remove bodies no longer referenced by any entry
+        self._conn.execute(
+            "DELETE FROM bodies WHERE hash NOT IN (SELECT body_hash FROM entries)"
+        )
+        self._counters["evictions"] += len(victims)
+        logger.debug(f"HTTP cache evicted {len(victims)} entries")
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM bodies")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache counters and size.
+
+        Returns:
+            Dict[str, Any]: hits (served without network), revalidated (304s),
+                            misses, stores, evictions, entries and size_bytes.
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            size = self._total_size_locked()
+            counters = dict(self._counters)
+        return {**counters, "entries": entries, "size_bytes": size}
+
+    def close(self) -> None:
+        """Close the underlying database connection (reopened if used again)."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def _compile_patterns(patterns: Iterable[Union[str, Pattern]]) -> List[Pattern]:
+    return [re.compile(p) if isinstance(p, str) else p for p in patterns]
+
+
+class _CachePolicy:
+    """Decision logic shared by the sync and async caching transports."""
+
+    def __init__(self, cache: HTTPCache, cacheable: Iterable[Union[str, Pattern]]):
+        self.cache = cache
+        self.patterns = _compile_patterns(cacheable)
+
+    def is_cacheable(self, request: httpx.Request) -> bool:
+        if request.method != "GET":
+            return False
+        url = str(request.url)
+        return any(p.search(url) for p in self.patterns)
+
+    def prepare(self, request: httpx.Request) -> Optional[CachedResponse]:
+        """Return a cached entry and add conditional headers when revalidating."""
+        entry = self.cache.get(request.method, str(request.url))
+        if entry is None:
+            self.cache.record("misses")
+            return None
+        if entry.etag:
+            request.headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            request.headers["If-Modified-Since"] = entry.last_modified
+        return entry
+
+    def finish(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        raw: bytes,
+        entry: Optional[CachedResponse],
+    ) -> httpx.Response:
+        """Store fresh 200s and turn 304s into the cached response."""
+        if response.status_code == 304 and entry is not None:
+            self.cache.record("revalidated")
+            self.cache.touch(request.method, str(request.url))
+            return entry.to_httpx(request)
+
+        if response.status_code == 200:
+            self.cache.put(
+                request.method,
+                str(request.url),
+                response.status_code,
+                response.headers.multi_items(),
+                raw,
+            )
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=httpx.ByteStream(raw),
+            request=request,
+            extensions=response.extensions,
+        )
+
+
+class CachingTransport(httpx.BaseTransport):
+    """
+    Synchronous httpx transport that serves and stores responses via HTTPCache.
+
+    Args:
+        transport (httpx.BaseTransport): Real transport that sends requests.
+        cache (HTTPCache): Response store.
+        cacheable (Iterable[Union[str, Pattern]]): URL regexes eligible for caching.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        cache: HTTPCache,
+        cacheable: Iterable[Union[str, Pattern]],
+    ):
+        self.transport = transport
+        self.policy = _CachePolicy(cache, cacheable)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.policy.is_cacheable(request):
+            return self.transport.handle_request(request)
+
+        entry = self.policy.prepare(request)
+        if entry is not None and self.policy.cache.is_fresh(entry):
+            self.policy.cache.record("hits")
+            return entry.to_httpx(request)
+
+        response = self.transport.handle_request(request)
+        try:
+            raw = b"".join(response.stream)
+        finally:
+            response.close()
+        return self.policy.finish(request, response, raw, entry)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCachingTransport(httpx.AsyncBaseTransport):
+    """
+    Asynchronous counterpart of CachingTransport for httpx.AsyncClient.
+
+    Args:
+        transport (httpx.AsyncBaseTransport): Real transport that sends requests.
+        cache (HTTPCache): Response store.
+        cacheable (Iterable[Union[str, Pattern]]): URL regexes eligible for caching.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        cache: HTTPCache,
+        cacheable: Iterable[Union[str, Pattern]],
+    ):
+        self.transport = transport
+        self.policy = _CachePolicy(cache, cacheable)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.policy.is_cacheable(request):
+            return await self.transport.handle_async_request(request)
+
+        entry = self.policy.prepare(request)
+        if entry is not None and self.policy.cache.is_fresh(entry):
+            self.policy.cache.record("hits")
+            return entry.to_httpx(request)
+
+        response = await self.transport.handle_async_request(request)
+        try:
+            raw = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        return self.policy.finish(request, response, raw, entry)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
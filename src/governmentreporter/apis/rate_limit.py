@@ -0,0 +1,342 @@
+"""
+Token-bucket rate limiting shared by all API clients talking to the same host.
+
+Government APIs publish quotas as "N requests per period". Sleeping a fixed
+delay before every request enforces that quota in the worst case but wastes
+budget whenever requests are spread out: a request issued after a long pause
+still waits the full delay. A token bucket instead accumulates unused budget
+(up to a burst capacity) and spends it immediately, only making callers wait
+once the bucket is empty.
+
+Key Components:
+    - TokenBucket: Thread- and asyncio-safe limiter with adaptive slow-down
+      on 429 responses and Retry-After support
+    - parse_retry_after(): Parse Retry-After header values (seconds or HTTP date)
+    - get_rate_limiter(): Process-wide registry returning one bucket per host,
+      so every client instance (sync or async) shares the same budget
+    - get_rate_limiter_metrics(): Snapshot of every registered bucket
+
+Adaptive Behavior:
+    - A 429 (or 503 with Retry-After) response blocks the bucket until the
+      server's Retry-After time and halves the refill rate
+    - Each successful response restores 10% of the configured rate, so the
+      limiter climbs back to full speed once the server stops pushing back
+
+Python Learning Notes:
+    - threading.Lock: Guards shared state across threads
+    - Reservations: Tokens may go negative; the deficit divided by the rate is
+      how long the caller must wait, so sleeping happens outside the lock
+    - time.monotonic(): Clock that never jumps backwards, ideal for intervals
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+# Fraction of the configured rate restored after each successful response
+RECOVERY_STEP = 0.1
+
+# Lowest fraction of the configured rate adaptive slow-down may reach
+MIN_RATE_FRACTION = 0.05
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """
+    Parse an HTTP Retry-After header into a number of seconds.
+
+    Retry-After may be either a delay in seconds ("120") or an HTTP date
+    ("Wed, 21 Oct 2015 07:28:00 GMT").
+
+    Args:
+        value (Any): Raw header value. Non-string values yield None.
+
+    Returns:
+        Optional[float]: Seconds to wait (never negative), or None if the
+                        value is missing or unparseable.
+
+    Example:
+        >>> parse_retry_after("30")
+        30.0
+        >>> parse_retry_after(None) is None
+        True
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter usable from threads and asyncio tasks.
+
+    The bucket refills at `rate` tokens per second up to `capacity`. Each
+    request takes one token; when none are available the caller reserves a
+    future token and waits exactly until it would have been refilled.
+
+    Attributes:
+        name (str): Identifier used in metrics (typically the API host).
+        base_rate (float): Configured refill rate in tokens per second.
+        rate (float): Current refill rate, lowered after 429 responses.
+        capacity (float): Maximum number of tokens (burst size).
+
+    Example:
+        bucket = TokenBucket(rate=10.0, capacity=10, name="api.example.com")
+        bucket.acquire()               # from synchronous code
+        await bucket.acquire_async()   # from a coroutine
+
+    Python Learning Notes:
+        - Both acquire() and acquire_async() share the same bookkeeping; only
+          the sleep call differs (time.sleep vs asyncio.sleep)
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, name: str = ""):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate (float): Tokens added per second. Must be positive.
+            capacity (float): Maximum stored tokens. At least 1.
+            name (str): Identifier reported in metrics.
+
+        Raises:
+            ValueError: If rate is not positive.
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+
+        self.name = name
+        self.base_rate = float(rate)
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+
+        # Metrics
+        self._acquired = 0
+        self._throttled = 0
+        self._total_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time elapsed since the last update (lock held)."""
+        if now > self._updated_at:
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+
+    def _reserve(self, tokens: float) -> float:
+        """
+        Take tokens and return how long the caller must wait before using them.
+
+        Args:
+            tokens (float): Number of tokens to take.
+
+        Returns:
+            float: Seconds to wait (0.0 when budget was available).
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                # Refill is frozen while blocked by Retry-After
+                start = self._blocked_until
+            else:
+                self._refill(now)
+                start = now
+
+            self._tokens -= tokens
+            wait = start - now
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+
+            self._acquired += 1
+            self._total_wait += wait
+            return wait
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block the current thread until `tokens` are available, then take them.
+
+        Args:
+            tokens (float): Number of tokens to take. Defaults to 1.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """
+        Wait (without blocking the event loop) until `tokens` are available.
+
+        Args:
+            tokens (float): Number of tokens to take. Defaults to 1.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """
+        Slow down after the server signalled it is rate limiting us.
+
+        Empties the bucket, blocks it until `retry_after` seconds from now (if
+        given) and halves the refill rate, bounded below by MIN_RATE_FRACTION
+        of the configured rate.
+
+        Args:
+            retry_after (Optional[float]): Seconds the server asked us to wait.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+                self._updated_at = max(self._updated_at, self._blocked_until)
+            self.rate = max(self.base_rate * MIN_RATE_FRACTION, self.rate / 2)
+            self._throttled += 1
+
+    def record_success(self) -> None:
+        """Gradually restore the refill rate after a successful response."""
+        if self.rate >= self.base_rate:
+            return
+        with self._lock:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * RECOVERY_STEP)
+
+    def observe(self, response: Any) -> None:
+        """
+        Update the limiter from an HTTP response.
+
+        429 responses, and 503 responses carrying Retry-After, trigger
+        penalize(); 2xx responses trigger record_success(). Anything without
+        an integer status_code (e.g. a test double) is ignored.
+
+        Args:
+            response (Any): httpx.Response (or compatible) object.
+        """
+        status = getattr(response, "status_code", None)
+        if not isinstance(status, int):
+            return
+
+        headers = getattr(response, "headers", None) or {}
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+
+        if status == 429 or (status == 503 and retry_after is not None):
+            self.penalize(retry_after)
+        elif 200 <= status < 300:
+            self.record_success()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available (negative while reservations are queued)."""
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._blocked_until:
+                self._refill(now)
+            return self._tokens
+
+    @property
+    def wait_time(self) -> float:
+        """Seconds a request made now would have to wait for a token."""
+        with self._lock:
+            now = time.monotonic()
+            blocked = max(0.0, self._blocked_until - now)
+            if not blocked:
+                self._refill(now)
+            deficit = 1.0 - self._tokens
+            return blocked + (deficit / self.rate if deficit > 0 else 0.0)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Return a snapshot of the limiter state.
+
+        Returns:
+            Dict[str, Any]: name, tokens, wait_time, rate, base_rate, capacity,
+                            acquired (requests admitted), throttled (429s seen)
+                            and total_wait_seconds.
+        """
+        tokens = self.tokens
+        wait_time = self.wait_time
+        return {
+            "name": self.name,
+            "tokens": round(tokens, 3),
+            "wait_time": round(wait_time, 3),
+            "rate": self.rate,
+            "base_rate": self.base_rate,
+            "capacity": self.capacity,
+            "acquired": self._acquired,
+            "throttled": self._throttled,
+            "total_wait_seconds": round(self._total_wait, 3),
+        }
+
+
+_registry: Dict[str, TokenBucket] = {}
+_registry_lock = threading.Lock()
+
+
+def get_rate_limiter(host: str, rate: float, capacity: float = 1.0) -> TokenBucket:
+    """
+    Return the shared TokenBucket for an API host, creating it on first use.
+
+    All clients for the same host share one budget regardless of how many
+    instances exist or whether they are sync or async. The first caller's
+    rate and capacity configure the bucket.
+
+    Args:
+        host (str): API host name, e.g. "www.federalregister.gov".
+        rate (float): Requests per second allowed for this host.
+        capacity (float): Burst size.
+
+    Returns:
+        TokenBucket: Shared limiter for the host.
+    """
+    with _registry_lock:
+        bucket = _registry.get(host)
+        if bucket is None:
+            bucket = TokenBucket(rate=rate, capacity=capacity, name=host)
+            _registry[host] = bucket
+        return bucket
+
+
+def get_rate_limiter_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Return metrics for every registered host limiter.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Mapping of host to TokenBucket.metrics().
+    """
+    with _registry_lock:
+        buckets = list(_registry.values())
+    return {bucket.name: bucket.metrics() for bucket in buckets}
+
+
+def reset_rate_limiters() -> None:
+    """Forget all registered limiters (used by tests and long-lived servers)."""
+    with _registry_lock:
+        _registry.clear()
@@ -2,7 +2,8 @@
 Database information and statistics CLI commands.
 
 Provides commands for inspecting Qdrant database contents, viewing
-collection statistics, and browsing sample documents.
+collection statistics, browsing sample documents, and breaking ingestion
+time down by stage from the progress databases.
 """
 
 import sys
@@ -21,6 +22,7 @@ def info():
         collections - List all collections with statistics
         sample      - Show sample documents from a collection
         stats       - Show detailed statistics for a collection
+        ingestion-stats - Show per-stage ingestion timings and run totals
     """
     pass
 
@@ -551,3 +553,134 @@ def stats(
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
+
+
+# Progress database and tracked document type of each ingestion
+INGESTION_PROGRESS = {
+    "scotus": ("scotus_ingestion.db", "scotus"),
+    "eo": ("executive_orders_ingestion.db", "executive_order"),
+}
+
+
+def _format_ms(milliseconds: Optional[float]) -> str:
+    """Format a duration in milliseconds as ms, s, m or h."""
+    if milliseconds is None:
+        return "-"
+    if milliseconds < 1000:
+        return f"{milliseconds:.0f}ms"
+    seconds = milliseconds / 1000
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.1f}m"
+    return f"{seconds / 3600:.1f}h"
+
+
+@info.command("ingestion-stats")
+@click.argument(
+    "ingestion",
+    required=False,
+    type=click.Choice(list(INGESTION_PROGRESS), case_sensitive=False),
+)
+@click.option(
+    "--progress-dir",
+    default="./data/progress",
+    help="Directory of the progress databases (default: ./data/progress)",
+)
+@click.option(
+    "--runs",
+    type=click.IntRange(min=1),
+    default=5,
+    help="Number of recent runs to show totals for (default: 5)",
+)
+def ingestion_stats(ingestion: Optional[str], progress_dir: str, runs: int):
+    """
+    Show where ingestion time goes, stage by stage.
+
+    For every document the progress database records how long its fetch,
+    chunk, LLM, embed and store stages took and how many tokens it used.
+    This shows the p50/p95/p99 of each stage over the documents' latest
+    processing, and each recent run's totals. Without an argument both
+    ingestions are shown.
+
+    Examples:
+        governmentreporter info ingestion-stats
+        governmentreporter info ingestion-stats scotus --runs 10
+    """
+    from pathlib import Path
+
+    from ..ingestion.progress import TIMED_STAGES, TOKEN_COUNTS, ProgressTracker
+
+    selected = [ingestion.lower()] if ingestion else list(INGESTION_PROGRESS)
+    for name in selected:
+        db_name, document_type = INGESTION_PROGRESS[name]
+        db_path = Path(progress_dir) / db_name
+        click.echo("=" * 80)
+        click.echo(f"INGESTION STATS: {name.upper()} ({db_path})")
+        click.echo("=" * 80)
+        if not db_path.exists():
+            click.echo("No progress database found.\n")
+            continue
+
+        tracker = ProgressTracker(str(db_path), document_type)
+        try:
+            stage_stats = tracker.get_stage_statistics()
+            run_history = tracker.get_run_history(limit=runs)
+        finally:
+            tracker.close()
+
+        click.echo("\n⏱️  Stage Timings per Document")
+        click.echo("-" * 80)
+        if not stage_stats:
+            click.echo("No stage timings recorded yet.")
+        else:
+            click.echo(
+                f"{'Stage':10s} {'Docs':>8s} {'p50':>9s} {'p95':>9s} "
+                f"{'p99':>9s} {'Total':>9s}"
+            )
+            for stage in TIMED_STAGES:
+                stat = stage_stats.get(f"{stage}_ms")
+                if stat is None:
+                    continue
+                click.echo(
+                    f"{stage:10s} {stat['count']:8,} {_format_ms(stat['p50']):>9s} "
+                    f"{_format_ms(stat['p95']):>9s} {_format_ms(stat['p99']):>9s} "
+                    f"{_format_ms(stat['total']):>9s}"
+                )
+
+            token_stats = [
+                (token, stage_stats[token])
+                for token in TOKEN_COUNTS
+                if token in stage_stats
+            ]
+            if token_stats:
+                click.echo("\n🔢 Tokens per Document")
+                click.echo("-" * 80)
+                for token_name, stat in token_stats:
+                    click.echo(
+                        f"{token_name:22s} p50 {stat['p50']:>8,}  "
+                        f"p95 {stat['p95']:>8,}  p99 {stat['p99']:>8,}  "
+                        f"total {stat['total']:>12,}"
+                    )
+
+        click.echo(f"\n📅 Recent Runs (last {runs})")
+        click.echo("-" * 80)
+        if not run_history:
+            click.echo("No runs recorded yet.")
+        for run in run_history:
+            click.echo(
+                f"Run {run['run_id']} started {run['started_at']} "
+                f"({run['start_date']} to {run['end_date']}): "
+                f"{run['completed_documents'] or 0:,} completed, "
+                f"{run['failed_documents'] or 0:,} failed"
+            )
+            stage_totals = ", ".join(
+                f"{stage} {_format_ms(run[f'{stage}_ms'])}" for stage in TIMED_STAGES
+            )
+            click.echo(f"  Stages: {stage_totals}")
+            click.echo(
+                f"  Tokens: LLM {run['llm_prompt_tokens'] or 0:,} prompt + "
+                f"{run['llm_completion_tokens'] or 0:,} completion, "
+                f"embeddings {run['embedding_tokens'] or 0:,}"
+            )
+        click.echo()
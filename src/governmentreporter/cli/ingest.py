@@ -6,10 +6,262 @@ into the Qdrant vector database.
 """
 
 import sys
+import threading
 from datetime import datetime
+from pathlib import Path
 
 import click
 
+# OpenAI requests in flight across both ingesters of `ingest all --concurrent`
+DEFAULT_OPENAI_CONCURRENCY = 8
+
+# Progress databases of `ingest all`
+SCOTUS_PROGRESS_DB = "./data/progress/scotus_ingestion.db"
+EO_PROGRESS_DB = "./data/progress/executive_orders_ingestion.db"
+
+
+def _open_http_cache(cache_dir, no_cache):
+    """
+    Open the on-disk HTTP response cache unless caching is disabled.
+
+    Args:
+        cache_dir: Directory for the cache database
+        no_cache: If True, return None so API clients always hit the network
+
+    Returns:
+        HTTPCache instance, or None when caching is disabled
+    """
+    if no_cache:
+        return None
+
+    from ..apis.http_cache import HTTPCache
+
+    return HTTPCache(cache_dir)
+
+
+def _open_embedding_cache(cache_dir, no_cache):
+    """
+    Open the on-disk embedding cache unless caching is disabled.
+
+    Args:
+        cache_dir: Directory for the cache database
+        no_cache: If True, return None so every text is sent to the API
+
+    Returns:
+        EmbeddingCache instance, or None when caching is disabled
+    """
+    if no_cache:
+        return None
+
+    from ..processors.embedding_cache import EmbeddingCache
+
+    return EmbeddingCache(cache_dir)
+
+
+def _discovery_options(progress_db, max_age_hours):
+    """
+    Ingester arguments for the persistent discovery cache.
+
+    The cache lives next to the progress database, so a resumed run of the
+    same command finds the clusters or orders discovered before.
+
+    Args:
+        progress_db: Path to the ingester's progress database
+        max_age_hours: Hours discovery results stay fresh; 0 disables the cache
+
+    Returns:
+        Keyword arguments for the SCOTUS and Executive Order ingesters,
+        threaded or asyncio
+    """
+    if not max_age_hours:
+        return {}
+    return {
+        "discovery_db": str(Path(progress_db).with_suffix(".discovery.db")),
+        "discovery_max_age": max_age_hours * 3600,
+    }
+
+
+def _open_cassette(record_dir, replay_dir):
+    """
+    Open a record/replay cassette from the --record/--replay options.
+
+    Exits with an error if both options are given.
+
+    Args:
+        record_dir: Directory to record API traffic into, or None
+        replay_dir: Directory to replay API traffic from, or None
+
+    Returns:
+        Cassette instance, or None when neither option is set
+    """
+    if record_dir and replay_dir:
+        click.echo("Error: --record and --replay cannot be used together", err=True)
+        sys.exit(1)
+    if not (record_dir or replay_dir):
+        return None
+
+    from ..apis.cassette import RECORD, REPLAY, Cassette
+
+    if record_dir:
+        return Cassette(record_dir, mode=RECORD)
+    return Cassette(replay_dir, mode=REPLAY)
+
+
+def _stage_workers(pipeline, spec):
+    """
+    Build the stage_workers argument from the --pipeline/--stage-workers options.
+
+    Exits with an error if the specification is invalid.
+
+    Args:
+        pipeline: Whether --pipeline was given
+        spec: Value of --stage-workers, or None
+
+    Returns:
+        Threads per pipeline stage, or None for batch processing
+    """
+    if not (pipeline or spec):
+        return None
+
+    from ..ingestion.pipeline import parse_stage_workers
+
+    try:
+        return parse_stage_workers(spec or "")
+    except ValueError as e:
+        click.echo(f"Error: --stage-workers: {e}", err=True)
+        sys.exit(1)
+
+
+def _async_concurrency(use_asyncio, max_in_flight, spec, threaded):
+    """
+    Build the async ingester's concurrency arguments from the --asyncio options.
+
+    Exits with an error if the specification is invalid or --asyncio is
+    combined with --workers/--pipeline/--stage-workers.
+
+    Args:
+        use_asyncio: Whether --asyncio was given
+        max_in_flight: Value of --max-in-flight
+        spec: Value of --concurrency, or None
+        threaded: Whether a thread-based processing option was given
+
+    Returns:
+        Keyword arguments for the async ingester, or None for threaded ingestion
+    """
+    if not (use_asyncio or spec):
+        return None
+    if threaded:
+        click.echo(
+            "Error: --asyncio cannot be combined with --workers, --pipeline "
+            "or --stage-workers",
+            err=True,
+        )
+        sys.exit(1)
+
+    from ..ingestion.async_base import parse_concurrency
+
+    try:
+        limits = parse_concurrency(spec or "")
+    except ValueError as e:
+        click.echo(f"Error: --concurrency: {e}", err=True)
+        sys.exit(1)
+    return {"max_in_flight": max_in_flight, **limits}
+
+
+def _run_side_by_side(ingesters):
+    """
+    Run ingesters at the same time, each on its own thread.
+
+    The threads are daemons joined with a timeout, so Ctrl-C still reaches
+    the main thread; documents of an interrupted run keep their leases
+    until they expire, and spooled work is kept.
+
+    Args:
+        ingesters: Mapping of label to ingester
+
+    Returns:
+        Mapping of label to the exception its run() raised, for failed runs
+    """
+    errors = {}
+
+    def run(name, ingester):
+        try:
+            ingester.run()
+        except Exception as e:
+            errors[name] = e
+
+    threads = [
+        threading.Thread(target=run, args=item, name=f"ingest-{item[0]}", daemon=True)
+        for item in ingesters.items()
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        while thread.is_alive():
+            thread.join(timeout=0.5)
+    return errors
+
+
+def _ingest_all_concurrently(discovery_max_age, **options):
+    """
+    Run the SCOTUS and Executive Order ingesters side by side for `ingest all`.
+
+    Args:
+        discovery_max_age: Hours discovery results stay fresh (0: no cache)
+        **options: Ingester arguments shared by both ingesters
+
+    Exits with an error if either ingester fails.
+    """
+    from ..ingestion.executive_orders import ExecutiveOrderIngester
+    from ..ingestion.scotus import SCOTUSIngester
+    from ..utils.monitoring import CombinedProgress
+
+    try:
+        ingesters = {
+            "SCOTUS": SCOTUSIngester(
+                batch_size=50,
+                progress_db=SCOTUS_PROGRESS_DB,
+                **_discovery_options(SCOTUS_PROGRESS_DB, discovery_max_age),
+                **options,
+            ),
+            "Executive Orders": ExecutiveOrderIngester(
+                batch_size=25,
+                progress_db=EO_PROGRESS_DB,
+                **_discovery_options(EO_PROGRESS_DB, discovery_max_age),
+                **options,
+            ),
+        }
+    except Exception as e:
+        click.echo(f"\n✗ Could not start ingestion: {e}", err=True)
+        sys.exit(1)
+
+    display = CombinedProgress()
+    for name, ingester in ingesters.items():
+        display.attach(name, ingester.performance_monitor)
+
+    click.echo("\nRunning SCOTUS and Executive Order ingestion concurrently...")
+    click.echo("-" * 80)
+    try:
+        errors = _run_side_by_side(ingesters)
+    except KeyboardInterrupt:
+        click.echo("\n\nIngestion interrupted by user")
+        sys.exit(0)
+
+    click.echo("\n" + "=" * 80)
+    click.echo(
+        "ALL INGESTION COMPLETE" if not errors else "INGESTION FINISHED WITH ERRORS"
+    )
+    click.echo("=" * 80)
+    for name in ingesters:
+        if name in errors:
+            click.echo(f"✗ {name} ingestion failed: {errors[name]}", err=True)
+        else:
+            click.echo(f"✓ {name} ingested successfully")
+    click.echo("\nUse 'governmentreporter info collections' to view statistics")
+    click.echo("=" * 80)
+    if errors:
+        sys.exit(1)
+
 
 @click.group()
 def ingest():
@@ -17,8 +269,15 @@ def ingest():
     Ingest government documents into vector database.
 
     Commands:
-        scotus    - Ingest Supreme Court opinions
-        eo        - Ingest Executive Orders
+        scotus       - Ingest Supreme Court opinions
+        scotus-bulk  - Ingest Supreme Court opinions from CourtListener bulk dumps
+        eo           - Ingest Executive Orders
+        eo-bulk      - Ingest Executive Orders from Federal Register bulk XML
+
+    Several ingest processes, on one machine or several sharing the progress
+    database, can work on the same date range at once: each document is
+    leased to one process at a time, and documents leased by a process that
+    crashed are picked up again once the lease expires.
     """
     pass
 
@@ -55,24 +314,163 @@ def ingest():
     is_flag=True,
     help="Run without actually storing documents in Qdrant",
 )
+@click.option(
+    "--cache-dir",
+    default="./data/cache/http",
+    help="Directory for the on-disk HTTP response cache (default: ./data/cache/http)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Disable the HTTP response cache and always download from the API",
+)
+@click.option(
+    "--embedding-cache-dir",
+    default="./data/cache/embeddings",
+    help="Directory for the on-disk embedding cache "
+    "(default: ./data/cache/embeddings)",
+)
+@click.option(
+    "--no-embedding-cache",
+    is_flag=True,
+    help="Disable the embedding cache and embed every chunk with the API",
+)
+@click.option(
+    "--record",
+    "record_dir",
+    type=click.Path(file_okay=False),
+    help="Record all API traffic to this cassette directory",
+)
+@click.option(
+    "--replay",
+    "replay_dir",
+    type=click.Path(exists=True, file_okay=False),
+    help="Replay API traffic from this cassette directory (no network access)",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of documents to process concurrently (default: 1)",
+)
+@click.option(
+    "--pipeline",
+    is_flag=True,
+    help="Run fetch, chunk, extract, embed and upsert as concurrent stages",
+)
+@click.option(
+    "--stage-workers",
+    "stage_workers_spec",
+    metavar="STAGE=N,...",
+    help="Threads per pipeline stage, e.g. extract=8,embed=2 (implies --pipeline)",
+)
+@click.option(
+    "--asyncio",
+    "use_asyncio",
+    is_flag=True,
+    help="Process documents as tasks on one event loop (for large backfills)",
+)
+@click.option(
+    "--max-in-flight",
+    type=click.IntRange(min=1),
+    default=100,
+    help="With --asyncio, documents processed at once (default: 100)",
+)
+@click.option(
+    "--concurrency",
+    "concurrency_spec",
+    metavar="SERVICE=N,...",
+    help="With --asyncio, requests in flight per service, e.g. llm=32,embedding=8 "
+    "(services: fetch, llm, embedding, upsert; implies --asyncio)",
+)
+@click.option(
+    "--embedding-rpm",
+    type=click.IntRange(min=1),
+    help="With --asyncio, embedding requests allowed per minute (default: unlimited)",
+)
+@click.option(
+    "--embedding-tpm",
+    type=click.IntRange(min=1),
+    help="With --asyncio, embedded tokens allowed per minute (default: unlimited)",
+)
+@click.option(
+    "--discovery-max-age",
+    type=click.FloatRange(min=0),
+    default=24.0,
+    help="Hours discovered IDs and metadata are reused by later runs, which then "
+    "skip discovery (default: 24; 0 disables the discovery cache)",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Re-check documents already ingested and update those that changed "
+    "(unchanged documents are skipped without LLM or embedding calls)",
+)
 @click.option(
     "--verbose",
     is_flag=True,
     help="Enable verbose logging",
 )
 def scotus(
-    start_date, end_date, batch_size, progress_db, qdrant_db_path, dry_run, verbose
+    start_date,
+    end_date,
+    batch_size,
+    progress_db,
+    qdrant_db_path,
+    dry_run,
+    cache_dir,
+    no_cache,
+    embedding_cache_dir,
+    no_embedding_cache,
+    record_dir,
+    replay_dir,
+    workers,
+    pipeline,
+    stage_workers_spec,
+    use_asyncio,
+    max_in_flight,
+    concurrency_spec,
+    embedding_rpm,
+    embedding_tpm,
+    discovery_max_age,
+    refresh,
+    verbose,
 ):
     """
     Ingest Supreme Court opinions from CourtListener API.
 
     Fetches opinions within the specified date range, processes them through
     the document chunking and metadata extraction pipeline, generates embeddings,
-    and stores them in Qdrant for semantic search.
+    and stores them in Qdrant for semantic search. Most of the time per opinion
+    is spent waiting on the API, LLM and embedding calls, so --workers N
+    processes N opinions at once. --pipeline instead runs each step as its own
+    stage with bounded queues in between, and reports which stage is the
+    bottleneck. --asyncio processes opinions as tasks on a single event loop,
+    with separate concurrency limits for each external service, which scales
+    to hundreds of in-flight requests during a backfill. --embedding-rpm and
+    --embedding-tpm then keep the concurrent embedding requests within the
+    account's per-minute limits.
+
+    Discovered opinion IDs and their cluster metadata are kept next to the
+    progress database, so a run resumed within --discovery-max-age hours
+    skips discovery.
+
+    --refresh re-fetches opinions that were already ingested. Each is
+    fingerprinted (content, chunker, prompt and embedding model), and only
+    the stages whose inputs changed are redone: an unchanged opinion costs no
+    LLM or embedding calls, and a new prompt only rewrites stored metadata.
 
     Example:
         governmentreporter ingest scotus --start-date 2020-01-01 --end-date 2024-12-31
+        governmentreporter ingest scotus --start-date 2020-01-01 --end-date 2024-12-31 --workers 8
+        governmentreporter ingest scotus --start-date 2020-01-01 --end-date 2024-12-31 --stage-workers extract=8,embed=2
+        governmentreporter ingest scotus --start-date 1990-01-01 --end-date 2024-12-31 --asyncio --max-in-flight 200
+        governmentreporter ingest scotus --start-date 1990-01-01 --end-date 2024-12-31 --asyncio --concurrency embedding=16 --embedding-tpm 1000000
         governmentreporter ingest scotus --start-date 2020-01-01 --end-date 2024-12-31 --dry-run
+        governmentreporter ingest scotus --start-date 2020-01-01 --end-date 2024-12-31 --refresh
+        governmentreporter ingest scotus --start-date 2020-01-01 --end-date 2024-12-31 --no-cache
+        governmentreporter ingest scotus --start-date 2024-01-01 --end-date 2024-12-31 --record ./cassettes/scotus
+        governmentreporter ingest scotus --start-date 2024-01-01 --end-date 2024-12-31 --replay ./cassettes/scotus --dry-run
     """
     # Validate dates
     try:
@@ -82,21 +480,207 @@ def scotus(
         click.echo("Error: Dates must be in YYYY-MM-DD format", err=True)
         sys.exit(1)
 
+    cassette = _open_cassette(record_dir, replay_dir)
+    concurrency = _async_concurrency(
+        use_asyncio,
+        max_in_flight,
+        concurrency_spec,
+        threaded=workers > 1 or pipeline or bool(stage_workers_spec),
+    )
+
     # Import here to avoid loading heavy dependencies unless needed
-    from ..ingestion.scotus import SCOTUSIngester
+    from ..ingestion.scotus import AsyncSCOTUSIngester, SCOTUSIngester
+    from ..utils.monitoring import setup_logging
+
+    # Setup logging
+    setup_logging(verbose)
+
+    # Run ingestion
+    if concurrency is not None:
+        ingester = AsyncSCOTUSIngester(
+            start_date=start_date,
+            end_date=end_date,
+            batch_size=batch_size,
+            dry_run=dry_run,
+            progress_db=progress_db,
+            qdrant_db_path=qdrant_db_path,
+            http_cache=_open_http_cache(cache_dir, no_cache),
+            embedding_cache=_open_embedding_cache(
+                embedding_cache_dir, no_embedding_cache
+            ),
+            cassette=cassette,
+            refresh=refresh,
+            embedding_requests_per_minute=embedding_rpm,
+            embedding_tokens_per_minute=embedding_tpm,
+            **_discovery_options(progress_db, discovery_max_age),
+            **concurrency,
+        )
+    else:
+        ingester = SCOTUSIngester(
+            start_date=start_date,
+            end_date=end_date,
+            batch_size=batch_size,
+            dry_run=dry_run,
+            progress_db=progress_db,
+            qdrant_db_path=qdrant_db_path,
+            workers=workers,
+            stage_workers=_stage_workers(pipeline, stage_workers_spec),
+            http_cache=_open_http_cache(cache_dir, no_cache),
+            embedding_cache=_open_embedding_cache(
+                embedding_cache_dir, no_embedding_cache
+            ),
+            cassette=cassette,
+            refresh=refresh,
+            **_discovery_options(progress_db, discovery_max_age),
+        )
+
+    try:
+        ingester.run()
+    except KeyboardInterrupt:
+        click.echo("\n\nIngestion interrupted by user")
+        sys.exit(0)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@ingest.command("scotus-bulk")
+@click.option(
+    "--opinions",
+    "opinions_path",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="CourtListener opinions dump (.csv/.jsonl, optionally .bz2/.gz/.xz)",
+)
+@click.option(
+    "--clusters",
+    "clusters_path",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="CourtListener opinion clusters dump",
+)
+@click.option(
+    "--dockets",
+    "dockets_path",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="CourtListener dockets dump",
+)
+@click.option(
+    "--citations",
+    "citations_path",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Optional CourtListener citations dump",
+)
+@click.option(
+    "--start-date",
+    default="1789-01-01",
+    help="Start date for opinion range (YYYY-MM-DD, default: 1789-01-01)",
+)
+@click.option(
+    "--end-date",
+    default=lambda: datetime.now().strftime("%Y-%m-%d"),
+    help="End date for opinion range (YYYY-MM-DD, default: today)",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=50,
+    help="Number of opinions to process in each batch (default: 50)",
+)
+@click.option(
+    "--progress-db",
+    default="./data/progress/scotus_ingestion.db",
+    help="Path to SQLite progress database (default: ./data/progress/scotus_ingestion.db)",
+)
+@click.option(
+    "--qdrant-db-path",
+    default="./data/qdrant/qdrant_db",
+    help="Path to Qdrant database directory (default: ./data/qdrant/qdrant_db)",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Run without actually storing documents in Qdrant",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of documents to process concurrently (default: 1)",
+)
+@click.option(
+    "--pipeline",
+    is_flag=True,
+    help="Run fetch, chunk, extract, embed and upsert as concurrent stages",
+)
+@click.option(
+    "--stage-workers",
+    "stage_workers_spec",
+    metavar="STAGE=N,...",
+    help="Threads per pipeline stage, e.g. extract=8,embed=2 (implies --pipeline)",
+)
+@click.option(
+    "--verbose",
+    is_flag=True,
+    help="Enable verbose logging",
+)
+def scotus_bulk(
+    opinions_path,
+    clusters_path,
+    dockets_path,
+    citations_path,
+    start_date,
+    end_date,
+    batch_size,
+    progress_db,
+    qdrant_db_path,
+    dry_run,
+    workers,
+    pipeline,
+    stage_workers_spec,
+    verbose,
+):
+    """
+    Ingest Supreme Court opinions from CourtListener bulk data files.
+
+    Streams the dump files from local disk instead of calling the rate-limited
+    API, which makes full-history backfills practical. Shares the progress
+    database with `ingest scotus`, so already-ingested opinions are skipped.
+
+    Example:
+        governmentreporter ingest scotus-bulk --opinions opinions.csv.bz2 --clusters opinion-clusters.csv.bz2 --dockets dockets.csv.bz2
+        governmentreporter ingest scotus-bulk --opinions opinions.csv.bz2 --clusters opinion-clusters.csv.bz2 --dockets dockets.csv.bz2 --start-date 2000-01-01 --dry-run
+    """
+    # Validate dates
+    try:
+        datetime.strptime(start_date, "%Y-%m-%d")
+        datetime.strptime(end_date, "%Y-%m-%d")
+    except ValueError:
+        click.echo("Error: Dates must be in YYYY-MM-DD format", err=True)
+        sys.exit(1)
+
+    # Import here to avoid loading heavy dependencies unless needed
+    from ..ingestion.courtlistener_bulk import CourtListenerBulkIngester
     from ..utils.monitoring import setup_logging
 
     # Setup logging
     setup_logging(verbose)
 
     # Run ingestion
-    ingester = SCOTUSIngester(
+    ingester = CourtListenerBulkIngester(
+        opinions_path=opinions_path,
+        clusters_path=clusters_path,
+        dockets_path=dockets_path,
+        citations_path=citations_path,
         start_date=start_date,
         end_date=end_date,
         batch_size=batch_size,
         dry_run=dry_run,
         progress_db=progress_db,
         qdrant_db_path=qdrant_db_path,
+        workers=workers,
+        stage_workers=_stage_workers(pipeline, stage_workers_spec),
     )
 
     try:
@@ -141,22 +725,144 @@ def scotus(
     is_flag=True,
     help="Run without actually storing documents in Qdrant",
 )
+@click.option(
+    "--cache-dir",
+    default="./data/cache/http",
+    help="Directory for the on-disk HTTP response cache (default: ./data/cache/http)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Disable the HTTP response cache and always download from the API",
+)
+@click.option(
+    "--embedding-cache-dir",
+    default="./data/cache/embeddings",
+    help="Directory for the on-disk embedding cache "
+    "(default: ./data/cache/embeddings)",
+)
+@click.option(
+    "--no-embedding-cache",
+    is_flag=True,
+    help="Disable the embedding cache and embed every chunk with the API",
+)
+@click.option(
+    "--record",
+    "record_dir",
+    type=click.Path(file_okay=False),
+    help="Record all API traffic to this cassette directory",
+)
+@click.option(
+    "--replay",
+    "replay_dir",
+    type=click.Path(exists=True, file_okay=False),
+    help="Replay API traffic from this cassette directory (no network access)",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of documents to process concurrently (default: 1)",
+)
+@click.option(
+    "--pipeline",
+    is_flag=True,
+    help="Run fetch, chunk, extract, embed and upsert as concurrent stages",
+)
+@click.option(
+    "--stage-workers",
+    "stage_workers_spec",
+    metavar="STAGE=N,...",
+    help="Threads per pipeline stage, e.g. extract=8,embed=2 (implies --pipeline)",
+)
+@click.option(
+    "--asyncio",
+    "use_asyncio",
+    is_flag=True,
+    help="Process documents as tasks on one event loop (for large backfills)",
+)
+@click.option(
+    "--max-in-flight",
+    type=click.IntRange(min=1),
+    default=100,
+    help="With --asyncio, documents processed at once (default: 100)",
+)
+@click.option(
+    "--concurrency",
+    "concurrency_spec",
+    metavar="SERVICE=N,...",
+    help="With --asyncio, requests in flight per service, e.g. llm=32,embedding=8 "
+    "(services: fetch, llm, embedding, upsert; implies --asyncio)",
+)
+@click.option(
+    "--embedding-rpm",
+    type=click.IntRange(min=1),
+    help="With --asyncio, embedding requests allowed per minute (default: unlimited)",
+)
+@click.option(
+    "--embedding-tpm",
+    type=click.IntRange(min=1),
+    help="With --asyncio, embedded tokens allowed per minute (default: unlimited)",
+)
+@click.option(
+    "--discovery-max-age",
+    type=click.FloatRange(min=0),
+    default=24.0,
+    help="Hours discovered IDs and metadata are reused by later runs, which then "
+    "skip discovery (default: 24; 0 disables the discovery cache)",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Re-check documents already ingested and update those that changed "
+    "(unchanged documents are skipped without LLM or embedding calls)",
+)
 @click.option(
     "--verbose",
     is_flag=True,
     help="Enable verbose logging",
 )
-def eo(start_date, end_date, batch_size, progress_db, qdrant_db_path, dry_run, verbose):
+def eo(
+    start_date,
+    end_date,
+    batch_size,
+    progress_db,
+    qdrant_db_path,
+    dry_run,
+    cache_dir,
+    no_cache,
+    embedding_cache_dir,
+    no_embedding_cache,
+    record_dir,
+    replay_dir,
+    workers,
+    pipeline,
+    stage_workers_spec,
+    use_asyncio,
+    max_in_flight,
+    concurrency_spec,
+    embedding_rpm,
+    embedding_tpm,
+    discovery_max_age,
+    refresh,
+    verbose,
+):
     """
     Ingest Executive Orders from Federal Register API.
 
     Fetches Executive Orders within the specified date range, processes them
     through the document chunking and metadata extraction pipeline, generates
-    embeddings, and stores them in Qdrant for semantic search.
+    embeddings, and stores them in Qdrant for semantic search. Discovered
+    orders are kept next to the progress database, so a run resumed within
+    --discovery-max-age hours skips discovery. --refresh re-checks orders
+    already ingested and redoes only the work their changes require (see
+    `ingest scotus`).
 
     Example:
         governmentreporter ingest eo --start-date 2021-01-20 --end-date 2024-12-31
         governmentreporter ingest eo --start-date 2021-01-20 --end-date 2024-12-31 --dry-run
+        governmentreporter ingest eo --start-date 2021-01-20 --end-date 2024-12-31 --refresh
+        governmentreporter ingest eo --start-date 2001-01-20 --end-date 2024-12-31 --asyncio --concurrency llm=32
     """
     # Validate dates
     try:
@@ -170,21 +876,184 @@ def eo(start_date, end_date, batch_size, progress_db, qdrant_db_path, dry_run, v
         click.echo("Error: Dates must be in YYYY-MM-DD format", err=True)
         sys.exit(1)
 
+    cassette = _open_cassette(record_dir, replay_dir)
+    concurrency = _async_concurrency(
+        use_asyncio,
+        max_in_flight,
+        concurrency_spec,
+        threaded=workers > 1 or pipeline or bool(stage_workers_spec),
+    )
+
     # Import here to avoid loading heavy dependencies unless needed
-    from ..ingestion.executive_orders import ExecutiveOrderIngester
+    from ..ingestion.executive_orders import (
+        AsyncExecutiveOrderIngester,
+        ExecutiveOrderIngester,
+    )
     from ..utils.monitoring import setup_logging
 
     # Setup logging
     setup_logging(verbose)
 
     # Run ingestion
-    ingester = ExecutiveOrderIngester(
+    if concurrency is not None:
+        ingester = AsyncExecutiveOrderIngester(
+            start_date=start_date,
+            end_date=end_date,
+            batch_size=batch_size,
+            dry_run=dry_run,
+            progress_db=progress_db,
+            qdrant_db_path=qdrant_db_path,
+            http_cache=_open_http_cache(cache_dir, no_cache),
+            embedding_cache=_open_embedding_cache(
+                embedding_cache_dir, no_embedding_cache
+            ),
+            cassette=cassette,
+            refresh=refresh,
+            embedding_requests_per_minute=embedding_rpm,
+            embedding_tokens_per_minute=embedding_tpm,
+            **_discovery_options(progress_db, discovery_max_age),
+            **concurrency,
+        )
+    else:
+        ingester = ExecutiveOrderIngester(
+            start_date=start_date,
+            end_date=end_date,
+            batch_size=batch_size,
+            dry_run=dry_run,
+            progress_db=progress_db,
+            qdrant_db_path=qdrant_db_path,
+            workers=workers,
+            stage_workers=_stage_workers(pipeline, stage_workers_spec),
+            http_cache=_open_http_cache(cache_dir, no_cache),
+            embedding_cache=_open_embedding_cache(
+                embedding_cache_dir, no_embedding_cache
+            ),
+            cassette=cassette,
+            refresh=refresh,
+            **_discovery_options(progress_db, discovery_max_age),
+        )
+
+    try:
+        ingester.run()
+    except KeyboardInterrupt:
+        click.echo("\n\nIngestion interrupted by user")
+        sys.exit(0)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@ingest.command("eo-bulk")
+@click.option(
+    "--xml-dir",
+    required=True,
+    type=click.Path(exists=True, file_okay=False),
+    help="Directory of Federal Register daily issue XML files or .zip packages",
+)
+@click.option(
+    "--start-date",
+    default="1994-01-01",
+    help="Start date for signing date range (YYYY-MM-DD, default: 1994-01-01)",
+)
+@click.option(
+    "--end-date",
+    default=lambda: datetime.now().strftime("%Y-%m-%d"),
+    help="End date for signing date range (YYYY-MM-DD, default: today)",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=25,
+    help="Number of orders to process in each batch (default: 25)",
+)
+@click.option(
+    "--progress-db",
+    default="./data/progress/executive_orders_ingestion.db",
+    help="Path to SQLite progress database (default: ./data/progress/executive_orders_ingestion.db)",
+)
+@click.option(
+    "--qdrant-db-path",
+    default="./data/qdrant/qdrant_db",
+    help="Path to Qdrant database directory (default: ./data/qdrant/qdrant_db)",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Run without actually storing documents in Qdrant",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of documents to process concurrently (default: 1)",
+)
+@click.option(
+    "--pipeline",
+    is_flag=True,
+    help="Run fetch, chunk, extract, embed and upsert as concurrent stages",
+)
+@click.option(
+    "--stage-workers",
+    "stage_workers_spec",
+    metavar="STAGE=N,...",
+    help="Threads per pipeline stage, e.g. extract=8,embed=2 (implies --pipeline)",
+)
+@click.option(
+    "--verbose",
+    is_flag=True,
+    help="Enable verbose logging",
+)
+def eo_bulk(
+    xml_dir,
+    start_date,
+    end_date,
+    batch_size,
+    progress_db,
+    qdrant_db_path,
+    dry_run,
+    workers,
+    pipeline,
+    stage_workers_spec,
+    verbose,
+):
+    """
+    Ingest Executive Orders from Federal Register bulk XML files.
+
+    Reads the daily issue XML published on govinfo.gov (FR bulk data) from
+    local disk instead of calling the Federal Register API for each order.
+    Shares the progress database with `ingest eo`, so already-ingested
+    orders are skipped.
+
+    Example:
+        governmentreporter ingest eo-bulk --xml-dir ./data/fr-bulk
+        governmentreporter ingest eo-bulk --xml-dir ./data/fr-bulk --start-date 2021-01-20 --dry-run
+    """
+    # Validate dates
+    try:
+        datetime.strptime(start_date, "%Y-%m-%d")
+        datetime.strptime(end_date, "%Y-%m-%d")
+    except ValueError:
+        click.echo("Error: Dates must be in YYYY-MM-DD format", err=True)
+        sys.exit(1)
+
+    # Import here to avoid loading heavy dependencies unless needed
+    from ..ingestion.executive_orders_xml import ExecutiveOrderXMLIngester
+    from ..utils.monitoring import setup_logging
+
+    # Setup logging
+    setup_logging(verbose)
+
+    # Run ingestion
+    ingester = ExecutiveOrderXMLIngester(
+        xml_dir=xml_dir,
         start_date=start_date,
         end_date=end_date,
         batch_size=batch_size,
         dry_run=dry_run,
         progress_db=progress_db,
         qdrant_db_path=qdrant_db_path,
+        workers=workers,
+        stage_workers=_stage_workers(pipeline, stage_workers_spec),
     )
 
     try:
@@ -218,22 +1087,123 @@ def eo(start_date, end_date, batch_size, progress_db, qdrant_db_path, dry_run, v
     is_flag=True,
     help="Run without actually storing documents in Qdrant",
 )
+@click.option(
+    "--cache-dir",
+    default="./data/cache/http",
+    help="Directory for the on-disk HTTP response cache (default: ./data/cache/http)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Disable the HTTP response cache and always download from the API",
+)
+@click.option(
+    "--embedding-cache-dir",
+    default="./data/cache/embeddings",
+    help="Directory for the on-disk embedding cache "
+    "(default: ./data/cache/embeddings)",
+)
+@click.option(
+    "--no-embedding-cache",
+    is_flag=True,
+    help="Disable the embedding cache and embed every chunk with the API",
+)
+@click.option(
+    "--record",
+    "record_dir",
+    type=click.Path(file_okay=False),
+    help="Record all API traffic to this cassette directory",
+)
+@click.option(
+    "--replay",
+    "replay_dir",
+    type=click.Path(exists=True, file_okay=False),
+    help="Replay API traffic from this cassette directory (no network access)",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of documents to process concurrently (default: 1)",
+)
+@click.option(
+    "--pipeline",
+    is_flag=True,
+    help="Run fetch, chunk, extract, embed and upsert as concurrent stages",
+)
+@click.option(
+    "--stage-workers",
+    "stage_workers_spec",
+    metavar="STAGE=N,...",
+    help="Threads per pipeline stage, e.g. extract=8,embed=2 (implies --pipeline)",
+)
+@click.option(
+    "--concurrent",
+    is_flag=True,
+    help="Run SCOTUS and Executive Order ingestion at the same time",
+)
+@click.option(
+    "--openai-concurrency",
+    type=click.IntRange(min=1),
+    help=(
+        "Maximum OpenAI requests in flight across both ingesters "
+        f"(default: {DEFAULT_OPENAI_CONCURRENCY} with --concurrent, else unlimited)"
+    ),
+)
+@click.option(
+    "--discovery-max-age",
+    type=click.FloatRange(min=0),
+    default=24.0,
+    help="Hours discovered IDs and metadata are reused by later runs, which then "
+    "skip discovery (default: 24; 0 disables the discovery cache)",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Re-check documents already ingested and update those that changed "
+    "(unchanged documents are skipped without LLM or embedding calls)",
+)
 @click.option(
     "--verbose",
     is_flag=True,
     help="Enable verbose logging",
 )
-def all(start_date, end_date, qdrant_db_path, dry_run, verbose):
+def all(
+    start_date,
+    end_date,
+    qdrant_db_path,
+    dry_run,
+    cache_dir,
+    no_cache,
+    embedding_cache_dir,
+    no_embedding_cache,
+    record_dir,
+    replay_dir,
+    workers,
+    pipeline,
+    stage_workers_spec,
+    concurrent,
+    openai_concurrency,
+    discovery_max_age,
+    refresh,
+    verbose,
+):
     """
-    Ingest both Supreme Court opinions and Executive Orders sequentially.
+    Ingest both Supreme Court opinions and Executive Orders.
 
     Runs SCOTUS ingestion first, then Executive Order ingestion for the same
     date range. Uses default batch sizes (50 for SCOTUS, 25 for EO). If SCOTUS
     ingestion fails, EO ingestion will not run.
 
+    With --concurrent both run at the same time, since they use different
+    source APIs; a full refresh then takes about as long as the slower of
+    the two. They share one OpenAI request budget (--openai-concurrency)
+    and one progress line, and a failure of one does not stop the other.
+
     Example:
         governmentreporter ingest all --start-date 2024-01-01 --end-date 2024-12-31
         governmentreporter ingest all --start-date 2024-01-01 --end-date 2024-12-31 --dry-run
+        governmentreporter ingest all --start-date 2024-01-01 --end-date 2024-12-31 --concurrent
     """
     # Validate dates
     try:
@@ -247,20 +1217,29 @@ def all(start_date, end_date, qdrant_db_path, dry_run, verbose):
         click.echo("Error: Dates must be in YYYY-MM-DD format", err=True)
         sys.exit(1)
 
+    cassette = _open_cassette(record_dir, replay_dir)
+
     # Import here to avoid loading heavy dependencies unless needed
     from ..database.qdrant import QdrantDBClient
     from ..ingestion.executive_orders import ExecutiveOrderIngester
     from ..ingestion.scotus import SCOTUSIngester
+    from ..utils.concurrency import openai_budget
     from ..utils.monitoring import setup_logging
 
     # Setup logging
     setup_logging(verbose)
 
+    if openai_concurrency is None and concurrent:
+        openai_concurrency = DEFAULT_OPENAI_CONCURRENCY
+    openai_budget.set_limit(openai_concurrency)
+
     click.echo("=" * 80)
     click.echo("INGESTING ALL DOCUMENTS")
     click.echo("=" * 80)
     click.echo(f"Date Range: {start_date} to {end_date}")
     click.echo(f"Dry Run: {dry_run}")
+    if concurrent:
+        click.echo(f"Mode: concurrent (OpenAI concurrency {openai_concurrency})")
     click.echo("=" * 80)
 
     # Create a shared Qdrant database client
@@ -269,6 +1248,27 @@ def all(start_date, end_date, qdrant_db_path, dry_run, verbose):
     # their own collections
     shared_db_client = QdrantDBClient(db_path=qdrant_db_path)
 
+    # One HTTP cache, embedding cache and cassette serve both ingesters
+    http_cache = _open_http_cache(cache_dir, no_cache)
+    embedding_cache = _open_embedding_cache(embedding_cache_dir, no_embedding_cache)
+
+    if concurrent:
+        _ingest_all_concurrently(
+            discovery_max_age,
+            start_date=start_date,
+            end_date=end_date,
+            dry_run=dry_run,
+            qdrant_db_path=qdrant_db_path,
+            workers=workers,
+            stage_workers=_stage_workers(pipeline, stage_workers_spec),
+            shared_db_client=shared_db_client,
+            http_cache=http_cache,
+            embedding_cache=embedding_cache,
+            cassette=cassette,
+            refresh=refresh,
+        )
+        return
+
     # 1. Run SCOTUS ingestion
     click.echo("\n[1/2] Running SCOTUS Opinion Ingestion...")
     click.echo("-" * 80)
@@ -278,9 +1278,16 @@ def all(start_date, end_date, qdrant_db_path, dry_run, verbose):
             end_date=end_date,
             batch_size=50,  # Default batch size
             dry_run=dry_run,
-            progress_db="./data/progress/scotus_ingestion.db",
+            progress_db=SCOTUS_PROGRESS_DB,
             qdrant_db_path=qdrant_db_path,
+            workers=workers,
+            stage_workers=_stage_workers(pipeline, stage_workers_spec),
             shared_db_client=shared_db_client,
+            http_cache=http_cache,
+            embedding_cache=embedding_cache,
+            cassette=cassette,
+            refresh=refresh,
+            **_discovery_options(SCOTUS_PROGRESS_DB, discovery_max_age),
         )
         scotus_ingester.run()
         click.echo("\n✓ SCOTUS ingestion completed successfully")
@@ -301,9 +1308,16 @@ def all(start_date, end_date, qdrant_db_path, dry_run, verbose):
             end_date=end_date,
             batch_size=25,  # Default batch size
             dry_run=dry_run,
-            progress_db="./data/progress/executive_orders_ingestion.db",
+            progress_db=EO_PROGRESS_DB,
             qdrant_db_path=qdrant_db_path,
+            workers=workers,
+            stage_workers=_stage_workers(pipeline, stage_workers_spec),
             shared_db_client=shared_db_client,
+            http_cache=http_cache,
+            embedding_cache=embedding_cache,
+            cassette=cassette,
+            refresh=refresh,
+            **_discovery_options(EO_PROGRESS_DB, discovery_max_age),
         )
         eo_ingester.run()
         click.echo("\n✓ Executive Order ingestion completed successfully")
@@ -14,6 +14,7 @@ from .delete import delete_command
 from .info import info
 from .ingest import ingest
 from .query import query
+from .reprocess import reprocess
 from .server import server
 
 
@@ -105,6 +106,7 @@ main.add_command(server)
 main.add_command(query)
 main.add_command(info)
 main.add_command(delete_command)
+main.add_command(reprocess)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,115 @@
+"""
+Reprocess command for repairing failed LLM metadata extraction.
+
+Documents whose LLM extraction failed during ingestion are stored with
+fallback metadata and flagged requires_reprocessing. This command re-runs
+only the extraction for them and updates the metadata of their stored
+chunks in place, without refetching or re-embedding anything.
+
+Commands:
+    governmentreporter reprocess             Repair both collections
+    governmentreporter reprocess --scotus    Repair Supreme Court opinions only
+    governmentreporter reprocess --eo        Repair Executive Orders only
+"""
+
+import sys
+
+import click
+
+# CLI flag -> collection name
+COLLECTIONS = {
+    "scotus": "supreme_court_opinions",
+    "eo": "executive_orders",
+}
+
+
+@click.command()
+@click.option(
+    "--scotus",
+    is_flag=True,
+    help="Reprocess the Supreme Court opinions collection",
+)
+@click.option(
+    "--eo",
+    is_flag=True,
+    help="Reprocess the Executive Orders collection",
+)
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    help="Maximum documents to reprocess per collection",
+)
+@click.option(
+    "--qdrant-db-path",
+    default="./data/qdrant/qdrant_db",
+    help="Path to Qdrant database",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Only count the flagged documents",
+)
+@click.option(
+    "--verbose",
+    is_flag=True,
+    help="Enable verbose logging",
+)
+def reprocess(scotus, eo, limit, qdrant_db_path, dry_run, verbose):
+    """
+    Re-run LLM metadata extraction for documents flagged requires_reprocessing.
+
+    Finds the flagged documents with a filtered scroll over the collection,
+    rebuilds each document's text from its stored chunks and extracts its
+    metadata again. The new metadata is written onto every chunk with a
+    payload-only update, so a repair costs one LLM call per document and no
+    API fetches or embeddings. Documents whose extraction fails again keep
+    their flag for the next run. Without --scotus or --eo both collections
+    are reprocessed.
+
+    Example:
+        governmentreporter reprocess
+        governmentreporter reprocess --scotus --limit 50
+        governmentreporter reprocess --eo --dry-run
+    """
+    selected = [flag for flag, chosen in (("scotus", scotus), ("eo", eo)) if chosen]
+
+    # Import here to avoid loading heavy dependencies unless needed
+    from ..database.qdrant import QdrantDBClient
+    from ..ingestion.reprocess import MetadataReprocessor
+    from ..utils.monitoring import setup_logging
+
+    setup_logging(verbose)
+
+    # Local Qdrant storage allows one client, so both collections share it
+    shared_db_client = QdrantDBClient(db_path=qdrant_db_path)
+
+    failed = False
+    for flag in selected or list(COLLECTIONS):
+        collection_name = COLLECTIONS[flag]
+        if collection_name not in shared_db_client.list_collections():
+            click.echo(f"\n{collection_name}: collection not found, skipping")
+            continue
+
+        reprocessor = MetadataReprocessor(
+            collection_name,
+            shared_db_client=shared_db_client,
+            dry_run=dry_run,
+        )
+        try:
+            counts = reprocessor.run(limit=limit)
+        except KeyboardInterrupt:
+            click.echo("\n\nReprocessing interrupted by user")
+            sys.exit(0)
+        except Exception as e:
+            click.echo(f"Error reprocessing {collection_name}: {e}", err=True)
+            sys.exit(1)
+
+        click.echo(f"\n{collection_name}: {counts['flagged']} flagged documents")
+        if not dry_run and counts["flagged"]:
+            click.echo(f"  Repaired: {counts['repaired']}")
+            click.echo(f"  Still failing: {counts['still failing']}")
+            click.echo(f"  Update failed: {counts['failed']}")
+        failed = failed or counts["failed"] > 0
+
+    if failed:
+        sys.exit(1)
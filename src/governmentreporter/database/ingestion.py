@@ -16,17 +16,170 @@ Python Learning Notes:
     - Adapter pattern: Converts between different data formats
     - Composition over inheritance: Uses QdrantClient internally
     - Batch processing: Improves performance for large datasets
+    - AsyncQdrantIngestionClient is the asyncio counterpart, built on
+      qdrant_client.AsyncQdrantClient
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 from uuid import uuid4
 
-from .qdrant import Document, QdrantDBClient
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    DeletePayload,
+    DeletePayloadOperation,
+    FieldCondition,
+    Filter,
+    FilterSelector,
+    MatchValue,
+    Range,
+    SetPayload,
+    SetPayloadOperation,
+    UpdateOperation,
+    VectorParams,
+)
+
+from .qdrant import Document, QdrantDBClient, build_point, point_id
 
 logger = logging.getLogger(__name__)
 
 
+def payloads_to_documents(
+    payloads: List[Dict[str, Any]], embeddings: List[List[float]]
+) -> Tuple[List[Document], int]:
+    """
+    Convert build_payloads_from_document() payloads into Qdrant Documents.
+
+    Args:
+        payloads: Chunk payloads ({"id", "text", "metadata", ...})
+        embeddings: Corresponding embedding vectors
+
+    Returns:
+        Tuple of (documents, number of payloads that could not be converted)
+    """
+    failed = 0
+    documents = []
+
+    # Convert payloads to Document format
+    for i, (payload, embedding) in enumerate(zip(payloads, embeddings)):
+        try:
+            # Extract text from payload
+            # The payload structure from build_payloads_from_document is:
+            # {"id": chunk_id, "text": chunk_text, "metadata": {...}, "embedding": []}
+            chunk_text = payload.get("text", "")
+
+            # Use the chunk_id from the payload (already includes document_id + chunk index)
+            # Fallback: if no id in payload, use document_id + index
+            chunk_id = payload.get("id")
+            if not chunk_id:
+                doc_id = payload.get("document_id", str(uuid4()))
+                chunk_index = payload.get("metadata", {}).get("chunk_index", i)
+                chunk_id = f"{doc_id}_chunk_{chunk_index}"
+
+            # Create Document object
+            # Build metadata by combining:
+            # 1. Fields from the payload's metadata dict
+            # 2. Any additional top-level fields (except id, text, embedding)
+            # This handles both production payloads (all in metadata) and test payloads
+            payload_metadata = payload.get("metadata", {})
+
+            # Handle case where metadata is not a dict (invalid but should not crash)
+            if isinstance(payload_metadata, dict):
+                metadata = payload_metadata.copy()
+            else:
+                logger.warning(
+                    f"Payload {i} has non-dict metadata: {type(payload_metadata)}"
+                )
+                metadata = {}
+
+            # Add any top-level fields that aren't id/text/embedding/metadata
+            for key, value in payload.items():
+                if key not in ("id", "text", "embedding", "metadata"):
+                    metadata[key] = value
+
+            doc = Document(
+                id=chunk_id,
+                text=chunk_text,
+                embedding=embedding,
+                metadata=metadata,
+            )
+            documents.append(doc)
+
+        except Exception as e:
+            logger.error(f"Failed to convert payload {i}: {e}")
+            failed += 1
+            continue
+
+    return documents, failed
+
+
+def set_payload_operations(
+    payloads: List[Dict[str, Any]],
+    remove_keys: Sequence[str] = (),
+) -> List[UpdateOperation]:
+    """
+    Build the operations that overwrite stored chunks' metadata with payloads'.
+
+    Each chunk's metadata is assembled as in payloads_to_documents(); the
+    stored text, vector and any keys not in the payload are left alone.
+
+    Args:
+        payloads: Chunk payloads ({"id", "text", "metadata", ...}) of stored chunks
+        remove_keys: Stored keys to delete from a chunk unless its payload
+                     sets them (e.g. flags that no longer apply)
+
+    Returns:
+        Set-payload (and delete-payload) operations, for batch_update_points()
+    """
+    operations: List[UpdateOperation] = []
+    for payload in payloads:
+        metadata = dict(payload.get("metadata") or {})
+        for key, value in payload.items():
+            if key not in ("id", "text", "embedding", "metadata"):
+                metadata[key] = value
+        points = [point_id(payload["id"])]
+        operations.append(
+            SetPayloadOperation(set_payload=SetPayload(payload=metadata, points=points))
+        )
+        stale = [key for key in remove_keys if key not in metadata]
+        if stale:
+            operations.append(
+                DeletePayloadOperation(
+                    delete_payload=DeletePayload(keys=stale, points=points)
+                )
+            )
+    return operations
+
+
+def stale_chunks_filter(chunk_counts: Mapping[str, int]) -> Filter:
+    """
+    Build a filter matching chunks left over from longer versions of documents.
+
+    A rebuilt document that now has fewer chunks overwrites chunks 0..n-1
+    (point IDs are derived from chunk IDs), but its old chunks n.. would
+    otherwise stay in the collection and keep turning up in searches.
+
+    Args:
+        chunk_counts: Current number of chunks by document ID
+
+    Returns:
+        Filter matching every stored chunk with chunk_index at or beyond its
+        document's chunk count
+    """
+    return Filter(
+        should=[
+            Filter(
+                must=[
+                    FieldCondition(key="document_id", match=MatchValue(value=doc_id)),
+                    FieldCondition(key="chunk_index", range=Range(gte=count)),
+                ]
+            )
+            for doc_id, count in chunk_counts.items()
+        ]
+    )
+
+
 class QdrantIngestionClient:
     """
     Specialized client for ingesting document chunks into Qdrant.
@@ -176,59 +329,8 @@ class QdrantIngestionClient:
         if not payloads:
             return 0, 0
 
+        documents, failed = payloads_to_documents(payloads, embeddings)
         successful = 0
-        failed = 0
-        documents = []
-
-        # Convert payloads to Document format
-        for i, (payload, embedding) in enumerate(zip(payloads, embeddings)):
-            try:
-                # Extract text from payload
-                # The payload structure from build_payloads_from_document is:
-                # {"id": chunk_id, "text": chunk_text, "metadata": {...}, "embedding": []}
-                chunk_text = payload.get("text", "")
-
-                # Use the chunk_id from the payload (already includes document_id + chunk index)
-                # Fallback: if no id in payload, use document_id + index
-                chunk_id = payload.get("id")
-                if not chunk_id:
-                    doc_id = payload.get("document_id", str(uuid4()))
-                    chunk_index = payload.get("metadata", {}).get("chunk_index", i)
-                    chunk_id = f"{doc_id}_chunk_{chunk_index}"
-
-                # Create Document object
-                # Build metadata by combining:
-                # 1. Fields from the payload's metadata dict
-                # 2. Any additional top-level fields (except id, text, embedding)
-                # This handles both production payloads (all in metadata) and test payloads
-                payload_metadata = payload.get("metadata", {})
-
-                # Handle case where metadata is not a dict (invalid but should not crash)
-                if isinstance(payload_metadata, dict):
-                    metadata = payload_metadata.copy()
-                else:
-                    logger.warning(
-                        f"Payload {i} has non-dict metadata: {type(payload_metadata)}"
-                    )
-                    metadata = {}
-
-                # Add any top-level fields that aren't id/text/embedding/metadata
-                for key, value in payload.items():
-                    if key not in ("id", "text", "embedding", "metadata"):
-                        metadata[key] = value
-
-                doc = Document(
-                    id=chunk_id,
-                    text=chunk_text,
-                    embedding=embedding,
-                    metadata=metadata,
-                )
-                documents.append(doc)
-
-            except Exception as e:
-                logger.error(f"Failed to convert payload {i}: {e}")
-                failed += 1
-                continue
 
         # Store documents in batches
         if documents:
@@ -258,6 +360,143 @@ class QdrantIngestionClient:
 
         return successful, failed
 
+    def get_payloads(self, chunk_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch the stored payloads of chunks, without their vectors.
+
+        Args:
+            chunk_ids (List[str]): Chunk IDs (the "id" of their payloads)
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Stored payload (text and metadata) by
+                chunk ID; chunks that are not stored are missing
+        """
+        points = self.client.client.retrieve(
+            collection_name=self.collection_name,
+            ids=[point_id(chunk_id) for chunk_id in chunk_ids],
+            with_payload=True,
+            with_vectors=False,
+        )
+        return {
+            point.payload.get("original_id", str(point.id)): point.payload
+            for point in points
+            if point.payload
+        }
+
+    def update_payloads(
+        self, payloads: List[Dict[str, Any]], remove_keys: Sequence[str] = ()
+    ) -> bool:
+        """
+        Overwrite the metadata of stored chunks, keeping their text and vectors.
+
+        All chunks are updated in one request, so re-extracted metadata can be
+        written without re-embedding or re-upserting the chunks.
+
+        Args:
+            payloads (List[Dict[str, Any]]): Payloads of chunks already stored
+            remove_keys (Sequence[str]): Stored keys to delete from chunks
+                whose payload does not set them
+
+        Returns:
+            bool: True if Qdrant acknowledged the update
+        """
+        if not payloads:
+            return True
+
+        try:
+            self.client.client.batch_update_points(
+                collection_name=self.collection_name,
+                update_operations=set_payload_operations(payloads, remove_keys),
+                wait=True,
+            )
+        except Exception as e:
+            logger.error(f"Payload update failed: {e}")
+            return False
+
+        logger.info(f"Updated metadata of {len(payloads)} chunks")
+        return True
+
+    def delete_stale_chunks(self, chunk_counts: Mapping[str, int]) -> bool:
+        """
+        Delete the chunks of rebuilt documents beyond their new chunk count.
+
+        Args:
+            chunk_counts (Mapping[str, int]): Current number of chunks by
+                document ID (see stale_chunks_filter())
+
+        Returns:
+            bool: True if Qdrant acknowledged the delete
+        """
+        if not chunk_counts:
+            return True
+
+        try:
+            self.client.client.delete(
+                collection_name=self.collection_name,
+                points_selector=FilterSelector(
+                    filter=stale_chunks_filter(chunk_counts)
+                ),
+                wait=True,
+            )
+        except Exception as e:
+            logger.error(f"Deleting stale chunks failed: {e}")
+            return False
+        return True
+
+    def _scroll(
+        self, scroll_filter: Filter, with_payload: Any = True, page_size: int = 256
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the payloads of all points matching a filter, page by page."""
+        offset = None
+        while True:
+            points, offset = self.client.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=scroll_filter,
+                limit=page_size,
+                offset=offset,
+                with_payload=with_payload,
+                with_vectors=False,
+            )
+            for point in points:
+                yield point.payload or {}
+            if offset is None:
+                return
+
+    def flagged_document_ids(self, flag: str = "requires_reprocessing") -> List[str]:
+        """
+        Find the documents whose chunks carry a boolean flag set to True.
+
+        Only the document_id of each matching chunk is read, so the scroll is
+        cheap even when many chunks are flagged.
+
+        Args:
+            flag (str): Payload key to filter on
+
+        Returns:
+            List[str]: Distinct document IDs, in the order first seen
+        """
+        flagged = Filter(must=[FieldCondition(key=flag, match=MatchValue(value=True))])
+        document_ids: Dict[str, None] = {}
+        for payload in self._scroll(flagged, with_payload=["document_id"]):
+            if payload.get("document_id"):
+                document_ids[str(payload["document_id"])] = None
+        return list(document_ids)
+
+    def get_document_payloads(self, document_id: str) -> List[Dict[str, Any]]:
+        """
+        Fetch the stored payloads of all chunks of a document, without vectors.
+
+        Args:
+            document_id (str): The document's ID (document_id in the payloads)
+
+        Returns:
+            List[Dict[str, Any]]: Stored payloads ordered by chunk_index
+        """
+        match = MatchValue(value=document_id)
+        same_document = Filter(must=[FieldCondition(key="document_id", match=match)])
+        payloads = list(self._scroll(same_document))
+        return sorted(payloads, key=lambda payload: payload.get("chunk_index", 0))
+
     def get_collection_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the collection.
@@ -315,3 +554,230 @@ class QdrantIngestionClient:
                 "total_documents": 0,
                 "error": str(e),
             }
+
+
+class AsyncQdrantIngestionClient:
+    """
+    Asyncio counterpart of QdrantIngestionClient built on AsyncQdrantClient.
+
+    Payloads are converted exactly as in QdrantIngestionClient. Sub-batches of
+    one batch_upsert_documents() call are upserted concurrently, with a
+    semaphore bounding how many upserts are in flight across all calls.
+
+    Local storage only allows one client per path, so an async ingester must
+    not share its db_path with a QdrantDBClient in the same process.
+
+    Attributes:
+        collection_name (str): Name of the Qdrant collection to use
+        client (AsyncQdrantClient): The underlying async Qdrant client
+        max_concurrency (int): Maximum upserts in flight
+
+    Example:
+        client = AsyncQdrantIngestionClient("executive_orders", db_path)
+        await client.create_collection()
+        success, failed = await client.batch_upsert_documents(payloads, embeddings)
+        await client.close()
+    """
+
+    def __init__(
+        self,
+        collection_name: str,
+        db_path: str = "./data/qdrant/qdrant_db",
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        max_concurrency: int = 2,
+    ):
+        """
+        Initialize the async ingestion client for a specific collection.
+
+        Args:
+            collection_name (str): Name of the collection to store documents in
+            db_path (str): Path to the local Qdrant database directory
+            url (Optional[str]): Remote Qdrant URL; db_path is ignored when set
+            api_key (Optional[str]): API key for remote Qdrant
+            max_concurrency (int): Maximum upserts in flight
+
+        Raises:
+            ValueError: If collection_name is empty
+        """
+        if not collection_name:
+            raise ValueError("collection_name is required")
+
+        self.collection_name = collection_name
+        if url:
+            self.client = AsyncQdrantClient(url=url, api_key=api_key)
+        else:
+            self.client = AsyncQdrantClient(path=db_path)
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding the number of concurrent upserts."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def create_collection(self) -> None:
+        """Create the collection if it does not exist yet."""
+        if await self.client.collection_exists(self.collection_name):
+            return
+
+        await self.client.create_collection(
+            collection_name=self.collection_name,
+            vectors_config=VectorParams(
+                size=QdrantDBClient.EMBEDDING_DIMENSION,
+                distance=QdrantDBClient.DEFAULT_DISTANCE,
+            ),
+        )
+        logger.info(f"Created collection {self.collection_name}")
+
+    async def batch_upsert_documents(
+        self,
+        payloads: List[Dict[str, Any]],
+        embeddings: List[List[float]],
+        batch_size: int = 100,
+    ) -> Tuple[int, int]:
+        """
+        Store document chunks with their embeddings.
+
+        Args:
+            payloads (List[Dict[str, Any]]): Chunk payloads
+            embeddings (List[List[float]]): Corresponding embedding vectors
+            batch_size (int): Points per upsert request
+
+        Returns:
+            Tuple[int, int]: (successful_count, failed_count)
+
+        Raises:
+            ValueError: If payloads and embeddings have different lengths
+        """
+        if len(payloads) != len(embeddings):
+            raise ValueError(
+                f"Payloads ({len(payloads)}) and embeddings ({len(embeddings)}) "
+                f"must have the same length"
+            )
+
+        documents, failed = payloads_to_documents(payloads, embeddings)
+
+        valid = []
+        for doc in documents:
+            try:
+                if len(doc.embedding) != QdrantDBClient.EMBEDDING_DIMENSION:
+                    raise ValueError(f"Document {doc.id} has invalid embedding")
+                QdrantDBClient._validate_date_fields(doc.metadata, doc.id)
+                valid.append(doc)
+            except (TypeError, ValueError) as e:
+                logger.error(f"Skipping invalid document: {e}")
+                failed += 1
+
+        batches = [valid[i : i + batch_size] for i in range(0, len(valid), batch_size)]
+        results = await asyncio.gather(*(self._upsert(batch) for batch in batches))
+        successful = sum(results)
+        failed += len(valid) - successful
+
+        logger.info(
+            f"Batch upsert complete: {successful} successful, {failed} failed "
+            f"out of {len(payloads)} total"
+        )
+        return successful, failed
+
+    async def _upsert(self, batch: List[Document]) -> int:
+        try:
+            async with self.semaphore:
+                await self.client.upsert(
+                    collection_name=self.collection_name,
+                    points=[build_point(doc) for doc in batch],
+                    wait=True,
+                )
+            return len(batch)
+        except Exception as e:
+            logger.error(f"Batch failed: {e}")
+            return 0
+
+    async def get_payloads(self, chunk_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch stored chunk payloads (see QdrantIngestionClient.get_payloads())."""
+        points = await self.client.retrieve(
+            collection_name=self.collection_name,
+            ids=[point_id(chunk_id) for chunk_id in chunk_ids],
+            with_payload=True,
+            with_vectors=False,
+        )
+        return {
+            point.payload.get("original_id", str(point.id)): point.payload
+            for point in points
+            if point.payload
+        }
+
+    async def update_payloads(self, payloads: List[Dict[str, Any]]) -> bool:
+        """Overwrite stored chunks' metadata (see QdrantIngestionClient)."""
+        if not payloads:
+            return True
+
+        try:
+            async with self.semaphore:
+                await self.client.batch_update_points(
+                    collection_name=self.collection_name,
+                    update_operations=set_payload_operations(payloads),
+                    wait=True,
+                )
+        except Exception as e:
+            logger.error(f"Payload update failed: {e}")
+            return False
+
+        logger.info(f"Updated metadata of {len(payloads)} chunks")
+        return True
+
+    async def delete_stale_chunks(self, chunk_counts: Mapping[str, int]) -> bool:
+        """Delete rebuilt documents' stale chunks (see QdrantIngestionClient)."""
+        if not chunk_counts:
+            return True
+
+        try:
+            async with self.semaphore:
+                await self.client.delete(
+                    collection_name=self.collection_name,
+                    points_selector=FilterSelector(
+                        filter=stale_chunks_filter(chunk_counts)
+                    ),
+                    wait=True,
+                )
+        except Exception as e:
+            logger.error(f"Deleting stale chunks failed: {e}")
+            return False
+        return True
+
+    async def get_collection_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the collection.
+
+        Returns:
+            Dict[str, Any]: Same keys as QdrantIngestionClient.get_collection_stats()
+        """
+        try:
+            if not await self.client.collection_exists(self.collection_name):
+                return {
+                    "collection_name": self.collection_name,
+                    "total_documents": 0,
+                    "error": "Collection not found",
+                }
+
+            info = await self.client.get_collection(self.collection_name)
+            return {
+                "collection_name": self.collection_name,
+                "total_documents": info.points_count,
+                "vector_size": info.config.params.vectors.size,
+                "distance_metric": str(info.config.params.vectors.distance),
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to get collection stats: {e}")
+            return {
+                "collection_name": self.collection_name,
+                "total_documents": 0,
+                "error": str(e),
+            }
+
+    async def close(self) -> None:
+        """Close the underlying client (releases the local storage lock)."""
+        await self.client.close()
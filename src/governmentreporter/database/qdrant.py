@@ -81,6 +81,51 @@ class SearchResult:
     score: float
 
 
+def point_id(document_id: str) -> str:
+    """
+    Qdrant point ID of a document (or chunk) ID.
+
+    Args:
+        document_id: Original ID, e.g. "12345_chunk_0"
+
+    Returns:
+        Deterministic UUID string derived from the ID
+    """
+    return str(uuid.uuid5(uuid.NAMESPACE_DNS, document_id))
+
+
+def build_point(document: Document) -> PointStruct:
+    """
+    Convert a Document into the Qdrant point stored for it.
+
+    The point ID is a deterministic UUID derived from the document ID, so
+    re-ingesting a document overwrites its point; the original ID is kept in
+    the payload next to the text and metadata.
+
+    Args:
+        document: Validated document with its embedding
+
+    Returns:
+        PointStruct ready for upsert (sync or async client)
+    """
+    # Prepare payload
+    payload = {
+        "text": document.text,
+        **(document.metadata or {}),
+    }
+
+    # Create point with UUID - store original ID in payload
+    # Generate deterministic UUID from document ID for consistency
+    point_uuid = point_id(document.id)
+    payload["original_id"] = document.id  # Store original ID in payload
+
+    return PointStruct(
+        id=point_uuid,  # Use UUID for Qdrant
+        vector=document.embedding,
+        payload=payload,
+    )
+
+
 class QdrantDBClient:
     """
     Unified client for all Qdrant operations.
@@ -184,8 +229,9 @@ class QdrantDBClient:
                 "host/port/url for remote connection"
             )
 
+    @staticmethod
     def _validate_date_fields(
-        self, metadata: Optional[Dict[str, Any]], document_id: str
+        metadata: Optional[Dict[str, Any]], document_id: str
     ) -> None:
         """
         Validate that date fields in metadata are integers (Unix timestamps).
@@ -329,22 +375,7 @@ class QdrantDBClient:
         if create_collection:
             self.create_collection(collection_name)
 
-        # Prepare payload
-        payload = {
-            "text": document.text,
-            **(document.metadata or {}),
-        }
-
-        # Create point with UUID - store original ID in payload
-        # Generate deterministic UUID from document ID for consistency
-        point_uuid = str(uuid.uuid5(uuid.NAMESPACE_DNS, document.id))
-        payload["original_id"] = document.id  # Store original ID in payload
-
-        point = PointStruct(
-            id=point_uuid,  # Use UUID for Qdrant
-            vector=document.embedding,
-            payload=payload,
-        )
+        point = build_point(document)
 
         try:
             self.client.upsert(
@@ -422,23 +453,7 @@ class QdrantDBClient:
             batch = documents[i : i + batch_size]
 
             # Prepare points
-            points = []
-            for doc in batch:
-                payload = {
-                    "text": doc.text,
-                    **(doc.metadata or {}),
-                }
-                # Generate deterministic UUID from document ID
-                point_uuid = str(uuid.uuid5(uuid.NAMESPACE_DNS, doc.id))
-                payload["original_id"] = doc.id  # Store original ID in payload
-
-                points.append(
-                    PointStruct(
-                        id=point_uuid,  # Use UUID for Qdrant
-                        vector=doc.embedding,
-                        payload=payload,
-                    )
-                )
+            points = [build_point(doc) for doc in batch]
 
             try:
                 self.client.upsert(
@@ -2,27 +2,58 @@
 Document ingestion module for GovernmentReporter.
 
 This module provides batch ingestion capabilities for government documents:
-- Supreme Court opinions from CourtListener
-- Executive Orders from Federal Register
+- Supreme Court opinions from CourtListener (REST API or bulk data dumps)
+- Executive Orders from Federal Register (API or bulk XML)
 - Progress tracking with SQLite
 - Batch processing with error recovery
+- Durable on-disk spool between embedding and the Qdrant upsert
+- Persistent discovery cache so resumed runs skip discovery
+- Reprocessing of documents whose LLM metadata extraction failed
+- Staged pipeline processing with per-stage worker pools
+- Asyncio-native ingestion with per-service concurrency limits
 - Performance monitoring
 
 Classes:
     DocumentIngester: Abstract base class for all ingesters
+    AsyncDocumentIngester: Abstract base class for asyncio ingesters
     SCOTUSIngester: Supreme Court opinion ingester
+    AsyncSCOTUSIngester: Supreme Court opinion ingester on an event loop
+    CourtListenerBulkIngester: Supreme Court opinions from bulk data dumps
     ExecutiveOrderIngester: Executive Order ingester
+    AsyncExecutiveOrderIngester: Executive Order ingester on an event loop
+    ExecutiveOrderXMLIngester: Executive Orders from Federal Register bulk XML
     ProgressTracker: SQLite-based progress tracking
+    StagedPipeline: Threaded stages connected by bounded queues
+    PayloadSpool: On-disk spool of documents awaiting upsert
+    DiscoveryCache: On-disk discovery results with an in-memory LRU front
+    MetadataReprocessor: Re-runs LLM extraction for flagged documents
 """
 
+from .async_base import AsyncDocumentIngester
 from .base import DocumentIngester
-from .executive_orders import ExecutiveOrderIngester
+from .courtlistener_bulk import CourtListenerBulkIngester
+from .discovery_cache import DiscoveryCache
+from .executive_orders import AsyncExecutiveOrderIngester, ExecutiveOrderIngester
+from .executive_orders_xml import ExecutiveOrderXMLIngester
+from .pipeline import PipelineStage, StagedPipeline
 from .progress import ProgressTracker
-from .scotus import SCOTUSIngester
+from .reprocess import MetadataReprocessor
+from .scotus import AsyncSCOTUSIngester, SCOTUSIngester
+from .spool import PayloadSpool
 
 __all__ = [
     "DocumentIngester",
     "SCOTUSIngester",
+    "CourtListenerBulkIngester",
     "ExecutiveOrderIngester",
+    "ExecutiveOrderXMLIngester",
+    "AsyncDocumentIngester",
+    "AsyncSCOTUSIngester",
+    "AsyncExecutiveOrderIngester",
     "ProgressTracker",
+    "PipelineStage",
+    "StagedPipeline",
+    "PayloadSpool",
+    "DiscoveryCache",
+    "MetadataReprocessor",
 ]
@@ -0,0 +1,650 @@
+"""
+Asyncio-native base class for document ingesters.
+
+AsyncDocumentIngester is the event-loop counterpart of DocumentIngester.
+Instead of one thread per in-flight document, every document is a task on a
+single event loop, and each external service gets its own concurrency limit:
+
+- Source API fetches: the async API client's semaphore (fetch_concurrency)
+- LLM metadata extraction: AsyncOpenAI, bounded by llm_concurrency
+- Embeddings: AsyncEmbeddingGenerator, bounded by embedding_concurrency and
+  optional requests- and tokens-per-minute budgets
+- Qdrant upserts: AsyncQdrantClient, bounded by upsert_concurrency
+
+max_in_flight bounds how many documents are being processed at once, so
+discovery never runs more than that far ahead of processing. Hundreds of
+requests can be in flight without hundreds of threads.
+
+Chunking is CPU-bound and runs in the default thread pool
+(asyncio.to_thread) so it does not stall the event loop, as do the fsynced
+writes to the payload spool. Progress tracking uses the same SQLite
+ProgressTracker as the threaded ingesters; its calls also run in the thread
+pool, since a claim can wait on another process's lock for up to the
+database's busy timeout.
+
+As in DocumentIngester, processed documents are spooled to disk and marked
+completed only after Qdrant has acknowledged their upsert, and documents
+whose fingerprint matches the stored one skip the stages that would produce
+the same output again. Each document's stage timings and token counts are
+recorded in the progress database. Time spent waiting for a service's
+concurrency slot counts towards the stage, except for the LLM stage, which
+is timed once a slot is held.
+
+Python Learning Notes:
+    - asyncio.run() starts the event loop and runs one coroutine to completion
+    - asyncio.create_task() schedules a coroutine to run concurrently
+    - async for iterates an asynchronous generator (paginated discovery)
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+
+from openai import AsyncOpenAI
+
+from ..apis.base import AsyncGovernmentAPIClient, Document
+from ..apis.cassette import Cassette
+from ..apis.http_cache import HTTPCache
+from ..database.ingestion import AsyncQdrantIngestionClient
+from ..processors.build_payloads import (
+    DocumentFingerprint,
+    PreparedDocument,
+    assemble_payloads,
+    extract_document_metadata_async,
+    fingerprint_document,
+    prepare_document,
+    stored_document_metadata,
+)
+from ..processors.chunking import count_tokens
+from ..processors.embedding_cache import EmbeddingCache
+from ..processors.embeddings import AsyncEmbeddingGenerator
+from ..processors.llm_extraction import track_llm_usage
+from ..utils.config import get_openai_api_key
+from ..utils.monitoring import PerformanceMonitor, StageTimer
+from .base import IngesterBookkeepingMixin
+from .progress import ProgressTracker
+from .spool import PayloadSpool, SpoolSegment
+
+logger = logging.getLogger(__name__)
+
+# External services with their own concurrency limit, and the defaults
+SERVICE_CONCURRENCY = {"fetch": 10, "llm": 16, "embedding": 4, "upsert": 2}
+
+
+def parse_concurrency(spec: str) -> Dict[str, int]:
+    """
+    Parse a "service=N,service=N" concurrency specification.
+
+    Services that are not mentioned keep their SERVICE_CONCURRENCY limit.
+
+    Args:
+        spec: e.g. "llm=32,embedding=8" (an empty string means all defaults)
+
+    Returns:
+        AsyncDocumentIngester keyword arguments, e.g. {"llm_concurrency": 32, ...}
+
+    Raises:
+        ValueError: If a service name is unknown or a limit is not a positive int
+    """
+    limits = dict(SERVICE_CONCURRENCY)
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, sep, count = part.partition("=")
+        name = name.strip()
+        if not sep or name not in limits:
+            raise ValueError(
+                f"Invalid service '{part}'; expected NAME=N with NAME one of "
+                f"{', '.join(SERVICE_CONCURRENCY)}"
+            )
+        try:
+            limits[name] = int(count)
+        except ValueError:
+            raise ValueError(f"Invalid concurrency limit in '{part}'") from None
+        if limits[name] < 1:
+            raise ValueError(f"Service {name} needs a limit of at least 1")
+    return {f"{name}_concurrency": value for name, value in limits.items()}
+
+
+class AsyncDocumentIngester(IngesterBookkeepingMixin, ABC):
+    """
+    Abstract base class for asyncio-native document ingesters.
+
+    Subclasses must implement:
+        - _get_collection_name(): Qdrant collection name
+        - _iter_document_ids(): async generator of document ID lists
+        - _fetch_document(): coroutine returning one Document
+
+    and assign self.api_client (an AsyncGovernmentAPIClient created with
+    max_concurrency=fetch_concurrency) in their constructor.
+
+    Example:
+        ingester = AsyncSCOTUSIngester(
+            start_date="2020-01-01",
+            end_date="2024-12-31",
+            max_in_flight=200,
+            llm_concurrency=32,
+        )
+        ingester.run()
+    """
+
+    statistics_title = "INGESTION COMPLETE (asyncio)"
+
+    def __init__(
+        self,
+        start_date: str,
+        end_date: str,
+        batch_size: int = 50,
+        dry_run: bool = False,
+        progress_db: str = "ingestion.db",
+        qdrant_db_path: str = "./data/qdrant/qdrant_db",
+        document_type: str = "generic",
+        http_cache: Optional[HTTPCache] = None,
+        cassette: Optional[Cassette] = None,
+        max_in_flight: int = 100,
+        fetch_concurrency: int = SERVICE_CONCURRENCY["fetch"],
+        llm_concurrency: int = SERVICE_CONCURRENCY["llm"],
+        embedding_concurrency: int = SERVICE_CONCURRENCY["embedding"],
+        upsert_concurrency: int = SERVICE_CONCURRENCY["upsert"],
+        embedding_requests_per_minute: Optional[int] = None,
+        embedding_tokens_per_minute: Optional[int] = None,
+        spool_dir: Optional[str] = None,
+        refresh: bool = False,
+        embedding_cache: Optional[EmbeddingCache] = None,
+    ):
+        """
+        Initialize the async document ingester.
+
+        Args:
+            start_date: Start date for document range (YYYY-MM-DD)
+            end_date: End date for document range (YYYY-MM-DD)
+            batch_size: Number of documents whose chunks are upserted together
+            dry_run: If True, don't actually store documents
+            progress_db: Path to SQLite database for progress tracking
+            qdrant_db_path: Path to Qdrant database directory
+            document_type: Type identifier for progress tracking
+            http_cache: Optional on-disk HTTP response cache for the API client
+            cassette: Optional record/replay cassette for the API client
+            max_in_flight: Maximum documents being processed at once
+            fetch_concurrency: Maximum source API requests in flight
+            llm_concurrency: Maximum LLM metadata extractions in flight
+            embedding_concurrency: Maximum embedding requests in flight
+            upsert_concurrency: Maximum Qdrant upserts in flight
+            embedding_requests_per_minute: Embedding requests allowed per
+                                           minute (None for unlimited)
+            embedding_tokens_per_minute: Embedded tokens allowed per minute
+                                         (None for unlimited)
+            spool_dir: Directory for the payload spool (default: progress_db
+                       with a .spool suffix)
+            refresh: Also process documents already completed, so changes at
+                     the source are picked up (unchanged ones are skipped)
+            embedding_cache: Optional persistent cache of embedding vectors;
+                             chunks whose text was embedded before are not
+                             sent to the embeddings API again.
+        """
+        limits = {
+            "max_in_flight": max_in_flight,
+            "fetch_concurrency": fetch_concurrency,
+            "llm_concurrency": llm_concurrency,
+            "embedding_concurrency": embedding_concurrency,
+            "upsert_concurrency": upsert_concurrency,
+        }
+        for name, value in limits.items():
+            if value < 1:
+                raise ValueError(f"{name} must be at least 1, got {value}")
+
+        self.start_date = start_date
+        self.end_date = end_date
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.refresh = refresh
+        self.concurrency = limits
+        self.max_in_flight = max_in_flight
+        self.fetch_concurrency = fetch_concurrency
+        self.llm_concurrency = llm_concurrency
+
+        self.progress_tracker = ProgressTracker(
+            progress_db, document_type, flush_interval=self.progress_flush_interval
+        )
+        self.spool = PayloadSpool(spool_dir or Path(progress_db).with_suffix(".spool"))
+        self.performance_monitor = PerformanceMonitor()
+
+        # One client per service, shared by every document task
+        self.llm_client = AsyncOpenAI(api_key=get_openai_api_key())
+        self.embedding_generator = AsyncEmbeddingGenerator(
+            max_concurrency=embedding_concurrency,
+            requests_per_minute=embedding_requests_per_minute,
+            tokens_per_minute=embedding_tokens_per_minute,
+            cache=embedding_cache,
+        )
+        self.embedding_cache = embedding_cache
+        self.qdrant_client = AsyncQdrantIngestionClient(
+            collection_name=self._get_collection_name(),
+            db_path=qdrant_db_path,
+            max_concurrency=upsert_concurrency,
+        )
+
+        # Source API client, assigned by subclasses after this constructor runs
+        self.api_client: Optional[AsyncGovernmentAPIClient] = None
+        self.http_cache = http_cache
+        self.cassette = cassette
+
+        # Running counts for progress reporting
+        self._documents_discovered = 0
+        self._documents_processed = 0
+        self._change_counts: Counter = Counter()
+        self._change_lock = threading.Lock()
+
+        # Spooled documents waiting for the next Qdrant upsert
+        self._pending_segments: List[Path] = []
+
+        # Created in run_async() so they belong to its event loop
+        self._in_flight: Optional[asyncio.Semaphore] = None
+        self._llm_semaphore: Optional[asyncio.Semaphore] = None
+
+        # Reset any stuck documents from previous runs
+        self.progress_tracker.reset_processing_status()
+
+    @abstractmethod
+    def _get_collection_name(self) -> str:
+        """Get the Qdrant collection name for this document type."""
+        pass
+
+    @abstractmethod
+    def _iter_document_ids(self) -> AsyncIterator[List[str]]:
+        """
+        Yield document IDs in groups as discovery proceeds (async generator).
+
+        Yields:
+            Lists of document IDs
+        """
+        pass
+
+    @abstractmethod
+    async def _fetch_document(self, doc_id: str) -> Document:
+        """
+        Fetch one document from the source API.
+
+        Raises:
+            Exception: If the document cannot be fetched
+        """
+        pass
+
+    def _leftover_document_ids(self) -> Iterable[str]:
+        """Documents left pending or failed by earlier runs (see DocumentIngester)."""
+        return self.progress_tracker.iter_pending_documents()
+
+    def run(self) -> None:
+        """Run the ingestion on a new event loop."""
+        asyncio.run(self.run_async())
+
+    async def run_async(self) -> None:
+        """
+        Execute the ingestion on the running event loop.
+
+        Documents are scheduled as tasks as soon as discovery yields them,
+        up to max_in_flight at a time.
+        """
+        logger.info(
+            f"Starting async ingestion for date range: "
+            f"{self.start_date} to {self.end_date}"
+        )
+        if self.dry_run:
+            logger.info("DRY RUN MODE - No documents will be stored")
+
+        run_id = await asyncio.to_thread(
+            self.progress_tracker.start_run,
+            self.start_date,
+            self.end_date,
+            {
+                "batch_size": self.batch_size,
+                "dry_run": self.dry_run,
+                "refresh": self.refresh,
+                **self.concurrency,
+            },
+        )
+
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        self._llm_semaphore = asyncio.Semaphore(self.llm_concurrency)
+        tasks: Set[asyncio.Task] = set()
+
+        try:
+            await self.qdrant_client.create_collection()
+            self.performance_monitor.start()
+            await asyncio.to_thread(self.progress_tracker.start_heartbeat)
+
+            # Store documents an earlier run spooled but could not upsert
+            await self._drain_spool()
+
+            found = 0
+            claimed = 0
+            seen: Set[str] = set()
+            async for doc_ids in self._iter_document_ids():
+                found += len(doc_ids)
+                await asyncio.to_thread(self.progress_tracker.add_documents, doc_ids)
+                new_ids = [d for d in dict.fromkeys(doc_ids) if d not in seen]
+                seen.update(new_ids)
+
+                # Leases keep concurrent ingesters off the same documents
+                page_claimed = await asyncio.to_thread(
+                    self.progress_tracker.claim_documents,
+                    new_ids,
+                    include_completed=self.refresh,
+                )
+                for doc_id in page_claimed:
+                    claimed += 1
+                    self._documents_discovered = claimed
+                    await self._schedule(doc_id, tasks)
+
+            if not found:
+                logger.warning("No documents found in the specified date range")
+                return
+
+            logger.info(f"Found {found} total documents")
+
+            # Pick up documents left pending, failed or abandoned by earlier
+            # runs, one page at a time
+            leftovers = (d for d in self._leftover_document_ids() if d not in seen)
+            while True:
+                page = await asyncio.to_thread(
+                    lambda: list(itertools.islice(leftovers, self.batch_size))
+                )
+                if not page:
+                    break
+                claimed_page = await asyncio.to_thread(
+                    self.progress_tracker.claim_documents, page
+                )
+                for doc_id in claimed_page:
+                    claimed += 1
+                    self._documents_discovered = claimed
+                    await self._schedule(doc_id, tasks)
+
+            if not claimed:
+                logger.info("All documents have already been processed")
+                return
+
+            await asyncio.gather(*tasks)
+            await self._flush_upserts()
+
+            # Retry anything this run could not store yet
+            await self._drain_spool()
+
+            logger.info(f"Processed {claimed} pending documents")
+            await self._print_final_statistics()
+
+        finally:
+            # Only still running here if the run was interrupted
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            # Hand unfinished documents back to other processes right away
+            await asyncio.to_thread(self._finish_run, run_id)
+
+            if self.api_client is not None:
+                await self.api_client.aclose()
+            await self.embedding_generator.aclose()
+            await self.llm_client.close()
+            await self.qdrant_client.close()
+
+    def _finish_run(self, run_id: int) -> None:
+        """Release this run's leases and close the progress database."""
+        self.progress_tracker.stop_heartbeat()
+        self.progress_tracker.release_leases()
+        self.progress_tracker.end_run(run_id)
+        self.progress_tracker.close()
+
+    async def _schedule(self, doc_id: str, tasks: Set[asyncio.Task]) -> None:
+        """Start processing a document once fewer than max_in_flight are running."""
+        await self._in_flight.acquire()
+        task = asyncio.create_task(self._process_document(doc_id))
+        tasks.add(task)
+
+        def done(finished: asyncio.Task) -> None:
+            tasks.discard(finished)
+            self._in_flight.release()
+
+        task.add_done_callback(done)
+
+    async def _process_document(self, doc_id: str) -> None:
+        """Fetch, chunk, extract, embed and queue one document for upsert."""
+        start_time = time.time()
+        timer = StageTimer()
+        try:
+            await asyncio.to_thread(self.progress_tracker.mark_processing, doc_id)
+
+            with timer.stage("fetch"):
+                document = await self._fetch_document(doc_id)
+
+            with timer.stage("chunk"):
+                # Chunking is CPU-bound; keep it off the event loop
+                prepared = await asyncio.to_thread(prepare_document, document)
+                if prepared is None:
+                    raise ValueError(f"No payloads generated for document {doc_id}")
+                fingerprint, redo = await asyncio.to_thread(
+                    self._plan_document, doc_id, prepared
+                )
+            if not redo:
+                await asyncio.to_thread(self._complete_unchanged, doc_id, timer)
+                self._record_result(failed=False)
+                return
+
+            doc_metadata = None
+            if "extract" not in redo:
+                doc_metadata = await self._stored_document_metadata(doc_id)
+            if doc_metadata is None:
+                async with self._llm_semaphore:
+                    with timer.stage("llm"), track_llm_usage() as usage:
+                        doc_metadata = await extract_document_metadata_async(
+                            prepared, client=self.llm_client
+                        )
+                timer.add_tokens("llm_prompt_tokens", usage["prompt_tokens"])
+                timer.add_tokens("llm_completion_tokens", usage["completion_tokens"])
+            doc_metadata = {**doc_metadata, **fingerprint.as_metadata()}
+            payloads = assemble_payloads(prepared, doc_metadata)
+
+            if redo == {"extract"}:
+                with timer.stage("store"):
+                    await self._update_stored_metadata(doc_id, payloads, fingerprint)
+                await self._record_timings(doc_id, timer)
+                return
+
+            texts = [p["text"] for p in payloads]
+            with timer.stage("embed"):
+                embeddings = await self.embedding_generator.generate_batch_embeddings(
+                    texts
+                )
+            timer.add_tokens(
+                "embedding_tokens",
+                await asyncio.to_thread(lambda: sum(map(count_tokens, texts))),
+            )
+
+            ingested_at = datetime.now().isoformat()
+            for payload in payloads:
+                payload["document_id"] = doc_id
+                payload["ingested_at"] = ingested_at
+
+            processing_time_ms = int((time.time() - start_time) * 1000)
+            if self.dry_run:
+                await asyncio.to_thread(
+                    self.progress_tracker.mark_completed, doc_id, processing_time_ms
+                )
+                await self._record_timings(doc_id, timer)
+                self._record_result(failed=False)
+                return
+
+            segment = await asyncio.to_thread(
+                self.spool.write, doc_id, payloads, embeddings
+            )
+            await asyncio.to_thread(
+                self.progress_tracker.mark_spooled, doc_id, processing_time_ms
+            )
+            await self._record_timings(doc_id, timer)
+            self._record_result(failed=False)
+
+            await self._queue_upsert(segment)
+
+        except Exception as e:
+            logger.error(f"Error processing document {doc_id}: {e}")
+            await asyncio.to_thread(self.progress_tracker.mark_failed, doc_id, str(e))
+            self._record_result(failed=True)
+
+    async def _record_timings(self, doc_id: str, timer: StageTimer) -> None:
+        """Write a document's stage timings to the progress database."""
+        await asyncio.to_thread(
+            self.progress_tracker.record_timings, doc_id, timer.stage_ms, timer.tokens
+        )
+
+    def _plan_document(
+        self, doc_id: str, prepared: PreparedDocument
+    ) -> Tuple[DocumentFingerprint, Set[str]]:
+        """Fingerprint a document and find the stages to redo (see DocumentIngester)."""
+        generator = self.embedding_generator
+        fingerprint = fingerprint_document(
+            prepared, f"{generator.model}:{generator.dimension}"
+        )
+        previous = DocumentFingerprint.from_metadata(
+            self.progress_tracker.get_fingerprint(doc_id)
+        )
+        return fingerprint, fingerprint.stages_to_redo(previous)
+
+    async def _stored_document_metadata(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        """Document-level metadata of a stored document's first chunk, if any."""
+        first_chunk = f"{doc_id}_chunk_0"
+        try:
+            stored = (await self.qdrant_client.get_payloads([first_chunk])).get(
+                first_chunk
+            )
+        except Exception as e:
+            logger.warning(f"Could not read stored metadata of {doc_id}: {e}")
+            return None
+        return stored_document_metadata(stored) if stored else None
+
+    async def _update_stored_metadata(
+        self,
+        doc_id: str,
+        payloads: List[Dict[str, Any]],
+        fingerprint: DocumentFingerprint,
+    ) -> None:
+        """Write re-extracted metadata onto a document's stored chunks."""
+        if self.dry_run:
+            await asyncio.to_thread(self.progress_tracker.mark_completed, doc_id)
+        else:
+            if not await self.qdrant_client.update_payloads(payloads):
+                raise RuntimeError(f"Could not update metadata of {doc_id} in Qdrant")
+            await asyncio.to_thread(
+                self.progress_tracker.mark_completed,
+                doc_id,
+                fingerprint=fingerprint.as_metadata(),
+            )
+        logger.info(f"Updated metadata of document {doc_id} without re-embedding")
+        self._count_change("metadata updated")
+        self._record_result(failed=False)
+
+    def _record_result(self, failed: bool) -> None:
+        self._documents_processed += 1
+        self.performance_monitor.record_document(failed=failed)
+        self.performance_monitor.print_progress(
+            self._documents_processed,
+            max(self._documents_discovered, self._documents_processed),
+            "Processing documents",
+        )
+
+    async def _queue_upsert(self, segment: Path) -> None:
+        """Add a spooled document to the next upsert, flushing every batch_size."""
+        self._pending_segments.append(segment)
+        if len(self._pending_segments) >= self.batch_size:
+            await self._flush_upserts()
+
+    async def _flush_upserts(self) -> None:
+        """Upsert all queued documents in Qdrant."""
+        # Swap the buffer before awaiting so other tasks start a new batch
+        paths, self._pending_segments = self._pending_segments, []
+        await self._store_segments(paths)
+
+    async def _drain_spool(self) -> None:
+        """
+        Store every spooled document, batch_size documents at a time.
+
+        Spooled documents whose segment is missing here and whose lease has
+        expired are then released to be processed again.
+        """
+        if self.dry_run:
+            return
+        paths = self.spool.segments()
+        if paths:
+            logger.info(f"Draining {len(paths)} spooled documents into Qdrant")
+        for i in range(0, len(paths), self.batch_size):
+            await self._store_segments(paths[i : i + self.batch_size])
+        await asyncio.to_thread(self._release_lost_spooled)
+
+    async def _store_segments(self, paths: List[Path]) -> None:
+        """Upsert spooled documents with retries (see DocumentIngester)."""
+        segments = []
+        for path in paths:
+            try:
+                segments.append(await asyncio.to_thread(self.spool.read, path))
+            except FileNotFoundError:
+                continue  # Already drained by another ingester
+        if not segments:
+            return
+
+        if await self._upsert_segments(segments, self.store_attempts):
+            return
+        if len(segments) > 1:
+            for segment in segments:
+                await self._upsert_segments([segment], attempts=1)
+
+    async def _upsert_segments(
+        self, segments: List[SpoolSegment], attempts: int
+    ) -> bool:
+        payloads = [p for segment in segments for p in segment.payloads]
+        embeddings = [e for segment in segments for e in segment.embeddings]
+        rebuilt = await asyncio.to_thread(self._rebuilt_chunk_counts, segments)
+
+        for delay in self._upsert_delays(len(segments), attempts):
+            if delay:
+                await asyncio.sleep(delay)
+            start_time = time.perf_counter()
+            if not await self.qdrant_client.delete_stale_chunks(rebuilt):
+                continue
+            if await self._store_batch(payloads, embeddings):
+                store_ms = (time.perf_counter() - start_time) * 1000
+                await asyncio.to_thread(self._complete_segments, segments, store_ms)
+                return True
+
+        self._keep_segments(segments)
+        return False
+
+    async def _store_batch(
+        self, documents: List[Dict[str, Any]], embeddings: List[List[float]]
+    ) -> bool:
+        """Store a batch of documents in Qdrant (see DocumentIngester)."""
+        try:
+            logger.info(f"Storing batch of {len(documents)} chunks in Qdrant")
+            successful, failed = await self.qdrant_client.batch_upsert_documents(
+                documents, embeddings, batch_size=100
+            )
+            logger.info(f"Stored {successful} chunks, {failed} failed")
+            return failed == 0
+        except Exception as e:
+            logger.error(f"Error storing batch in Qdrant: {e}")
+            return False
+
+    async def _print_final_statistics(self) -> None:
+        """Print final ingestion statistics."""
+        stats = await asyncio.to_thread(self.progress_tracker.get_statistics)
+        qdrant_stats = await self.qdrant_client.get_collection_stats()
+        print("\n".join(self._final_statistics_lines(stats, qdrant_stats)))
+
+    def _runtime_statistics_lines(self) -> List[str]:
+        """The concurrency limits the run used."""
+        limits = ", ".join(
+            f"{name}={value}" for name, value in self.concurrency.items()
+        )
+        return [f"Concurrency: {limits}"]
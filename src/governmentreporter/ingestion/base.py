@@ -16,22 +16,289 @@ Python Learning Notes:
     - Abstract Base Classes (ABC) enforce implementation of required methods
     - Template Method pattern: base class defines structure, subclasses fill in details
     - Shared logic reduces duplication across ingester implementations
+    - ThreadPoolExecutor overlaps the network-bound work (API fetch, LLM
+      extraction, embeddings) of several documents; the GIL is released
+      while threads wait on sockets
+    - With stage_workers the same steps run as a StagedPipeline instead,
+      one thread pool per step (see pipeline.py)
+    - A DocumentFingerprint recorded per stored document lets re-ingestion
+      skip the steps whose inputs have not changed
+    - A StageTimer per document records where its processing time went
+      (fetch, chunk, LLM, embed, store) in the progress database
+    - IngesterBookkeepingMixin holds the bookkeeping AsyncDocumentIngester
+      shares with DocumentIngester, so the two cannot drift apart
 """
 
+import itertools
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
-
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..apis.base import Document, GovernmentAPIClient
+from ..apis.cassette import Cassette
+from ..apis.http_cache import HTTPCache
+from ..apis.rate_limit import get_rate_limiter_metrics
 from ..database.ingestion import QdrantIngestionClient
 from ..database.qdrant import QdrantDBClient
-from ..processors.embeddings import EmbeddingGenerator
-from ..utils.monitoring import PerformanceMonitor
+from ..processors.build_payloads import (
+    DocumentFingerprint,
+    PreparedDocument,
+    assemble_payloads,
+    extract_document_metadata,
+    fingerprint_document,
+    prepare_document,
+    stored_document_metadata,
+)
+from ..processors.chunking import count_tokens
+from ..processors.embedding_cache import EmbeddingCache
+from ..processors.embeddings import EmbeddingAggregator, EmbeddingGenerator
+from ..processors.llm_extraction import track_llm_usage
+from ..utils.monitoring import PerformanceMonitor, StageTimer
+from .pipeline import (
+    DEFAULT_STAGE_WORKERS,
+    INGESTION_STAGES,
+    PipelineStage,
+    StagedPipeline,
+    format_stage_stats,
+)
 from .progress import ProgressTracker
+from .spool import PayloadSpool, SpoolSegment
 
 logger = logging.getLogger(__name__)
 
+# (success, payloads, embeddings, elapsed_ms) of one processed document
+_DocumentResult = Tuple[bool, List[Dict[str, Any]], List[List[float]], int]
+
+
+@dataclass
+class _PipelineItem:
+    """A document on its way through the staged pipeline."""
+
+    doc_id: str
+    started_at: float
+    document: Optional[Document] = None
+    prepared: Optional[PreparedDocument] = None
+    fingerprint: Optional[DocumentFingerprint] = None
+    redo: Set[str] = field(default_factory=set)
+    payloads: List[Dict[str, Any]] = field(default_factory=list)
+    embeddings: List[List[float]] = field(default_factory=list)
+
+
+class IngesterBookkeepingMixin:
+    """
+    Progress bookkeeping shared by DocumentIngester and AsyncDocumentIngester.
+
+    Everything here is synchronous: the threaded ingester calls it directly
+    and the asyncio ingester through asyncio.to_thread, so only the parts
+    that await a service differ between the two.
 
-class DocumentIngester(ABC):
+    Classes using it provide progress_tracker, spool, performance_monitor,
+    http_cache, embedding_cache, cassette, _change_counts and _change_lock.
+    """
+
+    # Upsert attempts per spooled batch, and the delay before the first retry
+    # (doubled for each further retry)
+    store_attempts = 3
+    store_retry_delay = 2.0
+
+    # Seconds document status updates are buffered before being written
+    progress_flush_interval = 1.0
+
+    # Heading of the final statistics
+    statistics_title = "INGESTION COMPLETE"
+
+    def _count_change(self, outcome: str) -> None:
+        """Count a document stored without a full reprocess."""
+        with self._change_lock:
+            self._change_counts[outcome] += 1
+
+    def _complete_unchanged(self, doc_id: str, timer: Optional[StageTimer]) -> None:
+        """Complete a document whose stored chunks are up to date."""
+        logger.info(f"Document {doc_id} is unchanged, skipping")
+        self.progress_tracker.mark_completed(doc_id)
+        if timer is not None:
+            self.progress_tracker.record_timings(doc_id, timer.stage_ms, timer.tokens)
+        self._count_change("unchanged")
+
+    def _upsert_delays(self, documents: int, attempts: int) -> Iterator[float]:
+        """
+        Seconds to wait before each upsert attempt of a spooled batch.
+
+        The first attempt starts at once; retries back off exponentially
+        from store_retry_delay.
+        """
+        for attempt in range(attempts):
+            if not attempt:
+                yield 0.0
+                continue
+            delay = self.store_retry_delay * 2 ** (attempt - 1)
+            logger.warning(
+                f"Retrying upsert of {documents} documents in {delay}s "
+                f"(attempt {attempt + 1}/{attempts})"
+            )
+            yield delay
+
+    def _rebuilt_chunk_counts(self, segments: List[SpoolSegment]) -> Dict[str, int]:
+        """
+        Chunk counts of the spooled documents that replace stored chunks.
+
+        A document stored before has a recorded fingerprint (mark_spooled()
+        keeps it until the new chunks are completed). Its chunks at or beyond
+        the new count are deleted before the upsert, so a document that
+        shrank leaves no stale chunks behind.
+        """
+        return {
+            segment.document_id: len(segment.payloads)
+            for segment in segments
+            if self.progress_tracker.get_fingerprint(segment.document_id) is not None
+        }
+
+    def _complete_segments(self, segments: List[SpoolSegment], store_ms: float) -> None:
+        """
+        Complete documents Qdrant has acknowledged and remove their segments.
+
+        Each document is charged its share of the upsert time, by chunk count.
+        """
+        chunks = sum(len(segment.payloads) for segment in segments)
+        for segment in segments:
+            self.progress_tracker.mark_completed(
+                segment.document_id, fingerprint=segment.fingerprint
+            )
+            share = len(segment.payloads) / max(chunks, 1)
+            self.progress_tracker.record_timings(
+                segment.document_id, {"store": store_ms * share}
+            )
+            self.spool.remove(segment.path)
+
+    def _release_lost_spooled(self) -> None:
+        """
+        Hand back spooled documents whose spool segment is not here.
+
+        A document spooled by a process that died, with its spool directory
+        lost or on another machine, could otherwise never be completed. Once
+        its lease has expired it is reset to pending and processed again.
+        """
+        released = self.progress_tracker.release_lost_spooled(self.spool.document_ids())
+        if released:
+            logger.warning(
+                f"Released {len(released)} spooled documents whose spool segment "
+                f"is missing; they will be processed again"
+            )
+
+    def _keep_segments(self, segments: List[SpoolSegment]) -> None:
+        """Log documents left in the spool after their last upsert attempt."""
+        logger.warning(
+            f"Could not store {len(segments)} documents; they stay in the spool "
+            f"at {self.spool.directory}"
+        )
+
+    def _runtime_statistics_lines(self) -> List[str]:
+        """Statistics of how the run was executed, shown after the throughput."""
+        return []
+
+    def _final_statistics_lines(
+        self, stats: Dict[str, Any], qdrant_stats: Dict[str, Any]
+    ) -> List[str]:
+        """
+        Lines of the statistics printed when a run ends.
+
+        Args:
+            stats: The progress tracker's get_statistics()
+            qdrant_stats: The Qdrant client's get_collection_stats()
+
+        Returns:
+            Lines of text
+        """
+        lines = ["\n" + "=" * 60, self.statistics_title, "=" * 60]
+
+        lines.append(f"Document Type: {stats['document_type']}")
+        lines.append(f"Total Documents: {stats['total']}")
+        lines.append(f"Completed: {stats['completed']}")
+        lines.append(f"Failed: {stats['failed']}")
+        lines.append(f"Pending: {stats['pending']}")
+        if stats["spooled"]:
+            lines.append(f"Spooled (awaiting Qdrant): {stats['spooled']}")
+        lines.append(f"Success Rate: {stats['success_rate']:.1f}%")
+
+        if stats["avg_processing_time_ms"]:
+            lines.append(
+                f"Avg Processing Time: {stats['avg_processing_time_ms']:.0f}ms"
+            )
+        if self._change_counts:
+            counts = sorted(self._change_counts.items())
+            lines.append(
+                "Reused Stored Work: " + ", ".join(f"{n} {k}" for k, n in counts)
+            )
+
+        perf_stats = self.performance_monitor.get_statistics()
+        lines.append(f"\nTotal Time: {perf_stats['elapsed_time_formatted']}")
+        lines.append(
+            f"Throughput: {perf_stats['throughput_per_minute']:.1f} docs/minute"
+        )
+        lines.extend(self._runtime_statistics_lines())
+
+        lines.append(f"\nQdrant Collection: {qdrant_stats.get('collection_name')}")
+        lines.append(
+            f"Total Chunks in Collection: {qdrant_stats.get('total_documents', 0)}"
+        )
+
+        if self.http_cache is not None:
+            cache_stats = self.http_cache.stats()
+            lines.append(
+                f"\nHTTP Cache: {cache_stats['hits']} hits, "
+                f"{cache_stats['revalidated']} revalidated, "
+                f"{cache_stats['misses']} misses "
+                f"({cache_stats['size_bytes'] / 1024**2:.1f} MB on disk)"
+            )
+
+        if self.embedding_cache is not None:
+            embedding_stats = self.embedding_cache.stats()
+            lines.append(
+                f"Embedding Cache: {embedding_stats['hits']} hits, "
+                f"{embedding_stats['misses']} misses, "
+                f"{embedding_stats['evictions']} evicted "
+                f"({embedding_stats['size_bytes'] / 1024**2:.1f} MB on disk)"
+            )
+
+        # Time spent throttled by each source API's shared rate limiter
+        for host, limiter in sorted(get_rate_limiter_metrics().items()):
+            lines.append(
+                f"Rate Limiter {host}: {limiter['acquired']} requests, "
+                f"{limiter['throttled']} throttled, "
+                f"{limiter['total_wait_seconds']:.1f}s waited "
+                f"(rate {limiter['rate']:g}/{limiter['base_rate']:g} per second, "
+                f"{limiter['tokens']:.1f} tokens, "
+                f"next wait {limiter['wait_time']:.1f}s)"
+            )
+
+        if self.cassette is not None:
+            cassette_stats = self.cassette.stats()
+            lines.append(
+                f"Cassette ({cassette_stats['mode']}): "
+                f"{cassette_stats['recorded']} recorded, "
+                f"{cassette_stats['replayed']} replayed "
+                f"from {cassette_stats['directory']}"
+            )
+
+        if stats["failed"] > 0:
+            lines += ["\n" + "=" * 60, "FAILED DOCUMENTS (showing up to 10):", "-" * 60]
+            for failed_doc in stats["failed_documents"]:
+                lines.append(f"ID: {failed_doc['document_id']}")
+                lines.append(f"Error: {failed_doc['error']}")
+                lines.append(f"Failed At: {failed_doc['failed_at']}")
+                lines.append("-" * 40)
+
+        return lines
+
+
+class DocumentIngester(IngesterBookkeepingMixin, ABC):
     """
     Abstract base class for document ingesters.
 
@@ -41,13 +308,20 @@ class DocumentIngester(ABC):
     and batch processing.
 
     The ingestion pipeline follows these steps:
-    1. Fetch document IDs from source API
+    1. Discover document IDs from source API (page by page when the
+       subclass overrides _iter_document_ids())
     2. Filter out already-processed documents
-    3. Process documents in batches:
+    3. Process documents in batches as soon as a batch has been discovered:
        a. Fetch document content
-       b. Build payloads (chunking + metadata extraction)
+       b. Build payloads (chunking + metadata extraction), skipping the
+          steps whose inputs are unchanged since the document was stored
+          (see _payloads_from_document())
        c. Generate embeddings
-       d. Store in Qdrant
+       d. Write payloads and embeddings to the on-disk spool
+       e. Drain the spool into Qdrant, with retries; a document is marked
+          completed only once Qdrant has acknowledged it
+       With stage_workers set, steps a-e instead run as concurrent pipeline
+       stages connected by bounded queues, each with its own worker count.
     4. Track progress and report statistics
 
     Attributes:
@@ -59,6 +333,11 @@ class DocumentIngester(ABC):
         embedding_generator: OpenAI embedding generator
         qdrant_client: Qdrant ingestion client
         performance_monitor: Performance tracking and statistics
+        api_client: Source API client set by subclasses; its pooled HTTP
+            connections are reused for the whole run and closed when it ends
+        workers: Number of documents of a batch processed concurrently
+        spool: On-disk spool of processed documents awaiting upsert
+        refresh: Whether completed documents are re-checked for changes
 
     Example:
         # Concrete implementation
@@ -69,9 +348,9 @@ class DocumentIngester(ABC):
             def _fetch_document_ids(self):
                 return ["doc1", "doc2", "doc3"]
 
-            def _process_single_document(self, doc_id, batch_docs, batch_embeds):
-                # Implementation here
-                return True
+            def _build_payloads(self, doc_id):
+                # Fetch and chunk the document here
+                return [{"text": "...", "chunk_index": 0}]
 
         # Usage
         ingester = MyIngester(
@@ -81,6 +360,9 @@ class DocumentIngester(ABC):
         ingester.run()
     """
 
+    # Capacity of each queue between staged pipeline stages
+    pipeline_queue_size = 16
+
     def __init__(
         self,
         start_date: str,
@@ -91,6 +373,13 @@ class DocumentIngester(ABC):
         qdrant_db_path: str = "./data/qdrant/qdrant_db",
         document_type: str = "generic",
         shared_db_client: Optional[QdrantDBClient] = None,
+        http_cache: Optional[HTTPCache] = None,
+        cassette: Optional[Cassette] = None,
+        workers: int = 1,
+        stage_workers: Optional[Dict[str, int]] = None,
+        spool_dir: Optional[str] = None,
+        refresh: bool = False,
+        embedding_cache: Optional[EmbeddingCache] = None,
     ):
         """
         Initialize the document ingester.
@@ -106,15 +395,51 @@ class DocumentIngester(ABC):
             shared_db_client: Optional pre-initialized QdrantDBClient for shared access.
                             When provided, multiple ingesters can share the same database
                             connection, which is required for local Qdrant storage.
+            http_cache: Optional on-disk HTTP response cache passed to the API
+                        client, so re-runs revalidate instead of redownloading.
+            cassette: Optional record/replay cassette passed to the API client.
+                      Replay mode serves API traffic from disk with no network.
+            workers: Number of documents of a batch to process concurrently
+                     in a thread pool (default 1: one at a time).
+                     _process_single_document() must then be thread-safe.
+            stage_workers: Run as a staged pipeline with this many threads
+                           per stage (fetch, chunk, extract, embed, upsert);
+                           stages not listed use DEFAULT_STAGE_WORKERS. None
+                           (default) processes whole documents in batches.
+                           Requires _fetch_document().
+            spool_dir: Directory for the payload spool (default: progress_db
+                       with a .spool suffix). Ingesters sharing a progress
+                       database should share the spool.
+            refresh: Also process documents already completed, so changes at
+                     the source are picked up. Unchanged documents are
+                     fetched (cheaply, through the HTTP cache) and skipped.
+            embedding_cache: Optional persistent cache of embedding vectors;
+                             chunks whose text was embedded before are not
+                             sent to the embeddings API again.
         """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if stage_workers is not None:
+            unknown = set(stage_workers) - set(INGESTION_STAGES)
+            if unknown:
+                raise ValueError(f"Unknown pipeline stages: {sorted(unknown)}")
+            stage_workers = {**DEFAULT_STAGE_WORKERS, **stage_workers}
+
         self.start_date = start_date
         self.end_date = end_date
         self.batch_size = batch_size
         self.dry_run = dry_run
+        self.workers = workers
+        self.stage_workers = stage_workers
+        self.refresh = refresh
 
         # Initialize tracking and monitoring
-        self.progress_tracker = ProgressTracker(progress_db, document_type)
-        self.embedding_generator = EmbeddingGenerator()
+        self.progress_tracker = ProgressTracker(
+            progress_db, document_type, flush_interval=self.progress_flush_interval
+        )
+        self.spool = PayloadSpool(spool_dir or Path(progress_db).with_suffix(".spool"))
+        self.embedding_generator = EmbeddingGenerator(cache=embedding_cache)
+        self.embedding_cache = embedding_cache
 
         # Create QdrantIngestionClient for this collection
         # If a shared_db_client is provided, use it; otherwise create a new connection
@@ -129,6 +454,34 @@ class DocumentIngester(ABC):
 
         self.performance_monitor = PerformanceMonitor()
 
+        # Source API client, assigned by subclasses after this constructor runs.
+        # A single client (and its connection pool) is used for the whole run.
+        self.api_client: Optional[GovernmentAPIClient] = None
+        self.http_cache = http_cache
+        self.cassette = cassette
+
+        # Running counts for progress reporting while discovery streams
+        self._documents_discovered = 0
+        self._documents_processed = 0
+        self._batches_started = 0
+
+        # Documents stored without a full reprocess, by outcome
+        self._change_counts: Counter = Counter()
+        self._change_lock = threading.Lock()
+
+        # Stage timings of documents in progress, written to the progress
+        # database once a document is spooled or completed
+        self._stage_timers: Dict[str, StageTimer] = {}
+
+        # Worker threads, created on the first batch when workers > 1
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Staged pipeline state, used when stage_workers is set
+        self._pipeline: Optional[StagedPipeline] = None
+        self._pipeline_stats: List[Dict[str, Any]] = []
+        self._upsert_lock = threading.Lock()
+        self._upsert_buffer: List[Optional[Path]] = []
+
         # Reset any stuck documents from previous runs
         self.progress_tracker.reset_processing_status()
 
@@ -142,20 +495,224 @@ class DocumentIngester(ABC):
         """
         pass
 
-    @abstractmethod
     def _fetch_document_ids(self) -> List[str]:
         """
         Fetch all document IDs to process from the source API.
 
         This method should query the government API and return a list
-        of document IDs within the date range.
+        of document IDs within the date range. Ingesters that override
+        _iter_document_ids() to discover page by page need not implement it.
 
         Returns:
             List of document IDs to process
         """
-        pass
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement _fetch_document_ids() "
+            f"or _iter_document_ids()"
+        )
+
+    def _iter_document_ids(self) -> Iterator[List[str]]:
+        """
+        Yield document IDs in groups as discovery proceeds.
+
+        run() adds each group to the progress tracker and starts processing
+        full batches immediately, so subclasses whose source API paginates
+        should override this to yield one page at a time. The default
+        yields the whole result of _fetch_document_ids() as a single group.
+
+        Yields:
+            Lists of document IDs
+        """
+        yield self._fetch_document_ids()
+
+    def _leftover_document_ids(self) -> Iterable[str]:
+        """
+        Get documents left pending or failed by earlier runs.
+
+        run() processes these after discovery, unless discovery already
+        yielded them. Ingesters that cannot fetch a document by ID alone
+        (e.g. ones reading from a file) override this to return [].
+
+        Returns:
+            Document IDs from the progress tracker, read page by page
+        """
+        return self.progress_tracker.iter_pending_documents()
+
+    def _fetch_document(self, doc_id: str) -> Document:
+        """
+        Fetch one document from the source.
+
+        Used by the fetch stage of the staged pipeline; ingesters that
+        support stage_workers override this.
+
+        Args:
+            doc_id: Document identifier to fetch
+
+        Returns:
+            The document
+
+        Raises:
+            ValueError: If the document cannot be fetched
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support staged ingestion"
+        )
+
+    def _build_payloads(self, doc_id: str) -> List[Dict[str, Any]]:
+        """
+        Fetch and chunk one document into payloads, without embeddings.
+
+        Ingesters that override this have the embeddings of a whole batch
+        generated together in packed requests (see EmbeddingAggregator)
+        instead of per document by _process_single_document().
+
+        Args:
+            doc_id: Document identifier to process
+
+        Returns:
+            Chunk payloads with document_id and ingested_at set
+
+        Raises:
+            Exception: If the document cannot be fetched or chunked
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support packed embeddings"
+        )
+
+    @property
+    def _packs_embeddings(self) -> bool:
+        return type(self)._build_payloads is not DocumentIngester._build_payloads
+
+    def _payloads_from_document(self, document: Document) -> List[Dict[str, Any]]:
+        """
+        Build a fetched document's payloads, redoing only what changed.
+
+        The document's fingerprint is compared with the one recorded when
+        it was last stored (see DocumentFingerprint.stages_to_redo()):
+
+        - Nothing changed: the document is completed as is.
+        - Only the extraction prompt changed: metadata is re-extracted and
+          written onto the stored chunks, without embedding or upserting.
+        - Only the embedding model changed: the stored metadata is reused
+          and only embeddings and the upsert are redone.
+        - Otherwise the payloads are built from scratch.
+
+        Subclasses call this from _build_payloads() in place of
+        build_payloads_from_document().
+
+        Args:
+            document: The fetched document
+
+        Returns:
+            Payloads stamped with the fingerprint, or [] if nothing is left to
+            embed and store (the document has then been marked completed)
+
+        Raises:
+            ValueError: If no payloads could be built
+            RuntimeError: If re-extracted metadata could not be written to Qdrant
+        """
+        timer = self._stage_timer(document.id)
+        timer.lap("fetch")  # The subclass fetched since mark_processing
+        with timer.stage("chunk"):
+            prepared = prepare_document(document)
+            if prepared is None:
+                raise ValueError(f"No payloads generated for document {document.id}")
+            fingerprint, redo = self._plan_document(document.id, prepared)
+        if not redo:
+            self._complete_unchanged(
+                document.id, self._stage_timers.pop(document.id, None)
+            )
+            return []
+
+        payloads = self._assemble_payloads(document.id, prepared, fingerprint, redo)
+        if redo == {"extract"}:
+            self._update_stored_metadata(document.id, payloads, fingerprint)
+            return []
+        return payloads
+
+    @property
+    def _embedding_model(self) -> str:
+        """Embedding model and dimension, as recorded in fingerprints."""
+        generator = self.embedding_generator
+        return f"{generator.model}:{generator.dimension}"
+
+    def _plan_document(
+        self, doc_id: str, prepared: PreparedDocument
+    ) -> Tuple[DocumentFingerprint, Set[str]]:
+        """Fingerprint a document and find the stages that must be redone."""
+        fingerprint = fingerprint_document(prepared, self._embedding_model)
+        previous = DocumentFingerprint.from_metadata(
+            self.progress_tracker.get_fingerprint(doc_id)
+        )
+        return fingerprint, fingerprint.stages_to_redo(previous)
+
+    def _assemble_payloads(
+        self,
+        doc_id: str,
+        prepared: PreparedDocument,
+        fingerprint: DocumentFingerprint,
+        redo: Set[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Assemble payloads, extracting LLM metadata only if "extract" is redone.
+
+        When only embeddings are redone, the metadata is read back from the
+        stored chunks; if they cannot be read, it is extracted again.
+        """
+        doc_metadata = None
+        if "extract" not in redo:
+            doc_metadata = self._stored_document_metadata(doc_id)
+        if doc_metadata is None:
+            timer = self._stage_timer(doc_id)
+            with timer.stage("llm"), track_llm_usage() as usage:
+                doc_metadata = extract_document_metadata(prepared)
+            timer.add_tokens("llm_prompt_tokens", usage["prompt_tokens"])
+            timer.add_tokens("llm_completion_tokens", usage["completion_tokens"])
+        doc_metadata = {**doc_metadata, **fingerprint.as_metadata()}
+        return assemble_payloads(prepared, doc_metadata)
+
+    def _stored_document_metadata(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        """Document-level metadata of a stored document's first chunk, if any."""
+        first_chunk = f"{doc_id}_chunk_0"
+        try:
+            stored = self.qdrant_client.get_payloads([first_chunk]).get(first_chunk)
+        except Exception as e:
+            logger.warning(f"Could not read stored metadata of {doc_id}: {e}")
+            return None
+        return stored_document_metadata(stored) if stored else None
+
+    def _update_stored_metadata(
+        self,
+        doc_id: str,
+        payloads: List[Dict[str, Any]],
+        fingerprint: DocumentFingerprint,
+    ) -> None:
+        """Write re-extracted metadata onto a document's stored chunks."""
+        if self.dry_run:
+            self.progress_tracker.mark_completed(doc_id)
+        else:
+            with self._stage_timer(doc_id).stage("store"):
+                updated = self.qdrant_client.update_payloads(payloads)
+            if not updated:
+                raise RuntimeError(f"Could not update metadata of {doc_id} in Qdrant")
+            self.progress_tracker.mark_completed(
+                doc_id, fingerprint=fingerprint.as_metadata()
+            )
+        self._record_timings(doc_id)
+        logger.info(f"Updated metadata of document {doc_id} without re-embedding")
+        self._count_change("metadata updated")
+
+    def _stage_timer(self, doc_id: str) -> StageTimer:
+        """The StageTimer of a document in progress, created on first use."""
+        # dict.setdefault is atomic, so worker threads need no lock here
+        return self._stage_timers.setdefault(doc_id, StageTimer())
+
+    def _record_timings(self, doc_id: str) -> None:
+        """Write a document's stage timings to the progress database."""
+        timer = self._stage_timers.pop(doc_id, None)
+        if timer is not None:
+            self.progress_tracker.record_timings(doc_id, timer.stage_ms, timer.tokens)
 
-    @abstractmethod
     def _process_single_document(
         self,
         doc_id: str,
@@ -165,7 +722,8 @@ class DocumentIngester(ABC):
         """
         Process a single document and add to batch.
 
-        This method should:
+        Only called for ingesters that do not override _build_payloads();
+        it must then:
         1. Fetch the document from the API
         2. Build payloads (chunking + metadata)
         3. Generate embeddings
@@ -179,7 +737,10 @@ class DocumentIngester(ABC):
         Returns:
             True if successful, False if failed
         """
-        pass
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement _build_payloads() "
+            f"or _process_single_document()"
+        )
 
     def run(self) -> None:
         """
@@ -187,9 +748,14 @@ class DocumentIngester(ABC):
 
         This method orchestrates the entire ingestion process:
         1. Fetches all document IDs
-        2. Filters out already-processed documents
-        3. Processes remaining documents in batches
+        2. Claims leases on the documents that still need processing
+        3. Processes the claimed documents in batches
         4. Reports final statistics
+
+        Leases let several processes ingest the same date range at once:
+        each document is claimed by exactly one of them, a heartbeat keeps
+        the leases alive while this run works, and leases left behind by a
+        crashed process expire and are picked up again.
         """
         logger.info(
             f"Starting ingestion for date range: {self.start_date} to {self.end_date}"
@@ -202,63 +768,268 @@ class DocumentIngester(ABC):
         run_id = self.progress_tracker.start_run(
             self.start_date,
             self.end_date,
-            {"batch_size": self.batch_size, "dry_run": self.dry_run},
+            {
+                "batch_size": self.batch_size,
+                "dry_run": self.dry_run,
+                "workers": self.workers,
+                "stage_workers": self.stage_workers,
+                "refresh": self.refresh,
+            },
         )
 
         try:
-            # Fetch document IDs
-            doc_ids = self._fetch_document_ids()
+            found = 0
+            claimed = 0
+            queued: List[str] = []
+            seen: Set[str] = set()
+            self.performance_monitor.start()
+            self.progress_tracker.start_heartbeat()
+
+            # Store documents an earlier run spooled but could not upsert
+            self._drain_spool()
+
+            if self.stage_workers is not None:
+                self._start_pipeline()
+
+            # Process full batches while discovery is still paginating
+            for doc_ids in self._iter_document_ids():
+                found += len(doc_ids)
+                # Add to tracker (ignores duplicates) before processing, so
+                # an interrupted run still knows about the documents
+                self.progress_tracker.add_documents(doc_ids)
+                new_ids = [d for d in dict.fromkeys(doc_ids) if d not in seen]
+                seen.update(new_ids)
+
+                # Completed documents and ones leased by another process
+                # are not claimed
+                page_claimed = self.progress_tracker.claim_documents(
+                    new_ids, include_completed=self.refresh
+                )
+                claimed += len(page_claimed)
+                queued.extend(page_claimed)
 
-            if not doc_ids:
+                self._documents_discovered = claimed
+                while len(queued) >= self.batch_size:
+                    batch, queued = queued[: self.batch_size], queued[self.batch_size :]
+                    self._dispatch_documents(batch)
+
+            if not found:
                 logger.warning("No documents found in the specified date range")
                 return
 
-            logger.info(f"Found {len(doc_ids)} total documents")
-
-            # Add all documents to tracker (will ignore duplicates)
-            for doc_id in doc_ids:
-                self.progress_tracker.add_document(doc_id)
-
-            # Get pending documents
-            pending_ids = self.progress_tracker.get_pending_documents()
-            logger.info(f"Processing {len(pending_ids)} pending documents")
-
-            if not pending_ids:
+            logger.info(f"Found {found} total documents")
+
+            # Pick up documents left pending, failed or abandoned by earlier
+            # runs, one page at a time
+            leftovers = (d for d in self._leftover_document_ids() if d not in seen)
+            while True:
+                page = list(itertools.islice(leftovers, self.batch_size))
+                if not page:
+                    break
+                page = self.progress_tracker.claim_documents(page)
+                claimed += len(page)
+                queued.extend(page)
+                self._documents_discovered = claimed
+                while len(queued) >= self.batch_size:
+                    batch, queued = queued[: self.batch_size], queued[self.batch_size :]
+                    self._dispatch_documents(batch)
+
+            if not claimed:
                 logger.info("All documents have already been processed")
                 return
 
-            # Process in batches
-            self.performance_monitor.start()
-            self._process_documents_batch(pending_ids)
+            if queued:
+                self._dispatch_documents(queued)
+            if self._pipeline is not None:
+                self._finish_pipeline()
+
+            # Retry anything this run could not store yet
+            self._drain_spool()
+
+            logger.info(f"Processed {claimed} pending documents")
 
             # Print final statistics
             self._print_final_statistics()
 
         finally:
+            # Only still set here if the run was interrupted
+            if self._pipeline is not None:
+                self._pipeline.abort()
+                self._pipeline = None
+
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+            # Hand unfinished documents back to other processes right away
+            self.progress_tracker.stop_heartbeat()
+            self.progress_tracker.release_leases()
+
             # Mark run as completed
             self.progress_tracker.end_run(run_id)
             self.progress_tracker.close()
 
+            # Release pooled HTTP connections held by the API client
+            if self.api_client is not None:
+                self.api_client.close()
+
+    def _dispatch_documents(self, doc_ids: List[str]) -> None:
+        """Hand documents to the staged pipeline, or process them as a batch."""
+        if self._pipeline is None:
+            self._process_documents_batch(doc_ids)
+            return
+        for doc_id in doc_ids:
+            # Blocks while the fetch stage is backed up
+            self._pipeline.submit(_PipelineItem(doc_id, time.time()))
+
+    def _start_pipeline(self) -> None:
+        """Start the staged pipeline threads."""
+        handlers = {
+            "fetch": self._stage_fetch,
+            "chunk": self._stage_chunk,
+            "extract": self._stage_extract,
+            "embed": self._stage_embed,
+            "upsert": self._stage_upsert,
+        }
+        self._pipeline = StagedPipeline(
+            [
+                PipelineStage(name, handlers[name], self.stage_workers[name])
+                for name in INGESTION_STAGES
+            ],
+            queue_size=self.pipeline_queue_size,
+            on_error=self._on_stage_error,
+        )
+        self._pipeline.start()
+
+    def _finish_pipeline(self) -> None:
+        """Drain the staged pipeline and store the last partial batch."""
+        self._pipeline.close()
+        self._pipeline_stats = self._pipeline.stats()
+        self._pipeline = None
+        if self._upsert_buffer:
+            batch, self._upsert_buffer = self._upsert_buffer, []
+            self._store_pipeline_batch(batch)
+
+    def _stage_fetch(self, item: _PipelineItem) -> _PipelineItem:
+        timer = self._stage_timers[item.doc_id] = StageTimer()
+        self.progress_tracker.mark_processing(item.doc_id)
+        with timer.stage("fetch"):
+            item.document = self._fetch_document(item.doc_id)
+        return item
+
+    def _stage_chunk(self, item: _PipelineItem) -> Optional[_PipelineItem]:
+        with self._stage_timer(item.doc_id).stage("chunk"):
+            item.prepared = prepare_document(item.document)
+            if item.prepared is None:
+                raise ValueError(f"No payloads generated for document {item.doc_id}")
+            item.fingerprint, item.redo = self._plan_document(
+                item.doc_id, item.prepared
+            )
+        if not item.redo:
+            self._complete_unchanged(
+                item.doc_id, self._stage_timers.pop(item.doc_id, None)
+            )
+            self._record_pipeline_result(failed=False)
+            return None
+        return item
+
+    def _stage_extract(self, item: _PipelineItem) -> Optional[_PipelineItem]:
+        item.payloads = self._assemble_payloads(
+            item.doc_id, item.prepared, item.fingerprint, item.redo
+        )
+        item.document = item.prepared = None  # Only the payloads are needed now
+        if item.redo == {"extract"}:
+            self._update_stored_metadata(item.doc_id, item.payloads, item.fingerprint)
+            self._record_pipeline_result(failed=False)
+            return None
+        return item
+
+    def _stage_embed(self, item: _PipelineItem) -> _PipelineItem:
+        texts = [p["text"] for p in item.payloads]
+        timer = self._stage_timer(item.doc_id)
+        with timer.stage("embed"):
+            item.embeddings = self.embedding_generator.generate_batch_embeddings(texts)
+        timer.add_tokens("embedding_tokens", sum(map(count_tokens, texts)))
+        ingested_at = datetime.now().isoformat()
+        for payload in item.payloads:
+            payload["document_id"] = item.doc_id
+            payload["ingested_at"] = ingested_at
+        return item
+
+    def _stage_upsert(self, item: _PipelineItem) -> None:
+        processing_time_ms = int((time.time() - item.started_at) * 1000)
+        segment = self._spool_document(
+            item.doc_id, item.payloads, item.embeddings, processing_time_ms
+        )
+        self._record_pipeline_result(failed=False)
+
+        # Store once batch_size documents have arrived, outside the lock
+        with self._upsert_lock:
+            self._upsert_buffer.append(segment)
+            if len(self._upsert_buffer) < self.batch_size:
+                return None
+            batch, self._upsert_buffer = self._upsert_buffer, []
+        self._store_pipeline_batch(batch)
+        return None
+
+    def _on_stage_error(
+        self, stage: str, item: _PipelineItem, error: Exception
+    ) -> None:
+        logger.error(f"Error in {stage} stage for document {item.doc_id}: {error}")
+        self.progress_tracker.mark_failed(item.doc_id, str(error))
+        self._stage_timers.pop(item.doc_id, None)
+        self._record_pipeline_result(failed=True)
+
+    def _record_pipeline_result(self, failed: bool) -> None:
+        with self._upsert_lock:
+            self._documents_processed += 1
+            processed = self._documents_processed
+            total = max(self._documents_discovered, processed)
+        self.performance_monitor.record_document(failed=failed)
+        self.performance_monitor.print_progress(
+            processed, total, "Processing documents"
+        )
+
+    def _store_pipeline_batch(self, segments: List[Optional[Path]]) -> None:
+        with self._upsert_lock:
+            self._batches_started += 1
+            batch_number = self._batches_started
+        logger.info(
+            f"Storing pipeline batch {batch_number} ({len(segments)} documents)"
+        )
+        # Dry runs spool nothing
+        self._store_segments([path for path in segments if path is not None])
+
     def _process_documents_batch(self, doc_ids: List[str]) -> None:
         """
         Process documents in batches.
 
+        Progress is reported against every document discovered so far, since
+        run() calls this repeatedly while discovery is still paginating.
+        With workers > 1 the documents of a batch are processed concurrently;
+        their payloads are still added to the batch in document order.
+        Ingesters implementing _build_payloads() embed the chunks of the
+        whole batch together once all its documents are built.
+
         Args:
             doc_ids: List of document IDs to process
         """
-        total = len(doc_ids)
-        processed = 0
+        processed = self._documents_processed
+        total = max(self._documents_discovered, processed + len(doc_ids))
 
-        for i in range(0, total, self.batch_size):
+        for i in range(0, len(doc_ids), self.batch_size):
             batch_ids = doc_ids[i : i + self.batch_size]
+            self._batches_started += 1
             logger.info(
-                f"Processing batch {i // self.batch_size + 1} ({len(batch_ids)} documents)"
+                f"Processing batch {self._batches_started} ({len(batch_ids)} documents)"
             )
 
-            batch_documents = []
-            batch_embeddings = []
+            segments: List[Path] = []
+            results = zip(batch_ids, self._map_documents(batch_ids))
+            if self._packs_embeddings:
+                results = self._embed_packed(list(results))
 
-            for doc_id in batch_ids:
+            for doc_id, (success, documents, embeddings, elapsed_ms) in results:
                 processed += 1
 
                 # Update progress bar
@@ -266,29 +1037,230 @@ class DocumentIngester(ABC):
                     processed, total, "Processing documents"
                 )
 
-                # Process individual document
-                success = self._process_single_document(
-                    doc_id, batch_documents, batch_embeddings
-                )
+                if success:
+                    try:
+                        segment = self._spool_document(
+                            doc_id, documents, embeddings, elapsed_ms
+                        )
+                    except Exception as e:
+                        logger.error(f"Error spooling document {doc_id}: {e}")
+                        self.progress_tracker.mark_failed(doc_id, str(e))
+                        self._stage_timers.pop(doc_id, None)
+                        success = False
+                    else:
+                        if segment is not None:
+                            segments.append(segment)
 
                 if success:
                     self.performance_monitor.record_document()
                 else:
                     self.performance_monitor.record_document(failed=True)
 
+            self._documents_processed = processed
+
             # Store batch in Qdrant
-            if batch_documents and not self.dry_run:
-                self._store_batch(batch_documents, batch_embeddings)
+            self._store_segments(segments)
+
+    def _map_documents(self, doc_ids: List[str]) -> Iterator[_DocumentResult]:
+        """
+        Process documents, on the worker pool when workers > 1.
+
+        Yields:
+            (success, payloads, embeddings, elapsed_ms) per document, in
+            doc_ids order
+        """
+        if self.workers == 1:
+            return map(self._process_document_isolated, doc_ids)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="ingest"
+            )
+        return self._executor.map(self._process_document_isolated, doc_ids)
+
+    def _process_document_isolated(self, doc_id: str) -> _DocumentResult:
+        """
+        Process one document into its own payload and embedding lists.
+
+        Worker threads never append to the shared batch lists; the calling
+        thread spools each document's lists once it is done.
+        """
+        start_time = time.time()
+        documents: List[Dict[str, Any]] = []
+        embeddings: List[List[float]] = []
+        if self._packs_embeddings:
+            # Embeddings are generated for the whole batch by _embed_packed()
+            success = self._build_document_payloads(doc_id, documents)
+        else:
+            success = self._process_single_document(doc_id, documents, embeddings)
+        elapsed_ms = int((time.time() - start_time) * 1000)
+        return success, documents, embeddings, elapsed_ms
+
+    def _build_document_payloads(
+        self, doc_id: str, documents: List[Dict[str, Any]]
+    ) -> bool:
+        try:
+            self._stage_timers[doc_id] = StageTimer()
+            self.progress_tracker.mark_processing(doc_id)
+            documents.extend(self._build_payloads(doc_id))
+            return True
+        except Exception as e:
+            logger.error(f"Error processing document {doc_id}: {e}")
+            self.progress_tracker.mark_failed(doc_id, str(e))
+            self._stage_timers.pop(doc_id, None)
+            return False
+
+    def _embed_packed(
+        self,
+        results: List[Tuple[str, _DocumentResult]],
+    ) -> List[Tuple[str, _DocumentResult]]:
+        """
+        Embed the chunks of every built document of a batch together.
+
+        Args:
+            results: (doc_id, (success, payloads, [], elapsed_ms)) per document
+
+        Returns:
+            The same results with embeddings filled in; elapsed_ms includes
+            the time the document waited for the shared requests. Each
+            document's embed stage is charged its share of that time, by
+            token count.
+        """
+        aggregator = EmbeddingAggregator(self.embedding_generator)
+        for doc_id, (success, documents, _, _) in results:
+            if success:
+                aggregator.add(doc_id, [p["text"] for p in documents])
+
+        start_time = time.time()
+        try:
+            embedded = aggregator.embed()
+            error = None
+        except Exception as e:
+            logger.error(f"Error generating embeddings for batch: {e}")
+            embedded, error = {}, str(e)
+        embed_ms = int((time.time() - start_time) * 1000)
+        total_tokens = sum(aggregator.token_counts.values())
+
+        packed = []
+        for doc_id, (success, documents, _, elapsed_ms) in results:
+            # Documents without payloads were completed without embedding
+            if success and documents and error is not None:
+                self.progress_tracker.mark_failed(doc_id, error)
+                self._stage_timers.pop(doc_id, None)
+                success = False
+            elif success and documents:
+                tokens = aggregator.token_counts.get(doc_id, 0)
+                timer = self._stage_timer(doc_id)
+                timer.add("embed", embed_ms * tokens / max(total_tokens, 1))
+                timer.add_tokens("embedding_tokens", tokens)
+            embeddings = embedded.get(doc_id, []) if success else []
+            packed.append(
+                (doc_id, (success, documents, embeddings, elapsed_ms + embed_ms))
+            )
+        return packed
+
+    def _spool_document(
+        self,
+        doc_id: str,
+        payloads: List[Dict[str, Any]],
+        embeddings: List[List[float]],
+        processing_time_ms: int,
+    ) -> Optional[Path]:
+        """
+        Write a processed document to the spool and mark it spooled.
+
+        In dry-run mode nothing will be stored, so the document is marked
+        completed right away. A document without payloads was already
+        completed by _payloads_from_document() and is not spooled.
+
+        Returns:
+            The spool segment, or None in dry-run mode or without payloads
+        """
+        if not payloads:
+            return None
+        if self.dry_run:
+            self.progress_tracker.mark_completed(doc_id, processing_time_ms)
+            self._record_timings(doc_id)
+            return None
+        segment = self.spool.write(doc_id, payloads, embeddings)
+        self.progress_tracker.mark_spooled(doc_id, processing_time_ms)
+        self._record_timings(doc_id)
+        return segment
+
+    def _drain_spool(self) -> None:
+        """
+        Store every spooled document, batch_size documents at a time.
+
+        Spooled documents whose segment is missing here and whose lease has
+        expired are then released to be processed again.
+        """
+        if self.dry_run:
+            return
+        paths = self.spool.segments()
+        if paths:
+            logger.info(f"Draining {len(paths)} spooled documents into Qdrant")
+        for i in range(0, len(paths), self.batch_size):
+            self._store_segments(paths[i : i + self.batch_size])
+        self._release_lost_spooled()
+
+    def _store_segments(self, paths: List[Path]) -> None:
+        """
+        Upsert spooled documents and complete them once Qdrant acknowledges.
+
+        The batch is retried store_attempts times with exponential backoff.
+        If it still fails, each document is tried once on its own so one bad
+        document cannot hold back the others. Documents that could not be
+        stored stay spooled for the next drain.
+
+        Args:
+            paths: Spool segments to store
+        """
+        segments = []
+        for path in paths:
+            try:
+                segments.append(self.spool.read(path))
+            except FileNotFoundError:
+                continue  # Already drained by another ingester
+        if not segments:
+            return
+
+        if self._upsert_segments(segments, self.store_attempts):
+            return
+        if len(segments) > 1:
+            for segment in segments:
+                self._upsert_segments([segment], attempts=1)
+
+    def _upsert_segments(self, segments: List[SpoolSegment], attempts: int) -> bool:
+        payloads = [p for segment in segments for p in segment.payloads]
+        embeddings = [e for segment in segments for e in segment.embeddings]
+        rebuilt = self._rebuilt_chunk_counts(segments)
+
+        for delay in self._upsert_delays(len(segments), attempts):
+            if delay:
+                time.sleep(delay)
+            start_time = time.perf_counter()
+            if not self.qdrant_client.delete_stale_chunks(rebuilt):
+                continue
+            if self._store_batch(payloads, embeddings):
+                store_ms = (time.perf_counter() - start_time) * 1000
+                self._complete_segments(segments, store_ms)
+                return True
+
+        self._keep_segments(segments)
+        return False
 
     def _store_batch(
         self, documents: List[Dict[str, Any]], embeddings: List[List[float]]
-    ) -> None:
+    ) -> bool:
         """
         Store a batch of documents in Qdrant.
 
         Args:
             documents: List of document payloads
             embeddings: Corresponding embedding vectors
+
+        Returns:
+            True if Qdrant acknowledged every chunk
         """
         try:
             logger.info(f"Storing batch of {len(documents)} chunks in Qdrant")
@@ -298,46 +1270,21 @@ class DocumentIngester(ABC):
             )
 
             logger.info(f"Stored {successful} chunks, {failed} failed")
+            return failed == 0
 
         except Exception as e:
             logger.error(f"Error storing batch in Qdrant: {e}")
+            return False
 
     def _print_final_statistics(self) -> None:
         """Print final ingestion statistics."""
-        print("\n" + "=" * 60)
-        print("INGESTION COMPLETE")
-        print("=" * 60)
-
-        # Get statistics from progress tracker
         stats = self.progress_tracker.get_statistics()
-
-        print(f"Document Type: {stats['document_type']}")
-        print(f"Total Documents: {stats['total']}")
-        print(f"Completed: {stats['completed']}")
-        print(f"Failed: {stats['failed']}")
-        print(f"Pending: {stats['pending']}")
-        print(f"Success Rate: {stats['success_rate']:.1f}%")
-
-        if stats["avg_processing_time_ms"]:
-            print(f"Avg Processing Time: {stats['avg_processing_time_ms']:.0f}ms")
-
-        # Get performance statistics
-        perf_stats = self.performance_monitor.get_statistics()
-        print(f"\nTotal Time: {perf_stats['elapsed_time_formatted']}")
-        print(f"Throughput: {perf_stats['throughput_per_minute']:.1f} docs/minute")
-
-        # Get Qdrant statistics
         qdrant_stats = self.qdrant_client.get_collection_stats()
-        print(f"\nQdrant Collection: {qdrant_stats.get('collection_name')}")
-        print(f"Total Chunks in Collection: {qdrant_stats.get('total_documents', 0)}")
-
-        # Show failed documents if any
-        if stats["failed"] > 0:
-            print("\n" + "=" * 60)
-            print("FAILED DOCUMENTS (showing up to 10):")
-            print("-" * 60)
-            for failed_doc in stats["failed_documents"]:
-                print(f"ID: {failed_doc['document_id']}")
-                print(f"Error: {failed_doc['error']}")
-                print(f"Failed At: {failed_doc['failed_at']}")
-                print("-" * 40)
+        print("\n".join(self._final_statistics_lines(stats, qdrant_stats)))
+
+    def _runtime_statistics_lines(self) -> List[str]:
+        """Per-stage utilization when run as a staged pipeline."""
+        if not self._pipeline_stats:
+            return []
+        lines = format_stage_stats(self._pipeline_stats)
+        return ["\nPipeline Stages:"] + [f"  {line}" for line in lines]
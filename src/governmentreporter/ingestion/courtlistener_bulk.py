@@ -0,0 +1,403 @@
+"""
+CourtListener bulk-data ingester for Supreme Court opinions.
+
+This module ingests Supreme Court opinions from CourtListener's bulk data
+files (https://www.courtlistener.com/help/api/bulk-data/) instead of the REST
+API. For full-history backfills, the API's rate limit is the bottleneck; the
+bulk dumps contain every opinion and can be read locally at disk speed.
+
+The ingester:
+- Streams the dockets dump to find SCOTUS dockets
+- Streams the clusters dump to keep SCOTUS clusters in the date range
+- Optionally streams the citations dump to attach citations to those clusters
+- Streams the opinions dump, building a Document for each SCOTUS opinion
+- Feeds the same build_payloads_from_document -> embeddings -> Qdrant
+  pipeline as SCOTUSIngester, recording completion in ProgressTracker
+
+Dump files may be plain, bzip2 (.bz2), gzip (.gz) or xz (.xz) compressed, in
+CSV or JSON Lines (.jsonl / .ndjson) format. Every file is read one record at
+a time, so multi-GB compressed dumps never have to fit in memory; only the
+SCOTUS clusters in the date range and one batch of opinions are held.
+"""
+
+import bz2
+import csv
+import gzip
+import json
+import logging
+import lzma
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Set, Union
+
+from ..apis.base import Document
+from ..apis.court_listener import _build_opinion_document, _extract_opinion_metadata
+from .base import DocumentIngester
+
+logger = logging.getLogger(__name__)
+
+# Cluster fields kept in memory and passed to the Document as cluster_data
+CLUSTER_FIELDS = (
+    "id",
+    "case_name",
+    "case_name_full",
+    "date_filed",
+    "judges",
+    "precedential_status",
+    "docket_id",
+)
+
+# Log streaming progress every this many records
+LOG_EVERY = 100_000
+
+_OPENERS = {".bz2": bz2.open, ".gz": gzip.open, ".xz": lzma.open}
+
+
+def open_dump(path: Union[str, Path]) -> IO[str]:
+    """
+    Open a bulk dump file for streaming text reads.
+
+    The decompressor is chosen from the file suffix, so compressed dumps are
+    decompressed incrementally as they are read.
+
+    Args:
+        path: Dump file path (.csv, .jsonl, optionally .bz2/.gz/.xz)
+
+    Returns:
+        Text file object (newline translation disabled, as csv requires)
+    """
+    path = Path(path)
+    opener = _OPENERS.get(path.suffix.lower(), open)
+    return opener(path, "rt", encoding="utf-8", newline="")
+
+
+def iter_dump_records(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one dictionary per record of a CSV or JSON Lines dump.
+
+    CourtListener's CSV dumps are PostgreSQL exports that escape quotes with
+    a backslash and contain very large text fields, so the csv module is
+    configured for both.
+
+    Args:
+        path: Dump file path
+
+    Yields:
+        Records keyed by column name
+    """
+    path = Path(path)
+    suffixes = [s.lower() for s in path.suffixes]
+    is_json_lines = ".jsonl" in suffixes or ".ndjson" in suffixes
+
+    with open_dump(path) as f:
+        if is_json_lines:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        else:
+            csv.field_size_limit(sys.maxsize)
+            yield from csv.DictReader(f, escapechar="\\")
+
+
+def _as_bool(value: Any) -> bool:
+    """Parse a boolean from a dump field (PostgreSQL writes 't'/'f')."""
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("t", "true", "1", "yes")
+
+
+class CourtListenerBulkIngester(DocumentIngester):
+    """
+    Handles ingestion of Supreme Court opinions from CourtListener bulk dumps.
+
+    Uses the same progress database namespace ("scotus") and Qdrant collection
+    as SCOTUSIngester, so opinions completed by either ingester are skipped
+    by the other.
+
+    Example:
+        ingester = CourtListenerBulkIngester(
+            opinions_path="opinions-2024-10-31.csv.bz2",
+            clusters_path="opinion-clusters-2024-10-31.csv.bz2",
+            dockets_path="dockets-2024-10-31.csv.bz2",
+            start_date="1789-01-01",
+            end_date="2024-12-31",
+        )
+        ingester.run()
+    """
+
+    def __init__(
+        self,
+        opinions_path: str,
+        clusters_path: str,
+        dockets_path: str,
+        start_date: str,
+        end_date: str,
+        citations_path: Optional[str] = None,
+        court_id: str = "scotus",
+        batch_size: int = 50,
+        dry_run: bool = False,
+        progress_db: str = "scotus_ingestion.db",
+        qdrant_db_path: str = "./data/qdrant/qdrant_db",
+        shared_db_client=None,
+        workers: int = 1,
+        stage_workers: Optional[Dict[str, int]] = None,
+        refresh: bool = False,
+        embedding_cache=None,
+    ):
+        """
+        Initialize the bulk ingester.
+
+        Args:
+            opinions_path: Opinions dump file
+            clusters_path: Opinion clusters dump file
+            dockets_path: Dockets dump file (needed for the court of a cluster)
+            start_date: Earliest cluster date_filed to ingest (YYYY-MM-DD)
+            end_date: Latest cluster date_filed to ingest (YYYY-MM-DD)
+            citations_path: Optional citations dump file
+            court_id: CourtListener court to keep (default: "scotus")
+            batch_size: Number of opinions to process in each batch
+            dry_run: If True, don't actually store documents
+            progress_db: Path to SQLite progress database
+            qdrant_db_path: Path to Qdrant database directory
+            shared_db_client: Optional pre-initialized QdrantDBClient for shared access
+            workers: Number of documents to process concurrently (default: 1)
+            stage_workers: Threads per pipeline stage; enables staged ingestion
+            refresh: Also re-check completed documents for changes at the source
+            embedding_cache: Optional EmbeddingCache of vectors already computed
+        """
+        super().__init__(
+            start_date=start_date,
+            end_date=end_date,
+            batch_size=batch_size,
+            dry_run=dry_run,
+            progress_db=progress_db,
+            qdrant_db_path=qdrant_db_path,
+            document_type="scotus",
+            shared_db_client=shared_db_client,
+            workers=workers,
+            stage_workers=stage_workers,
+            refresh=refresh,
+            embedding_cache=embedding_cache,
+        )
+
+        self.opinions_path = Path(opinions_path)
+        self.clusters_path = Path(clusters_path)
+        self.dockets_path = Path(dockets_path)
+        self.citations_path = Path(citations_path) if citations_path else None
+        self.court_id = court_id
+
+        # Clusters of the court in the date range, keyed by cluster ID
+        self.clusters: Dict[str, Dict[str, Any]] = {}
+
+        # Documents discovered but not yet processed, keyed by opinion ID.
+        # run() drains this one batch at a time.
+        self.pending_documents: Dict[str, Document] = {}
+
+    def _get_collection_name(self) -> str:
+        """Get the Qdrant collection name for SCOTUS opinions."""
+        return "supreme_court_opinions"
+
+    def _load_clusters(self) -> None:
+        """
+        Stream the dockets, clusters and citations dumps into self.clusters.
+
+        Only the docket IDs of the court and the clusters that belong to them
+        within the date range are kept in memory.
+        """
+        logger.info(f"Reading {self.court_id} dockets from {self.dockets_path}")
+        docket_numbers: Dict[str, str] = {}
+        for i, docket in enumerate(iter_dump_records(self.dockets_path), start=1):
+            if docket.get("court_id") == self.court_id:
+                docket_numbers[str(docket.get("id"))] = docket.get("docket_number")
+            if i % LOG_EVERY == 0:
+                logger.info(f"Scanned {i} dockets ({len(docket_numbers)} matched)")
+
+        logger.info(f"Reading clusters from {self.clusters_path}")
+        for i, cluster in enumerate(iter_dump_records(self.clusters_path), start=1):
+            if i % LOG_EVERY == 0:
+                logger.info(f"Scanned {i} clusters ({len(self.clusters)} matched)")
+
+            docket_id = str(cluster.get("docket_id"))
+            if docket_id not in docket_numbers:
+                continue
+            if cluster.get("precedential_status", "Published") != "Published":
+                continue
+            date_filed = (cluster.get("date_filed") or "")[:10]
+            if not (self.start_date <= date_filed <= self.end_date):
+                continue
+
+            kept = {field: cluster.get(field) for field in CLUSTER_FIELDS}
+            kept["docket_number"] = docket_numbers[docket_id]
+            kept["citations"] = []
+            self.clusters[str(cluster.get("id"))] = kept
+
+        if self.citations_path:
+            logger.info(f"Reading citations from {self.citations_path}")
+            for citation in iter_dump_records(self.citations_path):
+                cluster = self.clusters.get(str(citation.get("cluster_id")))
+                if cluster is not None:
+                    cluster["citations"].append(
+                        {
+                            "volume": citation.get("volume"),
+                            "reporter": citation.get("reporter"),
+                            "page": citation.get("page"),
+                            "type": citation.get("type"),
+                        }
+                    )
+
+        logger.info(
+            f"Found {len(self.clusters)} {self.court_id} clusters "
+            f"from {self.start_date} to {self.end_date}"
+        )
+
+    def _build_document(
+        self, opinion: Dict[str, Any], cluster: Dict[str, Any]
+    ) -> Document:
+        """
+        Build the same Document CourtListenerClient.get_document() returns.
+
+        Args:
+            opinion: Opinion record from the dump
+            cluster: Matching cluster from self.clusters
+
+        Returns:
+            Supreme Court Opinion document
+        """
+        opinion = dict(opinion)
+        opinion["per_curiam"] = _as_bool(opinion.get("per_curiam", False))
+        metadata = _extract_opinion_metadata(opinion)
+        if not metadata["text_content"]:
+            # Older opinions often only have plain_text in the dumps
+            metadata["text_content"] = opinion.get("plain_text") or ""
+        metadata["docket_number"] = cluster.get("docket_number")
+
+        return _build_opinion_document(
+            str(opinion.get("id")), opinion, metadata, cluster
+        )
+
+    def _iter_document_ids(self) -> Iterator[List[str]]:
+        """
+        Stream the opinions dump, yielding opinion IDs one batch at a time.
+
+        Each yielded opinion's Document is stored in pending_documents until
+        _process_single_document() consumes it. Opinions already completed
+        in the progress database are skipped without building a Document.
+
+        Yields:
+            Lists of at most batch_size opinion IDs
+        """
+        self._load_clusters()
+        if not self.clusters:
+            return
+
+        logger.info(f"Streaming opinions from {self.opinions_path}")
+        batch: List[str] = []
+        for i, opinion in enumerate(iter_dump_records(self.opinions_path), start=1):
+            if i % LOG_EVERY == 0:
+                logger.info(f"Scanned {i} opinions")
+
+            cluster = self.clusters.get(str(opinion.get("cluster_id")))
+            if cluster is None:
+                continue
+
+            doc_id = str(opinion.get("id"))
+            if not self.progress_tracker.is_processed(doc_id):
+                self.pending_documents[doc_id] = self._build_document(opinion, cluster)
+            batch.append(doc_id)
+
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    def _fetch_document_ids(self) -> List[str]:
+        """
+        Collect every matching opinion ID from the dumps.
+
+        Returns:
+            List of opinion IDs (their Documents are kept in pending_documents)
+        """
+        return [doc_id for batch in self._iter_document_ids() for doc_id in batch]
+
+    def _leftover_document_ids(self) -> List[str]:
+        """Documents not in this dump cannot be fetched by ID, so none are resumed."""
+        return []
+
+    def _fetch_document(self, doc_id: str) -> Document:
+        """
+        Take the Document built for an opinion while streaming the dump.
+
+        Raises:
+            ValueError: If the opinion was not read from the dump
+        """
+        document = self.pending_documents.pop(doc_id, None)
+        if document is None:
+            raise ValueError(f"Opinion {doc_id} was not read from the dump")
+
+        logger.info(f"Ingesting SCOTUS opinion: {document.title}")
+        return document
+
+    def _build_payloads(self, doc_id: str) -> List[Dict[str, Any]]:
+        """
+        Fetch an opinion from the dump and build its chunk payloads, without embeddings.
+
+        Args:
+            doc_id: Opinion ID to process
+
+        Returns:
+            Chunk payloads with document_id and ingested_at set, or [] if
+            the stored chunks needed no re-embedding
+
+        Raises:
+            ValueError: If no payloads could be built
+        """
+        document = self._fetch_document(doc_id)
+
+        # Empty when the stored chunks are up to date (already completed)
+        payloads = self._payloads_from_document(document)
+
+        ingested_at = datetime.now().isoformat()
+        for payload in payloads:
+            payload["document_id"] = doc_id
+            payload["ingested_at"] = ingested_at
+        return payloads
+
+    def _process_single_document(
+        self,
+        doc_id: str,
+        batch_documents: List[Dict[str, Any]],
+        batch_embeddings: List[List[float]],
+    ) -> bool:
+        """
+        Process one opinion read from the dump.
+
+        Args:
+            doc_id: Opinion ID to process
+            batch_documents: List to append document payloads to
+            batch_embeddings: List to append embeddings to
+
+        Returns:
+            True if successful, False if failed
+        """
+        try:
+            self.progress_tracker.mark_processing(doc_id)
+
+            payloads = self._build_payloads(doc_id)
+
+            # Generate embeddings for each chunk
+            chunk_texts = [p["text"] for p in payloads]
+            embeddings = self.embedding_generator.generate_batch_embeddings(chunk_texts)
+
+            batch_documents.extend(payloads)
+            batch_embeddings.extend(embeddings)
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Error processing opinion {doc_id}: {e}")
+            self.progress_tracker.mark_failed(doc_id, str(e))
+            return False
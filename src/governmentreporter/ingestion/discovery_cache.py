@@ -0,0 +1,336 @@
+"""
+Persistent cache of discovery results for API ingesters.
+
+Discovery pages through listing endpoints (CourtListener clusters, Federal
+Register executive order searches) and keeps per-document metadata for the
+processing step: the cluster of each SCOTUS opinion, the listing entry of
+each executive order. Kept only in process memory, that metadata is lost on
+restart, so a resumed run has to page through the listings again, and on a
+full-history run it grows with the whole date range.
+
+DiscoveryCache keeps it in a compact on-disk store instead:
+
+    - records: (namespace, key) -> zlib-compressed JSON value, stored_at
+    - listings: (namespace, name) -> zlib-compressed JSON list of keys,
+      stored_at; the complete result of one discovery (e.g. one date range)
+
+A bounded in-memory LRU front (LRUCache) serves recently used records, so
+memory stays flat however many documents are discovered. Records and
+listings older than max_age are ignored: a fresh listing lets a resumed run
+skip discovery entirely, a stale one is discovered again.
+
+Python Learning Notes:
+    - collections.OrderedDict.move_to_end() makes an LRU cache a few lines
+    - check_same_thread=False plus a threading.Lock lets worker threads share
+      one sqlite3 connection
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Iterable, List, Mapping, Optional, Tuple, Union
+
+from ..utils import get_logger
+
+logger = get_logger(__name__)
+
+# Records kept in memory per cache
+DEFAULT_MEMORY_ITEMS = 2048
+
+# Seconds records and listings stay fresh (one day)
+DEFAULT_MAX_AGE = 24 * 3600.0
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe mapping that keeps only the most recently used items.
+
+    Example:
+        texts = LRUCache(maxsize=256)
+        texts["url"] = "text"
+        texts.get("url")  # "text", now the most recently used item
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Args:
+            maxsize: Maximum number of items kept
+
+        Raises:
+            ValueError: If maxsize is less than 1
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self._items: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return an item (marking it recently used), or default."""
+        with self._lock:
+            if key not in self._items:
+                return default
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """Remove and return an item, or return default."""
+        with self._lock:
+            return self._items.pop(key, default)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._items
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+
+class DiscoveryCache:
+    """
+    Discovery metadata keyed by document ID, on disk with an LRU front.
+
+    Supports the dict operations the ingesters use (item access, get, pop,
+    update, in, len), so it can stand in for a plain dict. pop() only drops the
+    in-memory copy: the record stays on disk until it expires, so a document
+    that fails and is retried by a later run still finds its metadata.
+
+    Several caches (namespaces) can share one database file, and several
+    processes can share it too (SQLite WAL mode).
+
+    Example:
+        clusters = DiscoveryCache("./data/progress/scotus_discovery.db", "clusters")
+        clusters["123456"] = cluster
+        clusters.put_listing("2024-01-01:2024-12-31", opinion_ids)
+
+        # A later run within max_age
+        opinion_ids = clusters.get_listing("2024-01-01:2024-12-31")
+        cluster = clusters.get("123456")
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        namespace: str,
+        memory_items: int = DEFAULT_MEMORY_ITEMS,
+        max_age: Optional[float] = DEFAULT_MAX_AGE,
+    ):
+        """
+        Open (or create) a discovery cache.
+
+        Args:
+            db_path: SQLite database file (created, with its directory, on
+                     first use)
+            namespace: Name separating this cache from others in the file
+            memory_items: Records kept in the in-memory LRU front
+            max_age: Seconds records and listings stay fresh; None means
+                     they never expire
+        """
+        self.db_path = Path(db_path)
+        self.namespace = namespace
+        self.max_age = max_age
+        self._memory = LRUCache(memory_items)
+
+        self._lock = threading.Lock()
+        # Opened on first use so constructing a cache touches no files
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Database connection, created (with its directory) on first use."""
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                str(self.db_path),
+                check_same_thread=False,
+                isolation_level=None,
+                timeout=30.0,
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS records (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    stored_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                );
+                CREATE TABLE IF NOT EXISTS listings (
+                    namespace TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    keys BLOB NOT NULL,
+                    stored_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, name)
+                );
+                """
+            )
+        return self._connection
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        return zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+    @staticmethod
+    def _decode(data: bytes) -> Any:
+        return json.loads(zlib.decompress(data))
+
+    def _fresh_since(self) -> float:
+        """Oldest stored_at that is still fresh."""
+        return time.time() - self.max_age if self.max_age is not None else 0.0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Look up a record, in memory first, then on disk.
+
+        Args:
+            key: Document ID
+            default: Returned when there is no fresh record
+
+        Returns:
+            The record, or default
+        """
+        value = self._memory.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM records "
+                "WHERE namespace = ? AND key = ? AND stored_at >= ?",
+                (self.namespace, key, self._fresh_since()),
+            ).fetchone()
+        if row is None:
+            return default
+
+        value = self._decode(row[0])
+        self._memory[key] = value
+        return value
+
+    def update(
+        self, items: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]]
+    ) -> None:
+        """
+        Store several records in one transaction (like dict.update()).
+
+        Args:
+            items: Mapping or (document ID, record) pairs
+        """
+        if isinstance(items, Mapping):
+            items = items.items()
+        stored_at = time.time()
+        rows = []
+        for key, value in items:
+            self._memory[key] = value
+            rows.append((self.namespace, key, self._encode(value), stored_at))
+        if not rows:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO records "
+                    "(namespace, key, value, stored_at) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """
+        Return a record and drop it from memory (it stays on disk).
+
+        Args:
+            key: Document ID
+            default: Returned when there is no fresh record
+
+        Returns:
+            The record, or default
+        """
+        value = self._memory.pop(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        self._memory.pop(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.update([(key, value)])
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        """Number of fresh records on disk."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM records WHERE namespace = ? AND stored_at >= ?",
+                (self.namespace, self._fresh_since()),
+            ).fetchone()
+        return row[0]
+
+    def get_listing(self, name: str) -> Optional[List[str]]:
+        """
+        Return the keys of a completed discovery, if it is still fresh.
+
+        Args:
+            name: Listing name (e.g. the discovered date range)
+
+        Returns:
+            Document IDs in discovery order, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT keys FROM listings "
+                "WHERE namespace = ? AND name = ? AND stored_at >= ?",
+                (self.namespace, name, self._fresh_since()),
+            ).fetchone()
+        return self._decode(row[0]) if row is not None else None
+
+    def put_listing(self, name: str, keys: List[str]) -> None:
+        """
+        Record the keys found by a completed discovery.
+
+        Args:
+            name: Listing name (e.g. the discovered date range)
+            keys: Document IDs in discovery order
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO listings (namespace, name, keys, stored_at) "
+                "VALUES (?, ?, ?, ?)",
+                (self.namespace, name, self._encode(keys), time.time()),
+            )
+
+    def close(self) -> None:
+        """Close the database connection (reopened on next use)."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
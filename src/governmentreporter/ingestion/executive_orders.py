@@ -14,17 +14,63 @@ The ingester:
 """
 
 import logging
-import time
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from ..apis.base import Document
-from ..apis.federal_register import FederalRegisterClient
-from ..processors.build_payloads import build_payloads_from_document
+from ..apis.federal_register import AsyncFederalRegisterClient, FederalRegisterClient
+from .async_base import AsyncDocumentIngester
 from .base import DocumentIngester
+from .discovery_cache import DEFAULT_MAX_AGE, DiscoveryCache, LRUCache
 
 logger = logging.getLogger(__name__)
 
+# Result pages of the EO listing fetched in parallel during ID discovery
+LIST_PAGE_CONCURRENCY = 4
+
+# Order texts kept in memory (the HTTP cache keeps them on disk)
+TEXT_CACHE_SIZE = 256
+
+
+def _order_document(
+    doc_id: str, order_metadata: Dict[str, Any], raw_text: str
+) -> Document:
+    """
+    Build the Document for an order from its API metadata and full text.
+
+    Args:
+        doc_id: Document number of the order
+        order_metadata: Order metadata in Federal Register API format
+        raw_text: Cleaned full text of the order
+
+    Returns:
+        The order as a Document
+    """
+    return Document(
+        id=doc_id,
+        title=order_metadata.get("title", ""),
+        date=order_metadata.get(
+            "signing_date", order_metadata.get("publication_date", "")
+        ),
+        type="Executive Order",
+        source="Federal Register",
+        content=raw_text,
+        metadata={
+            "executive_order_number": order_metadata.get("executive_order_number"),
+            "president": (
+                order_metadata.get("president", {}).get("name")
+                if "president" in order_metadata
+                else None
+            ),
+            "signing_date": order_metadata.get("signing_date"),
+            "publication_date": order_metadata.get("publication_date"),
+            "document_number": doc_id,
+            "agencies": order_metadata.get("agencies", []),
+            "topics": order_metadata.get("topics", []),
+        },
+        url=order_metadata.get("html_url", ""),
+    )
+
 
 class ExecutiveOrderIngester(DocumentIngester):
     """
@@ -58,6 +104,14 @@ class ExecutiveOrderIngester(DocumentIngester):
         progress_db: str = "executive_orders_ingestion.db",
         qdrant_db_path: str = "./data/qdrant/qdrant_db",
         shared_db_client=None,
+        http_cache=None,
+        cassette=None,
+        workers: int = 1,
+        stage_workers: Optional[Dict[str, int]] = None,
+        discovery_db: Optional[str] = None,
+        discovery_max_age: Optional[float] = DEFAULT_MAX_AGE,
+        refresh: bool = False,
+        embedding_cache=None,
     ):
         """
         Initialize the Executive Order ingester.
@@ -70,6 +124,16 @@ class ExecutiveOrderIngester(DocumentIngester):
             progress_db: Path to SQLite progress database
             qdrant_db_path: Path to Qdrant database directory
             shared_db_client: Optional pre-initialized QdrantDBClient for shared access
+            http_cache: Optional HTTPCache for API responses
+            cassette: Optional Cassette to record or replay API traffic
+            workers: Number of documents to process concurrently (default: 1)
+            stage_workers: Threads per pipeline stage; enables staged ingestion
+            discovery_db: Optional SQLite file persisting discovered orders,
+                          so resumed runs skip discovery (default: memory only)
+            discovery_max_age: Seconds discovery results in discovery_db
+                               stay fresh (None: forever)
+            refresh: Also re-check completed documents for changes at the source
+            embedding_cache: Optional EmbeddingCache of vectors already computed
         """
         # Initialize base class
         super().__init__(
@@ -81,16 +145,34 @@ class ExecutiveOrderIngester(DocumentIngester):
             qdrant_db_path=qdrant_db_path,
             document_type="executive_order",
             shared_db_client=shared_db_client,
+            http_cache=http_cache,
+            cassette=cassette,
+            workers=workers,
+            stage_workers=stage_workers,
+            refresh=refresh,
+            embedding_cache=embedding_cache,
         )
 
         # Initialize EO-specific API client
-        self.api_client = FederalRegisterClient()
+        self.api_client = FederalRegisterClient(
+            http_cache=http_cache, cassette=cassette
+        )
+
+        # Persistent discovery results (order metadata and completed
+        # listings), or None to keep metadata in memory for this run only
+        self.discovery_cache: Optional[DiscoveryCache] = (
+            DiscoveryCache(discovery_db, "executive_orders", max_age=discovery_max_age)
+            if discovery_db
+            else None
+        )
 
         # Cache for raw text URLs to avoid duplicate fetches
-        self.text_url_cache = {}
+        self.text_url_cache = LRUCache(TEXT_CACHE_SIZE)
 
         # Store metadata for lookup during processing
-        self.orders_metadata = {}
+        self.orders_metadata: Union[Dict[str, Dict[str, Any]], DiscoveryCache] = (
+            self.discovery_cache if self.discovery_cache is not None else {}
+        )
 
     def _get_collection_name(self) -> str:
         """Get the Qdrant collection name for Executive Orders."""
@@ -104,9 +186,22 @@ class ExecutiveOrderIngester(DocumentIngester):
         Register API and stores it for later use during processing. It returns
         the list of document numbers.
 
+        With a discovery cache, the listing of the date range is recorded;
+        while it is fresh, later runs reuse it and the cached metadata instead
+        of calling the API.
+
         Returns:
             List of document numbers (IDs) to process
         """
+        listing_key = f"orders:{self.start_date}:{self.end_date}"
+        if self.discovery_cache is not None:
+            listing = self.discovery_cache.get_listing(listing_key)
+            if listing is not None:
+                logger.info(
+                    f"Using {len(listing)} cached Executive Orders, skipping discovery"
+                )
+                return listing
+
         logger.info("Fetching Executive Orders from Federal Register API...")
 
         all_orders = []
@@ -114,7 +209,9 @@ class ExecutiveOrderIngester(DocumentIngester):
         try:
             # Use the list_executive_orders method with date filtering
             orders = self.api_client.list_executive_orders(
-                start_date=self.start_date, end_date=self.end_date
+                start_date=self.start_date,
+                end_date=self.end_date,
+                max_concurrent_pages=LIST_PAGE_CONCURRENCY,
             )
 
             # Process the generator and collect all orders
@@ -129,34 +226,130 @@ class ExecutiveOrderIngester(DocumentIngester):
 
             # Store metadata for later lookup and add to progress tracker
             for order in all_orders:
-                doc_id = order.get("document_number", "")
-                if doc_id:
-                    self.orders_metadata[doc_id] = order
-
-                    # Add to progress tracker with metadata
-                    self.progress_tracker.add_document(
-                        doc_id,
-                        metadata={
-                            "title": order.get("title", ""),
-                            "executive_order_number": order.get(
-                                "executive_order_number", ""
-                            ),
-                            "signing_date": order.get("signing_date", ""),
-                            "publication_date": order.get("publication_date", ""),
-                        },
-                    )
+                self._track_order(order)
 
             # Return list of document IDs
-            return [
+            doc_ids = [
                 order.get("document_number")
                 for order in all_orders
                 if order.get("document_number")
             ]
+            if self.discovery_cache is not None:
+                self.discovery_cache.put_listing(listing_key, doc_ids)
+            return doc_ids
 
         except Exception as e:
             logger.error(f"Error fetching Executive Orders: {e}")
             return []
 
+    def _track_order(self, order: Dict[str, Any]) -> None:
+        """
+        Store an order's metadata for processing and add it to the tracker.
+
+        Args:
+            order: Executive order metadata in Federal Register API format
+        """
+        doc_id = order.get("document_number", "")
+        if not doc_id:
+            return
+
+        self.orders_metadata[doc_id] = order
+
+        # Add to progress tracker with metadata
+        self.progress_tracker.add_document(
+            doc_id,
+            metadata={
+                "title": order.get("title", ""),
+                "executive_order_number": order.get("executive_order_number", ""),
+                "signing_date": order.get("signing_date", ""),
+                "publication_date": order.get("publication_date", ""),
+            },
+        )
+
+    def _get_order_text(self, doc_id: str, order_metadata: Dict[str, Any]) -> str:
+        """
+        Get the full text of an order from its raw_text_url (with caching).
+
+        Args:
+            doc_id: Document number of the order
+            order_metadata: Order metadata from discovery
+
+        Returns:
+            Cleaned full text of the order
+        """
+        raw_text_url = order_metadata.get("raw_text_url")
+        if not raw_text_url:
+            raise ValueError(f"No raw text URL for order {doc_id}")
+
+        raw_text = self.text_url_cache.get(raw_text_url)
+        if raw_text is not None:
+            logger.debug(f"Using cached text for order {doc_id}")
+            return raw_text
+
+        logger.debug(f"Fetching raw text for order {doc_id}")
+        raw_text = self.api_client.get_executive_order_text(raw_text_url)
+        self.text_url_cache[raw_text_url] = raw_text
+        return raw_text
+
+    def _fetch_document(self, doc_id: str) -> Document:
+        """
+        Build the Document for one order from its metadata and full text.
+
+        Args:
+            doc_id: Document number of the order
+
+        Returns:
+            The order as a Document
+
+        Raises:
+            ValueError: If the metadata or text is missing
+        """
+        # Get order metadata
+        order_metadata = self.orders_metadata.get(doc_id)
+        if not order_metadata:
+            raise ValueError(f"No metadata found for order {doc_id}")
+
+        # Log the document being ingested
+        html_url = order_metadata.get("html_url", f"Document Number: {doc_id}")
+        eo_number = order_metadata.get("executive_order_number", "N/A")
+        logger.info(f"Ingesting Executive Order {eo_number}: {html_url}")
+
+        raw_text = self._get_order_text(doc_id, order_metadata)
+
+        if not raw_text:
+            raise ValueError(f"Could not fetch raw text for order {doc_id}")
+
+        return _order_document(doc_id, order_metadata, raw_text)
+
+    def _build_payloads(self, doc_id: str) -> List[Dict[str, Any]]:
+        """
+        Fetch an executive order and build its chunk payloads, without embeddings.
+
+        Args:
+            doc_id: Document number to process
+
+        Returns:
+            Chunk payloads with document_id and ingested_at set, or [] if
+            the stored chunks needed no re-embedding
+
+        Raises:
+            ValueError: If no payloads could be built
+        """
+        document = self._fetch_document(doc_id)
+
+        # Process through the pipeline
+        logger.debug(f"Building payloads for order {doc_id}")
+        # Empty when the stored chunks are up to date (already completed)
+        payloads = self._payloads_from_document(document)
+
+        logger.debug(f"Generated {len(payloads)} chunks for order {doc_id}")
+
+        ingested_at = datetime.now().isoformat()
+        for payload in payloads:
+            payload["document_id"] = doc_id
+            payload["ingested_at"] = ingested_at
+        return payloads
+
     def _process_single_document(
         self,
         doc_id: str,
@@ -168,7 +361,7 @@ class ExecutiveOrderIngester(DocumentIngester):
 
         This method:
         1. Looks up the order metadata
-        2. Fetches the raw text (with caching)
+        2. Gets the full text via _get_order_text() (fetched and cached)
         3. Creates a Document object
         4. Builds payloads (chunking + metadata extraction)
         5. Generates embeddings
@@ -182,92 +375,18 @@ class ExecutiveOrderIngester(DocumentIngester):
         Returns:
             True if successful, False if failed
         """
-        start_time = time.time()
-
         try:
             # Mark as processing
             self.progress_tracker.mark_processing(doc_id)
 
-            # Get order metadata
-            order_metadata = self.orders_metadata.get(doc_id)
-            if not order_metadata:
-                raise ValueError(f"No metadata found for order {doc_id}")
-
-            # Log the document being ingested
-            html_url = order_metadata.get("html_url", f"Document Number: {doc_id}")
-            eo_number = order_metadata.get("executive_order_number", "N/A")
-            logger.info(f"Ingesting Executive Order {eo_number}: {html_url}")
-
-            # Get raw text URL
-            raw_text_url = order_metadata.get("raw_text_url")
-            if not raw_text_url:
-                raise ValueError(f"No raw text URL for order {doc_id}")
-
-            # Fetch raw text (with caching)
-            if raw_text_url in self.text_url_cache:
-                raw_text = self.text_url_cache[raw_text_url]
-                logger.debug(f"Using cached text for order {doc_id}")
-            else:
-                logger.debug(f"Fetching raw text for order {doc_id}")
-                raw_text = self.api_client.get_executive_order_text(raw_text_url)
-                self.text_url_cache[raw_text_url] = raw_text
-
-            if not raw_text:
-                raise ValueError(f"Could not fetch raw text for order {doc_id}")
-
-            # Create Document object for processing
-            document = Document(
-                id=doc_id,
-                title=order_metadata.get("title", ""),
-                date=order_metadata.get(
-                    "signing_date", order_metadata.get("publication_date", "")
-                ),
-                type="Executive Order",
-                source="Federal Register",
-                content=raw_text,
-                metadata={
-                    "executive_order_number": order_metadata.get(
-                        "executive_order_number"
-                    ),
-                    "president": (
-                        order_metadata.get("president", {}).get("name")
-                        if "president" in order_metadata
-                        else None
-                    ),
-                    "signing_date": order_metadata.get("signing_date"),
-                    "publication_date": order_metadata.get("publication_date"),
-                    "document_number": doc_id,
-                    "agencies": order_metadata.get("agencies", []),
-                    "topics": order_metadata.get("topics", []),
-                },
-                url=order_metadata.get("html_url", ""),
-            )
-
-            # Process through the pipeline
-            logger.debug(f"Building payloads for order {doc_id}")
-            payloads = build_payloads_from_document(document)
-
-            if not payloads:
-                raise ValueError(f"No payloads generated for order {doc_id}")
-
-            logger.debug(f"Generated {len(payloads)} chunks for order {doc_id}")
+            payloads = self._build_payloads(doc_id)
 
             # Generate embeddings for each chunk
             chunk_texts = [p["text"] for p in payloads]
             embeddings = self.embedding_generator.generate_batch_embeddings(chunk_texts)
 
-            # Convert payloads to Qdrant format
-            for payload, embedding in zip(payloads, embeddings):
-                doc_dict = payload
-                doc_dict["document_id"] = doc_id
-                doc_dict["ingested_at"] = datetime.now().isoformat()
-
-                batch_documents.append(doc_dict)
-                batch_embeddings.append(embedding)
-
-            # Mark as completed
-            processing_time_ms = (time.time() - start_time) * 1000
-            self.progress_tracker.mark_completed(doc_id, int(processing_time_ms))
+            batch_documents.extend(payloads)
+            batch_embeddings.extend(embeddings)
 
             return True
 
@@ -283,3 +402,180 @@ class ExecutiveOrderIngester(DocumentIngester):
 
         # Add EO-specific statistics
         print(f"\nText URL Cache Hits: {len(self.text_url_cache)} unique URLs cached")
+
+
+class AsyncExecutiveOrderIngester(AsyncDocumentIngester):
+    """
+    Asyncio-native Executive Order ingester.
+
+    Streams orders from AsyncFederalRegisterClient.list_executive_orders()
+    and processes them on a single event loop (see AsyncDocumentIngester).
+    Shares the progress database and collection with ExecutiveOrderIngester.
+
+    Example:
+        ingester = AsyncExecutiveOrderIngester(
+            start_date="2021-01-20",
+            end_date="2024-12-31",
+            max_in_flight=100,
+        )
+        ingester.run()
+    """
+
+    # Orders grouped into one batch of discovered IDs
+    discovery_page_size = 20
+
+    def __init__(
+        self,
+        start_date: str,
+        end_date: str,
+        batch_size: int = 25,
+        dry_run: bool = False,
+        progress_db: str = "executive_orders_ingestion.db",
+        qdrant_db_path: str = "./data/qdrant/qdrant_db",
+        http_cache=None,
+        cassette=None,
+        discovery_db: Optional[str] = None,
+        discovery_max_age: Optional[float] = DEFAULT_MAX_AGE,
+        refresh: bool = False,
+        embedding_cache=None,
+        **concurrency: Optional[int],
+    ):
+        """
+        Initialize the async Executive Order ingester.
+
+        Args:
+            start_date: Start date for order range (YYYY-MM-DD)
+            end_date: End date for order range (YYYY-MM-DD)
+            batch_size: Number of orders whose chunks are upserted together
+            dry_run: If True, don't actually store documents
+            progress_db: Path to SQLite progress database
+            qdrant_db_path: Path to Qdrant database directory
+            http_cache: Optional HTTPCache for API responses
+            cassette: Optional Cassette to record or replay API traffic
+            discovery_db: Optional SQLite file persisting order metadata, so
+                          resumed runs skip discovery (default: memory only)
+            discovery_max_age: Seconds discovery results in discovery_db
+                               stay fresh (None: forever)
+            refresh: Also re-check completed documents for changes at the source
+            embedding_cache: Optional EmbeddingCache of vectors already computed
+            **concurrency: max_in_flight, per-service limits and embedding
+                per-minute budgets, passed to AsyncDocumentIngester
+        """
+        super().__init__(
+            start_date=start_date,
+            end_date=end_date,
+            batch_size=batch_size,
+            dry_run=dry_run,
+            progress_db=progress_db,
+            qdrant_db_path=qdrant_db_path,
+            document_type="executive_order",
+            http_cache=http_cache,
+            cassette=cassette,
+            refresh=refresh,
+            embedding_cache=embedding_cache,
+            **concurrency,
+        )
+
+        self.api_client = AsyncFederalRegisterClient(
+            max_concurrency=self.fetch_concurrency,
+            http_cache=http_cache,
+            cassette=cassette,
+        )
+
+        # Shared with ExecutiveOrderIngester, so either can reuse the other's
+        # results
+        self.discovery_cache: Optional[DiscoveryCache] = (
+            DiscoveryCache(discovery_db, "executive_orders", max_age=discovery_max_age)
+            if discovery_db
+            else None
+        )
+
+        # Order metadata from discovery, consumed by _fetch_document()
+        self.orders_metadata: Union[Dict[str, Dict[str, Any]], DiscoveryCache] = (
+            self.discovery_cache if self.discovery_cache is not None else {}
+        )
+
+    def _get_collection_name(self) -> str:
+        """Get the Qdrant collection name for Executive Orders."""
+        return "executive_orders"
+
+    _track_order = ExecutiveOrderIngester._track_order
+
+    async def _iter_document_ids(self) -> AsyncIterator[List[str]]:
+        """
+        Stream order document numbers as listing pages arrive.
+
+        API errors end discovery after logging; IDs already yielded are kept.
+        With a discovery cache, a fresh listing of the date range is replayed
+        instead of calling the API, and a completed discovery is recorded.
+
+        Yields:
+            Lists of document numbers
+        """
+        listing_key = f"orders:{self.start_date}:{self.end_date}"
+        if self.discovery_cache is not None:
+            listing = self.discovery_cache.get_listing(listing_key)
+            if listing is not None:
+                logger.info(
+                    f"Using {len(listing)} cached Executive Orders, skipping discovery"
+                )
+                for i in range(0, len(listing), self.discovery_page_size):
+                    yield listing[i : i + self.discovery_page_size]
+                return
+
+        logger.info("Fetching Executive Orders from Federal Register API...")
+
+        discovered: List[str] = []
+        doc_ids: List[str] = []
+        completed = False
+        try:
+            async for order in self.api_client.list_executive_orders(
+                self.start_date, self.end_date
+            ):
+                if not order.get("document_number"):
+                    continue
+                self._track_order(order)
+                doc_ids.append(order["document_number"])
+                if len(doc_ids) >= self.discovery_page_size:
+                    discovered.extend(doc_ids)
+                    yield doc_ids
+                    doc_ids = []
+            completed = True
+        except Exception as e:
+            logger.error(f"Error fetching Executive Orders: {e}")
+
+        if doc_ids:
+            discovered.extend(doc_ids)
+            yield doc_ids
+
+        if completed and self.discovery_cache is not None:
+            self.discovery_cache.put_listing(listing_key, discovered)
+
+    async def _fetch_document(self, doc_id: str) -> Document:
+        """
+        Build the Document for one order from its metadata and full text.
+
+        Orders left over from an earlier run have no discovery metadata;
+        it is fetched from the API.
+
+        Raises:
+            ValueError: If the text is missing
+        """
+        order_metadata = self.orders_metadata.pop(doc_id, None)
+        if not order_metadata:
+            order_metadata = await self.api_client.get_executive_order(doc_id)
+
+        raw_text_url = order_metadata.get("raw_text_url")
+        if not raw_text_url:
+            raise ValueError(f"No raw text URL for order {doc_id}")
+
+        eo_number = order_metadata.get("executive_order_number", "N/A")
+        logger.info(
+            f"Ingesting Executive Order {eo_number}: {order_metadata.get('html_url', doc_id)}"
+        )
+
+        raw_text = await self.api_client.get_executive_order_text(raw_text_url)
+        if not raw_text:
+            raise ValueError(f"Could not fetch raw text for order {doc_id}")
+
+        return _order_document(doc_id, order_metadata, raw_text)
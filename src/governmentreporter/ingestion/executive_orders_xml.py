@@ -0,0 +1,381 @@
+"""
+Executive Order ingester for Federal Register bulk XML.
+
+This module ingests Executive Orders from the Federal Register's daily issue
+XML files (the GPO/govinfo bulk data, one FR-YYYY-MM-DD.xml per issue) stored
+in a local directory. The full text is taken straight from the XML, so a
+backfill needs no API calls at all: neither the listing requests nor one
+raw_text_url request per order.
+
+The ingester:
+- Scans a directory (recursively) for FR-*.xml issues or .zip packages
+- Streams each issue with iterparse and extracts the EXECORD elements
+- Builds metadata in the same shape the Federal Register API returns, so
+  FederalRegisterClient.extract_basic_metadata() and the shared payload
+  pipeline see identical input
+- Processes orders through the ExecutiveOrderIngester pipeline
+"""
+
+import logging
+import re
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
+from xml.etree import ElementTree
+
+from .executive_orders import ExecutiveOrderIngester
+
+logger = logging.getLogger(__name__)
+
+# Presidents by inauguration date, in the Federal Register API's format
+PRESIDENTS = [
+    ("1993-01-20", "William J. Clinton", "william-j-clinton"),
+    ("2001-01-20", "George W. Bush", "george-w-bush"),
+    ("2009-01-20", "Barack Obama", "barack-obama"),
+    ("2017-01-20", "Donald Trump", "donald-trump"),
+    ("2021-01-20", "Joseph R. Biden Jr.", "joe-biden"),
+    ("2025-01-20", "Donald Trump", "donald-trump"),
+]
+
+# Elements inside EXECORD that are layout or filing data, not order text
+SKIPPED_TAGS = {"PRTPAGE", "GPH", "FRDOC", "FILED", "BILCOD"}
+
+_ISSUE_NAME = re.compile(r"FR-(\d{4}-\d{2}-\d{2})")
+_EO_HEADING = re.compile(
+    r"Executive Order\s+(\d+)(?:\s+of\s+(\w+\s+\d{1,2},\s*\d{4}))?", re.IGNORECASE
+)
+_FR_DOC = re.compile(r"FR\s+Doc\.?\s*([\w-]+)")
+_SPACES = re.compile(r"\s+")
+
+FR_BASE_URL = "https://www.federalregister.gov"
+
+
+def president_for_date(signing_date: str) -> Optional[Dict[str, str]]:
+    """
+    Look up the president in office on a date.
+
+    Args:
+        signing_date: Date in YYYY-MM-DD format
+
+    Returns:
+        {"name": ..., "identifier": ...} as the API returns it, or None
+        for dates before the first entry in PRESIDENTS
+    """
+    president = None
+    for inaugurated, name, identifier in PRESIDENTS:
+        if signing_date >= inaugurated:
+            president = {"name": name, "identifier": identifier}
+    return president
+
+
+def _parse_long_date(text: str) -> Optional[str]:
+    """Parse "October 30, 2023" (optionally followed by a period) to ISO."""
+    text = _SPACES.sub(" ", text).strip().rstrip(".")
+    try:
+        return datetime.strptime(text, "%B %d, %Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def _element_text(element: ElementTree.Element) -> str:
+    """All text inside an element, with whitespace collapsed."""
+    return _SPACES.sub(" ", "".join(element.itertext())).strip()
+
+
+def _order_urls(document_number: str, publication_date: str) -> Dict[str, str]:
+    """Federal Register URLs for a document, as the API would report them."""
+    path_date = publication_date.replace("-", "/")
+    return {
+        "html_url": f"{FR_BASE_URL}/d/{document_number}",
+        "pdf_url": (
+            f"https://www.govinfo.gov/content/pkg/FR-{publication_date}"
+            f"/pdf/{document_number}.pdf"
+        ),
+        "full_text_xml_url": (
+            f"{FR_BASE_URL}/documents/full_text/xml/{path_date}/{document_number}.xml"
+        ),
+        "body_html_url": (
+            f"{FR_BASE_URL}/documents/full_text/html/{path_date}/{document_number}.html"
+        ),
+        "raw_text_url": (
+            f"{FR_BASE_URL}/documents/full_text/text/{path_date}/{document_number}.txt"
+        ),
+        "json_url": f"{FR_BASE_URL}/api/v1/documents/{document_number}.json",
+    }
+
+
+def _build_order(
+    execord: ElementTree.Element,
+    volume: Optional[int],
+    publication_date: str,
+    start_page: Optional[int],
+    end_page: Optional[int],
+) -> Optional[Tuple[Dict[str, Any], str]]:
+    """
+    Extract metadata and text from one EXECORD element.
+
+    Args:
+        execord: The EXECORD element
+        volume: Federal Register volume of the issue
+        publication_date: Issue date (YYYY-MM-DD)
+        start_page: Printed page the order starts on
+        end_page: Printed page the order ends on
+
+    Returns:
+        (order metadata in API format, full text), or None if the element
+        has no FR document number or executive order number
+    """
+    heading = execord.find("EXECORDR")
+    match = _EO_HEADING.search(_element_text(heading)) if heading is not None else None
+    frdoc = execord.find("FRDOC")
+    doc_match = _FR_DOC.search(_element_text(frdoc)) if frdoc is not None else None
+    if not match or not doc_match:
+        return None
+
+    document_number = doc_match.group(1)
+    signing_date = _parse_long_date(match.group(2)) if match.group(2) else None
+    if signing_date is None:
+        date_element = execord.find("DATE")
+        if date_element is not None:
+            signing_date = _parse_long_date(_element_text(date_element))
+
+    title_element = execord.find("HD")
+    title = _element_text(title_element) if title_element is not None else ""
+
+    paragraphs = [
+        _element_text(child) for child in execord if child.tag not in SKIPPED_TAGS
+    ]
+    text = "\n\n".join(p for p in paragraphs if p)
+
+    citation = f"{volume} FR {start_page}" if volume and start_page else ""
+    order: Dict[str, Any] = {
+        "document_number": document_number,
+        "title": title,
+        "type": "Presidential Document",
+        "subtype": "Executive Order",
+        "executive_order_number": int(match.group(1)),
+        "presidential_document_number": match.group(1),
+        "signing_date": signing_date or "",
+        "publication_date": publication_date,
+        "citation": citation,
+        "volume": volume,
+        "start_page": start_page,
+        "end_page": end_page,
+        "page_length": (end_page - start_page + 1 if start_page and end_page else None),
+        "agencies": ["Executive Office of the President"],
+    }
+    president = president_for_date(signing_date or publication_date)
+    if president:
+        order["president"] = president
+    order.update(_order_urls(document_number, publication_date))
+    return order, text
+
+
+def iter_issue_orders(
+    source: Union[str, Path, IO[bytes]], publication_date: Optional[str] = None
+) -> Iterator[Tuple[Dict[str, Any], str]]:
+    """
+    Stream the executive orders out of one daily Federal Register issue.
+
+    The issue is parsed incrementally; each EXECORD is cleared once it has
+    been extracted, so memory use does not grow with the size of the issue.
+
+    Args:
+        source: Path or binary file object of an FR issue XML file
+        publication_date: Issue date (YYYY-MM-DD). Read from the issue's
+                          header DATE element when not given.
+
+    Yields:
+        (order metadata in Federal Register API format, full text)
+    """
+    volume: Optional[int] = None
+    current_page: Optional[int] = None
+    start_page: Optional[int] = None
+    depth = 0
+    order_opened = False
+
+    for event, element in ElementTree.iterparse(source, events=("start", "end")):
+        tag = element.tag
+        if event == "start":
+            if tag == "PRTPAGE" and element.get("P", "").isdigit():
+                current_page = int(element.get("P"))
+                if order_opened:
+                    # A page break before any content: the order starts there
+                    start_page = current_page
+            elif tag == "EXECORD":
+                depth += 1
+                start_page = current_page
+            order_opened = tag == "EXECORD"
+            continue
+
+        if tag == "VOL" and volume is None and (element.text or "").strip().isdigit():
+            volume = int(element.text.strip())
+        elif tag == "DATE" and publication_date is None and depth == 0:
+            header_date = _SPACES.sub(" ", element.text or "").strip()
+            parsed = _parse_long_date(header_date.split(", ", 1)[-1])
+            if parsed:
+                publication_date = parsed
+        elif tag == "EXECORD":
+            depth -= 1
+            order = _build_order(
+                element, volume, publication_date or "", start_page, current_page
+            )
+            element.clear()
+            if order is not None:
+                yield order
+        elif depth == 0 and tag in ("PRESDOCU", "RULE", "PRORULE", "NOTICE"):
+            # Free documents we have finished with
+            element.clear()
+
+
+def iter_issue_files(xml_dir: Union[str, Path]) -> Iterator[Tuple[str, Path]]:
+    """
+    Find daily issue files under a directory, in publication order.
+
+    Args:
+        xml_dir: Directory containing FR-YYYY-MM-DD.xml files or .zip packages
+
+    Yields:
+        (publication date, path) for each issue
+    """
+    issues = []
+    for path in Path(xml_dir).rglob("FR-*"):
+        match = _ISSUE_NAME.match(path.name)
+        if match and path.suffix.lower() in (".xml", ".zip"):
+            issues.append((match.group(1), path))
+    yield from sorted(issues)
+
+
+def _iter_file_orders(
+    path: Path, publication_date: str
+) -> Iterator[Tuple[Dict[str, Any], str]]:
+    """Yield orders from an issue XML file or every XML file in a package."""
+    if path.suffix.lower() != ".zip":
+        yield from iter_issue_orders(path, publication_date)
+        return
+
+    with zipfile.ZipFile(path) as package:
+        for name in package.namelist():
+            if name.lower().endswith(".xml"):
+                with package.open(name) as member:
+                    yield from iter_issue_orders(member, publication_date)
+
+
+class ExecutiveOrderXMLIngester(ExecutiveOrderIngester):
+    """
+    Ingests Executive Orders from local Federal Register bulk XML files.
+
+    Uses the same progress database namespace and Qdrant collection as
+    ExecutiveOrderIngester, so orders completed by either are skipped by
+    the other.
+
+    Example:
+        ingester = ExecutiveOrderXMLIngester(
+            xml_dir="./data/federal_register/xml",
+            start_date="1994-01-01",
+            end_date="2024-12-31",
+        )
+        ingester.run()
+    """
+
+    def __init__(
+        self,
+        xml_dir: str,
+        start_date: str,
+        end_date: str,
+        batch_size: int = 25,
+        dry_run: bool = False,
+        progress_db: str = "executive_orders_ingestion.db",
+        qdrant_db_path: str = "./data/qdrant/qdrant_db",
+        shared_db_client=None,
+        workers: int = 1,
+        stage_workers: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize the XML ingester.
+
+        Args:
+            xml_dir: Directory containing FR-YYYY-MM-DD.xml issues (searched
+                     recursively; .zip issue packages are also read)
+            start_date: Start of the signing date range (YYYY-MM-DD)
+            end_date: End of the signing date range (YYYY-MM-DD)
+            batch_size: Number of orders to process in each batch
+            dry_run: If True, don't actually store documents
+            progress_db: Path to SQLite progress database
+            qdrant_db_path: Path to Qdrant database directory
+            shared_db_client: Optional pre-initialized QdrantDBClient for shared access
+            workers: Number of documents to process concurrently (default: 1)
+            stage_workers: Threads per pipeline stage; enables staged ingestion
+        """
+        super().__init__(
+            start_date=start_date,
+            end_date=end_date,
+            batch_size=batch_size,
+            dry_run=dry_run,
+            progress_db=progress_db,
+            qdrant_db_path=qdrant_db_path,
+            shared_db_client=shared_db_client,
+            workers=workers,
+            stage_workers=stage_workers,
+        )
+
+        self.xml_dir = Path(xml_dir)
+
+        # Full text of each discovered order, keyed by document number
+        self.order_texts: Dict[str, str] = {}
+
+    def _fetch_document_ids(self) -> List[str]:
+        """
+        Extract all Executive Orders signed in the date range from the XML.
+
+        Issues published before start_date are skipped without parsing,
+        since an order is always published after it is signed.
+
+        Returns:
+            List of document numbers (IDs) to process
+        """
+        logger.info(
+            f"Reading Executive Orders from Federal Register XML in {self.xml_dir}"
+        )
+
+        doc_ids: List[str] = []
+        issues = 0
+        for publication_date, path in iter_issue_files(self.xml_dir):
+            if publication_date < self.start_date:
+                continue
+            issues += 1
+
+            try:
+                for order, text in _iter_file_orders(path, publication_date):
+                    signing_date = order["signing_date"] or publication_date
+                    if not (self.start_date <= signing_date <= self.end_date):
+                        continue
+
+                    doc_id = order["document_number"]
+                    if doc_id in self.orders_metadata:
+                        continue  # Reprinted in a later issue
+
+                    self._track_order(order)
+                    self.order_texts[doc_id] = text
+                    doc_ids.append(doc_id)
+            except (ElementTree.ParseError, zipfile.BadZipFile) as e:
+                logger.error(f"Skipping unreadable issue {path}: {e}")
+
+        logger.info(f"Found {len(doc_ids)} Executive Orders in {issues} issues")
+        return doc_ids
+
+    def _get_order_text(self, doc_id: str, order_metadata: Dict[str, Any]) -> str:
+        """Return the text extracted from the XML (no API request)."""
+        text = self.order_texts.pop(doc_id, "")
+        if not text:
+            raise ValueError(f"No text extracted from XML for order {doc_id}")
+        return text
+
+    def _leftover_document_ids(self) -> List[str]:
+        """Orders not in the XML directory have no text here, so none are resumed."""
+        return []
+
+    def _print_final_statistics(self) -> None:
+        """Print final ingestion statistics (no text URL cache is used)."""
+        super(ExecutiveOrderIngester, self)._print_final_statistics()
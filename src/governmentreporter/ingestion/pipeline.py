@@ -0,0 +1,314 @@
+"""
+Staged producer/consumer pipeline for document ingestion.
+
+Each stage has its own pool of worker threads and reads from a bounded
+queue fed by the previous stage, so slow network-bound stages (LLM metadata
+extraction, embeddings) overlap with each other and with Qdrant upserts:
+while document N is being embedded, document N+1 is already in the LLM
+stage and an earlier batch is being written. Bounded queues apply
+backpressure, so a fast stage can never run far ahead of a slow one and
+memory use stays flat.
+
+Per-stage statistics (busy time, utilization, queue depth) show which stage
+is the bottleneck: it is the one whose workers are busy nearly all the time
+while the queue in front of it stays full.
+
+The ingestion stages, in order:
+    fetch   -> source API request for the document
+    chunk   -> type detection, metadata normalization and chunking
+    extract -> LLM metadata extraction and payload assembly
+    embed   -> OpenAI embeddings for the chunks
+    upsert  -> progress tracking and batched Qdrant upserts
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Ingestion stages in pipeline order, with their default worker counts
+INGESTION_STAGES = ("fetch", "chunk", "extract", "embed", "upsert")
+DEFAULT_STAGE_WORKERS = {"fetch": 2, "chunk": 1, "extract": 4, "embed": 2, "upsert": 1}
+
+# Marks the end of a stage's input; each worker consumes exactly one
+_STOP = object()
+
+# How often blocked workers check whether the pipeline was aborted (seconds)
+_POLL_INTERVAL = 0.1
+
+
+def parse_stage_workers(spec: str) -> Dict[str, int]:
+    """
+    Parse a "stage=N,stage=N" worker specification.
+
+    Stages that are not mentioned keep their DEFAULT_STAGE_WORKERS count.
+
+    Args:
+        spec: e.g. "extract=8,embed=2" (an empty string means all defaults)
+
+    Returns:
+        Worker count for every ingestion stage
+
+    Raises:
+        ValueError: If a stage name is unknown or a count is not a positive int
+    """
+    workers = dict(DEFAULT_STAGE_WORKERS)
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, sep, count = part.partition("=")
+        name = name.strip()
+        if not sep or name not in workers:
+            raise ValueError(
+                f"Invalid stage '{part}'; expected NAME=N with NAME one of "
+                f"{', '.join(INGESTION_STAGES)}"
+            )
+        try:
+            workers[name] = int(count)
+        except ValueError:
+            raise ValueError(f"Invalid worker count in '{part}'") from None
+        if workers[name] < 1:
+            raise ValueError(f"Stage {name} needs at least 1 worker")
+    return workers
+
+
+class PipelineStage:
+    """
+    One stage of a StagedPipeline: a handler, its worker count and statistics.
+
+    The handler receives an item and returns the item to pass to the next
+    stage, or None to drop it. Exceptions are counted and reported to the
+    pipeline's on_error callback; the item is dropped.
+
+    Attributes:
+        name (str): Stage name used in statistics
+        handler (Callable[[Any], Any]): Work function
+        workers (int): Number of worker threads
+    """
+
+    def __init__(self, name: str, handler: Callable[[Any], Any], workers: int = 1):
+        if workers < 1:
+            raise ValueError(f"Stage {name} needs at least 1 worker")
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+
+        self._lock = threading.Lock()
+        self.processed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.queue_samples = 0
+        self.queue_depth_total = 0
+        self.queue_depth_max = 0
+
+    def _record(self, depth: int, busy: float, failed: bool) -> None:
+        with self._lock:
+            self.queue_samples += 1
+            self.queue_depth_total += depth
+            self.queue_depth_max = max(self.queue_depth_max, depth)
+            self.busy_seconds += busy
+            if failed:
+                self.failed += 1
+            else:
+                self.processed += 1
+
+
+class StagedPipeline:
+    """
+    Runs items through stages connected by bounded queues.
+
+    Example:
+        pipeline = StagedPipeline(
+            [
+                PipelineStage("fetch", fetch, workers=2),
+                PipelineStage("extract", extract, workers=8),
+                PipelineStage("store", store),
+            ],
+            queue_size=16,
+        )
+        pipeline.start()
+        for doc_id in doc_ids:
+            pipeline.submit(doc_id)  # blocks while the first queue is full
+        pipeline.close()  # drains every stage in order
+        for row in pipeline.stats():
+            print(row["stage"], row["utilization"])
+
+    Python Learning Notes:
+        - queue.Queue(maxsize=N): put() blocks when N items are waiting,
+          which is how backpressure propagates upstream
+        - A sentinel object per worker shuts a stage down only after
+          everything queued before it has been handled
+    """
+
+    def __init__(
+        self,
+        stages: List[PipelineStage],
+        queue_size: int = 16,
+        on_error: Optional[Callable[[str, Any, Exception], None]] = None,
+    ):
+        """
+        Args:
+            stages: Stages in processing order
+            queue_size: Capacity of the queue in front of each stage
+            on_error: Called as on_error(stage_name, item, exception) from the
+                      worker thread when a handler raises
+        """
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = stages
+        self.queue_size = queue_size
+        self.on_error = on_error
+
+        self._queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+        self._threads: List[List[threading.Thread]] = []
+        self._aborted = threading.Event()
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+    def start(self) -> None:
+        """Start the worker threads of every stage."""
+        self._started_at = time.perf_counter()
+        for index, stage in enumerate(self.stages):
+            threads = [
+                threading.Thread(
+                    target=self._work,
+                    args=(index,),
+                    name=f"pipeline-{stage.name}-{n}",
+                    daemon=True,
+                )
+                for n in range(stage.workers)
+            ]
+            for thread in threads:
+                thread.start()
+            self._threads.append(threads)
+
+    def submit(self, item: Any) -> None:
+        """Queue an item for the first stage, blocking while its queue is full."""
+        self._put(self._queues[0], item)
+
+    def close(self) -> None:
+        """Wait for every submitted item to pass through all stages."""
+        for index, stage in enumerate(self.stages):
+            for _ in range(stage.workers):
+                self._put(self._queues[index], _STOP)
+            for thread in self._threads[index]:
+                thread.join()
+        self._finished_at = time.perf_counter()
+
+    def abort(self) -> None:
+        """Stop all workers without draining the queues."""
+        self._aborted.set()
+        for threads in self._threads:
+            for thread in threads:
+                thread.join()
+        if self._finished_at is None:
+            self._finished_at = time.perf_counter()
+
+    def _put(self, q: queue.Queue, item: Any) -> None:
+        while not self._aborted.is_set():
+            try:
+                q.put(item, timeout=_POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def _work(self, index: int) -> None:
+        stage = self.stages[index]
+        inbox = self._queues[index]
+        outbox = self._queues[index + 1] if index + 1 < len(self.stages) else None
+
+        while not self._aborted.is_set():
+            try:
+                item = inbox.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            if item is _STOP:
+                return
+
+            depth = inbox.qsize()
+            started = time.perf_counter()
+            failed = False
+            try:
+                result = stage.handler(item)
+            except Exception as e:
+                failed = True
+                result = None
+                logger.debug(f"Pipeline stage {stage.name} failed: {e}")
+                if self.on_error is not None:
+                    self.on_error(stage.name, item, e)
+            stage._record(depth, time.perf_counter() - started, failed)
+
+            if result is not None and outbox is not None:
+                self._put(outbox, result)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Per-stage statistics.
+
+        Returns:
+            One dict per stage with: stage, workers, processed, failed,
+            busy_seconds, utilization (busy time / (elapsed * workers)),
+            queue_mean and queue_max (depth of the stage's input queue, sampled
+            each time a worker takes an item) and queue_capacity
+        """
+        if self._started_at is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._finished_at or time.perf_counter()) - self._started_at
+
+        rows = []
+        for stage in self.stages:
+            with stage._lock:
+                rows.append(
+                    {
+                        "stage": stage.name,
+                        "workers": stage.workers,
+                        "processed": stage.processed,
+                        "failed": stage.failed,
+                        "busy_seconds": stage.busy_seconds,
+                        "utilization": (
+                            stage.busy_seconds / (elapsed * stage.workers)
+                            if elapsed > 0
+                            else 0.0
+                        ),
+                        "queue_mean": (
+                            stage.queue_depth_total / stage.queue_samples
+                            if stage.queue_samples
+                            else 0.0
+                        ),
+                        "queue_max": stage.queue_depth_max,
+                        "queue_capacity": self.queue_size,
+                    }
+                )
+        return rows
+
+
+def format_stage_stats(rows: List[Dict[str, Any]]) -> List[str]:
+    """
+    Format StagedPipeline.stats() as a table, flagging the bottleneck.
+
+    The bottleneck is the stage with the highest utilization.
+
+    Args:
+        rows: Output of StagedPipeline.stats()
+
+    Returns:
+        Lines of text
+    """
+    lines = [
+        f"{'Stage':<8} {'Workers':>7} {'Done':>6} {'Failed':>6} "
+        f"{'Busy':>9} {'Util':>6} {'Queue avg/max':>14}"
+    ]
+    bottleneck = max(rows, key=lambda r: r["utilization"])["stage"] if rows else None
+    for row in rows:
+        marker = "  <- bottleneck" if row["stage"] == bottleneck else ""
+        queue_depth = (
+            f"{row['queue_mean']:.1f}/{row['queue_max']} of {row['queue_capacity']}"
+        )
+        lines.append(
+            f"{row['stage']:<8} {row['workers']:>7} {row['processed']:>6} "
+            f"{row['failed']:>6} {row['busy_seconds']:>8.1f}s "
+            f"{row['utilization'] * 100:>5.0f}% {queue_depth:>14}{marker}"
+        )
+    return lines
@@ -7,18 +7,73 @@ detailed statistics about processing status.
 
 The tracker uses SQLite to maintain state across script runs, allowing
 for safe interruption and resumption of large batch jobs.
+
+Several ingestion processes (or machines sharing the database file) can work
+on the same date range at once. Documents are handed out with time-limited
+leases: a process claims documents, renews its leases with a heartbeat while
+it works, and completing or failing a document releases its lease. Leases of
+a process that crashed simply expire, and the documents become claimable
+again. Spooled documents keep their lease until their upsert completes them;
+if the process and its spool are lost, release_lost_spooled() hands them
+back once the lease has expired.
+
+Bookkeeping is kept off the ingestion hot path: the database runs in WAL
+mode, discovered documents are added in one transaction per page, and
+status updates can be buffered and written in one transaction per
+flush_interval. Every read flushes the buffer first, so a tracker always sees
+its own updates; other processes see them within flush_interval. Pending
+documents are read page by page with keyset pagination instead of all at
+once.
+
+Each document also records how long its fetch, chunk, LLM, embed and store
+stages took and how many tokens it cost; end_run() adds them up per run,
+and get_stage_statistics() reports their percentiles.
 """
 
+import functools
+import itertools
 import json
 import logging
+import math
+import os
+import socket
 import sqlite3
+import threading
+import time
+import uuid
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Ingestion stages timed per document, stored in <stage>_ms columns
+TIMED_STAGES = ("fetch", "chunk", "llm", "embed", "store")
+
+# Token counts recorded per document
+TOKEN_COUNTS = ("llm_prompt_tokens", "llm_completion_tokens", "embedding_tokens")
+
+# Columns of document_progress (and per-run totals in ingestion_runs)
+METRIC_COLUMNS = tuple(f"{stage}_ms" for stage in TIMED_STAGES) + TOKEN_COUNTS
+
+
+def _synchronized(method):
+    """Run a ProgressTracker method while holding the tracker's lock."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    index = max(0, math.ceil(fraction * len(values)) - 1)
+    return values[index]
+
 
 class ProcessingStatus(Enum):
     """
@@ -26,13 +81,16 @@ class ProcessingStatus(Enum):
 
     A document moves through these states during ingestion:
     - PENDING: Document identified but not yet processed
-    - PROCESSING: Currently being worked on
+    - PROCESSING: Leased by an ingestion process that is working on it
+    - SPOOLED: Payloads and embeddings written to the local spool, waiting
+      for Qdrant to acknowledge the upsert
     - COMPLETED: Successfully ingested into Qdrant
     - FAILED: Error occurred during processing
     """
 
     PENDING = "pending"
     PROCESSING = "processing"
+    SPOOLED = "spooled"
     COMPLETED = "completed"
     FAILED = "failed"
 
@@ -48,14 +106,37 @@ class ProgressTracker:
     - Generate statistics about processing progress
     - Store error information for failed documents
 
+    All methods may be called from multiple threads; they share one
+    connection and are serialized by a lock. Multiple processes coordinate
+    through leases (see claim_documents()).
+
     Attributes:
         db_path (Path): Path to the SQLite database file
         conn (sqlite3.Connection): Database connection
         document_type (str): Type of documents being tracked (e.g., 'scotus', 'executive_order')
+        worker_id (str): Owner recorded on the leases this tracker takes
+        lease_seconds (float): How long a lease lasts without a heartbeat
+        flush_interval (float): Seconds status updates may wait in the buffer
+            (0: written immediately)
     """
 
+    # Seconds to wait for another process's write lock before giving up
+    BUSY_TIMEOUT = 30.0
+
+    # Document IDs per IN (...) clause, below SQLite's bound-parameter limit
+    _SQL_CHUNK = 500
+
+    # Buffered status updates that trigger a flush without waiting for the timer
+    MAX_BUFFERED_UPDATES = 1000
+
     def __init__(
-        self, db_path: str = "ingestion_progress.db", document_type: str = "generic"
+        self,
+        db_path: str = "ingestion_progress.db",
+        document_type: str = "generic",
+        worker_id: Optional[str] = None,
+        lease_seconds: float = 600.0,
+        flush_interval: float = 0.0,
+        wal: bool = True,
     ):
         """
         Initialize the progress tracker with a SQLite database.
@@ -63,15 +144,51 @@ class ProgressTracker:
         Args:
             db_path: Path to the SQLite database file. Will be created if it doesn't exist.
             document_type: Type of documents being tracked (for organizing multiple ingestion types).
+            worker_id: Lease owner name; defaults to host, process ID and a random suffix.
+            lease_seconds: Lease duration; a heartbeat renews leases every third of it.
+            flush_interval: Buffer status updates (mark_*) and write them in one
+                transaction at most this many seconds later; 0 writes each
+                update immediately.
+            wal: Use write-ahead logging, so readers never block the writer.
+                Disable for database files on network shares, where WAL's
+                shared memory does not work.
         """
         self.db_path = Path(db_path)
         self.document_type = document_type
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self.lease_seconds = lease_seconds
+        self.flush_interval = flush_interval
+        # Run started by start_run(); documents processed are recorded under it
+        self.run_id: Optional[int] = None
+        # One connection shared by ingestion worker threads: every method that
+        # touches it runs under self._lock (see _synchronized)
+        self._lock = threading.RLock()
         self.conn = sqlite3.connect(
-            self.db_path, isolation_level=None
-        )  # Autocommit mode
+            self.db_path,
+            isolation_level=None,  # Autocommit mode
+            check_same_thread=False,
+            timeout=self.BUSY_TIMEOUT,
+        )
         self.conn.row_factory = sqlite3.Row  # Enable column access by name
+        if wal:
+            # WAL commits append to the log instead of rewriting pages, and
+            # NORMAL sync skips the fsync per commit (the log is still synced
+            # at checkpoints, so a crash loses at most the last commits)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._heartbeat_stop = threading.Event()
+
+        # Status updates waiting for the next flush: (SQL, parameters) in the
+        # order they were made
+        self._buffered_updates: List[Tuple[str, Tuple[Any, ...]]] = []
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_stop = threading.Event()
         self._initialize_database()
 
+    @_synchronized
     def _initialize_database(self) -> None:
         """
         Create the database tables if they don't exist.
@@ -85,6 +202,16 @@ class ProgressTracker:
         - created_at: When the record was first created
         - updated_at: Last status update time
         - processing_time_ms: Time taken to process (for performance metrics)
+        - lease_owner: worker_id of the process working on the document
+        - lease_expires_at: Unix time when that lease runs out
+        - content_hash: Hash of the source text the stored chunks came from
+        - fingerprint: JSON DocumentFingerprint of the stored chunks (content
+          hash plus chunker, prompt and embedding model versions)
+        - fetch_ms, chunk_ms, llm_ms, embed_ms, store_ms: Time spent in each
+          stage the last time the document was processed
+        - llm_prompt_tokens, llm_completion_tokens, embedding_tokens: Tokens
+          that processing used
+        - run_id: Ingestion run that last processed the document
         """
         cursor = self.conn.cursor()
 
@@ -100,11 +227,38 @@ class ProgressTracker:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 processing_time_ms INTEGER,
+                lease_owner TEXT,
+                lease_expires_at REAL,
+                content_hash TEXT,
+                fingerprint TEXT,
+                fetch_ms INTEGER,
+                chunk_ms INTEGER,
+                llm_ms INTEGER,
+                embed_ms INTEGER,
+                store_ms INTEGER,
+                llm_prompt_tokens INTEGER,
+                llm_completion_tokens INTEGER,
+                embedding_tokens INTEGER,
+                run_id INTEGER,
                 PRIMARY KEY (document_id, document_type)
             )
         """
         )
 
+        # Databases created by older versions lack the lease, fingerprint and
+        # stage metric columns
+        self._add_missing_columns(
+            "document_progress",
+            [
+                ("lease_owner", "TEXT"),
+                ("lease_expires_at", "REAL"),
+                ("content_hash", "TEXT"),
+                ("fingerprint", "TEXT"),
+                *((column, "INTEGER") for column in METRIC_COLUMNS),
+                ("run_id", "INTEGER"),
+            ],
+        )
+
         # Index for efficient status queries
         cursor.execute(
             """
@@ -126,11 +280,47 @@ class ProgressTracker:
                 failed_documents INTEGER DEFAULT 0,
                 started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 completed_at TIMESTAMP,
-                parameters TEXT
+                parameters TEXT,
+                fetch_ms INTEGER,
+                chunk_ms INTEGER,
+                llm_ms INTEGER,
+                embed_ms INTEGER,
+                store_ms INTEGER,
+                llm_prompt_tokens INTEGER,
+                llm_completion_tokens INTEGER,
+                embedding_tokens INTEGER
+            )
+        """
+        )
+        self._add_missing_columns(
+            "ingestion_runs", [(column, "INTEGER") for column in METRIC_COLUMNS]
+        )
+
+        # Pagination cursors for resumable, streaming document discovery
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS discovery_cursors (
+                document_type TEXT NOT NULL,
+                cursor_key TEXT NOT NULL,
+                cursor TEXT NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (document_type, cursor_key)
             )
         """
         )
 
+    def _add_missing_columns(self, table: str, columns: List[Tuple[str, str]]) -> None:
+        """Add the (name, type) columns a table created by an older version lacks."""
+        existing = {
+            row["name"] for row in self.conn.execute(f"PRAGMA table_info({table})")
+        }
+        for column, column_type in columns:
+            if column not in existing:
+                self.conn.execute(
+                    f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"
+                )
+
+    @_synchronized
     def start_run(
         self, start_date: str, end_date: str, parameters: Dict[str, Any] = None
     ) -> int:
@@ -154,15 +344,21 @@ class ProgressTracker:
             (self.document_type, start_date, end_date, json.dumps(parameters or {})),
         )
 
-        return cursor.lastrowid
+        self.run_id = cursor.lastrowid
+        return self.run_id
 
+    @_synchronized
     def end_run(self, run_id: int) -> None:
         """
         Mark an ingestion run as completed.
 
+        The run's stage times and token counts are the sums over the
+        documents it processed.
+
         Args:
             run_id: The ID of the run to complete
         """
+        self._flush_updates()
         cursor = self.conn.cursor()
 
         # Update run statistics
@@ -187,6 +383,21 @@ class ProgressTracker:
             (self.document_type, self.document_type, self.document_type, run_id),
         )
 
+        sums = ", ".join(f"SUM({column}) AS {column}" for column in METRIC_COLUMNS)
+        totals = cursor.execute(
+            f"""
+            SELECT {sums} FROM document_progress
+            WHERE document_type = ? AND run_id = ?
+        """,
+            (self.document_type, run_id),
+        ).fetchone()
+        assignments = ", ".join(f"{column} = ?" for column in METRIC_COLUMNS)
+        cursor.execute(
+            f"UPDATE ingestion_runs SET {assignments} WHERE run_id = ?",
+            (*(totals[column] for column in METRIC_COLUMNS), run_id),
+        )
+
+    @_synchronized
     def add_document(self, document_id: str, metadata: Dict[str, Any] = None) -> None:
         """
         Add a new document to track.
@@ -208,6 +419,93 @@ class ProgressTracker:
             # Document already exists, ignore
             pass
 
+    @_synchronized
+    def add_documents(
+        self, document_ids: Iterable[str], metadata: Dict[str, Any] = None
+    ) -> None:
+        """
+        Add many documents to track in a single transaction.
+
+        Documents that are already tracked are left unchanged.
+
+        Args:
+            document_ids: Unique identifiers of the documents
+            metadata: Optional metadata stored with every one of them
+        """
+        metadata_json = json.dumps(metadata or {})
+        rows = [(doc_id, self.document_type, metadata_json) for doc_id in document_ids]
+        if not rows:
+            return
+
+        cursor = self.conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO document_progress
+                    (document_id, document_type, status, metadata)
+                VALUES (?, ?, 'pending', ?)
+            """,
+                rows,
+            )
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+    def _write_update(self, sql: str, parameters: Tuple[Any, ...]) -> None:
+        """Run a status update now, or buffer it when flush_interval is set."""
+        if not self.flush_interval:
+            self.conn.execute(sql, parameters)
+            return
+
+        self._buffered_updates.append((sql, parameters))
+        if len(self._buffered_updates) >= self.MAX_BUFFERED_UPDATES:
+            self._flush_updates()
+        elif self._flush_thread is None:
+            self._start_flush_timer()
+
+    def _flush_updates(self) -> None:
+        """Write buffered status updates in one transaction (caller holds the lock)."""
+        if not self._buffered_updates:
+            return
+        updates, self._buffered_updates = self._buffered_updates, []
+
+        cursor = self.conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            # Consecutive updates of one kind go in a single executemany; the
+            # order of updates to one document is kept
+            for sql, group in itertools.groupby(updates, key=lambda u: u[0]):
+                cursor.executemany(sql, [parameters for _, parameters in group])
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            self._buffered_updates = updates + self._buffered_updates
+            raise
+
+    @_synchronized
+    def flush(self) -> None:
+        """Write any buffered status updates to the database now."""
+        self._flush_updates()
+
+    def _start_flush_timer(self) -> None:
+        """Flush buffered updates every flush_interval from a background thread."""
+
+        def flush_periodically() -> None:
+            while not self._flush_stop.wait(self.flush_interval):
+                try:
+                    self.flush()
+                except sqlite3.Error as e:
+                    logger.warning(f"Progress flush failed: {e}")
+
+        self._flush_stop.clear()
+        self._flush_thread = threading.Thread(
+            target=flush_periodically, name="progress-flush", daemon=True
+        )
+        self._flush_thread.start()
+
+    @_synchronized
     def is_processed(self, document_id: str) -> bool:
         """
         Check if a document has already been successfully processed.
@@ -218,6 +516,7 @@ class ProgressTracker:
         Returns:
             True if the document was successfully processed, False otherwise
         """
+        self._flush_updates()
         cursor = self.conn.cursor()
         result = cursor.execute(
             """
@@ -229,25 +528,279 @@ class ProgressTracker:
 
         return result is not None
 
+    @_synchronized
     def mark_processing(self, document_id: str) -> None:
         """
-        Mark a document as currently being processed.
+        Mark a document as currently being processed, leased to this tracker.
+
+        The stage times and token counts of an earlier processing of the
+        document are cleared; the document now counts towards this run.
 
         Args:
             document_id: Document to mark as processing
         """
+        clear_metrics = ", ".join(f"{column} = NULL" for column in METRIC_COLUMNS)
+        self._write_update(
+            f"""
+            UPDATE document_progress 
+            SET status = 'processing', updated_at = CURRENT_TIMESTAMP,
+                lease_owner = ?, lease_expires_at = ?, run_id = ?,
+                {clear_metrics}
+            WHERE document_id = ? AND document_type = ?
+        """,
+            (
+                self.worker_id,
+                time.time() + self.lease_seconds,
+                self.run_id,
+                document_id,
+                self.document_type,
+            ),
+        )
+
+    @_synchronized
+    def claim_documents(
+        self, document_ids: List[str], include_completed: bool = False
+    ) -> List[str]:
+        """
+        Lease the given documents to this tracker, skipping unavailable ones.
+
+        A document can be claimed if it is pending or failed, or if it is
+        processing under a lease that has expired (its process crashed or
+        stopped renewing). Completed documents and documents leased by a live
+        process are skipped. The claim is a single write transaction, so two
+        processes claiming the same documents never both get one.
+
+        Args:
+            document_ids: Candidate documents (already added to the tracker)
+            include_completed: Also claim completed documents, so a refresh
+                run can check them for changes
+
+        Returns:
+            The claimed document IDs, in the order given
+        """
+        if not document_ids:
+            return []
+
+        claimable = "'pending', 'failed'"
+        if include_completed:
+            claimable += ", 'completed'"
+        now = time.time()
+        claimed: Set[str] = set()
+        self._flush_updates()
+        cursor = self.conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            for i in range(0, len(document_ids), self._SQL_CHUNK):
+                chunk = document_ids[i : i + self._SQL_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"""
+                    UPDATE document_progress
+                    SET status = 'processing', updated_at = CURRENT_TIMESTAMP,
+                        lease_owner = ?, lease_expires_at = ?
+                    WHERE document_type = ? AND document_id IN ({placeholders})
+                      AND (status IN ({claimable})
+                           OR (status = 'processing'
+                               AND (lease_expires_at IS NULL
+                                    OR lease_expires_at < ?)))
+                """,
+                    (
+                        self.worker_id,
+                        now + self.lease_seconds,
+                        self.document_type,
+                        *chunk,
+                        now,
+                    ),
+                )
+                rows = cursor.execute(
+                    f"""
+                    SELECT document_id FROM document_progress
+                    WHERE document_type = ? AND document_id IN ({placeholders})
+                      AND status = 'processing' AND lease_owner = ?
+                """,
+                    (self.document_type, *chunk, self.worker_id),
+                ).fetchall()
+                claimed.update(row["document_id"] for row in rows)
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+        return [doc_id for doc_id in dict.fromkeys(document_ids) if doc_id in claimed]
+
+    @_synchronized
+    def heartbeat(self) -> int:
+        """
+        Renew every lease this tracker holds on documents processing or spooled.
+
+        Returns:
+            Number of leases renewed
+        """
+        self._flush_updates()
         cursor = self.conn.cursor()
         cursor.execute(
             """
-            UPDATE document_progress 
-            SET status = 'processing', updated_at = CURRENT_TIMESTAMP
+            UPDATE document_progress
+            SET lease_expires_at = ?
+            WHERE document_type = ? AND status IN ('processing', 'spooled')
+              AND lease_owner = ?
+        """,
+            (time.time() + self.lease_seconds, self.document_type, self.worker_id),
+        )
+        return cursor.rowcount
+
+    @_synchronized
+    def release_leases(self) -> int:
+        """
+        Return documents this tracker leased but did not finish to 'pending'.
+
+        Called when an ingestion run stops early, so other processes can pick
+        the documents up immediately instead of waiting for the leases to
+        expire.
+
+        Returns:
+            Number of documents released
+        """
+        self._flush_updates()
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            UPDATE document_progress
+            SET status = 'pending', updated_at = CURRENT_TIMESTAMP,
+                lease_owner = NULL, lease_expires_at = NULL
+            WHERE document_type = ? AND status = 'processing' AND lease_owner = ?
+        """,
+            (self.document_type, self.worker_id),
+        )
+        return cursor.rowcount
+
+    def start_heartbeat(self, interval: Optional[float] = None) -> None:
+        """
+        Renew this tracker's leases from a background thread until stopped.
+
+        Args:
+            interval: Seconds between renewals (default: a third of lease_seconds)
+        """
+        if self._heartbeat_thread is not None:
+            return
+        interval = interval or self.lease_seconds / 3
+
+        def beat() -> None:
+            while not self._heartbeat_stop.wait(interval):
+                try:
+                    self.heartbeat()
+                except sqlite3.Error as e:
+                    logger.warning(f"Lease heartbeat failed: {e}")
+
+        self._heartbeat_stop.clear()
+        self._heartbeat_thread = threading.Thread(
+            target=beat, name="progress-heartbeat", daemon=True
+        )
+        self._heartbeat_thread.start()
+
+    def stop_heartbeat(self) -> None:
+        """Stop the background heartbeat started by start_heartbeat()."""
+        if self._heartbeat_thread is None:
+            return
+        self._heartbeat_stop.set()
+        self._heartbeat_thread.join()
+        self._heartbeat_thread = None
+
+    @_synchronized
+    def mark_spooled(
+        self, document_id: str, processing_time_ms: Optional[int] = None
+    ) -> None:
+        """
+        Mark a document as processed and spooled, awaiting its Qdrant upsert.
+
+        Spooled documents are neither claimed nor reported as pending: their
+        paid-for payloads and embeddings are on disk, and only the upsert
+        remains. The lease stays with this tracker, renewed by the heartbeat,
+        so other processes can tell a live spool from a lost one (see
+        release_lost_spooled()).
+
+        Args:
+            document_id: Document whose payloads were spooled
+            processing_time_ms: Optional processing time in milliseconds
+        """
+        self._write_update(
+            """
+            UPDATE document_progress
+            SET status = 'spooled',
+                updated_at = CURRENT_TIMESTAMP,
+                processing_time_ms = ?,
+                error_message = NULL,
+                lease_owner = ?,
+                lease_expires_at = ?
             WHERE document_id = ? AND document_type = ?
         """,
-            (document_id, self.document_type),
+            (
+                processing_time_ms,
+                self.worker_id,
+                time.time() + self.lease_seconds,
+                document_id,
+                self.document_type,
+            ),
         )
 
+    @_synchronized
+    def release_lost_spooled(self, local_document_ids: Iterable[str]) -> List[str]:
+        """
+        Return spooled documents whose spool segment is gone to 'pending'.
+
+        Only draining the segment written when a document was spooled can
+        complete it. If the process that spooled it died and its spool
+        directory was lost, or is on another machine, the document would stay
+        spooled forever. Once its lease has expired (no live process renews
+        it) and the local spool holds no segment for it, it is released to
+        be claimed and processed again.
+
+        Args:
+            local_document_ids: Documents with a segment in the local spool
+
+        Returns:
+            The released document IDs
+        """
+        keep = set(local_document_ids)
+        now = time.time()
+        self._flush_updates()
+        cursor = self.conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            rows = cursor.execute(
+                """
+                SELECT document_id FROM document_progress
+                WHERE document_type = ? AND status = 'spooled'
+                  AND (lease_expires_at IS NULL OR lease_expires_at < ?)
+            """,
+                (self.document_type, now),
+            ).fetchall()
+            released = [r["document_id"] for r in rows if r["document_id"] not in keep]
+            for i in range(0, len(released), self._SQL_CHUNK):
+                chunk = released[i : i + self._SQL_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"""
+                    UPDATE document_progress
+                    SET status = 'pending', updated_at = CURRENT_TIMESTAMP,
+                        lease_owner = NULL, lease_expires_at = NULL
+                    WHERE document_type = ? AND document_id IN ({placeholders})
+                """,
+                    (self.document_type, *chunk),
+                )
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+        return released
+
+    @_synchronized
     def mark_completed(
-        self, document_id: str, processing_time_ms: Optional[int] = None
+        self,
+        document_id: str,
+        processing_time_ms: Optional[int] = None,
+        fingerprint: Optional[Dict[str, str]] = None,
     ) -> None:
         """
         Mark a document as successfully completed.
@@ -255,20 +808,105 @@ class ProgressTracker:
         Args:
             document_id: Document that was successfully processed
             processing_time_ms: Optional processing time in milliseconds
+                (keeps the time recorded by mark_spooled() when None)
+            fingerprint: DocumentFingerprint.as_metadata() of the chunks now
+                stored (keeps the recorded fingerprint when None)
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
+        self._write_update(
             """
             UPDATE document_progress 
             SET status = 'completed', 
                 updated_at = CURRENT_TIMESTAMP,
-                processing_time_ms = ?,
-                error_message = NULL
+                processing_time_ms = COALESCE(?, processing_time_ms),
+                content_hash = COALESCE(?, content_hash),
+                fingerprint = COALESCE(?, fingerprint),
+                error_message = NULL,
+                lease_owner = NULL,
+                lease_expires_at = NULL
+            WHERE document_id = ? AND document_type = ?
+        """,
+            (
+                processing_time_ms,
+                fingerprint["content_hash"] if fingerprint else None,
+                json.dumps(fingerprint, sort_keys=True) if fingerprint else None,
+                document_id,
+                self.document_type,
+            ),
+        )
+
+    @_synchronized
+    def record_timings(
+        self,
+        document_id: str,
+        stage_ms: Dict[str, float],
+        tokens: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Add stage durations and token counts to a document's metrics.
+
+        Values are added to those already recorded since the document was
+        last marked processing, so stages finishing at different times (the
+        store stage runs after the document is spooled) can each record
+        their own.
+
+        Args:
+            document_id: Document the metrics belong to
+            stage_ms: Milliseconds per stage name (see TIMED_STAGES)
+            tokens: Token counts by name (see TOKEN_COUNTS)
+
+        Raises:
+            ValueError: If a stage or token count name is unknown
+        """
+        values = {f"{stage}_ms": round(ms) for stage, ms in stage_ms.items()}
+        values.update(tokens or {})
+        unknown = set(values) - set(METRIC_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown stage metrics: {sorted(unknown)}")
+
+        # COALESCE(NULL + value, value) starts the sum of a column not yet set;
+        # a value not given leaves the column unchanged
+        assignments = ", ".join(
+            f"{column} = COALESCE({column} + ?, ?, {column})"
+            for column in METRIC_COLUMNS
+        )
+        parameters = [
+            value for column in METRIC_COLUMNS for value in [values.get(column)] * 2
+        ]
+        self._write_update(
+            f"""
+            UPDATE document_progress SET {assignments}
             WHERE document_id = ? AND document_type = ?
         """,
-            (processing_time_ms, document_id, self.document_type),
+            (*parameters, document_id, self.document_type),
         )
 
+    @_synchronized
+    def get_fingerprint(self, document_id: str) -> Optional[Dict[str, str]]:
+        """
+        Get the fingerprint recorded when a document's chunks were last stored.
+
+        Args:
+            document_id: Document identifier
+
+        Returns:
+            The DocumentFingerprint.as_metadata() fields, or None if the
+            document was never stored with a fingerprint
+        """
+        self._flush_updates()
+        cursor = self.conn.cursor()
+        row = cursor.execute(
+            """
+            SELECT fingerprint FROM document_progress
+            WHERE document_id = ? AND document_type = ?
+        """,
+            (document_id, self.document_type),
+        ).fetchone()
+
+        if row is None or not row["fingerprint"]:
+            return None
+        return json.loads(row["fingerprint"])
+
+    @_synchronized
     def mark_failed(self, document_id: str, error_message: str) -> None:
         """
         Mark a document as failed with an error message.
@@ -277,13 +915,14 @@ class ProgressTracker:
             document_id: Document that failed to process
             error_message: Description of what went wrong
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
+        self._write_update(
             """
             UPDATE document_progress 
             SET status = 'failed', 
                 error_message = ?,
-                updated_at = CURRENT_TIMESTAMP
+                updated_at = CURRENT_TIMESTAMP,
+                lease_owner = NULL,
+                lease_expires_at = NULL
             WHERE document_id = ? AND document_type = ?
         """,
             (error_message, document_id, self.document_type),
@@ -293,25 +932,60 @@ class ProgressTracker:
         """
         Get list of documents that still need to be processed.
 
+        These are pending and failed documents, plus documents whose
+        processing lease has expired. Other processes may claim any of them
+        first; use claim_documents() before working on them. Prefer
+        iter_pending_documents() for large sets.
+
         Args:
             limit: Maximum number of pending documents to return
 
         Returns:
             List of document IDs that are pending processing
         """
-        cursor = self.conn.cursor()
-        query = """
-            SELECT document_id FROM document_progress 
-            WHERE document_type = ? AND status IN ('pending', 'failed')
-            ORDER BY created_at
+        return list(itertools.islice(self.iter_pending_documents(), limit))
+
+    def iter_pending_documents(self, page_size: int = 1000) -> Iterator[str]:
         """
+        Iterate over the documents that still need processing, page by page.
 
-        if limit:
-            query += f" LIMIT {limit}"
+        Pages are read with keyset pagination on the row ID (each query
+        starts after the last row of the previous page), so no page costs
+        more than page_size rows and the whole set is never held in memory.
+        The tracker is only locked while a page is read; documents claimed
+        meanwhile are not returned again.
 
-        results = cursor.execute(query, (self.document_type,)).fetchall()
-        return [row["document_id"] for row in results]
+        Args:
+            page_size: Document IDs read per query
+
+        Yields:
+            Document IDs in the order they were added
+        """
+        last_rowid = 0
+        while True:
+            with self._lock:
+                self._flush_updates()
+                rows = self.conn.execute(
+                    """
+                    SELECT rowid, document_id FROM document_progress
+                    WHERE document_type = ? AND rowid > ?
+                      AND (status IN ('pending', 'failed')
+                           OR (status = 'processing'
+                               AND (lease_expires_at IS NULL
+                                    OR lease_expires_at < ?)))
+                    ORDER BY rowid
+                    LIMIT ?
+                """,
+                    (self.document_type, last_rowid, time.time(), page_size),
+                ).fetchall()
+
+            for row in rows:
+                yield row["document_id"]
+            if len(rows) < page_size:
+                return
+            last_rowid = rows[-1]["rowid"]
 
+    @_synchronized
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get detailed statistics about the ingestion progress.
@@ -323,10 +997,12 @@ class ProgressTracker:
             - failed: Documents that failed processing
             - pending: Documents waiting to be processed
             - processing: Documents currently being processed
+            - spooled: Documents waiting in the spool for their Qdrant upsert
             - success_rate: Percentage of successful processing
             - avg_processing_time_ms: Average time to process a document
             - failed_documents: List of failed document IDs with error messages
         """
+        self._flush_updates()
         cursor = self.conn.cursor()
 
         # Get counts by status
@@ -337,6 +1013,7 @@ class ProgressTracker:
             "failed": 0,
             "pending": 0,
             "processing": 0,
+            "spooled": 0,
             "success_rate": 0.0,
             "avg_processing_time_ms": None,
             "failed_documents": [],
@@ -364,6 +1041,8 @@ class ProgressTracker:
                 stats["pending"] = count
             elif status == "processing":
                 stats["processing"] = count
+            elif status == "spooled":
+                stats["spooled"] = count
             stats["total"] += count
 
         # Calculate success rate
@@ -408,27 +1087,142 @@ class ProgressTracker:
 
         return stats
 
+    @_synchronized
+    def get_stage_statistics(
+        self, run_id: Optional[int] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Get the distribution of stage times and token counts per document.
+
+        Args:
+            run_id: Only include documents processed by this run (default: the
+                latest processing of every document)
+
+        Returns:
+            Dictionary keyed by metric column (fetch_ms, ..., store_ms,
+            llm_prompt_tokens, ...), each with count, total, p50, p95 and
+            p99; metrics no document has recorded are left out
+        """
+        self._flush_updates()
+        cursor = self.conn.cursor()
+        run_filter, parameters = "", [self.document_type]
+        if run_id is not None:
+            run_filter = "AND run_id = ?"
+            parameters.append(run_id)
+
+        stats = {}
+        for column in METRIC_COLUMNS:
+            values = [
+                row[0]
+                for row in cursor.execute(
+                    f"""
+                    SELECT {column} FROM document_progress
+                    WHERE document_type = ? AND {column} IS NOT NULL {run_filter}
+                    ORDER BY {column}
+                """,
+                    parameters,
+                )
+            ]
+            if values:
+                stats[column] = {
+                    "count": len(values),
+                    "total": sum(values),
+                    "p50": _percentile(values, 0.50),
+                    "p95": _percentile(values, 0.95),
+                    "p99": _percentile(values, 0.99),
+                }
+        return stats
+
+    @_synchronized
     def reset_processing_status(self) -> None:
         """
-        Reset any documents stuck in 'processing' state back to 'pending'.
+        Reset documents stuck in 'processing' state back to 'pending'.
 
         This is useful when restarting after a crash where documents may
-        have been left in the processing state.
+        have been left in the processing state. Only documents whose lease
+        has expired (or that never had one) are reset; documents another
+        live process is working on keep their lease.
         """
+        self._flush_updates()
         cursor = self.conn.cursor()
         cursor.execute(
             """
             UPDATE document_progress 
-            SET status = 'pending', updated_at = CURRENT_TIMESTAMP
+            SET status = 'pending', updated_at = CURRENT_TIMESTAMP,
+                lease_owner = NULL, lease_expires_at = NULL
             WHERE document_type = ? AND status = 'processing'
+              AND (lease_expires_at IS NULL OR lease_expires_at < ?)
         """,
-            (self.document_type,),
+            (self.document_type, time.time()),
         )
 
         count = cursor.rowcount
         if count > 0:
             logger.info(f"Reset {count} documents from 'processing' to 'pending' state")
 
+    @_synchronized
+    def get_discovery_cursor(self, cursor_key: str) -> Optional[str]:
+        """
+        Get the saved pagination cursor for an interrupted discovery.
+
+        Args:
+            cursor_key: Identifies the discovery (e.g., source and date range)
+
+        Returns:
+            The saved cursor (typically the next page URL), or None
+        """
+        cursor = self.conn.cursor()
+        row = cursor.execute(
+            """
+            SELECT cursor FROM discovery_cursors
+            WHERE document_type = ? AND cursor_key = ?
+        """,
+            (self.document_type, cursor_key),
+        ).fetchone()
+
+        return row["cursor"] if row else None
+
+    @_synchronized
+    def save_discovery_cursor(self, cursor_key: str, value: str) -> None:
+        """
+        Save the pagination cursor of a discovery in progress.
+
+        Callers should save the cursor only after every document from the
+        pages before it has been added with add_document(), so resuming never
+        skips documents.
+
+        Args:
+            cursor_key: Identifies the discovery (e.g., source and date range)
+            value: Cursor to resume from (typically the next page URL)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO discovery_cursors
+                (document_type, cursor_key, cursor, updated_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        """,
+            (self.document_type, cursor_key, value),
+        )
+
+    @_synchronized
+    def clear_discovery_cursor(self, cursor_key: str) -> None:
+        """
+        Forget the cursor once a discovery has run to completion.
+
+        Args:
+            cursor_key: Identifies the discovery (e.g., source and date range)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            DELETE FROM discovery_cursors
+            WHERE document_type = ? AND cursor_key = ?
+        """,
+            (self.document_type, cursor_key),
+        )
+
+    @_synchronized
     def get_run_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get history of recent ingestion runs.
@@ -437,7 +1231,8 @@ class ProgressTracker:
             limit: Maximum number of runs to return
 
         Returns:
-            List of run information dictionaries
+            List of run information dictionaries, including the run's total
+            stage times and token counts (see end_run())
         """
         cursor = self.conn.cursor()
         runs = cursor.execute(
@@ -454,7 +1249,15 @@ class ProgressTracker:
 
     def close(self) -> None:
         """
-        Close the database connection.
+        Stop the heartbeat, write buffered updates and close the connection.
         """
-        if self.conn:
-            self.conn.close()
+        # Outside the lock: the background threads may be waiting for it
+        self.stop_heartbeat()
+        if self._flush_thread is not None:
+            self._flush_stop.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+        with self._lock:
+            if self.conn:
+                self._flush_updates()
+                self.conn.close()
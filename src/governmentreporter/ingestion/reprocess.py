@@ -0,0 +1,206 @@
+"""
+Repair documents whose LLM metadata extraction failed during ingestion.
+
+When GPT extraction fails, build_payloads stores fallback metadata on every
+chunk of the document and flags it with requires_reprocessing. The
+MetadataReprocessor finds those documents with a filtered Qdrant scroll,
+rebuilds each document's text from its stored chunks and runs only the LLM
+extraction again. The new fields are written onto the chunks with a
+payload-only update: nothing is refetched from the source API and nothing is
+re-embedded, so a repair costs one LLM call per document.
+
+The text given to the LLM is the concatenation of the stored chunks. Chunks
+overlap slightly, so it repeats a few sentences, which does not matter for
+summarizing the document.
+
+Python Learning Notes:
+    - Qdrant's scroll API pages through points matching a filter, without
+      a query vector
+    - A payload-only update changes metadata while keeping the vector
+"""
+
+import logging
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from ..apis.base import Document
+from ..database.ingestion import QdrantIngestionClient
+from ..processors.build_payloads import PreparedDocument, extract_document_metadata
+from ..utils.monitoring import PerformanceMonitor
+
+logger = logging.getLogger(__name__)
+
+# Payload flags written when LLM extraction fails; removed once it succeeds
+FAILURE_FLAGS = ("llm_extraction_failed", "requires_reprocessing")
+
+# Document type (as used by the chunkers and LLM prompts) of each collection
+COLLECTION_DOC_TYPES = {
+    "supreme_court_opinions": "scotus",
+    "executive_orders": "eo",
+}
+
+
+def rebuild_prepared_document(
+    document_id: str, doc_type: str, stored: List[Dict[str, Any]]
+) -> PreparedDocument:
+    """
+    Rebuild enough of a PreparedDocument from stored chunks to re-run extraction.
+
+    Args:
+        document_id: ID of the document the chunks belong to
+        doc_type: "scotus" or "eo"
+        stored: Stored chunk payloads, ordered by chunk_index
+
+    Returns:
+        PreparedDocument whose content is the chunks' text, with no API
+        metadata (so extraction returns only the LLM fields)
+    """
+    first = stored[0]
+    chunks = [
+        (payload.get("text", ""), {"section_label": payload.get("section_label")})
+        for payload in stored
+    ]
+    content = "\n\n".join(text for text, _ in chunks)
+
+    # The SCOTUS prompt also uses the syllabus, which has its own chunks
+    syllabus = "\n\n".join(
+        text
+        for text, meta in chunks
+        if str(meta.get("section_label") or "").startswith("Syllabus")
+    )
+
+    document = Document(
+        id=document_id,
+        title=first.get("title", ""),
+        date=str(first.get("year", "")),
+        type=first.get("type", doc_type),
+        source=first.get("source", ""),
+        content=content,
+    )
+    return PreparedDocument(
+        document=document,
+        doc_type=doc_type,
+        doc_metadata={},
+        chunks=chunks,
+        syllabus=syllabus or None,
+    )
+
+
+class MetadataReprocessor:
+    """
+    Re-run LLM extraction for the flagged documents of one collection.
+
+    Example:
+        reprocessor = MetadataReprocessor("supreme_court_opinions")
+        counts = reprocessor.run(limit=100)
+        print(f"Repaired {counts['repaired']} opinions")
+    """
+
+    def __init__(
+        self,
+        collection_name: str,
+        qdrant_db_path: str = "./data/qdrant/qdrant_db",
+        shared_db_client=None,
+        dry_run: bool = False,
+    ):
+        """
+        Initialize the reprocessor.
+
+        Args:
+            collection_name: Qdrant collection to repair
+            qdrant_db_path: Path to Qdrant database directory
+            shared_db_client: Optional pre-initialized QdrantDBClient for shared access
+            dry_run: If True, only report the flagged documents
+
+        Raises:
+            ValueError: If the collection's document type is unknown
+        """
+        if collection_name not in COLLECTION_DOC_TYPES:
+            raise ValueError(
+                f"Cannot reprocess collection '{collection_name}'; expected one of "
+                f"{', '.join(COLLECTION_DOC_TYPES)}"
+            )
+
+        self.collection_name = collection_name
+        self.doc_type = COLLECTION_DOC_TYPES[collection_name]
+        self.dry_run = dry_run
+        self.qdrant_client = QdrantIngestionClient(
+            collection_name=collection_name,
+            db_path=qdrant_db_path,
+            db_client=shared_db_client,
+        )
+        self.performance_monitor = PerformanceMonitor()
+
+    def find_flagged_documents(self) -> List[str]:
+        """IDs of the documents whose chunks are flagged requires_reprocessing."""
+        return self.qdrant_client.flagged_document_ids("requires_reprocessing")
+
+    def run(self, limit: Optional[int] = None) -> Counter:
+        """
+        Reprocess the flagged documents.
+
+        Args:
+            limit: Maximum number of documents to reprocess (None: all)
+
+        Returns:
+            Counter of outcomes: "repaired", "still failing", "failed" (the
+            update could not be written) and "flagged" (documents found)
+        """
+        document_ids = self.find_flagged_documents()
+        if limit is not None:
+            document_ids = document_ids[:limit]
+
+        counts: Counter = Counter(flagged=len(document_ids))
+        logger.info(
+            f"Found {len(document_ids)} documents to reprocess "
+            f"in {self.collection_name}"
+        )
+        if self.dry_run or not document_ids:
+            return counts
+
+        self.performance_monitor.start()
+        for i, document_id in enumerate(document_ids, start=1):
+            outcome = self.reprocess_document(document_id)
+            counts[outcome] += 1
+            self.performance_monitor.record_document(failed=outcome != "repaired")
+            self.performance_monitor.print_progress(
+                i, len(document_ids), "Reprocessing documents"
+            )
+        return counts
+
+    def reprocess_document(self, document_id: str) -> str:
+        """
+        Re-run LLM extraction for one document and update its chunks.
+
+        Args:
+            document_id: ID of a flagged document
+
+        Returns:
+            "repaired", "still failing" (extraction failed again; the chunks
+            keep their flags) or "failed" (chunks missing or update rejected)
+        """
+        try:
+            stored = self.qdrant_client.get_document_payloads(document_id)
+        except Exception as e:
+            logger.error(f"Could not read chunks of {document_id}: {e}")
+            return "failed"
+        if not stored:
+            logger.warning(f"No stored chunks found for {document_id}")
+            return "failed"
+
+        prepared = rebuild_prepared_document(document_id, self.doc_type, stored)
+        llm_fields = extract_document_metadata(prepared)
+        if llm_fields.get("requires_reprocessing"):
+            logger.warning(f"LLM extraction failed again for {document_id}")
+            return "still failing"
+
+        payloads = [
+            {"id": payload["original_id"], "metadata": llm_fields}
+            for payload in stored
+            if payload.get("original_id")
+        ]
+        if not self.qdrant_client.update_payloads(payloads, remove_keys=FAILURE_FLAGS):
+            return "failed"
+
+        logger.info(f"Repaired metadata of {document_id} ({len(payloads)} chunks)")
+        return "repaired"
@@ -5,7 +5,7 @@ This module provides batch ingestion of Supreme Court opinions from the
 CourtListener API into the Qdrant vector database.
 
 The ingester:
-- Fetches opinion IDs with pagination handling
+- Streams opinion IDs page by page, with a resumable pagination cursor
 - Processes documents through chunking and metadata extraction
 - Generates embeddings using OpenAI
 - Stores in Qdrant with progress tracking
@@ -15,11 +15,22 @@ The ingester:
 import logging
 import time
 from datetime import datetime
-from typing import Any, Dict, List
-
-from ..apis.court_listener import CourtListenerClient
-from ..processors.build_payloads import build_payloads_from_document
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from ..apis.base import Document
+from ..apis.court_listener import AsyncCourtListenerClient, CourtListenerClient
+from .async_base import AsyncDocumentIngester
 from .base import DocumentIngester
+from .discovery_cache import DEFAULT_MAX_AGE, DiscoveryCache
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +67,14 @@ class SCOTUSIngester(DocumentIngester):
         progress_db: str = "scotus_ingestion.db",
         qdrant_db_path: str = "./data/qdrant/qdrant_db",
         shared_db_client=None,
+        http_cache=None,
+        cassette=None,
+        workers: int = 1,
+        stage_workers: Optional[Dict[str, int]] = None,
+        discovery_db: Optional[str] = None,
+        discovery_max_age: Optional[float] = DEFAULT_MAX_AGE,
+        refresh: bool = False,
+        embedding_cache=None,
     ):
         """
         Initialize the SCOTUS ingester.
@@ -68,6 +87,16 @@ class SCOTUSIngester(DocumentIngester):
             progress_db: Path to SQLite progress database
             qdrant_db_path: Path to Qdrant database directory
             shared_db_client: Optional pre-initialized QdrantDBClient for shared access
+            http_cache: Optional HTTPCache for API responses
+            cassette: Optional Cassette to record or replay API traffic
+            workers: Number of documents to process concurrently (default: 1)
+            stage_workers: Threads per pipeline stage; enables staged ingestion
+            discovery_db: Optional SQLite file persisting discovered clusters,
+                          so resumed runs skip discovery (default: memory only)
+            discovery_max_age: Seconds discovery results in discovery_db
+                               stay fresh (None: forever)
+            refresh: Also re-check completed documents for changes at the source
+            embedding_cache: Optional EmbeddingCache of vectors already computed
         """
         # Initialize base class
         super().__init__(
@@ -79,23 +108,45 @@ class SCOTUSIngester(DocumentIngester):
             qdrant_db_path=qdrant_db_path,
             document_type="scotus",
             shared_db_client=shared_db_client,
+            http_cache=http_cache,
+            cassette=cassette,
+            workers=workers,
+            stage_workers=stage_workers,
+            refresh=refresh,
+            embedding_cache=embedding_cache,
         )
 
         # Initialize SCOTUS-specific API client
-        self.api_client = CourtListenerClient()
+        self.api_client = CourtListenerClient(http_cache=http_cache, cassette=cassette)
+
+        # Persistent discovery results (clusters and completed listings), or
+        # None to keep cluster metadata in memory for this run only
+        self.discovery_cache: Optional[DiscoveryCache] = (
+            DiscoveryCache(discovery_db, "scotus_clusters", max_age=discovery_max_age)
+            if discovery_db
+            else None
+        )
 
         # Cache for cluster metadata to avoid redundant API calls
         # Maps opinion_id -> cluster_data dictionary
-        # Populated during _fetch_document_ids() and used in _process_single_document()
-        self.cluster_cache: Dict[str, Dict[str, Any]] = {}
+        # Populated during discovery and consumed by _fetch_document()
+        self.cluster_cache: Union[Dict[str, Dict[str, Any]], DiscoveryCache] = (
+            self.discovery_cache if self.discovery_cache is not None else {}
+        )
 
     def _get_collection_name(self) -> str:
         """Get the Qdrant collection name for SCOTUS opinions."""
         return "supreme_court_opinions"
 
-    def _fetch_document_ids(self) -> List[str]:
+    def _discovery_cursor_key(self) -> str:
+        """Key under which the cluster pagination cursor is persisted."""
+        return f"clusters:{self.start_date}:{self.end_date}"
+
+    def _iter_cluster_pages(
+        self, resume_url: Optional[str] = None
+    ) -> Iterator[Tuple[List[str], Optional[str]]]:
         """
-        Fetch all Supreme Court opinion IDs in the date range.
+        Page through SCOTUS clusters, yielding opinion IDs one page at a time.
 
         This method queries the clusters endpoint (not opinions) because:
         - The clusters endpoint is more efficient (fewer results to paginate)
@@ -103,25 +154,24 @@ class SCOTUSIngester(DocumentIngester):
         - We can cache cluster metadata for later use (avoids redundant API calls)
         - The docket__court=scotus filter reliably returns only SCOTUS clusters
 
-        The method:
-        - Uses docket__court=scotus filter (verified to work correctly)
-        - Handles pagination automatically
-        - Caches cluster metadata for performance optimization
-        - Includes retry logic for transient server errors
+        Only the current page of clusters is held in memory; each cluster is
+        kept in cluster_cache for its opinions until they are processed.
 
-        Returns:
-            List of opinion IDs to process
-        """
-        logger.info("Fetching opinion IDs from CourtListener clusters API...")
-        logger.info(f"Date range: {self.start_date} to {self.end_date}")
+        Args:
+            resume_url: Next-page URL saved by an interrupted discovery. When
+                        given, pagination continues from that page.
 
-        all_opinion_ids: List[str] = []
-        all_clusters: List[Dict[str, Any]] = []
+        Yields:
+            Tuples of (opinion IDs on this page, next page URL or None)
 
+        Error Handling:
+            API errors end pagination after logging; pages already yielded
+            remain valid, so callers keep the partial results.
+        """
         # Query clusters endpoint with court filter
         # The docket__court=scotus filter is reliable (verified 2025-10-13)
         url = f"{self.api_client.base_url}/clusters/"
-        params: Dict[str, Any] = {
+        params: Optional[Dict[str, Any]] = {
             "docket__court": "scotus",  # Filter to SCOTUS only (reliable)
             "date_filed__gte": self.start_date,
             "date_filed__lte": self.end_date,
@@ -132,260 +182,458 @@ class SCOTUSIngester(DocumentIngester):
             "order_by": "-date_filed,id",
             "page_size": 20,  # API maximum for clusters endpoint
         }
+        if resume_url:
+            # The saved next-page URL already carries every query parameter
+            url, params = resume_url, None
+
+        total_clusters = 0
+        total_opinions = 0
 
         try:
             import httpx
 
-            # Create HTTP client with longer timeout for pagination
-            with httpx.Client(timeout=120.0) as client:
-                page = 1
-                max_pages = 200  # Safety limit to prevent runaway pagination
-
-                # Paginate through all SCOTUS clusters in date range
-                while url and page <= max_pages:
-                    # Rate limiting
-                    time.sleep(self.api_client._get_rate_limit_delay())
-
-                    logger.info(f"Fetching page {page}...")
-
-                    # Retry logic for transient errors (502, 503, 504)
-                    max_retries = 3
-                    retry_delay = 5  # seconds
-
-                    for attempt in range(max_retries):
-                        try:
-                            response = client.get(
-                                url, headers=self.api_client.headers, params=params
+            page = 1
+            max_pages = 200  # Safety limit to prevent runaway pagination
+
+            # Paginate through all SCOTUS clusters in date range
+            while url and page <= max_pages:
+                logger.info(f"Fetching page {page}...")
+
+                # Retry logic for transient errors (502, 503, 504)
+                max_retries = 3
+                retry_delay = 5  # seconds
+
+                for attempt in range(max_retries):
+                    try:
+                        # Wait for the host's shared token bucket rather than
+                        # sleeping a fixed delay before every page
+                        self.api_client.rate_limiter.acquire()
+
+                        # Reuse the API client's pooled connection; pagination
+                        # pages can be slow, so allow a longer timeout.
+                        # params=None keeps the query string of next-page URLs
+                        response = self.api_client.http_client.get(
+                            url,
+                            headers=self.api_client.headers,
+                            params=params,
+                            timeout=120.0,
+                        )
+                        self.api_client.rate_limiter.observe(response)
+                        response.raise_for_status()
+                        break  # Success, exit retry loop
+                    except httpx.HTTPStatusError as e:
+                        if (
+                            e.response.status_code in [502, 503, 504]
+                            and attempt < max_retries - 1
+                        ):
+                            logger.warning(
+                                f"API error {e.response.status_code} on page {page}, "
+                                f"retrying in {retry_delay}s (attempt {attempt + 1}/{max_retries})..."
                             )
-                            response.raise_for_status()
-                            break  # Success, exit retry loop
-                        except httpx.HTTPStatusError as e:
-                            if (
-                                e.response.status_code in [502, 503, 504]
-                                and attempt < max_retries - 1
-                            ):
-                                logger.warning(
-                                    f"API error {e.response.status_code} on page {page}, "
-                                    f"retrying in {retry_delay}s (attempt {attempt + 1}/{max_retries})..."
-                                )
-                                time.sleep(retry_delay)
-                                retry_delay *= 2  # Exponential backoff
-                            else:
-                                raise  # Re-raise if not retryable or max retries exceeded
-
-                    data = response.json()
-                    results = data.get("results", [])
-
-                    if not results:
-                        logger.info(f"No more results on page {page}, stopping.")
-                        break
-
-                    # Collect all clusters from this page
-                    # No validation needed - the API filter is reliable
-                    page_clusters = len(results)
-                    all_clusters.extend(results)
-
-                    # Log progress
-                    logger.info(
-                        f"Page {page}: {page_clusters} clusters collected "
-                        f"({len(all_clusters)} total)"
-                    )
+                            time.sleep(retry_delay)
+                            retry_delay *= 2  # Exponential backoff
+                        else:
+                            raise  # Re-raise if not retryable or max retries exceeded
 
-                    # Get next page URL
-                    next_url = data.get("next")
+                data = response.json()
+                results = data.get("results", [])
 
-                    if not next_url:
-                        logger.info("No next URL, pagination complete")
-                        break
+                if not results:
+                    logger.info(f"No more results on page {page}, stopping.")
+                    break
 
-                    url = next_url
-                    params = {}  # Clear params (they're in the next URL)
-                    page += 1
-
-                    # Safety check to prevent infinite loops
-                    if page > max_pages:
-                        logger.warning(
-                            f"Reached maximum page limit ({max_pages} pages), "
-                            "stopping pagination"
-                        )
-                        break
+                # No validation needed - the API filter is reliable
+                page_opinion_ids = self._extract_opinion_ids(results)
+                total_clusters += len(results)
+                total_opinions += len(page_opinion_ids)
 
-                # Extract opinion IDs from all collected clusters
                 logger.info(
-                    f"Extracting opinion IDs from {len(all_clusters)} SCOTUS clusters..."
+                    f"Page {page}: {len(results)} clusters, "
+                    f"{len(page_opinion_ids)} opinions "
+                    f"({total_opinions} opinions total)"
                 )
 
-                for cluster in all_clusters:
-                    # Extract opinion IDs from sub_opinions
-                    sub_opinions = cluster.get("sub_opinions", [])
+                # Get next page URL
+                next_url = data.get("next") or None
+                yield page_opinion_ids, next_url
 
-                    if not sub_opinions:
-                        logger.warning(
-                            f"Cluster {cluster.get('id')} has no sub_opinions, skipping"
-                        )
-                        continue
-
-                    for opinion_url in sub_opinions:
-                        # Extract opinion ID from URL
-                        # Format: .../api/rest/v4/opinions/{id}/
-                        try:
-                            opinion_id = opinion_url.rstrip("/").split("/")[-1]
-                            all_opinion_ids.append(str(opinion_id))
+                if not next_url:
+                    logger.info("No next URL, pagination complete")
+                    break
 
-                            # Cache cluster data for this opinion
-                            # This avoids refetching cluster data during processing
-                            self.cluster_cache[str(opinion_id)] = cluster
+                url = next_url
+                params = None  # Params are already in the next URL
+                page += 1
 
-                        except (IndexError, AttributeError) as e:
-                            logger.warning(
-                                f"Could not extract opinion ID from "
-                                f"URL: {opinion_url}, error: {e}"
-                            )
+                # Safety check to prevent infinite loops
+                if page > max_pages:
+                    logger.warning(
+                        f"Reached maximum page limit ({max_pages} pages), "
+                        "stopping pagination"
+                    )
+                    break
 
             # Each opinion belongs to exactly one cluster per CourtListener's data model
             # (Court → Docket → Cluster → Opinions hierarchy is strictly one-to-many)
             # Therefore, opinion IDs are guaranteed unique - no deduplication needed
 
             logger.info(
-                f"Successfully fetched {len(all_opinion_ids)} opinion IDs "
-                f"from {len(all_clusters)} SCOTUS clusters"
+                f"Successfully fetched {total_opinions} opinion IDs "
+                f"from {total_clusters} SCOTUS clusters"
             )
 
-            # Log cluster cache size
-            logger.info(f"Cached metadata for {len(self.cluster_cache)} opinions")
-
         except Exception as e:
             logger.error(f"Error during cluster fetching: {e}")
+            if total_clusters > 0:
+                logger.warning(
+                    f"Stopping discovery after {total_clusters} SCOTUS clusters "
+                    f"({total_opinions} opinion IDs); partial results are kept"
+                )
+            else:
+                logger.error("No SCOTUS clusters collected before error occurred")
+
+    def _extract_opinion_ids(self, clusters: List[Dict[str, Any]]) -> List[str]:
+        """
+        Extract opinion IDs from clusters and cache each opinion's cluster.
 
-            # If we collected any clusters before the error, extract opinion IDs
-            if len(all_clusters) > 0:
+        Args:
+            clusters: Cluster dictionaries from the clusters endpoint
+
+        Returns:
+            Opinion IDs from the clusters' sub_opinions URLs
+        """
+        opinion_ids: List[str] = []
+        page_clusters: Dict[str, Dict[str, Any]] = {}
+
+        for cluster in clusters:
+            # Extract opinion IDs from sub_opinions
+            sub_opinions = cluster.get("sub_opinions", [])
+
+            if not sub_opinions:
                 logger.warning(
-                    f"Collected {len(all_clusters)} SCOTUS clusters before error, "
-                    f"extracting opinion IDs from partial results..."
+                    f"Cluster {cluster.get('id')} has no sub_opinions, skipping"
                 )
+                continue
+
+            for opinion_url in sub_opinions:
+                # Extract opinion ID from URL
+                # Format: .../api/rest/v4/opinions/{id}/
+                try:
+                    opinion_id = str(opinion_url.rstrip("/").split("/")[-1])
+                    opinion_ids.append(opinion_id)
+
+                    # Cache cluster data for this opinion
+                    # This avoids refetching cluster data during processing
+                    page_clusters[opinion_id] = cluster
+
+                except (IndexError, AttributeError) as e:
+                    logger.warning(
+                        f"Could not extract opinion ID from "
+                        f"URL: {opinion_url}, error: {e}"
+                    )
+
+        # One write per page when the cache is persistent
+        self.cluster_cache.update(page_clusters)
+        return opinion_ids
 
-                # Extract opinion IDs from clusters we did manage to collect
-                for cluster in all_clusters:
-                    sub_opinions = cluster.get("sub_opinions", [])
+    def _iter_document_ids(self) -> Iterator[List[str]]:
+        """
+        Stream opinion IDs page by page, persisting the pagination cursor.
 
-                    if not sub_opinions:
-                        continue
+        Processing in run() starts as soon as the first page has arrived.
+        After run() has added a page's IDs to the progress tracker, the next
+        page URL is saved there, so an interrupted discovery resumes from
+        that page instead of starting over. The cursor is cleared once
+        pagination completes.
 
-                    for opinion_url in sub_opinions:
-                        try:
-                            opinion_id = opinion_url.rstrip("/").split("/")[-1]
-                            all_opinion_ids.append(str(opinion_id))
-                            self.cluster_cache[str(opinion_id)] = cluster
-                        except (IndexError, AttributeError) as e:
-                            logger.warning(
-                                f"Could not extract opinion ID from URL: {opinion_url}, error: {e}"
-                            )
+        With a discovery cache, a completed discovery of the date range is
+        also recorded; while it is fresh, later runs replay it instead of
+        paging through the API, and take cluster data from the cache.
+
+        Opinions discovered by an earlier, interrupted run are not re-yielded;
+        run() picks them up from the tracker's pending documents and their
+        cluster data is fetched on demand.
+
+        Yields:
+            Lists of opinion IDs, one list per clusters page
+        """
+        logger.info("Fetching opinion IDs from CourtListener clusters API...")
+        logger.info(f"Date range: {self.start_date} to {self.end_date}")
 
+        cursor_key = self._discovery_cursor_key()
+        if self.discovery_cache is not None:
+            listing = self.discovery_cache.get_listing(cursor_key)
+            if listing is not None:
                 logger.info(
-                    f"Extracted {len(all_opinion_ids)} opinion IDs from "
-                    f"{len(all_clusters)} SCOTUS clusters "
-                    f"(partial results due to API error)"
+                    f"Using {len(listing)} cached opinion IDs, skipping discovery"
                 )
+                for i in range(0, len(listing), self.batch_size):
+                    yield listing[i : i + self.batch_size]
+                return
+
+        resume_url = self.progress_tracker.get_discovery_cursor(cursor_key)
+        if resume_url:
+            logger.info(f"Resuming cluster discovery from saved cursor: {resume_url}")
+
+        # Only a discovery that starts at the first page yields a full listing
+        discovered: Optional[List[str]] = (
+            [] if self.discovery_cache is not None and not resume_url else None
+        )
+        completed = False
+        for opinion_ids, next_url in self._iter_cluster_pages(resume_url):
+            if discovered is not None:
+                discovered.extend(opinion_ids)
+            yield opinion_ids
+
+            # The consumer has now tracked this page's IDs; move the cursor on
+            if next_url:
+                self.progress_tracker.save_discovery_cursor(cursor_key, next_url)
             else:
-                logger.error("No SCOTUS clusters collected before error occurred")
+                completed = True
 
-        return all_opinion_ids
+        if completed:
+            if discovered is not None:
+                self.discovery_cache.put_listing(cursor_key, discovered)
+            self.progress_tracker.clear_discovery_cursor(cursor_key)
 
-    def _process_single_document(
-        self,
-        doc_id: str,
-        batch_documents: List[Dict[str, Any]],
-        batch_embeddings: List[List[float]],
-    ) -> bool:
+    def _fetch_document(self, doc_id: str) -> Document:
+        """
+        Fetch one opinion, using the cluster data cached during discovery.
+
+        Args:
+            doc_id: Opinion ID to fetch
+
+        Returns:
+            The opinion as a Document
+
+        Raises:
+            ValueError: If the opinion could not be fetched
         """
-        Process a single Supreme Court opinion using cached cluster data.
+        # Retrieve cached cluster data
+        # This was populated during discovery and already validated; pop it
+        # so memory is bounded by the documents not yet processed (a discovery
+        # cache keeps its disk copy for retries)
+        cluster_data = self.cluster_cache.pop(doc_id, None)
+
+        if not cluster_data:
+            # This shouldn't happen if discovery worked correctly,
+            # but we handle it gracefully by proceeding without cluster data
+            logger.warning(
+                f"No cached cluster data for opinion {doc_id}, "
+                f"will fetch from API (slower)"
+            )
 
-        This method:
-        1. Retrieves cached cluster data (validated during _fetch_document_ids())
-        2. Fetches the opinion from CourtListener with field selection
-        3. Passes cluster data to avoid redundant API call
-        4. Builds payloads (chunking + metadata extraction)
-        5. Generates embeddings
-        6. Adds to batch lists
+        # Fetch opinion data with cached cluster data
+        # This skips the cluster API call since we already have the data
+        logger.debug(f"Fetching opinion {doc_id}")
+        document = self.api_client.get_document(doc_id, cluster_data=cluster_data)
 
-        Performance Optimization:
-            Court validation already happened in _fetch_document_ids(), so this
-            method skips validation and uses cached cluster data to avoid
-            redundant API calls. This reduces API calls per opinion from 4 to 1.
+        # Log the document being ingested
+        if document:
+            case_name = document.title or f"Opinion ID: {doc_id}"
+            logger.info(f"Ingesting SCOTUS opinion: {case_name}")
+
+        if not document:
+            raise ValueError(f"Could not fetch document for opinion {doc_id}")
+
+        return document
+
+    def _build_payloads(self, doc_id: str) -> List[Dict[str, Any]]:
+        """
+        Fetch an opinion and build its chunk payloads, without embeddings.
 
         Args:
             doc_id: Opinion ID to process
-            batch_documents: List to append document payloads to
-            batch_embeddings: List to append embeddings to
 
         Returns:
-            True if successful, False if failed
+            Chunk payloads with document_id and ingested_at set, or [] if
+            the stored chunks needed no re-embedding
 
-        Error Handling:
-            - If cluster data not found in cache, falls back to fetching
-            - API failures are logged and marked as failed in progress tracker
-            - Processing failures don't block other opinions in batch
+        Raises:
+            ValueError: If no payloads could be built
         """
-        start_time = time.time()
+        document = self._fetch_document(doc_id)
 
-        try:
-            # Mark as processing
-            self.progress_tracker.mark_processing(doc_id)
+        # Process through the pipeline
+        logger.debug(f"Building payloads for opinion {doc_id}")
+        # Empty when the stored chunks are up to date (already completed)
+        payloads = self._payloads_from_document(document)
 
-            # Retrieve cached cluster data
-            # This was populated during _fetch_document_ids() and already validated
-            cluster_data = self.cluster_cache.get(doc_id)
+        logger.debug(f"Generated {len(payloads)} chunks for opinion {doc_id}")
 
-            if not cluster_data:
-                # This shouldn't happen if _fetch_document_ids() worked correctly,
-                # but we handle it gracefully by proceeding without cluster data
-                logger.warning(
-                    f"No cached cluster data for opinion {doc_id}, "
-                    f"will fetch from API (slower)"
-                )
+        ingested_at = datetime.now().isoformat()
+        for payload in payloads:
+            payload["document_id"] = doc_id
+            payload["ingested_at"] = ingested_at
+        return payloads
 
-            # Fetch opinion data with cached cluster data
-            # This skips the cluster API call since we already have the data
-            logger.debug(f"Fetching opinion {doc_id}")
-            document = self.api_client.get_document(doc_id, cluster_data=cluster_data)
 
-            # Log the document being ingested
-            if document:
-                case_name = document.title or f"Opinion ID: {doc_id}"
-                logger.info(f"Ingesting SCOTUS opinion: {case_name}")
+class AsyncSCOTUSIngester(AsyncDocumentIngester):
+    """
+    Asyncio-native Supreme Court opinion ingester.
 
-            if not document:
-                raise ValueError(f"Could not fetch document for opinion {doc_id}")
+    Discovers opinions through AsyncCourtListenerClient.list_scotus_clusters()
+    and processes them on a single event loop (see AsyncDocumentIngester).
+    Shares the progress database and collection with SCOTUSIngester, so the
+    two can be used interchangeably on the same date range.
 
-            # Process through the pipeline
-            logger.debug(f"Building payloads for opinion {doc_id}")
-            payloads = build_payloads_from_document(document)
+    Example:
+        ingester = AsyncSCOTUSIngester(
+            start_date="2020-01-01",
+            end_date="2024-12-31",
+            max_in_flight=200,
+        )
+        ingester.run()
+    """
 
-            if not payloads:
-                raise ValueError(f"No payloads generated for opinion {doc_id}")
+    # Clusters grouped into one batch of discovered IDs (the API page size)
+    discovery_page_size = 20
 
-            logger.debug(f"Generated {len(payloads)} chunks for opinion {doc_id}")
+    def __init__(
+        self,
+        start_date: str,
+        end_date: str,
+        batch_size: int = 50,
+        dry_run: bool = False,
+        progress_db: str = "scotus_ingestion.db",
+        qdrant_db_path: str = "./data/qdrant/qdrant_db",
+        http_cache=None,
+        cassette=None,
+        discovery_db: Optional[str] = None,
+        discovery_max_age: Optional[float] = DEFAULT_MAX_AGE,
+        refresh: bool = False,
+        embedding_cache=None,
+        **concurrency: Optional[int],
+    ):
+        """
+        Initialize the async SCOTUS ingester.
 
-            # Generate embeddings for each chunk
-            chunk_texts = [p["text"] for p in payloads]
-            embeddings = self.embedding_generator.generate_batch_embeddings(chunk_texts)
+        Args:
+            start_date: Start date for opinion range (YYYY-MM-DD)
+            end_date: End date for opinion range (YYYY-MM-DD)
+            batch_size: Number of opinions whose chunks are upserted together
+            dry_run: If True, don't actually store documents
+            progress_db: Path to SQLite progress database
+            qdrant_db_path: Path to Qdrant database directory
+            http_cache: Optional HTTPCache for API responses
+            cassette: Optional Cassette to record or replay API traffic
+            discovery_db: Optional SQLite file persisting discovered clusters,
+                          so resumed runs skip discovery (default: memory only)
+            discovery_max_age: Seconds discovery results in discovery_db
+                               stay fresh (None: forever)
+            refresh: Also re-check completed documents for changes at the source
+            embedding_cache: Optional EmbeddingCache of vectors already computed
+            **concurrency: max_in_flight, per-service limits and embedding
+                per-minute budgets, passed to AsyncDocumentIngester
+        """
+        super().__init__(
+            start_date=start_date,
+            end_date=end_date,
+            batch_size=batch_size,
+            dry_run=dry_run,
+            progress_db=progress_db,
+            qdrant_db_path=qdrant_db_path,
+            document_type="scotus",
+            http_cache=http_cache,
+            cassette=cassette,
+            refresh=refresh,
+            embedding_cache=embedding_cache,
+            **concurrency,
+        )
+
+        self.api_client = AsyncCourtListenerClient(
+            max_concurrency=self.fetch_concurrency,
+            http_cache=http_cache,
+            cassette=cassette,
+        )
+
+        # Shared with SCOTUSIngester, so either can reuse the other's results
+        self.discovery_cache: Optional[DiscoveryCache] = (
+            DiscoveryCache(discovery_db, "scotus_clusters", max_age=discovery_max_age)
+            if discovery_db
+            else None
+        )
 
-            # Convert payloads to Qdrant format
-            for payload, embedding in zip(payloads, embeddings):
-                doc_dict = payload
-                doc_dict["document_id"] = doc_id
-                doc_dict["ingested_at"] = datetime.now().isoformat()
+        # Maps opinion_id -> cluster_data, consumed by _fetch_document()
+        self.cluster_cache: Union[Dict[str, Dict[str, Any]], DiscoveryCache] = (
+            self.discovery_cache if self.discovery_cache is not None else {}
+        )
+
+    def _get_collection_name(self) -> str:
+        """Get the Qdrant collection name for SCOTUS opinions."""
+        return "supreme_court_opinions"
+
+    _extract_opinion_ids = SCOTUSIngester._extract_opinion_ids
+    _discovery_cursor_key = SCOTUSIngester._discovery_cursor_key
+
+    async def _iter_document_ids(self) -> AsyncIterator[List[str]]:
+        """
+        Stream opinion IDs one clusters page at a time.
 
-                batch_documents.append(doc_dict)
-                batch_embeddings.append(embedding)
+        API errors end discovery after logging; IDs already yielded are kept.
+        With a discovery cache, a fresh listing of the date range is replayed
+        instead of calling the API, and a completed discovery is recorded.
 
-            # Mark as completed
-            processing_time_ms = (time.time() - start_time) * 1000
-            self.progress_tracker.mark_completed(doc_id, int(processing_time_ms))
+        Yields:
+            Lists of opinion IDs
+        """
+        logger.info("Fetching opinion IDs from CourtListener clusters API...")
+        logger.info(f"Date range: {self.start_date} to {self.end_date}")
 
-            return True
+        listing_key = self._discovery_cursor_key()
+        if self.discovery_cache is not None:
+            listing = self.discovery_cache.get_listing(listing_key)
+            if listing is not None:
+                logger.info(
+                    f"Using {len(listing)} cached opinion IDs, skipping discovery"
+                )
+                for i in range(0, len(listing), self.batch_size):
+                    yield listing[i : i + self.batch_size]
+                return
 
+        discovered: List[str] = []
+        clusters: List[Dict[str, Any]] = []
+        completed = False
+        try:
+            async for cluster in self.api_client.list_scotus_clusters(
+                self.start_date, self.end_date
+            ):
+                clusters.append(cluster)
+                if len(clusters) >= self.discovery_page_size:
+                    opinion_ids = self._extract_opinion_ids(clusters)
+                    discovered.extend(opinion_ids)
+                    yield opinion_ids
+                    clusters = []
+            completed = True
         except Exception as e:
-            logger.error(f"Error processing opinion {doc_id}: {e}")
-            self.progress_tracker.mark_failed(doc_id, str(e))
-            return False
+            logger.error(f"Error during cluster fetching: {e}")
+
+        if clusters:
+            opinion_ids = self._extract_opinion_ids(clusters)
+            discovered.extend(opinion_ids)
+            yield opinion_ids
+
+        if completed and self.discovery_cache is not None:
+            self.discovery_cache.put_listing(listing_key, discovered)
+
+    async def _fetch_document(self, doc_id: str) -> Document:
+        """
+        Fetch one opinion, using the cluster data cached during discovery.
+
+        Raises:
+            ValueError: If the opinion could not be fetched
+        """
+        cluster_data = self.cluster_cache.pop(doc_id, None)
+        if not cluster_data:
+            logger.warning(
+                f"No cached cluster data for opinion {doc_id}, "
+                f"will fetch from API (slower)"
+            )
+
+        document = await self.api_client.get_document(doc_id, cluster_data=cluster_data)
+        if not document:
+            raise ValueError(f"Could not fetch document for opinion {doc_id}")
+
+        case_name = document.title or f"Opinion ID: {doc_id}"
+        logger.info(f"Ingesting SCOTUS opinion: {case_name}")
+        return document
@@ -0,0 +1,212 @@
+"""
+Durable on-disk spool between embedding and the Qdrant upsert.
+
+Once a document's payloads and embeddings exist, the expensive work (LLM
+metadata extraction and embeddings) has been paid for. The spool writes them
+to local disk before anything is sent to Qdrant, so a failed or interrupted
+upsert never loses that work: the store step drains the spool with retries,
+and segments that could not be stored are drained again by the next run.
+A document is recorded as completed only after Qdrant acknowledged it.
+
+Each document is one segment of two files:
+    <name>.f32   embeddings as packed little-endian float32 values
+    <name>.json  document ID, vector dimension and the chunk payloads
+
+Both are written to a temporary name, fsynced and renamed into place, the
+JSON file last, so a segment is only visible once it is complete. Segments
+are read back oldest first.
+
+Python Learning Notes:
+    - array.array("f") stores C floats (float32) compactly; tobytes() and
+      frombytes() convert to and from raw bytes without any extra dependency
+    - os.replace() renames atomically, so readers never see a partial file
+"""
+
+import itertools
+import json
+import logging
+import os
+import sys
+import time
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Union
+
+from ..processors.build_payloads import DocumentFingerprint
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SpoolSegment:
+    """One spooled document: its chunk payloads and their embeddings."""
+
+    path: Path
+    document_id: str
+    payloads: List[Dict[str, Any]]
+    embeddings: List[List[float]]
+
+    @property
+    def fingerprint(self) -> Optional[Dict[str, str]]:
+        """Fingerprint fields stamped on the payloads, recorded on completion."""
+        if not self.payloads:
+            return None
+        fingerprint = DocumentFingerprint.from_metadata(
+            self.payloads[0].get("metadata")
+        )
+        return fingerprint.as_metadata() if fingerprint else None
+
+
+class PayloadSpool:
+    """
+    Directory of spooled documents awaiting upsert.
+
+    Several ingesters may share a spool directory. Upserts are idempotent
+    (point IDs are derived from chunk IDs), so a segment drained twice is
+    harmless, and remove() tolerates segments already removed by another
+    process.
+
+    Example:
+        spool = PayloadSpool("./data/progress/scotus_ingestion.spool")
+        spool.write("12345", payloads, embeddings)
+        for path in spool.segments():
+            segment = spool.read(path)
+            store(segment.payloads, segment.embeddings)
+            spool.remove(path)
+    """
+
+    _counter = itertools.count()
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Args:
+            directory: Spool directory (created on the first write)
+        """
+        self.directory = Path(directory)
+
+    def write(
+        self,
+        document_id: str,
+        payloads: List[Dict[str, Any]],
+        embeddings: List[List[float]],
+    ) -> Path:
+        """
+        Durably write one document's payloads and embeddings.
+
+        Args:
+            document_id: Document the chunks belong to
+            payloads: Chunk payloads
+            embeddings: One embedding per payload, all of the same dimension
+
+        Returns:
+            Path of the segment (pass it to read() and remove())
+
+        Raises:
+            ValueError: If payloads and embeddings do not pair up
+        """
+        if len(payloads) != len(embeddings):
+            raise ValueError(
+                f"Payloads ({len(payloads)}) and embeddings ({len(embeddings)}) "
+                f"must have the same length"
+            )
+        dimension = len(embeddings[0]) if embeddings else 0
+        if any(len(e) != dimension for e in embeddings):
+            raise ValueError(f"Embeddings of document {document_id} differ in size")
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Time-ordered, unique across processes and threads
+        name = f"{time.time_ns():020d}-{os.getpid()}-{next(self._counter):06d}"
+        vectors = array("f", (value for e in embeddings for value in e))
+        if sys.byteorder != "little":
+            vectors.byteswap()
+
+        self._write_atomic(self.directory / f"{name}.f32", vectors.tobytes())
+        header = {
+            "document_id": document_id,
+            "dimension": dimension,
+            "payloads": payloads,
+        }
+        path = self.directory / f"{name}.json"
+        self._write_atomic(path, json.dumps(header, default=str).encode("utf-8"))
+        return path
+
+    def segments(self) -> List[Path]:
+        """
+        List complete segments, oldest first.
+
+        Returns:
+            Segment paths
+        """
+        if not self.directory.is_dir():
+            return []
+        return sorted(self.directory.glob("*.json"))
+
+    def document_ids(self) -> Set[str]:
+        """
+        IDs of the documents with a complete segment in the spool.
+
+        Only the segment headers are read, not the embeddings.
+
+        Returns:
+            Document IDs
+        """
+        ids = set()
+        for path in self.segments():
+            try:
+                ids.add(json.loads(path.read_text(encoding="utf-8"))["document_id"])
+            except FileNotFoundError:
+                continue  # Drained in the meantime
+        return ids
+
+    def read(self, path: Path) -> SpoolSegment:
+        """
+        Load a segment.
+
+        Args:
+            path: Segment path from write() or segments()
+
+        Returns:
+            The spooled document
+
+        Raises:
+            FileNotFoundError: If the segment was removed in the meantime
+        """
+        header = json.loads(path.read_text(encoding="utf-8"))
+        vectors = array("f")
+        vectors.frombytes(path.with_suffix(".f32").read_bytes())
+        if sys.byteorder != "little":
+            vectors.byteswap()
+
+        dimension = header["dimension"]
+        embeddings = [
+            vectors[i : i + dimension].tolist()
+            for i in range(0, len(vectors), dimension or 1)
+        ]
+        return SpoolSegment(
+            path=path,
+            document_id=header["document_id"],
+            payloads=header["payloads"],
+            embeddings=embeddings,
+        )
+
+    def remove(self, path: Path) -> None:
+        """Delete a stored segment (JSON first, so it disappears atomically)."""
+        for file in (path, path.with_suffix(".f32")):
+            try:
+                file.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __len__(self) -> int:
+        return len(self.segments())
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        tmp = path.with_name(f".{path.name}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
@@ -39,10 +39,32 @@ Python Learning Notes:
     - This file makes the directory a Python package
 """
 
-from .build_payloads import build_payloads_from_document
+from .build_payloads import (
+    DocumentFingerprint,
+    PreparedDocument,
+    assemble_payloads,
+    build_payloads_from_document,
+    extract_document_metadata,
+    extract_document_metadata_async,
+    fingerprint_document,
+    prepare_document,
+    stored_document_metadata,
+)
 from .chunking import chunk_executive_order, chunk_supreme_court_opinion
-from .embeddings import EmbeddingGenerator, generate_embedding
-from .llm_extraction import generate_eo_llm_fields, generate_scotus_llm_fields
+from .embedding_cache import EmbeddingCache
+from .embeddings import (
+    AsyncEmbeddingGenerator,
+    EmbeddingAggregator,
+    EmbeddingGenerator,
+    generate_embedding,
+)
+from .llm_extraction import (
+    generate_eo_llm_fields,
+    generate_eo_llm_fields_async,
+    generate_scotus_llm_fields,
+    generate_scotus_llm_fields_async,
+    track_llm_usage,
+)
 from .schema import (
     ChunkMetadata,
     ExecutiveOrderMetadata,
@@ -53,6 +75,16 @@ from .schema import (
 __all__ = [
     # Main interface
     "build_payloads_from_document",
+    # Payload building stages
+    "PreparedDocument",
+    "prepare_document",
+    "extract_document_metadata",
+    "extract_document_metadata_async",
+    "assemble_payloads",
+    # Change detection
+    "DocumentFingerprint",
+    "fingerprint_document",
+    "stored_document_metadata",
     # Schemas
     "SupremeCourtMetadata",
     "ExecutiveOrderMetadata",
@@ -61,10 +93,16 @@ __all__ = [
     # LLM extraction
     "generate_scotus_llm_fields",
     "generate_eo_llm_fields",
+    "generate_scotus_llm_fields_async",
+    "generate_eo_llm_fields_async",
+    "track_llm_usage",
     # Chunking
     "chunk_supreme_court_opinion",
     "chunk_executive_order",
     # Embeddings
     "EmbeddingGenerator",
+    "AsyncEmbeddingGenerator",
+    "EmbeddingAggregator",
+    "EmbeddingCache",
     "generate_embedding",
 ]
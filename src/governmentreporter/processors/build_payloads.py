@@ -27,14 +27,31 @@ Python Learning Notes:
     - Defensive programming with validation
 """
 
+import hashlib
+import json
 import re
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from openai import AsyncOpenAI
 
 from ..apis.base import Document
 from ..utils import get_logger
-from .chunking import chunk_executive_order, chunk_supreme_court_opinion
-from .llm_extraction import generate_eo_llm_fields, generate_scotus_llm_fields
+from .chunking import (
+    CHUNKER_VERSION,
+    chunk_executive_order,
+    chunk_supreme_court_opinion,
+    get_chunking_config,
+)
+from .llm_extraction import (
+    LLM_MODEL,
+    PROMPT_VERSION,
+    generate_eo_llm_fields,
+    generate_eo_llm_fields_async,
+    generate_scotus_llm_fields,
+    generate_scotus_llm_fields_async,
+)
 from .schema import (
     ChunkMetadata,
     ExecutiveOrderMetadata,
@@ -283,6 +300,10 @@ def build_payloads_from_document(doc: Document) -> List[Dict[str, Any]]:
         6. Combine all metadata at chunk level
         7. Format as Qdrant payloads
 
+        Steps 1-4 are prepare_document(), step 5 is
+        extract_document_metadata() and steps 6-7 are assemble_payloads();
+        staged ingestion calls them separately.
+
     Args:
         doc (Document): Document object from a government API client
                        Must have non-empty content and valid type/source
@@ -339,6 +360,192 @@ def build_payloads_from_document(doc: Document) -> List[Dict[str, Any]]:
         - Dictionary merging with ** operator
         - Exception handling with logging
     """
+    prepared = prepare_document(doc)
+    if prepared is None:
+        return []
+
+    doc_metadata = extract_document_metadata(prepared)
+    return assemble_payloads(prepared, doc_metadata)
+
+
+@dataclass
+class PreparedDocument:
+    """
+    A document that has been typed, normalized and chunked.
+
+    This is the hand-off between the cheap, CPU-only steps of payload
+    building and the LLM metadata extraction, so an ingestion pipeline can
+    run them in separate stages with their own worker counts.
+
+    Attributes:
+        document (Document): The source document
+        doc_type (str): "scotus" or "eo"
+        doc_metadata (Dict[str, Any]): Normalized API metadata
+        chunks (List[Tuple[str, Dict[str, Any]]]): (chunk_text, chunk_meta) pairs
+        syllabus (Optional[str]): SCOTUS syllabus passed to the LLM, if found
+    """
+
+    document: Document
+    doc_type: str
+    doc_metadata: Dict[str, Any]
+    chunks: List[Tuple[str, Dict[str, Any]]]
+    syllabus: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class DocumentFingerprint:
+    """
+    Everything a document's stored chunks were derived from.
+
+    Recorded in the progress database and in every chunk payload when a
+    document is stored. Comparing it with the fingerprint of a freshly
+    fetched copy tells an ingester which processing steps can be skipped.
+
+    Attributes:
+        content_hash (str): SHA-256 of the normalized text and API metadata
+        chunker_version (str): Chunker version and chunking configuration
+        prompt_version (str): LLM extraction prompt version and model
+        embedding_model (str): Embedding model and vector dimension
+    """
+
+    content_hash: str
+    chunker_version: str
+    prompt_version: str
+    embedding_model: str
+
+    def as_metadata(self) -> Dict[str, str]:
+        """Fields stored in each chunk payload and in the progress database."""
+        return asdict(self)
+
+    @classmethod
+    def from_metadata(
+        cls, metadata: Optional[Dict[str, Any]]
+    ) -> Optional["DocumentFingerprint"]:
+        """Read a fingerprint back from as_metadata() fields, if all are present."""
+        if not metadata:
+            return None
+        try:
+            return cls(**{name: metadata[name] for name in cls.__dataclass_fields__})
+        except KeyError:
+            return None
+
+    def stages_to_redo(self, previous: Optional["DocumentFingerprint"]) -> Set[str]:
+        """
+        Processing stages whose inputs changed since previous was stored.
+
+        Args:
+            previous (Optional[DocumentFingerprint]): Fingerprint of the stored
+                chunks, or None if the document was never stored
+
+        Returns:
+            Set[str]: Empty when nothing changed; {"chunk", "extract", "embed"}
+                when the text or chunker changed (every chunk may differ);
+                otherwise "extract" and/or "embed"
+        """
+        if (
+            previous is None
+            or previous.content_hash != self.content_hash
+            or previous.chunker_version != self.chunker_version
+        ):
+            return {"chunk", "extract", "embed"}
+
+        stages = set()
+        if previous.prompt_version != self.prompt_version:
+            stages.add("extract")
+        if previous.embedding_model != self.embedding_model:
+            stages.add("embed")
+        return stages
+
+
+def fingerprint_document(
+    prepared: PreparedDocument, embedding_model: str
+) -> DocumentFingerprint:
+    """
+    Compute the fingerprint of a prepared document.
+
+    Runs of whitespace are collapsed to single spaces before hashing, so
+    reformatting by the source API does not count as a change. The "year"
+    field is left out of the hashed metadata: it is derived from the date
+    (already hashed as publication_date) and falls back to the current year
+    when the date does not parse, which would change the hash every January.
+
+    Args:
+        prepared (PreparedDocument): Output of prepare_document()
+        embedding_model (str): Embedding model and dimension, e.g.
+                               "text-embedding-3-small:1536"
+
+    Returns:
+        DocumentFingerprint: The document's fingerprint
+    """
+    hashed_metadata = {k: v for k, v in prepared.doc_metadata.items() if k != "year"}
+    content = hashlib.sha256()
+    content.update(" ".join(prepared.document.content.split()).encode("utf-8"))
+    content.update(
+        json.dumps(hashed_metadata, sort_keys=True, default=str).encode("utf-8")
+    )
+
+    cfg = get_chunking_config(prepared.doc_type)
+    return DocumentFingerprint(
+        content_hash=content.hexdigest(),
+        chunker_version=(
+            f"{CHUNKER_VERSION}:{cfg.min_tokens}-{cfg.target_tokens}-"
+            f"{cfg.max_tokens}-{cfg.overlap_ratio}"
+        ),
+        prompt_version=f"{PROMPT_VERSION}:{LLM_MODEL}",
+        embedding_model=embedding_model,
+    )
+
+
+# Fallback LLM fields used when extraction fails, by document type
+_LLM_FALLBACK_FIELDS = {
+    "scotus": {
+        "document_summary": "Unable to generate summary.",
+        "constitution_cited": [],
+        "federal_statutes_cited": [],
+        "federal_regulations_cited": [],
+        "cases_cited": [],
+        "topics_or_policy_areas": [
+            "supreme court",
+            "legal opinion",
+            "court decision",
+        ],
+        "holding_plain": "Unable to extract holding.",
+        "outcome_simple": "Unable to extract outcome.",
+        "issue_plain": "Unable to extract issue.",
+        "reasoning": "Unable to extract reasoning.",
+    },
+    "eo": {
+        "document_summary": "Unable to generate summary.",
+        "agencies_impacted": [],
+        "constitution_cited": [],
+        "federal_statutes_cited": [],
+        "federal_regulations_cited": [],
+        "cases_cited": [],
+        "topics_or_policy_areas": [
+            "executive order",
+            "federal policy",
+            "presidential action",
+        ],
+    },
+}
+
+
+def prepare_document(doc: Document) -> Optional[PreparedDocument]:
+    """
+    Validate, type, normalize and chunk a document (no LLM calls).
+
+    First stage of build_payloads_from_document().
+
+    Args:
+        doc (Document): Document object from a government API client
+
+    Returns:
+        Optional[PreparedDocument]: The chunked document, or None when the
+                                   type is unknown or no chunks were produced
+
+    Raises:
+        ValueError: If document is invalid (None or empty content)
+    """
     # Validate input
     if not doc:
         raise ValueError("Document cannot be None")
@@ -366,172 +573,175 @@ def build_payloads_from_document(doc: Document) -> List[Dict[str, Any]]:
         logger.warning(
             "Unknown document type: %s from %s - skipping", doc.type, doc.source
         )
-        return []
+        return None
 
     logger.info("Processing document %s (%s)", doc.id, doc.type)
 
     try:
         if is_scotus:
-            # Process Supreme Court Opinion
-
-            # 1. Extract document-level metadata
+            # Extract document-level metadata, then chunk the opinion
+            # (with section detection)
             doc_metadata = normalize_scotus_metadata(doc)
-
-            # 2. Chunk the opinion (with section detection)
             chunks, syllabus = chunk_supreme_court_opinion(doc.content)
-
-            if not chunks:
-                logger.warning("No chunks generated for document %s", doc.id)
-                return []
-
-            # 3. Generate LLM metadata fields (optional - non-blocking)
-            llm_extraction_successful = True
-            try:
-                llm_fields = generate_scotus_llm_fields(doc.content, syllabus)
-            except Exception as e:
-                logger.warning(
-                    "Failed to generate LLM fields for %s: %s", doc.id, str(e)
-                )
-                llm_extraction_successful = False
-
-                # Use standardized fallback messages
-                llm_fields = {
-                    "document_summary": "Unable to generate summary.",
-                    "constitution_cited": [],
-                    "federal_statutes_cited": [],
-                    "federal_regulations_cited": [],
-                    "cases_cited": [],
-                    "topics_or_policy_areas": [
-                        "supreme court",
-                        "legal opinion",
-                        "court decision",
-                    ],
-                    "holding_plain": "Unable to extract holding.",
-                    "outcome_simple": "Unable to extract outcome.",
-                    "issue_plain": "Unable to extract issue.",
-                    "reasoning": "Unable to extract reasoning.",
-                }
-
-            # 4. Merge document and LLM metadata
-            full_doc_metadata = {**doc_metadata, **llm_fields}
-
-            # Add failure tracking if LLM extraction failed
-            if not llm_extraction_successful:
-                full_doc_metadata["llm_extraction_failed"] = True
-                full_doc_metadata["requires_reprocessing"] = True
-
-            # 5. Create payload for each chunk
-            payloads = []
-            for chunk_index, (chunk_text, chunk_meta) in enumerate(chunks):
-                # Generate unique chunk ID
-                chunk_id = f"{doc.id}_chunk_{chunk_index}"
-
-                # Create chunk metadata
-                chunk_metadata = ChunkMetadata(
-                    chunk_id=chunk_id,
-                    chunk_index=chunk_index,
-                    section_label=chunk_meta.get("section_label", "Unknown"),
-                )
-
-                # Combine all metadata
-                combined_metadata = {**full_doc_metadata, **chunk_metadata.model_dump()}
-
-                # Create Qdrant Document-compatible payload
-                # Note: embedding will be added by the caller after generation
-                payload = {
-                    "id": chunk_id,
-                    "text": chunk_text,
-                    "embedding": [],  # Placeholder - will be filled by caller
-                    "metadata": combined_metadata,
-                }
-
-                payloads.append(payload)
-
-            logger.info(
-                "Generated %d payloads for SCOTUS opinion %s", len(payloads), doc.id
-            )
-            return payloads
-
+            prepared = PreparedDocument(doc, "scotus", doc_metadata, chunks, syllabus)
         else:  # Executive Order
-            # 1. Extract document-level metadata
             doc_metadata = normalize_eo_metadata(doc)
-
-            # 2. Chunk the executive order
             chunks = chunk_executive_order(doc.content)
-
-            if not chunks:
-                logger.warning("No chunks generated for document %s", doc.id)
-                return []
-
-            # 3. Generate LLM metadata fields (optional - non-blocking)
-            llm_extraction_successful = True
-            try:
-                llm_fields = generate_eo_llm_fields(doc.content)
-            except Exception as e:
-                logger.warning(
-                    "Failed to generate LLM fields for %s: %s", doc.id, str(e)
-                )
-                llm_extraction_successful = False
-
-                # Use standardized fallback messages
-                llm_fields = {
-                    "document_summary": "Unable to generate summary.",
-                    "agencies_impacted": [],
-                    "constitution_cited": [],
-                    "federal_statutes_cited": [],
-                    "federal_regulations_cited": [],
-                    "cases_cited": [],
-                    "topics_or_policy_areas": [
-                        "executive order",
-                        "federal policy",
-                        "presidential action",
-                    ],
-                }
-
-            # 4. Merge document and LLM metadata
-            full_doc_metadata = {**doc_metadata, **llm_fields}
-
-            # Add failure tracking if LLM extraction failed
-            if not llm_extraction_successful:
-                full_doc_metadata["llm_extraction_failed"] = True
-                full_doc_metadata["requires_reprocessing"] = True
-
-            # 5. Create payload for each chunk
-            payloads = []
-            for chunk_index, (chunk_text, chunk_meta) in enumerate(chunks):
-                # Generate unique chunk ID
-                chunk_id = f"{doc.id}_chunk_{chunk_index}"
-
-                # Create chunk metadata
-                chunk_metadata = ChunkMetadata(
-                    chunk_id=chunk_id,
-                    chunk_index=chunk_index,
-                    section_label=chunk_meta.get("section_label", "Unknown"),
-                )
-
-                # Combine all metadata
-                combined_metadata = {**full_doc_metadata, **chunk_metadata.model_dump()}
-
-                # Create Qdrant Document-compatible payload
-                # Note: embedding will be added by the caller after generation
-                payload = {
-                    "id": chunk_id,
-                    "text": chunk_text,
-                    "embedding": [],  # Placeholder - will be filled by caller
-                    "metadata": combined_metadata,
-                }
-
-                payloads.append(payload)
-
-            logger.info(
-                "Generated %d payloads for Executive Order %s", len(payloads), doc.id
-            )
-            return payloads
-
+            prepared = PreparedDocument(doc, "eo", doc_metadata, chunks)
     except Exception as e:
         logger.error("Failed to build payloads for document %s: %s", doc.id, str(e))
         raise
 
+    if not prepared.chunks:
+        logger.warning("No chunks generated for document %s", doc.id)
+        return None
+
+    return prepared
+
+
+def extract_document_metadata(prepared: PreparedDocument) -> Dict[str, Any]:
+    """
+    Generate the LLM fields for a prepared document and merge them in.
+
+    Second stage of build_payloads_from_document(). LLM extraction is
+    optional (non-blocking): on failure standardized fallback fields are
+    used and the document is flagged with requires_reprocessing.
+
+    Args:
+        prepared (PreparedDocument): Output of prepare_document()
+
+    Returns:
+        Dict[str, Any]: Document-level metadata shared by every chunk
+    """
+    doc = prepared.document
+    try:
+        if prepared.doc_type == "scotus":
+            llm_fields = generate_scotus_llm_fields(doc.content, prepared.syllabus)
+        else:
+            llm_fields = generate_eo_llm_fields(doc.content)
+    except Exception as e:
+        logger.warning("Failed to generate LLM fields for %s: %s", doc.id, str(e))
+        llm_fields = None
+
+    return _merge_llm_fields(prepared, llm_fields)
+
+
+async def extract_document_metadata_async(
+    prepared: PreparedDocument, client: Optional[AsyncOpenAI] = None
+) -> Dict[str, Any]:
+    """
+    Asyncio version of extract_document_metadata().
+
+    Args:
+        prepared (PreparedDocument): Output of prepare_document()
+        client (Optional[AsyncOpenAI]): Shared async OpenAI client
+
+    Returns:
+        Dict[str, Any]: Document-level metadata shared by every chunk
+    """
+    doc = prepared.document
+    try:
+        if prepared.doc_type == "scotus":
+            llm_fields = await generate_scotus_llm_fields_async(
+                doc.content, prepared.syllabus, client=client
+            )
+        else:
+            llm_fields = await generate_eo_llm_fields_async(doc.content, client=client)
+    except Exception as e:
+        logger.warning("Failed to generate LLM fields for %s: %s", doc.id, str(e))
+        llm_fields = None
+
+    return _merge_llm_fields(prepared, llm_fields)
+
+
+def _merge_llm_fields(
+    prepared: PreparedDocument, llm_fields: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Combine API and LLM metadata; llm_fields=None means extraction failed."""
+    llm_extraction_successful = llm_fields is not None
+    if not llm_extraction_successful:
+        # Use standardized fallback messages
+        llm_fields = dict(_LLM_FALLBACK_FIELDS[prepared.doc_type])
+
+    # Merge document and LLM metadata
+    full_doc_metadata = {**prepared.doc_metadata, **llm_fields}
+
+    # Add failure tracking if LLM extraction failed
+    if not llm_extraction_successful:
+        full_doc_metadata["llm_extraction_failed"] = True
+        full_doc_metadata["requires_reprocessing"] = True
+
+    return full_doc_metadata
+
+
+def assemble_payloads(
+    prepared: PreparedDocument, doc_metadata: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    Create one Qdrant payload per chunk.
+
+    Final stage of build_payloads_from_document().
+
+    Args:
+        prepared (PreparedDocument): Output of prepare_document()
+        doc_metadata (Dict[str, Any]): Output of extract_document_metadata()
+
+    Returns:
+        List[Dict[str, Any]]: Payloads with id, text, empty embedding and
+                             combined document + chunk metadata
+    """
+    doc = prepared.document
+    payloads = []
+    for chunk_index, (chunk_text, chunk_meta) in enumerate(prepared.chunks):
+        # Generate unique chunk ID
+        chunk_id = f"{doc.id}_chunk_{chunk_index}"
+
+        # Create chunk metadata
+        chunk_metadata = ChunkMetadata(
+            chunk_id=chunk_id,
+            chunk_index=chunk_index,
+            section_label=chunk_meta.get("section_label", "Unknown"),
+        )
+
+        # Combine all metadata
+        combined_metadata = {**doc_metadata, **chunk_metadata.model_dump()}
+
+        # Create Qdrant Document-compatible payload
+        # Note: embedding will be added by the caller after generation
+        payloads.append(
+            {
+                "id": chunk_id,
+                "text": chunk_text,
+                "embedding": [],  # Placeholder - will be filled by caller
+                "metadata": combined_metadata,
+            }
+        )
+
+    label = "SCOTUS opinion" if prepared.doc_type == "scotus" else "Executive Order"
+    logger.info("Generated %d payloads for %s %s", len(payloads), label, doc.id)
+    return payloads
+
+
+def stored_document_metadata(stored: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Recover document-level metadata from a chunk payload stored in Qdrant.
+
+    The result can be passed to assemble_payloads() to rebuild a document's
+    payloads without repeating LLM extraction; chunk-level fields are
+    replaced there.
+
+    Args:
+        stored (Dict[str, Any]): Stored point payload of one of the chunks
+
+    Returns:
+        Dict[str, Any]: The payload without its text and point bookkeeping
+    """
+    return {
+        key: value
+        for key, value in stored.items()
+        if key not in ("text", "original_id")
+    }
+
 
 def validate_payload(payload: Dict[str, Any]) -> bool:
     """
@@ -32,6 +32,7 @@ import tiktoken
 
 # Import shared utilities from base
 from .base import (
+    CHUNKER_VERSION,
     EO_CFG,
     SCOTUS_CFG,
     ChunkingConfig,
@@ -52,6 +53,7 @@ __all__ = [
     "ChunkingConfig",
     "SCOTUS_CFG",
     "EO_CFG",
+    "CHUNKER_VERSION",
     "_load_config",
     "get_chunking_config",
     # Utilities
@@ -84,6 +84,10 @@ def _load_config(prefix: str, defaults: Dict[str, Any]) -> ChunkingConfig:
     )
 
 
+# Version of the chunking algorithms; bump it whenever a change to them alters
+# the chunks produced for the same text, so ingestion re-chunks stored documents
+CHUNKER_VERSION = "1"
+
 # Module-level configurations
 SCOTUS_CFG = _load_config(
     "RAG_SCOTUS",
@@ -0,0 +1,315 @@
+"""
+Persistent on-disk cache of text embeddings.
+
+Re-ingesting documents, re-chunking experiments and the boilerplate repeated
+across executive orders all ask the embeddings API for vectors it has already
+computed. This module keeps those vectors on disk, so EmbeddingGenerator
+only sends texts it has never embedded with the same model.
+
+Cache Policy:
+    - Entries are keyed by (model, dimension, SHA-256 of the text), so a new
+      embedding model or dimension never serves stale vectors
+    - Vectors are stored as packed float32, 4 bytes per dimension (6 KB for
+      text-embedding-3-small)
+    - Total vector size is bounded with least-recently-used eviction
+    - Zero vectors (EmbeddingGenerator's fallback after a failed request)
+      are never stored
+
+Python Learning Notes:
+    - array("f") packs floats as C float (32-bit) values; tobytes() and
+      frombytes() convert to and from a BLOB without any third-party library
+    - float32 keeps about 7 significant digits, more than embedding
+      similarity needs, in half the space of Python's 64-bit floats
+    - sqlite3: Standard-library embedded database, safe to share between
+      threads when access is serialized with a lock
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Default upper bound for stored vector bytes (about 170,000 vectors of 1536
+# dimensions)
+DEFAULT_MAX_SIZE_BYTES = 1024**3
+
+# Eviction trims the cache to this fraction of max_size_bytes so that it does
+# not run on every single store once the cache is full
+EVICTION_TARGET_RATIO = 0.9
+
+# Text hashes per IN (...) clause, below SQLite's bound-parameter limit
+_SQL_CHUNK = 500
+
+
+def text_hash(text: str) -> str:
+    """SHA-256 hex digest of a text, the text's part of the cache key."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed, size-bounded store of embedding vectors.
+
+    Storage layout (one database file in cache_dir):
+        - embeddings: (model, dimension, text_hash) -> float32 vector BLOB,
+          stored_at, accessed_at
+
+    Example:
+        cache = EmbeddingCache("./data/cache/embeddings")
+        generator = EmbeddingGenerator(cache=cache)
+        embeddings = generator.generate_batch_embeddings(chunk_texts)
+        print(cache.stats())  # {"hits": ..., "misses": ..., ...}
+
+    Python Learning Notes:
+        - check_same_thread=False plus a threading.Lock lets one connection
+          serve every ingestion worker thread
+    """
+
+    DB_FILENAME = "embedding_cache.db"
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+    ):
+        """
+        Open (or create) a cache directory.
+
+        Args:
+            cache_dir (Union[str, Path]): Directory holding the cache database.
+            max_size_bytes (int): Upper bound on stored vector bytes.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.db_path = self.cache_dir / self.DB_FILENAME
+        self.max_size_bytes = max_size_bytes
+
+        self._lock = threading.Lock()
+        # Opened on first use so constructing a cache touches no files
+        self._connection: Optional[sqlite3.Connection] = None
+        # Stored vector bytes, read from the database when it is opened
+        self._size = 0
+
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Database connection, created (with its directory) on first use."""
+        if self._connection is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                str(self.db_path), check_same_thread=False, isolation_level=None
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._init_schema(self._connection)
+            self._size = self._total_size_locked()
+        return self._connection
+
+    @staticmethod
+    def _init_schema(conn: sqlite3.Connection) -> None:
+        """Create the cache table if it does not exist."""
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                dimension INTEGER NOT NULL,
+                text_hash TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (model, dimension, text_hash)
+            );
+            CREATE INDEX IF NOT EXISTS idx_embeddings_accessed
+                ON embeddings(accessed_at);
+            """
+        )
+
+    def get_many(
+        self, model: str, dimension: int, texts: Sequence[str]
+    ) -> List[Optional[List[float]]]:
+        """
+        Look up the vectors of many texts and mark the found ones as used.
+
+        Args:
+            model (str): Embedding model name.
+            dimension (int): Vector dimension.
+            texts (Sequence[str]): Texts to look up.
+
+        Returns:
+            List[Optional[List[float]]]: Each text's vector, or None on a miss.
+        """
+        hashes = [text_hash(text) for text in texts]
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            unique = list(dict.fromkeys(hashes))
+            for i in range(0, len(unique), _SQL_CHUNK):
+                chunk = unique[i : i + _SQL_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"""
+                    SELECT text_hash, vector FROM embeddings
+                    WHERE model = ? AND dimension = ?
+                      AND text_hash IN ({placeholders})
+                    """,
+                    (model, dimension, *chunk),
+                ).fetchall()
+                for key, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[key] = vector.tolist()
+
+            if found:
+                self._write_locked(
+                    """
+                    UPDATE embeddings SET accessed_at = ?
+                    WHERE model = ? AND dimension = ? AND text_hash = ?
+                    """,
+                    [(time.time(), model, dimension, key) for key in found],
+                )
+            hits = sum(1 for key in hashes if key in found)
+            self._counters["hits"] += hits
+            self._counters["misses"] += len(hashes) - hits
+
+        return [found.get(key) for key in hashes]
+
+    def put_many(
+        self,
+        model: str,
+        dimension: int,
+        texts: Sequence[str],
+        vectors: Sequence[List[float]],
+    ) -> None:
+        """
+        Store the vectors of many texts, replacing existing entries.
+
+        Zero vectors are skipped: they stand in for failed requests.
+
+        Args:
+            model (str): Embedding model name.
+            dimension (int): Vector dimension.
+            texts (Sequence[str]): Embedded texts.
+            vectors (Sequence[List[float]]): Their vectors, in the same order.
+        """
+        now = time.time()
+        rows: Dict[str, Tuple] = {}
+        for text, vector in zip(texts, vectors):
+            if any(vector):
+                key = text_hash(text)
+                rows[key] = (model, dimension, key, array("f", vector).tobytes())
+        if not rows:
+            return
+
+        with self._lock:
+            # Replacing an entry frees its old vector
+            self._size -= self._stored_size_locked(model, dimension, list(rows))
+            self._write_locked(
+                """
+                INSERT OR REPLACE INTO embeddings
+                    (model, dimension, text_hash, vector, stored_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [(*row, now, now) for row in rows.values()],
+            )
+            self._size += sum(len(row[3]) for row in rows.values())
+            self._counters["stores"] += len(rows)
+            if self._size > self.max_size_bytes:
+                self._evict_locked()
+
+    def _write_locked(self, sql: str, rows: List[Tuple]) -> None:
+        """Run one statement for many rows in a single transaction."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(sql, rows)
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def _stored_size_locked(self, model: str, dimension: int, hashes: List[str]) -> int:
+        """Bytes currently stored for the given text hashes."""
+        size = 0
+        for i in range(0, len(hashes), _SQL_CHUNK):
+            chunk = hashes[i : i + _SQL_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            row = self._conn.execute(
+                f"""
+                SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings
+                WHERE model = ? AND dimension = ? AND text_hash IN ({placeholders})
+                """,
+                (model, dimension, *chunk),
+            ).fetchone()
+            size += int(row[0])
+        return size
+
+    def _total_size_locked(self) -> int:
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+        ).fetchone()
+        return int(row[0])
+
+    def _evict_locked(self) -> None:
+        """Drop least recently used vectors until under the size limit."""
+        # Other processes may share the file, so evict from the real total
+        total = self._total_size_locked()
+        if total <= self.max_size_bytes:
+            self._size = total
+            return
+
+        target = int(self.max_size_bytes * EVICTION_TARGET_RATIO)
+        cursor = self._conn.execute(
+            """
+            SELECT rowid, LENGTH(vector) FROM embeddings
+            ORDER BY accessed_at ASC
+            """
+        )
+        victims = []
+        for rowid, size in cursor:
+            if total <= target:
+                break
+            victims.append((rowid,))
+            total -= size
+
+        self._write_locked("DELETE FROM embeddings WHERE rowid = ?", victims)
+        self._size = total
+        self._counters["evictions"] += len(victims)
+        logger.debug(f"Embedding cache evicted {len(victims)} vectors")
+
+    def total_size(self) -> int:
+        """Return the total size of stored vectors in bytes."""
+        with self._lock:
+            return self._total_size_locked()
+
+    def clear(self) -> None:
+        """Remove every cached vector."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return cache counters and size.
+
+        Returns:
+            Dict[str, int]: hits, misses, stores, evictions, entries and
+                            size_bytes.
+        """
+        with self._lock:
+            (entries,) = self._conn.execute(
+                "SELECT COUNT(*) FROM embeddings"
+            ).fetchone()
+            size = self._total_size_locked()
+            counters = dict(self._counters)
+        return {**counters, "entries": entries, "size_bytes": size}
+
+    def close(self) -> None:
+        """Close the underlying database connection (reopened if used again)."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -11,6 +11,15 @@ The module focuses on:
     - Batch processing for large document sets
     - Retry logic and error handling for API resilience
     - Support for the text-embedding-3-small model (1536 dimensions)
+    - An asyncio generator (AsyncEmbeddingGenerator) for concurrent requests
+    - Packing texts into few, full requests within the API's per-request
+      input and token limits, including chunks of many documents at once
+      (EmbeddingAggregator)
+    - Splitting texts longer than the model's input limit and combining
+      the pieces' embeddings
+    - Pacing requests by the rate-limit headers OpenAI returns
+    - An optional persistent EmbeddingCache, so texts embedded before are
+      never sent again
 
 Python Learning Notes:
     - Vector embeddings are numerical representations of text meaning
@@ -20,16 +29,155 @@ Python Learning Notes:
     - Type hints clarify expected inputs and outputs
 """
 
+import asyncio
 import logging
+import math
 import time
-from typing import List, Optional
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
+from ..utils.concurrency import RateBudget, openai_budget, openai_rate_limits
 from ..utils.config import get_openai_api_key
+from .chunking import count_tokens
+from .embedding_cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
+# Per-request limits of the OpenAI embeddings endpoint
+MAX_INPUTS_PER_REQUEST = 2048
+MAX_TOKENS_PER_REQUEST = 300_000
+
+# Longest single input text-embedding-3-small accepts, in tokens
+MAX_TOKENS_PER_INPUT = 8191
+
+
+def pack_requests(
+    token_counts: List[int],
+    max_inputs: int = MAX_INPUTS_PER_REQUEST,
+    max_tokens: int = MAX_TOKENS_PER_REQUEST,
+) -> List[Tuple[int, int]]:
+    """
+    Group consecutive inputs into as few embedding requests as possible.
+
+    Inputs are packed greedily in order: a request is closed when adding
+    the next input would exceed max_inputs inputs or max_tokens tokens.
+    An input larger than max_tokens on its own still gets a request (the
+    API reports the error for that request alone).
+
+    Args:
+        token_counts (List[int]): Token count of each input, in order
+        max_inputs (int): Maximum inputs per request
+        max_tokens (int): Maximum total tokens per request
+
+    Returns:
+        List[Tuple[int, int]]: (start, end) slice bounds of each request
+
+    Example:
+        pack_requests([300, 300, 300], max_tokens=600)
+        # [(0, 2), (2, 3)]
+
+    Python Learning Notes:
+        - Returning slice bounds rather than sub-lists lets callers slice
+          any parallel list (texts, owners) the same way
+    """
+    requests = []
+    start = 0
+    tokens = 0
+    for i, count in enumerate(token_counts):
+        if i > start and (i - start >= max_inputs or tokens + count > max_tokens):
+            requests.append((start, i))
+            start, tokens = i, 0
+        tokens += count
+    if start < len(token_counts):
+        requests.append((start, len(token_counts)))
+    return requests
+
+
+def split_oversized(
+    text: str,
+    token_counter: Callable[[str], int] = count_tokens,
+    max_tokens: int = MAX_TOKENS_PER_INPUT,
+) -> List[Tuple[str, int]]:
+    """
+    Split a text into pieces the embedding model accepts.
+
+    A text within max_tokens is returned whole. A longer one is halved at
+    the whitespace nearest its middle (or exactly at the middle if it has
+    none), and each half is split again until every piece fits.
+
+    Args:
+        text (str): Text to split
+        token_counter (Callable[[str], int]): Counts the tokens of a text
+        max_tokens (int): Maximum tokens per piece
+
+    Returns:
+        List[Tuple[str, int]]: (piece, token count) pairs, in text order
+
+    Example:
+        split_oversized("aaaa bbbb", token_counter=len, max_tokens=5)
+        # [("aaaa", 4), (" bbbb", 5)]
+    """
+    tokens = token_counter(text)
+    if tokens <= max_tokens or len(text) < 2:
+        return [(text, tokens)]
+
+    middle = len(text) // 2
+    before, after = text.rfind(" ", 1, middle + 1), text.find(" ", middle)
+    candidates = [i for i in (before, after) if 0 < i < len(text)]
+    cut = min(candidates, key=lambda i: abs(i - middle)) if candidates else middle
+    return split_oversized(text[:cut], token_counter, max_tokens) + split_oversized(
+        text[cut:], token_counter, max_tokens
+    )
+
+
+def combine_embeddings(
+    embeddings: List[List[float]], weights: List[int]
+) -> List[float]:
+    """
+    Combine the embeddings of a text's pieces into one for the whole text.
+
+    The result is the weighted average of the pieces, scaled back to unit
+    length like the model's own embeddings. If any piece failed (a zero
+    vector), the combination is a zero vector too, so that a partial
+    embedding is never mistaken for a complete one.
+
+    Args:
+        embeddings (List[List[float]]): Embedding of each piece
+        weights (List[int]): Weight of each piece (its token count)
+
+    Returns:
+        List[float]: Embedding of the whole text
+
+    Python Learning Notes:
+        - zip(*embeddings) walks the vectors one dimension at a time
+    """
+    if len(embeddings) == 1:
+        return embeddings[0]
+    if not all(any(embedding) for embedding in embeddings):
+        return [0.0] * len(embeddings[0])
+
+    combined = [
+        sum(weight * value for weight, value in zip(weights, column))
+        for column in zip(*embeddings)
+    ]
+    norm = math.sqrt(sum(value * value for value in combined)) or 1.0
+    return [value / norm for value in combined]
+
+
+def _rejoin_pieces(
+    pieces: List[List[Tuple[str, int]]], embeddings: List[List[float]]
+) -> List[List[float]]:
+    """Combine the flat list of piece embeddings back into one per text."""
+    combined = []
+    start = 0
+    for text_pieces in pieces:
+        end = start + len(text_pieces)
+        counts = [count for _, count in text_pieces]
+        combined.append(combine_embeddings(embeddings[start:end], counts))
+        start = end
+    return combined
+
 
 class EmbeddingGenerator:
     """
@@ -49,6 +197,8 @@ class EmbeddingGenerator:
         client (OpenAI): OpenAI client instance for API calls
         model (str): The embedding model to use (text-embedding-3-small)
         dimension (int): Vector dimension size (1536 for text-embedding-3-small)
+        cache (Optional[EmbeddingCache]): Vectors of texts embedded before,
+            consulted before any request is sent
 
     Example:
         # Initialize the generator
@@ -71,7 +221,9 @@ class EmbeddingGenerator:
         - Logging helps debug issues in production
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self, api_key: Optional[str] = None, cache: Optional[EmbeddingCache] = None
+    ):
         """
         Initialize the embedding generator with OpenAI API.
 
@@ -83,6 +235,8 @@ class EmbeddingGenerator:
             api_key (Optional[str]): OpenAI API key for authentication.
                 If not provided, will attempt to load from environment
                 variable OPENAI_API_KEY via get_openai_api_key().
+            cache (Optional[EmbeddingCache]): Persistent cache of vectors;
+                only texts it does not hold are sent to the API.
 
         Raises:
             ValueError: If no API key is provided and none found in environment
@@ -96,6 +250,7 @@ class EmbeddingGenerator:
         self.client = OpenAI(api_key=self.api_key)
         self.model = "text-embedding-3-small"
         self.dimension = 1536  # Dimension for text-embedding-3-small
+        self.cache = cache
 
     def generate_embedding(self, text: str) -> List[float]:
         """
@@ -137,12 +292,23 @@ class EmbeddingGenerator:
             - Exponential backoff (delay *= 2) reduces API load
             - f-strings (f"...") format strings with variables
         """
+        embeddings = self._embed_cached(
+            [text], lambda misses: [self._embed_one(misses[0])]
+        )
+        return embeddings[0]
+
+    def _embed_one(self, text: str) -> List[float]:
+        """Request one text's embedding, retrying with exponential backoff."""
         max_retries = 3
         retry_delay = 1.0
 
         for attempt in range(max_retries):
             try:
-                response = self.client.embeddings.create(input=text, model=self.model)
+                openai_rate_limits.wait()
+                with openai_budget:
+                    response = self.client.embeddings.create(
+                        input=text, model=self.model
+                    )
                 return response.data[0].embedding
 
             except Exception as e:
@@ -156,7 +322,7 @@ class EmbeddingGenerator:
                     raise
 
     def generate_batch_embeddings(
-        self, texts: List[str], batch_size: int = 20
+        self, texts: List[str], batch_size: Optional[int] = None
     ) -> List[List[float]]:
         """
         Generate embeddings for multiple text chunks in batches.
@@ -164,16 +330,19 @@ class EmbeddingGenerator:
         OpenAI's API supports batch embedding generation which is more efficient
         than individual requests. This method processes multiple texts in a single
         API call when possible, significantly reducing latency and API usage.
+        Batches are sized by token count (see generate_packed_embeddings()),
+        so each request is filled close to the API's per-request limits.
 
         If a batch fails, the method falls back to individual generation for that
         batch to ensure all texts get processed, even if some cause errors.
 
         Args:
             texts (List[str]): List of text chunks to generate embeddings for.
-                Each text should be within the model's token limit.
-            batch_size (int): Number of texts to process in each API call.
-                Default is 20, which balances efficiency with API limits.
-                Maximum supported by API is typically 2048.
+                Texts over the model's token limit are split, and their
+                pieces' embeddings combined.
+            batch_size (Optional[int]): Maximum number of texts per API call.
+                By default only the API's own limits (2048 texts and 300,000
+                tokens per request) apply.
 
         Returns:
             List[List[float]]: List of embedding vectors, one for each input text.
@@ -202,28 +371,114 @@ class EmbeddingGenerator:
             - extend() adds all elements from another list
             - Fallback logic ensures robustness when APIs fail
         """
-        embeddings = []
+        return self.generate_packed_embeddings(
+            texts, max_inputs=batch_size or MAX_INPUTS_PER_REQUEST
+        )
+
+    def generate_packed_embeddings(
+        self,
+        texts: List[str],
+        token_counter: Callable[[str], int] = count_tokens,
+        max_inputs: int = MAX_INPUTS_PER_REQUEST,
+        max_tokens: int = MAX_TOKENS_PER_REQUEST,
+    ) -> List[List[float]]:
+        """
+        Generate embeddings in as few requests as the API limits allow.
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
+        Each request is filled up to max_inputs texts and max_tokens tokens
+        (see pack_requests()). A text over the model's input limit is split
+        into pieces (see split_oversized()) whose embeddings are combined
+        (see combine_embeddings()). Failed requests fall back to one request
+        per text, and requests are paced by the rate-limit headers of
+        earlier responses.
 
-            try:
-                response = self.client.embeddings.create(input=batch, model=self.model)
+        Args:
+            texts (List[str]): Text chunks to embed
+            token_counter (Callable[[str], int]): Counts the tokens of a text
+            max_inputs (int): Maximum texts per request
+            max_tokens (int): Maximum total tokens per request
 
-                # Extract embeddings in order
-                batch_embeddings = [item.embedding for item in response.data]
-                embeddings.extend(batch_embeddings)
+        Returns:
+            List[List[float]]: One embedding per input text, in input order
+
+        Example:
+            generator = EmbeddingGenerator()
+            # Chunks of a whole ingestion batch, typically one or two requests
+            embeddings = generator.generate_packed_embeddings(chunk_texts)
+        """
+
+        def embed(misses: List[str]) -> List[List[float]]:
+            pieces = [split_oversized(text, token_counter) for text in misses]
+            flat = [piece for text_pieces in pieces for piece, _ in text_pieces]
+            counts = [count for text_pieces in pieces for _, count in text_pieces]
+            bounds = pack_requests(counts, max_inputs, max_tokens)
+            return _rejoin_pieces(pieces, self._embed_requests(flat, bounds, counts))
+
+        return self._embed_cached(texts, embed)
+
+    def _embed_cached(
+        self,
+        texts: List[str],
+        embed: Callable[[List[str]], List[List[float]]],
+    ) -> List[List[float]]:
+        """
+        Embed texts, sending only cache misses to embed().
+
+        Without a cache every text is sent. With one, each distinct missing
+        text is sent once (repeated boilerplate costs a single input), and
+        the new vectors are stored for next time.
 
-                # Small delay to respect rate limits
-                if i + batch_size < len(texts):
-                    time.sleep(0.1)
+        Args:
+            texts (List[str]): Texts to embed
+            embed (Callable): Embeds a list of texts through the API
+
+        Returns:
+            List[List[float]]: One embedding per input text, in input order
+        """
+        if self.cache is None or not texts:
+            return embed(texts)
+
+        embeddings = self.cache.get_many(self.model, self.dimension, texts)
+        misses = list(dict.fromkeys(t for t, e in zip(texts, embeddings) if e is None))
+        if misses:
+            new = dict(zip(misses, embed(misses)))
+            self.cache.put_many(self.model, self.dimension, misses, list(new.values()))
+            embeddings = [
+                new[text] if embedding is None else embedding
+                for text, embedding in zip(texts, embeddings)
+            ]
+        return embeddings
+
+    def _embed_requests(
+        self,
+        texts: List[str],
+        bounds: List[Tuple[int, int]],
+        token_counts: List[int],
+    ) -> List[List[float]]:
+        """
+        Send one embeddings request per (start, end) slice of texts.
+
+        Before each request the shared rate-limit pacer is asked for room
+        for the request's tokens; the raw response's headers then update
+        what is left of the account's limits. A failed request is retried
+        whole (see _embed_packed) before its texts are sent one at a time.
+        """
+        embeddings = []
+
+        for start, end in bounds:
+            batch = texts[start:end]
+
+            try:
+                embeddings.extend(
+                    self._embed_packed(batch, sum(token_counts[start:end]))
+                )
 
             except Exception as e:
                 logger.error(f"Batch embedding generation failed: {e}")
                 # Fall back to individual generation for this batch
                 for text in batch:
                     try:
-                        embedding = self.generate_embedding(text)
+                        embedding = self._embed_one(text)
                         embeddings.append(embedding)
                     except Exception as e2:
                         logger.error(f"Individual embedding generation failed: {e2}")
@@ -232,6 +487,402 @@ class EmbeddingGenerator:
 
         return embeddings
 
+    def _embed_packed(self, batch: List[str], tokens: int) -> List[List[float]]:
+        """
+        Send one packed embeddings request, retrying with exponential backoff.
+
+        A failed attempt's response headers (a 429 still reports the limits)
+        are fed to the rate-limit pacer, so the next attempt waits at least
+        until the observed reset as well as for the backoff. Only when every
+        attempt fails does the caller fall back to one request per text.
+        """
+        max_retries = 3
+        retry_delay = 1.0
+
+        for attempt in range(max_retries):
+            try:
+                openai_rate_limits.wait(tokens)
+                with openai_budget:
+                    raw = self.client.embeddings.with_raw_response.create(
+                        input=batch, model=self.model
+                    )
+                openai_rate_limits.observe(raw.headers)
+                response = raw.parse()
+
+                # Extract embeddings in order
+                return [item.embedding for item in response.data]
+
+            except Exception as e:
+                logger.warning(
+                    f"Packed embedding request attempt {attempt + 1} failed: {e}"
+                )
+                error_response = getattr(e, "response", None)
+                if error_response is not None:
+                    openai_rate_limits.observe(error_response.headers)
+                if attempt < max_retries - 1:
+                    time.sleep(retry_delay)
+                    retry_delay *= 2  # Exponential backoff
+                else:
+                    raise
+
+
+class EmbeddingAggregator:
+    """
+    Collects chunk texts from many documents and embeds them together.
+
+    Documents are added one at a time under a key (e.g. the document ID);
+    embed() then sends all their texts in packed requests (see
+    EmbeddingGenerator.generate_packed_embeddings()) and hands each
+    document back its own embeddings. A short executive order no longer
+    costs a request of its own, and a long opinion's chunks fill requests
+    alongside the rest of the batch.
+
+    Attributes:
+        generator (EmbeddingGenerator): Generator that sends the requests
+        token_counter (Callable[[str], int]): Counts the tokens of a text
+        token_counts (Dict[Hashable, int]): Tokens each key's texts used in
+            the last embed()
+
+    Example:
+        aggregator = EmbeddingAggregator(generator)
+        for doc_id, payloads in built.items():
+            aggregator.add(doc_id, [p["text"] for p in payloads])
+        embeddings = aggregator.embed()  # {doc_id: [vector, ...]}
+
+    Python Learning Notes:
+        - Recording (key, start, end) per document lets one flat result list
+          be sliced back apart without copying texts around
+    """
+
+    def __init__(
+        self,
+        generator: EmbeddingGenerator,
+        token_counter: Callable[[str], int] = count_tokens,
+    ):
+        """
+        Initialize an empty aggregator.
+
+        Args:
+            generator (EmbeddingGenerator): Generator that sends the requests
+            token_counter (Callable[[str], int]): Counts the tokens of a text
+        """
+        self.generator = generator
+        self.token_counter = token_counter
+        self.token_counts: Dict[Hashable, int] = {}
+        self._texts: List[str] = []
+        self._spans: List[Tuple[Hashable, int, int]] = []
+
+    def add(self, key: Hashable, texts: List[str]) -> None:
+        """
+        Queue one document's chunk texts.
+
+        Args:
+            key (Hashable): Identifies the document in the result of embed()
+            texts (List[str]): The document's chunk texts, in order
+        """
+        start = len(self._texts)
+        self._texts.extend(texts)
+        self._spans.append((key, start, len(self._texts)))
+
+    def __len__(self) -> int:
+        """Number of texts waiting to be embedded."""
+        return len(self._texts)
+
+    def embed(self) -> Dict[Hashable, List[List[float]]]:
+        """
+        Embed every queued text and scatter the results back per document.
+
+        The aggregator is empty again afterwards.
+
+        Returns:
+            Dict[Hashable, List[List[float]]]: Each key's embeddings, in the
+                order its texts were added
+        """
+        texts, spans = self._texts, self._spans
+        self._texts, self._spans = [], []
+        if not texts:
+            self.token_counts = {key: 0 for key, _, _ in spans}
+            return {key: [] for key, _, _ in spans}
+
+        # Count each distinct text once; the counts both pack the requests
+        # and are reported per key
+        counts = {text: self.token_counter(text) for text in set(texts)}
+        self.token_counts = {
+            key: sum(counts[text] for text in texts[start:end])
+            for key, start, end in spans
+        }
+
+        def token_counter(text: str) -> int:
+            # Pieces of split oversized texts were not counted above
+            count = counts.get(text)
+            return self.token_counter(text) if count is None else count
+
+        embeddings = self.generator.generate_packed_embeddings(
+            texts, token_counter=token_counter
+        )
+        return {key: embeddings[start:end] for key, start, end in spans}
+
+
+class AsyncEmbeddingGenerator:
+    """
+    Asyncio counterpart of EmbeddingGenerator built on AsyncOpenAI.
+
+    The requests of one call to generate_batch_embeddings() are packed by
+    token count like EmbeddingGenerator's and sent concurrently. Shared by
+    all calls, a semaphore bounds how many embedding requests are in flight
+    at once and a RateBudget keeps them within the account's requests- and
+    tokens-per-minute limits, so a backfill of hundreds of thousands of
+    chunks runs as fast as the limits allow without being throttled.
+
+    Attributes:
+        client (AsyncOpenAI): Async OpenAI client (pooled connections)
+        model (str): The embedding model to use (text-embedding-3-small)
+        dimension (int): Vector dimension size (1536)
+        max_concurrency (int): Maximum embedding requests in flight
+        rate_budget (RateBudget): Requests- and tokens-per-minute budget
+        token_counter (Callable[[str], int]): Counts the tokens of a text
+        cache (Optional[EmbeddingCache]): Vectors of texts embedded before,
+            consulted before any request is sent
+
+    Example:
+        generator = AsyncEmbeddingGenerator(
+            max_concurrency=16, requests_per_minute=3000, tokens_per_minute=1_000_000
+        )
+        embeddings = await generator.generate_batch_embeddings(texts)
+        await generator.aclose()
+
+    Python Learning Notes:
+        - asyncio.Semaphore is created lazily so it binds to the running loop
+        - asyncio.gather() preserves the order of its awaitables' results
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: int = 4,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        token_counter: Callable[[str], int] = count_tokens,
+        cache: Optional[EmbeddingCache] = None,
+    ):
+        """
+        Initialize the async embedding generator.
+
+        Args:
+            api_key (Optional[str]): OpenAI API key (read from the environment
+                                    when omitted)
+            max_concurrency (int): Maximum embedding requests in flight
+            requests_per_minute (Optional[int]): Embedding requests allowed
+                per minute (None for unlimited)
+            tokens_per_minute (Optional[int]): Embedded tokens allowed per
+                minute (None for unlimited)
+            token_counter (Callable[[str], int]): Counts the tokens of a text
+            cache (Optional[EmbeddingCache]): Persistent cache of vectors;
+                only texts it does not hold are sent to the API
+
+        Raises:
+            ValueError: If no API key is provided and none found in environment,
+                        or a per-minute budget is less than 1
+        """
+        self.api_key = api_key or get_openai_api_key()
+        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.model = "text-embedding-3-small"
+        self.dimension = 1536
+        self.max_concurrency = max_concurrency
+        self.rate_budget = RateBudget(requests_per_minute, tokens_per_minute)
+        self.token_counter = token_counter
+        self.cache = cache
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding the number of concurrent embedding requests."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def generate_embedding(self, text: str) -> List[float]:
+        """
+        Generate an embedding for a single text chunk.
+
+        Retries up to 3 times with exponential backoff, like
+        EmbeddingGenerator.generate_embedding(). Each attempt takes one
+        request, and the text's tokens, from the per-minute budget.
+
+        Args:
+            text (str): Text to generate embedding for
+
+        Returns:
+            List[float]: 1536-dimensional embedding
+
+        Raises:
+            Exception: If embedding generation fails after all retry attempts
+        """
+        embeddings = await self._embed_cached([text], self._embed_each)
+        return embeddings[0]
+
+    async def _embed_one(self, text: str) -> List[float]:
+        """Request one text's embedding, retrying with exponential backoff."""
+        max_retries = 3
+        retry_delay = 1.0
+        tokens = self.token_counter(text)
+
+        for attempt in range(max_retries):
+            try:
+                await self.rate_budget.acquire(tokens)
+                async with self.semaphore:
+                    response = await self.client.embeddings.create(
+                        input=text, model=self.model
+                    )
+                return response.data[0].embedding
+
+            except Exception as e:
+                logger.warning(
+                    f"Embedding generation attempt {attempt + 1} failed: {e}"
+                )
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(retry_delay)
+                    retry_delay *= 2  # Exponential backoff
+                else:
+                    raise
+
+    async def _embed_each(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts with one request each (see _embed_one())."""
+        return [await self._embed_one(text) for text in texts]
+
+    async def generate_batch_embeddings(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        max_tokens: int = MAX_TOKENS_PER_REQUEST,
+    ) -> List[List[float]]:
+        """
+        Generate embeddings for multiple text chunks, batches concurrently.
+
+        Texts are split and packed into requests as in
+        EmbeddingGenerator.generate_packed_embeddings(). A failed batch is
+        retried whole before falling back to one request per text, and a
+        text that still fails gets a zero vector, as in
+        EmbeddingGenerator.generate_batch_embeddings().
+        With a cache, only the texts it does not hold are sent.
+
+        Args:
+            texts (List[str]): Text chunks to embed
+            batch_size (Optional[int]): Maximum texts per API call (default:
+                the API's limit of 2048)
+            max_tokens (int): Maximum total tokens per API call
+
+        Returns:
+            List[List[float]]: One embedding per input text, in input order
+        """
+        max_inputs = batch_size or MAX_INPUTS_PER_REQUEST
+
+        async def embed(misses: List[str]) -> List[List[float]]:
+            # Counting tokens is CPU-bound, so it runs off the event loop
+            pieces = await asyncio.to_thread(
+                lambda: [split_oversized(text, self.token_counter) for text in misses]
+            )
+            flat = [piece for text_pieces in pieces for piece, _ in text_pieces]
+            counts = [count for text_pieces in pieces for _, count in text_pieces]
+            bounds = pack_requests(counts, max_inputs, max_tokens)
+
+            results = await asyncio.gather(
+                *(
+                    self._embed_batch(flat[start:end], sum(counts[start:end]))
+                    for start, end in bounds
+                )
+            )
+            embeddings = [embedding for batch in results for embedding in batch]
+            return _rejoin_pieces(pieces, embeddings)
+
+        return await self._embed_cached(texts, embed)
+
+    async def _embed_cached(
+        self,
+        texts: List[str],
+        embed: Callable[[List[str]], Awaitable[List[List[float]]]],
+    ) -> List[List[float]]:
+        """
+        Embed texts, sending only cache misses to embed().
+
+        Works like EmbeddingGenerator._embed_cached(); the SQLite lookups and
+        writes run off the event loop.
+        """
+        if not texts:
+            return []
+        if self.cache is None:
+            return await embed(texts)
+
+        embeddings = await asyncio.to_thread(
+            self.cache.get_many, self.model, self.dimension, texts
+        )
+        misses = list(dict.fromkeys(t for t, e in zip(texts, embeddings) if e is None))
+        if misses:
+            new = dict(zip(misses, await embed(misses)))
+            await asyncio.to_thread(
+                self.cache.put_many,
+                self.model,
+                self.dimension,
+                misses,
+                list(new.values()),
+            )
+            embeddings = [
+                new[text] if embedding is None else embedding
+                for text, embedding in zip(texts, embeddings)
+            ]
+        return embeddings
+
+    async def _embed_batch(self, batch: List[str], tokens: int) -> List[List[float]]:
+        try:
+            return await self._embed_packed(batch, tokens)
+
+        except Exception as e:
+            logger.error(f"Batch embedding generation failed: {e}")
+
+        # Fall back to individual generation for this batch
+        embeddings = []
+        for text in batch:
+            try:
+                embeddings.append(await self._embed_one(text))
+            except Exception as e2:
+                logger.error(f"Individual embedding generation failed: {e2}")
+                # Use zero vector as fallback
+                embeddings.append([0.0] * self.dimension)
+        return embeddings
+
+    async def _embed_packed(self, batch: List[str], tokens: int) -> List[List[float]]:
+        """
+        Send one packed embeddings request, retrying with exponential backoff.
+
+        Works like EmbeddingGenerator._embed_packed(); each attempt takes the
+        request's tokens from the per-minute budget.
+        """
+        max_retries = 3
+        retry_delay = 1.0
+
+        for attempt in range(max_retries):
+            try:
+                await self.rate_budget.acquire(tokens)
+                async with self.semaphore:
+                    response = await self.client.embeddings.create(
+                        input=batch, model=self.model
+                    )
+                return [item.embedding for item in response.data]
+
+            except Exception as e:
+                logger.warning(
+                    f"Packed embedding request attempt {attempt + 1} failed: {e}"
+                )
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(retry_delay)
+                    retry_delay *= 2  # Exponential backoff
+                else:
+                    raise
+
+    async def aclose(self) -> None:
+        """Close the underlying AsyncOpenAI client."""
+        await self.client.close()
+
 
 def generate_embedding(text: str) -> List[float]:
     """
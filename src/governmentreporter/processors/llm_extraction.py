@@ -12,6 +12,8 @@ The module focuses on:
     - Topic and policy area identification balancing technical precision and searchability
     - Supreme Court opinion analysis (holdings, outcomes, issues, reasoning)
     - Executive Order impact assessment (actions, agencies, deadlines)
+    - Asyncio variants (generate_*_llm_fields_async) for AsyncOpenAI
+    - Token usage accounting for the calls made in a block (track_llm_usage)
 
 Python Learning Notes:
     - OpenAI client requires API key from environment variables
@@ -21,18 +23,56 @@ Python Learning Notes:
     - Docstrings provide comprehensive documentation
 """
 
+import asyncio
 import json
 import re
 import time
-from typing import Any, Dict, List, Optional
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from openai import APIError, OpenAI, RateLimitError
+from openai import APIError, AsyncOpenAI, OpenAI, RateLimitError
 
 from ..utils import get_logger
+from ..utils.concurrency import openai_budget
 from ..utils.config import get_openai_api_key
 
 logger = get_logger(__name__)
 
+# Model used for metadata extraction
+LLM_MODEL = "gpt-5-mini"
+
+# Version of the extraction prompts; bump it whenever the prompts or response
+# parsing change, so ingestion re-extracts the metadata of stored documents
+PROMPT_VERSION = "1"
+
+# Token counter of the innermost track_llm_usage() block, if any. A context
+# variable is local to each thread and asyncio task, so concurrent documents
+# count their own calls.
+_llm_usage: ContextVar[Optional[Counter]] = ContextVar("llm_usage", default=None)
+
+
+@contextmanager
+def track_llm_usage() -> Iterator[Counter]:
+    """
+    Count the tokens used by extraction calls made in the enclosed block.
+
+    Yields:
+        Counter: prompt_tokens and completion_tokens of the calls so far
+
+    Example:
+        with track_llm_usage() as usage:
+            fields = generate_eo_llm_fields(text)
+        print(usage["prompt_tokens"], usage["completion_tokens"])
+    """
+    usage: Counter = Counter()
+    token = _llm_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _llm_usage.reset(token)
+
 
 def generate_scotus_llm_fields(
     text: str, syllabus: Optional[str] = None
@@ -106,27 +146,106 @@ def generate_scotus_llm_fields(
         # Initialize OpenAI client
         client = OpenAI(api_key=get_openai_api_key())
 
-        # Prepare the content for analysis
-        analysis_content = text
-        syllabus_instruction = ""
+        system_prompt, user_prompt = _scotus_prompts(text, syllabus)
+
+        # Call GPT-5-mini with JSON response format and retry logic
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                with openai_budget:
+                    response = client.chat.completions.create(
+                        **_completion_request(system_prompt, user_prompt, 2000)
+                    )
+                break  # Success, exit retry loop
+            except APIError as e:
+                wait_time = _retry_wait_time(e, attempt, max_retries)
+                if wait_time is None:
+                    raise  # Re-raise on final attempt or non-retryable errors
+                time.sleep(wait_time)
+
+        _record_usage(response)
+        return _parse_scotus_response(response)
+
+    except Exception as e:
+        logger.error("Failed to extract SCOTUS metadata: %s", str(e), exc_info=True)
+        return _scotus_fallback_fields()
+
+
+async def generate_scotus_llm_fields_async(
+    text: str,
+    syllabus: Optional[str] = None,
+    client: Optional[AsyncOpenAI] = None,
+) -> Dict[str, Any]:
+    """
+    Asyncio version of generate_scotus_llm_fields().
+
+    Uses the same prompts, retries and fallback fields, but awaits an
+    AsyncOpenAI client so many extractions can be in flight on one event loop.
+
+    Args:
+        text (str): Full text of the Supreme Court opinion
+        syllabus (Optional[str]): The Syllabus text if available
+        client (Optional[AsyncOpenAI]): Shared async client; pass one to reuse
+                                       its connection pool across documents.
+                                       A new client is created when omitted.
+
+    Returns:
+        Dict[str, Any]: Same fields as generate_scotus_llm_fields()
+
+    Example:
+        client = AsyncOpenAI(api_key=get_openai_api_key())
+        results = await asyncio.gather(
+            *(generate_scotus_llm_fields_async(t, client=client) for t in texts)
+        )
+    """
+    try:
+        client = client or AsyncOpenAI(api_key=get_openai_api_key())
+        system_prompt, user_prompt = _scotus_prompts(text, syllabus)
 
-        if syllabus:
-            # If Syllabus is available, prepend it for priority extraction
-            analysis_content = f"SYLLABUS (USE THIS FOR HOLDING, OUTCOME, AND ISSUE):\n{syllabus}\n\nFULL OPINION:\n{text}"
-            syllabus_instruction = """
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                response = await client.chat.completions.create(
+                    **_completion_request(system_prompt, user_prompt, 2000)
+                )
+                break
+            except APIError as e:
+                wait_time = _retry_wait_time(e, attempt, max_retries)
+                if wait_time is None:
+                    raise
+                await asyncio.sleep(wait_time)
+
+        _record_usage(response)
+        return _parse_scotus_response(response)
+
+    except Exception as e:
+        logger.error("Failed to extract SCOTUS metadata: %s", str(e), exc_info=True)
+        return _scotus_fallback_fields()
+
+
+def _scotus_prompts(text: str, syllabus: Optional[str]) -> Tuple[str, str]:
+    """Build the (system, user) prompts for SCOTUS metadata extraction."""
+    # Prepare the content for analysis
+    analysis_content = text
+    syllabus_instruction = ""
+
+    if syllabus:
+        # If Syllabus is available, prepend it for priority extraction
+        analysis_content = f"SYLLABUS (USE THIS FOR HOLDING, OUTCOME, AND ISSUE):\n{syllabus}\n\nFULL OPINION:\n{text}"
+        syllabus_instruction = """
             CRITICAL: Extract holding_plain, outcome_simple, and issue_plain ONLY from the SYLLABUS section.
             The Syllabus is the Court's official summary and provides the authoritative source for these fields.
             Use the full opinion for all other fields (citations, topics, reasoning).
             """
-        else:
-            syllabus_instruction = """
+    else:
+        syllabus_instruction = """
             CRITICAL: When NO Syllabus is provided, extract holding_plain, outcome_simple, and issue_plain
             ONLY from the majority opinion. NEVER use dissenting or concurring opinions for these fields.
             Dissents and concurrences represent alternative views, not the Court's actual holding.
             """
 
-        # System prompt defining the extraction task
-        system_prompt = f"""You are a legal analyst extracting document-level metadata from Supreme Court opinions for a RAG system.
+    # System prompt defining the extraction task
+    system_prompt = f"""You are a legal analyst extracting document-level metadata from Supreme Court opinions for a RAG system.
 
 Your task is to create metadata that provides context for understanding individual chunks (500-800 token fragments)
 from much larger opinions (15,000+ words). This metadata helps LLM clients assess chunk relevance and synthesize
@@ -261,135 +380,94 @@ Extract the following fields in JSON format:
     Example: "Applied rational basis review to appropriations challenges. Statutory authorization constitutes valid appropriation under historical practice dating to founding era. Distinguished from nondelegation doctrine cases where Congress delegates legislative power rather than authorizing expenditures. Relied on precedent upholding standing appropriations for judicial salaries and mint operations."
 """
 
-        # User prompt with the opinion text
-        user_prompt = (
-            f"Extract metadata from this Supreme Court opinion:\n\n{analysis_content}"
-        )
+    # User prompt with the opinion text
+    user_prompt = (
+        f"Extract metadata from this Supreme Court opinion:\n\n{analysis_content}"
+    )
 
-        # Call GPT-5-mini with JSON response format and retry logic
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                response = client.chat.completions.create(
-                    model="gpt-5-mini",
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    response_format={"type": "json_object"},
-                    max_completion_tokens=2000,
-                    reasoning_effort="minimal",
-                )
-                break  # Success, exit retry loop
-            except RateLimitError as e:
-                if attempt < max_retries - 1:
-                    wait_time = 2**attempt  # Exponential backoff: 1s, 2s, 4s
-                    logger.warning(
-                        "Rate limited on attempt %d/%d, waiting %ds: %s",
-                        attempt + 1,
-                        max_retries,
-                        wait_time,
-                        str(e),
-                    )
-                    time.sleep(wait_time)
-                    continue
-                raise  # Re-raise on final attempt
-            except APIError as e:
-                if (
-                    attempt < max_retries - 1
-                    and hasattr(e, "status_code")
-                    and e.status_code in [502, 503, 504]
-                ):
-                    wait_time = 2**attempt
-                    logger.warning(
-                        "API error %d on attempt %d/%d, waiting %ds: %s",
-                        e.status_code,
-                        attempt + 1,
-                        max_retries,
-                        wait_time,
-                        str(e),
-                    )
-                    time.sleep(wait_time)
-                    continue
-                raise  # Re-raise on final attempt or non-retryable errors
-
-        # Log finish_reason and refusal for debugging content filter issues
-        logger.info(f"Finish reason: {response.choices[0].finish_reason}")
-        logger.info(f"Refusal: {response.choices[0].message.refusal}")
-
-        # Check if response has content
-        if not response.choices or not response.choices[0].message.content:
-            logger.error("Empty response from OpenAI API for SCOTUS metadata")
-            raise ValueError("Empty response from OpenAI API")
-
-        # Parse the JSON response
-        response_content = response.choices[0].message.content
-        logger.debug("OpenAI response length: %d characters", len(response_content))
-
-        try:
-            result = json.loads(response_content)
-        except json.JSONDecodeError as e:
-            logger.error("Failed to parse OpenAI JSON response: %s", str(e))
-            logger.debug(
-                "Response content: %s", response_content[:500]
-            )  # Log first 500 chars
-            raise
-
-        # Ensure all required fields are present with defaults
-        required_fields = {
-            "document_summary": "",
-            "constitution_cited": [],
-            "federal_statutes_cited": [],
-            "federal_regulations_cited": [],
-            "cases_cited": [],
-            "topics_or_policy_areas": [],
-            "holding_plain": "",
-            "outcome_simple": "",
-            "issue_plain": "",
-            "reasoning": "",
-        }
-
-        # Merge with defaults to ensure all fields exist
-        for field, default in required_fields.items():
-            if field not in result:
-                result[field] = default
-
-        # Validate topics count (ensure 5-8 topics)
-        if len(result["topics_or_policy_areas"]) < 5:
-            logger.warning("Less than 5 topics extracted, may affect retrieval quality")
-        elif len(result["topics_or_policy_areas"]) > 8:
-            result["topics_or_policy_areas"] = result["topics_or_policy_areas"][:8]
+    return system_prompt, user_prompt
+
+
+def _parse_scotus_response(response: Any) -> Dict[str, Any]:
+    """Validate a SCOTUS chat completion and fill in missing fields."""
+    # Log finish_reason and refusal for debugging content filter issues
+    logger.info(f"Finish reason: {response.choices[0].finish_reason}")
+    logger.info(f"Refusal: {response.choices[0].message.refusal}")
+
+    # Check if response has content
+    if not response.choices or not response.choices[0].message.content:
+        logger.error("Empty response from OpenAI API for SCOTUS metadata")
+        raise ValueError("Empty response from OpenAI API")
 
+    # Parse the JSON response
+    response_content = response.choices[0].message.content
+    logger.debug("OpenAI response length: %d characters", len(response_content))
+
+    try:
+        result = json.loads(response_content)
+    except json.JSONDecodeError as e:
+        logger.error("Failed to parse OpenAI JSON response: %s", str(e))
         logger.debug(
-            "Successfully extracted SCOTUS metadata with %d citations",
-            sum(
-                len(result[f])
-                for f in [
-                    "constitution_cited",
-                    "federal_statutes_cited",
-                    "federal_regulations_cited",
-                    "cases_cited",
-                ]
-            ),
-        )
+            "Response content: %s", response_content[:500]
+        )  # Log first 500 chars
+        raise
+
+    # Ensure all required fields are present with defaults
+    required_fields = {
+        "document_summary": "",
+        "constitution_cited": [],
+        "federal_statutes_cited": [],
+        "federal_regulations_cited": [],
+        "cases_cited": [],
+        "topics_or_policy_areas": [],
+        "holding_plain": "",
+        "outcome_simple": "",
+        "issue_plain": "",
+        "reasoning": "",
+    }
+
+    # Merge with defaults to ensure all fields exist
+    for field, default in required_fields.items():
+        if field not in result:
+            result[field] = default
+
+    # Validate topics count (ensure 5-8 topics)
+    if len(result["topics_or_policy_areas"]) < 5:
+        logger.warning("Less than 5 topics extracted, may affect retrieval quality")
+    elif len(result["topics_or_policy_areas"]) > 8:
+        result["topics_or_policy_areas"] = result["topics_or_policy_areas"][:8]
+
+    logger.debug(
+        "Successfully extracted SCOTUS metadata with %d citations",
+        sum(
+            len(result[f])
+            for f in [
+                "constitution_cited",
+                "federal_statutes_cited",
+                "federal_regulations_cited",
+                "cases_cited",
+            ]
+        ),
+    )
 
-        return result
+    return result
 
-    except Exception as e:
-        logger.error("Failed to extract SCOTUS metadata: %s", str(e), exc_info=True)
-        # Return minimal valid metadata on error
-        return {
-            "document_summary": "Unable to generate summary.",
-            "constitution_cited": [],
-            "federal_statutes_cited": [],
-            "federal_regulations_cited": [],
-            "cases_cited": [],
-            "topics_or_policy_areas": ["legal", "court decision"],
-            "holding_plain": "Unable to extract holding.",
-            "outcome_simple": "Unable to determine outcome.",
-            "issue_plain": "Unable to extract issue.",
-            "reasoning": "Unable to extract reasoning.",
-        }
+
+def _scotus_fallback_fields() -> Dict[str, Any]:
+    """Minimal valid SCOTUS metadata returned when extraction fails."""
+    # Return minimal valid metadata on error
+    return {
+        "document_summary": "Unable to generate summary.",
+        "constitution_cited": [],
+        "federal_statutes_cited": [],
+        "federal_regulations_cited": [],
+        "cases_cited": [],
+        "topics_or_policy_areas": ["legal", "court decision"],
+        "holding_plain": "Unable to extract holding.",
+        "outcome_simple": "Unable to determine outcome.",
+        "issue_plain": "Unable to extract issue.",
+        "reasoning": "Unable to extract reasoning.",
+    }
 
 
 def generate_eo_llm_fields(text: str) -> Dict[str, Any]:
@@ -447,8 +525,77 @@ def generate_eo_llm_fields(text: str) -> Dict[str, Any]:
         # Initialize OpenAI client
         client = OpenAI(api_key=get_openai_api_key())
 
-        # System prompt defining the extraction task for Executive Orders
-        system_prompt = """You are a policy analyst extracting document-level metadata from Presidential Executive Orders for a RAG system.
+        system_prompt, user_prompt = _eo_prompts(text)
+
+        # Call GPT-5-mini with JSON response format and retry logic
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                with openai_budget:
+                    response = client.chat.completions.create(
+                        **_completion_request(system_prompt, user_prompt, 1500)
+                    )
+                break  # Success, exit retry loop
+            except APIError as e:
+                wait_time = _retry_wait_time(e, attempt, max_retries)
+                if wait_time is None:
+                    raise  # Re-raise on final attempt or non-retryable errors
+                time.sleep(wait_time)
+
+        _record_usage(response)
+        return _parse_eo_response(response)
+
+    except Exception as e:
+        logger.error(
+            "Failed to extract Executive Order metadata: %s", str(e), exc_info=True
+        )
+        return _eo_fallback_fields()
+
+
+async def generate_eo_llm_fields_async(
+    text: str, client: Optional[AsyncOpenAI] = None
+) -> Dict[str, Any]:
+    """
+    Asyncio version of generate_eo_llm_fields().
+
+    Args:
+        text (str): Full text of the Executive Order
+        client (Optional[AsyncOpenAI]): Shared async client (created when omitted)
+
+    Returns:
+        Dict[str, Any]: Same fields as generate_eo_llm_fields()
+    """
+    try:
+        client = client or AsyncOpenAI(api_key=get_openai_api_key())
+        system_prompt, user_prompt = _eo_prompts(text)
+
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                response = await client.chat.completions.create(
+                    **_completion_request(system_prompt, user_prompt, 1500)
+                )
+                break
+            except APIError as e:
+                wait_time = _retry_wait_time(e, attempt, max_retries)
+                if wait_time is None:
+                    raise
+                await asyncio.sleep(wait_time)
+
+        _record_usage(response)
+        return _parse_eo_response(response)
+
+    except Exception as e:
+        logger.error(
+            "Failed to extract Executive Order metadata: %s", str(e), exc_info=True
+        )
+        return _eo_fallback_fields()
+
+
+def _eo_prompts(text: str) -> Tuple[str, str]:
+    """Build the (system, user) prompts for Executive Order metadata extraction."""
+    # System prompt defining the extraction task for Executive Orders
+    system_prompt = """You are a policy analyst extracting document-level metadata from Presidential Executive Orders for a RAG system.
 
 Your task is to create metadata that provides context for understanding individual chunks (300-400 token fragments)
 from much larger executive orders. This metadata helps LLM clients assess chunk relevance and synthesize answers
@@ -541,129 +688,146 @@ Extract the following fields in JSON format:
    Think: "What would someone type into a search engine to find this order?"
 """
 
-        # User prompt with the Executive Order text
-        user_prompt = f"Extract metadata from this Executive Order:\n\n{text}"
+    # User prompt with the Executive Order text
+    user_prompt = f"Extract metadata from this Executive Order:\n\n{text}"
 
-        # Call GPT-5-mini with JSON response format and retry logic
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                response = client.chat.completions.create(
-                    model="gpt-5-mini",
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    response_format={"type": "json_object"},
-                    max_completion_tokens=1500,
-                    reasoning_effort="minimal",
-                )
-                break  # Success, exit retry loop
-            except RateLimitError as e:
-                if attempt < max_retries - 1:
-                    wait_time = 2**attempt  # Exponential backoff: 1s, 2s, 4s
-                    logger.warning(
-                        "Rate limited on attempt %d/%d, waiting %ds: %s",
-                        attempt + 1,
-                        max_retries,
-                        wait_time,
-                        str(e),
-                    )
-                    time.sleep(wait_time)
-                    continue
-                raise  # Re-raise on final attempt
-            except APIError as e:
-                if (
-                    attempt < max_retries - 1
-                    and hasattr(e, "status_code")
-                    and e.status_code in [502, 503, 504]
-                ):
-                    wait_time = 2**attempt
-                    logger.warning(
-                        "API error %d on attempt %d/%d, waiting %ds: %s",
-                        e.status_code,
-                        attempt + 1,
-                        max_retries,
-                        wait_time,
-                        str(e),
-                    )
-                    time.sleep(wait_time)
-                    continue
-                raise  # Re-raise on final attempt or non-retryable errors
-
-        # Log finish_reason and refusal for debugging content filter issues
-        logger.info(f"Finish reason: {response.choices[0].finish_reason}")
-        logger.info(f"Refusal: {response.choices[0].message.refusal}")
-
-        # Check if response has content
-        if not response.choices or not response.choices[0].message.content:
-            logger.error("Empty response from OpenAI API for EO metadata")
-            raise ValueError("Empty response from OpenAI API")
-
-        # Parse the JSON response
-        response_content = response.choices[0].message.content
-        logger.debug("OpenAI response length: %d characters", len(response_content))
-
-        try:
-            result = json.loads(response_content)
-        except json.JSONDecodeError as e:
-            logger.error("Failed to parse OpenAI JSON response: %s", str(e))
-            logger.debug(
-                "Response content: %s", response_content[:500]
-            )  # Log first 500 chars
-            raise
-
-        # Ensure all required fields are present with defaults
-        required_fields = {
-            "document_summary": "",
-            "agencies_impacted": [],
-            "constitution_cited": [],
-            "federal_statutes_cited": [],
-            "federal_regulations_cited": [],
-            "cases_cited": [],
-            "topics_or_policy_areas": [],
-        }
-
-        # Merge with defaults to ensure all fields exist
-        for field, default in required_fields.items():
-            if field not in result:
-                result[field] = default
-
-        # Validate and adjust topics count (ensure 5-8 topics)
-        if len(result["topics_or_policy_areas"]) < 5:
-            # Add generic topics if too few
-            generic_topics = [
-                "federal policy",
-                "executive action",
-                "government regulation",
-            ]
-            while len(result["topics_or_policy_areas"]) < 5 and generic_topics:
-                if generic_topics[0] not in result["topics_or_policy_areas"]:
-                    result["topics_or_policy_areas"].append(generic_topics.pop(0))
-        elif len(result["topics_or_policy_areas"]) > 8:
-            result["topics_or_policy_areas"] = result["topics_or_policy_areas"][:8]
+    return system_prompt, user_prompt
 
-        logger.debug(
-            "Successfully extracted EO metadata with %d impacted agencies",
-            len(result["agencies_impacted"]),
-        )
 
-        return result
+def _parse_eo_response(response: Any) -> Dict[str, Any]:
+    """Validate an Executive Order chat completion and fill in missing fields."""
+    # Log finish_reason and refusal for debugging content filter issues
+    logger.info(f"Finish reason: {response.choices[0].finish_reason}")
+    logger.info(f"Refusal: {response.choices[0].message.refusal}")
 
-    except Exception as e:
-        logger.error(
-            "Failed to extract Executive Order metadata: %s", str(e), exc_info=True
+    # Check if response has content
+    if not response.choices or not response.choices[0].message.content:
+        logger.error("Empty response from OpenAI API for EO metadata")
+        raise ValueError("Empty response from OpenAI API")
+
+    # Parse the JSON response
+    response_content = response.choices[0].message.content
+    logger.debug("OpenAI response length: %d characters", len(response_content))
+
+    try:
+        result = json.loads(response_content)
+    except json.JSONDecodeError as e:
+        logger.error("Failed to parse OpenAI JSON response: %s", str(e))
+        logger.debug(
+            "Response content: %s", response_content[:500]
+        )  # Log first 500 chars
+        raise
+
+    # Ensure all required fields are present with defaults
+    required_fields = {
+        "document_summary": "",
+        "agencies_impacted": [],
+        "constitution_cited": [],
+        "federal_statutes_cited": [],
+        "federal_regulations_cited": [],
+        "cases_cited": [],
+        "topics_or_policy_areas": [],
+    }
+
+    # Merge with defaults to ensure all fields exist
+    for field, default in required_fields.items():
+        if field not in result:
+            result[field] = default
+
+    # Validate and adjust topics count (ensure 5-8 topics)
+    if len(result["topics_or_policy_areas"]) < 5:
+        # Add generic topics if too few
+        generic_topics = [
+            "federal policy",
+            "executive action",
+            "government regulation",
+        ]
+        while len(result["topics_or_policy_areas"]) < 5 and generic_topics:
+            if generic_topics[0] not in result["topics_or_policy_areas"]:
+                result["topics_or_policy_areas"].append(generic_topics.pop(0))
+    elif len(result["topics_or_policy_areas"]) > 8:
+        result["topics_or_policy_areas"] = result["topics_or_policy_areas"][:8]
+
+    logger.debug(
+        "Successfully extracted EO metadata with %d impacted agencies",
+        len(result["agencies_impacted"]),
+    )
+
+    return result
+
+
+def _eo_fallback_fields() -> Dict[str, Any]:
+    """Minimal valid Executive Order metadata returned when extraction fails."""
+    return {
+        "document_summary": "Unable to generate summary.",
+        "agencies_impacted": [],
+        "constitution_cited": [],
+        "federal_statutes_cited": [],
+        "federal_regulations_cited": [],
+        "cases_cited": [],
+        "topics_or_policy_areas": ["federal policy", "executive action"],
+    }
+
+
+def _completion_request(
+    system_prompt: str, user_prompt: str, max_completion_tokens: int
+) -> Dict[str, Any]:
+    """Keyword arguments for chat.completions.create() (sync or async)."""
+    return {
+        "model": LLM_MODEL,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        "response_format": {"type": "json_object"},
+        "max_completion_tokens": max_completion_tokens,
+        "reasoning_effort": "minimal",
+    }
+
+
+def _record_usage(response: Any) -> None:
+    """Add a completion's token usage to the active track_llm_usage() block."""
+    usage = _llm_usage.get()
+    if usage is None or getattr(response, "usage", None) is None:
+        return
+    usage["prompt_tokens"] += response.usage.prompt_tokens or 0
+    usage["completion_tokens"] += response.usage.completion_tokens or 0
+
+
+def _retry_wait_time(error: APIError, attempt: int, max_retries: int) -> Optional[int]:
+    """
+    Backoff before retrying a failed completion, or None to give up.
+
+    Rate limits and 502/503/504 responses are retried with exponential
+    backoff (1s, 2s, 4s) until the final attempt.
+    """
+    if attempt >= max_retries - 1:
+        return None
+
+    wait_time = 2**attempt
+    if isinstance(error, RateLimitError):
+        logger.warning(
+            "Rate limited on attempt %d/%d, waiting %ds: %s",
+            attempt + 1,
+            max_retries,
+            wait_time,
+            str(error),
         )
-        # Return minimal valid metadata on error
-        return {
-            "document_summary": "Unable to generate summary.",
-            "agencies_impacted": [],
-            "constitution_cited": [],
-            "federal_statutes_cited": [],
-            "federal_regulations_cited": [],
-            "cases_cited": [],
-            "topics_or_policy_areas": ["federal policy", "executive action"],
-        }
+        return wait_time
+
+    status_code = getattr(error, "status_code", None)
+    if status_code in [502, 503, 504]:
+        logger.warning(
+            "API error %d on attempt %d/%d, waiting %ds: %s",
+            status_code,
+            attempt + 1,
+            max_retries,
+            wait_time,
+            str(error),
+        )
+        return wait_time
+
+    return None
 
 
 # Docstring examples for testing
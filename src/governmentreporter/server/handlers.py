@@ -30,6 +30,7 @@ from ..apis.federal_register import FederalRegisterClient
 from ..database.qdrant import QdrantDBClient
 from ..processors.embeddings import generate_embedding
 from .query_processor import QueryProcessor
+from .resources import get_shared_client
 
 logger = logging.getLogger(__name__)
 
@@ -459,7 +460,7 @@ async def handle_get_document_by_id(
                 # Extract opinion ID from metadata (stored as document_id)
                 opinion_id = payload.get("document_id")
                 if opinion_id:
-                    client = CourtListenerClient()
+                    client = get_shared_client(CourtListenerClient)
                     full_doc = client.get_opinion(int(opinion_id))
                     formatted_response = processor.format_full_document(
                         "scotus", full_doc, payload
@@ -471,7 +472,7 @@ async def handle_get_document_by_id(
                     "executive_order_number"
                 )
                 if doc_number:
-                    client = FederalRegisterClient()
+                    client = get_shared_client(FederalRegisterClient)
                     try:
                         full_doc = client.get_document(doc_number)
                         formatted_response = processor.format_full_document(
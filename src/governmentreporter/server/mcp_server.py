@@ -49,7 +49,7 @@ from .handlers import (
     handle_search_government_documents,
     handle_search_scotus_opinions,
 )
-from .resources import list_available_resources, read_resource
+from .resources import close_api_clients, list_available_resources, read_resource
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -513,8 +513,9 @@ class GovernmentReporterMCP:
 
         This method:
         1. Closes the Qdrant client connection
-        2. Cleans up any server resources
-        3. Logs shutdown completion
+        2. Closes the shared government API clients
+        3. Cleans up any server resources
+        4. Logs shutdown completion
         """
         logger.info(f"Shutting down {self.config.server_name}...")
 
@@ -523,6 +524,9 @@ class GovernmentReporterMCP:
             # QdrantDBClient doesn't have explicit close, but we can set to None
             self.qdrant_client = None
 
+        # Release pooled connections held by the shared government API clients
+        close_api_clients()
+
         logger.info("MCP server shut down successfully")
 
 
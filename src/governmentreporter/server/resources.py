@@ -7,10 +7,15 @@ complete document content when the LLM needs more context than chunks provide.
 
 Resources use the polymorphic GovernmentAPIClient interface to fetch documents
 on-demand from government APIs, ensuring fresh data without storage overhead.
+API clients are created once per server process and reused, so repeated
+resource reads share pooled keep-alive connections instead of opening a new
+connection for every request.
 
 Functions:
     parse_resource_uri: Parse resource URIs into document type and ID
+    get_shared_client: Get the process-wide instance of an API client class
     get_api_client: Get appropriate API client for document type
+    close_api_clients: Close all shared API clients and their connection pools
     read_resource: Fetch and format full document by URI
     format_document_resource: Format Document object for MCP response
     list_available_resources: List example resources for discovery
@@ -44,6 +49,11 @@ CLIENT_MAP: Dict[str, type] = {
     "executive_order": FederalRegisterClient,
 }
 
+# Shared API client instances keyed by client class. Reusing one instance per
+# class keeps its pooled HTTP connections alive across resource reads and tool
+# calls for the lifetime of the server.
+_shared_clients: Dict[type, GovernmentAPIClient] = {}
+
 
 def parse_resource_uri(uri: str) -> Tuple[str, str]:
     """
@@ -90,7 +100,8 @@ def get_api_client(doc_type: str) -> GovernmentAPIClient:
 
     This function implements the factory pattern to create API clients
     polymorphically. It uses the CLIENT_MAP to determine which concrete
-    client class to instantiate based on the document type.
+    client class to use based on the document type, and returns the shared
+    instance of that class (see get_shared_client).
 
     Args:
         doc_type: Document type identifier ("scotus" or "executive_order")
@@ -110,7 +121,47 @@ def get_api_client(doc_type: str) -> GovernmentAPIClient:
     if not client_class:
         raise ValueError(f"No client available for document type: {doc_type}")
 
-    return client_class()
+    return get_shared_client(client_class)
+
+
+def get_shared_client(client_class: type) -> GovernmentAPIClient:
+    """
+    Get the shared instance of an API client class, creating it if needed.
+
+    The first call for a given class instantiates the client; later calls
+    return the same instance so its connection pool is reused.
+
+    Args:
+        client_class: GovernmentAPIClient subclass to instantiate
+
+    Returns:
+        The shared client instance for that class
+
+    Example:
+        >>> client = get_shared_client(CourtListenerClient)
+        >>> client is get_shared_client(CourtListenerClient)
+        True
+    """
+    client = _shared_clients.get(client_class)
+    if client is None:
+        client = client_class()
+        _shared_clients[client_class] = client
+    return client
+
+
+def close_api_clients() -> None:
+    """
+    Close all shared API clients and release their pooled connections.
+
+    Called when the MCP server shuts down. Clients are recreated on demand
+    if they are requested again afterwards.
+    """
+    for client in _shared_clients.values():
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning(f"Error closing API client: {e}")
+    _shared_clients.clear()
 
 
 async def read_resource(uri: str) -> str:
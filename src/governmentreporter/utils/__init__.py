@@ -7,6 +7,7 @@ into specialized modules for different concerns:
 - config.py: Environment variable management for API keys and tokens
 - citations.py: Legal citation formatting utilities
 - monitoring.py: Performance monitoring and progress tracking utilities
+- concurrency.py: Process-wide concurrency budgets for shared services (OpenAI)
 - __init__.py: Centralized imports and common utilities like logging
 
 Integration Points:
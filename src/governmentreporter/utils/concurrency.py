@@ -0,0 +1,346 @@
+"""
+Process-wide concurrency budgets for shared external services.
+
+Several ingesters can run at once in one process (see ``ingest all
+--concurrent``), each with its own worker threads. Their calls to a shared
+service such as OpenAI must still respect one account-wide rate limit, so
+the calls acquire a slot from a single budget instead of each ingester
+bounding only its own requests.
+
+The module-level ``openai_budget`` is used around every synchronous OpenAI
+request (LLM metadata extraction and embeddings). It is unlimited until a
+limit is set, so code that never configures it behaves as before.
+
+The module-level ``openai_rate_limits`` paces requests by the rate-limit
+headers OpenAI returns (remaining requests and tokens in the current
+window), so a caller waits only when the next request would not fit.
+
+RateBudget enforces a configured requests-per-minute and tokens-per-minute
+budget on asyncio tasks, for code that sends many requests concurrently.
+
+Python Learning Notes:
+    - threading.Condition lets waiting threads sleep until a slot is freed
+    - Implementing __enter__/__exit__ makes an object usable in a with block
+    - time.monotonic() never jumps with wall-clock changes, so it is the
+      right clock for deadlines
+    - A token bucket refills continuously, so a per-minute budget is spread
+      over the minute instead of being spent in a burst and then waited out
+"""
+
+import asyncio
+import re
+import threading
+import time
+from typing import Mapping, Optional
+
+# Upper bound on one pacing wait, in case a reset header is far off
+MAX_PACING_DELAY = 60.0
+
+# One component of an OpenAI reset duration such as "6m0s" or "120ms"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+class ConcurrencyBudget:
+    """
+    Limits how many calls to a service are in flight across all threads.
+
+    Unlike threading.Semaphore, the limit can be changed after creation
+    (e.g. from a CLI option) and None means unlimited.
+
+    Attributes:
+        limit (Optional[int]): Maximum calls in flight (None for unlimited)
+        in_flight (int): Calls currently holding a slot
+        peak (int): Highest number of calls that held a slot at once
+
+    Example:
+        budget = ConcurrencyBudget(limit=8)
+        with budget:
+            response = client.embeddings.create(...)
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        """
+        Args:
+            limit: Maximum calls in flight (None for unlimited)
+
+        Raises:
+            ValueError: If limit is less than 1
+        """
+        self._condition = threading.Condition()
+        self.in_flight = 0
+        self.peak = 0
+        self.limit: Optional[int] = None
+        self.set_limit(limit)
+
+    def set_limit(self, limit: Optional[int]) -> None:
+        """
+        Change the limit; waiting callers are re-checked against it.
+
+        Args:
+            limit: Maximum calls in flight (None for unlimited)
+
+        Raises:
+            ValueError: If limit is less than 1
+        """
+        if limit is not None and limit < 1:
+            raise ValueError(f"Concurrency limit must be at least 1, got {limit}")
+        with self._condition:
+            self.limit = limit
+            self._condition.notify_all()
+
+    def acquire(self) -> None:
+        """Wait for a free slot and take it."""
+        with self._condition:
+            while self.limit is not None and self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def release(self) -> None:
+        """Give a slot back."""
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify()
+
+    def __enter__(self) -> "ConcurrencyBudget":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Parse an OpenAI rate-limit reset duration into seconds.
+
+    Args:
+        value: Header value such as "1s", "6m0s", "1h2m3.5s" or "20ms"
+
+    Returns:
+        Seconds, or None if the value is missing or not a duration
+
+    Example:
+        parse_duration("1m30s")  # 90.0
+    """
+    if not value:
+        return None
+    parts = _DURATION_PART.findall(value)
+    if "".join(number + unit for number, unit in parts) != value.strip():
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+class RateLimitPacer:
+    """
+    Paces requests by the rate-limit headers of earlier responses.
+
+    Each response reports how many requests and tokens remain in the
+    current window and when the window resets. Until the allowance runs
+    out, wait() returns at once and reserves the request's share, so
+    threads sharing the pacer do not all spend the same remainder; a
+    request that does not fit waits for the reset.
+
+    Attributes:
+        remaining_requests (Optional[int]): Requests left (None: unknown)
+        remaining_tokens (Optional[int]): Tokens left (None: unknown)
+        waited (float): Total seconds callers have waited
+
+    Example:
+        pacer = RateLimitPacer()
+        pacer.wait(tokens=12_000)
+        raw = client.embeddings.with_raw_response.create(...)
+        pacer.observe(raw.headers)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.remaining_requests: Optional[int] = None
+        self.remaining_tokens: Optional[int] = None
+        self._requests_reset_at = 0.0
+        self._tokens_reset_at = 0.0
+        self.waited = 0.0
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """
+        Record the limits reported by a response.
+
+        Args:
+            headers: Response headers; missing or malformed values are ignored
+        """
+        now = time.monotonic()
+        requests = _header_int(headers, "x-ratelimit-remaining-requests")
+        tokens = _header_int(headers, "x-ratelimit-remaining-tokens")
+        with self._lock:
+            if requests is not None:
+                self.remaining_requests = requests
+                self._requests_reset_at = now + (
+                    parse_duration(headers.get("x-ratelimit-reset-requests")) or 0.0
+                )
+            if tokens is not None:
+                self.remaining_tokens = tokens
+                self._tokens_reset_at = now + (
+                    parse_duration(headers.get("x-ratelimit-reset-tokens")) or 0.0
+                )
+
+    def wait(self, tokens: int = 0) -> float:
+        """
+        Wait until a request of the given size fits the observed limits.
+
+        Args:
+            tokens: Tokens the request will use
+
+        Returns:
+            Seconds waited (0.0 when the request fits right away)
+        """
+        with self._lock:
+            now = time.monotonic()
+            # A window that has reset is full again, so its limit is unknown
+            if now >= self._requests_reset_at:
+                self.remaining_requests = None
+            if now >= self._tokens_reset_at:
+                self.remaining_tokens = None
+
+            delay = 0.0
+            if self.remaining_requests is not None and self.remaining_requests < 1:
+                delay = self._requests_reset_at - now
+            if self.remaining_tokens is not None and tokens > self.remaining_tokens:
+                delay = max(delay, self._tokens_reset_at - now)
+            delay = min(delay, MAX_PACING_DELAY)
+
+            if delay > 0:
+                self.remaining_requests = self.remaining_tokens = None
+                self.waited += delay
+            else:
+                if self.remaining_requests is not None:
+                    self.remaining_requests -= 1
+                if self.remaining_tokens is not None:
+                    self.remaining_tokens -= tokens
+
+        if delay > 0:
+            time.sleep(delay)
+        return max(delay, 0.0)
+
+
+class RateBudget:
+    """
+    Requests-per-minute and tokens-per-minute budget for asyncio tasks.
+
+    Each limit is a token bucket that holds up to one minute's budget and
+    refills at limit / 60 per second. acquire() waits until both buckets
+    hold enough for the request, then takes it; waiting tasks are served
+    in order, so a large request is not starved by smaller ones.
+
+    Attributes:
+        requests_per_minute (Optional[int]): Request budget (None: unlimited)
+        tokens_per_minute (Optional[int]): Token budget (None: unlimited)
+        waited (float): Total seconds tasks have waited
+
+    Example:
+        budget = RateBudget(requests_per_minute=3000, tokens_per_minute=1_000_000)
+        await budget.acquire(tokens=12_000)
+        response = await client.embeddings.create(...)
+
+    Python Learning Notes:
+        - asyncio.Lock is created lazily so it binds to the running loop
+        - Holding the lock while sleeping makes later tasks queue behind
+          the first one that has to wait
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+    ):
+        """
+        Args:
+            requests_per_minute: Request budget (None for unlimited)
+            tokens_per_minute: Token budget (None for unlimited)
+
+        Raises:
+            ValueError: If a budget is less than 1
+        """
+        for name, limit in (
+            ("requests_per_minute", requests_per_minute),
+            ("tokens_per_minute", tokens_per_minute),
+        ):
+            if limit is not None and limit < 1:
+                raise ValueError(f"{name} must be at least 1, got {limit}")
+
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.waited = 0.0
+        # Buckets start full, so the first minute's budget is available at once
+        self._requests = float(requests_per_minute or 0)
+        self._tokens = float(tokens_per_minute or 0)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """Lock that queues tasks waiting for budget."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """
+        Wait until the budget has room for one request of the given size.
+
+        A request larger than the whole token budget waits for a full
+        bucket and then takes all of it.
+
+        Args:
+            tokens: Tokens the request will use
+        """
+        if self.requests_per_minute is None and self.tokens_per_minute is None:
+            return
+
+        async with self.lock:
+            while True:
+                delay = self._take(tokens)
+                if delay <= 0:
+                    return
+                self.waited += delay
+                await asyncio.sleep(delay)
+
+    def _take(self, tokens: int) -> float:
+        """Take one request's budget, or return the seconds until it fits."""
+        now = time.monotonic()
+        elapsed, self._updated = now - self._updated, now
+
+        delay = 0.0
+        if self.requests_per_minute is not None:
+            rate = self.requests_per_minute / 60.0
+            self._requests = min(
+                self.requests_per_minute, self._requests + elapsed * rate
+            )
+            delay = max(delay, (1 - self._requests) / rate)
+        if self.tokens_per_minute is not None:
+            rate = self.tokens_per_minute / 60.0
+            self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * rate)
+            needed = min(tokens, self.tokens_per_minute)
+            delay = max(delay, (needed - self._tokens) / rate)
+
+        if delay <= 0:
+            if self.requests_per_minute is not None:
+                self._requests -= 1
+            if self.tokens_per_minute is not None:
+                self._tokens -= min(tokens, self.tokens_per_minute)
+        return delay
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    """Integer value of a header, or None if missing or malformed."""
+    try:
+        return int(headers.get(name))
+    except (TypeError, ValueError):
+        return None
+
+
+# Shared by every synchronous OpenAI request in the process
+openai_budget = ConcurrencyBudget()
+
+# Paces synchronous OpenAI embedding requests by the account's rate limits
+openai_rate_limits = RateLimitPacer()
@@ -12,6 +12,8 @@ The module focuses on:
     - Estimated time to completion (ETA) calculations
     - Human-readable duration formatting
     - Statistical analysis of processing times
+    - One combined progress line for operations running side by side
+    - Per-document stage timings (StageTimer)
 
 Python Learning Notes:
     - Performance monitoring helps identify bottlenecks
@@ -20,8 +22,10 @@ Python Learning Notes:
     - Time tracking enables capacity planning
 """
 
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 class PerformanceMonitor:
@@ -39,6 +43,11 @@ class PerformanceMonitor:
         - Individual operation timing statistics
         - Progress visualization with ETA
 
+    A monitor may be shared by worker threads: recording, statistics and
+    progress output are serialized by an internal lock. A monitor attached
+    to a CombinedProgress reports its progress there instead of printing
+    its own bar.
+
     Attributes:
         start_time (float): Unix timestamp when monitoring started
         documents_processed (int): Count of successfully processed items
@@ -86,10 +95,12 @@ class PerformanceMonitor:
             - None is Python's null value
             - Lists store ordered collections of items
         """
+        self._lock = threading.Lock()
         self.start_time: Optional[float] = None
         self.documents_processed: int = 0
         self.documents_failed: int = 0
         self.processing_times: List[float] = []
+        self.progress_display: Optional["CombinedProgress"] = None
 
     def start(self) -> None:
         """
@@ -109,10 +120,11 @@ class PerformanceMonitor:
             - time.time() gives current time as float seconds
             - Resetting state ensures clean metrics
         """
-        self.start_time = time.time()
-        self.documents_processed = 0
-        self.documents_failed = 0
-        self.processing_times = []
+        with self._lock:
+            self.start_time = time.time()
+            self.documents_processed = 0
+            self.documents_failed = 0
+            self.processing_times = []
 
     def record_document(
         self, processing_time_ms: Optional[float] = None, failed: bool = False
@@ -149,13 +161,15 @@ class PerformanceMonitor:
             - Boolean flags control conditional logic
             - append() adds items to end of list
             - += increments counter variables
+            - += is not atomic across threads, hence the lock
         """
-        if failed:
-            self.documents_failed += 1
-        else:
-            self.documents_processed += 1
-            if processing_time_ms:
-                self.processing_times.append(processing_time_ms)
+        with self._lock:
+            if failed:
+                self.documents_failed += 1
+            else:
+                self.documents_processed += 1
+                if processing_time_ms:
+                    self.processing_times.append(processing_time_ms)
 
     def get_statistics(self, total_documents: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -201,6 +215,11 @@ class PerformanceMonitor:
             - Division by zero checks prevent crashes
             - f-strings format numbers with precision
         """
+        with self._lock:
+            return self._get_statistics_locked(total_documents)
+
+    def _get_statistics_locked(self, total_documents: Optional[int]) -> Dict[str, Any]:
+        """Compute get_statistics() while the caller holds the lock."""
         if not self.start_time:
             return {"error": "Monitor not started"}
 
@@ -279,12 +298,23 @@ class PerformanceMonitor:
         if total == 0:
             return
 
+        with self._lock:
+            if self.progress_display is None:
+                self._print_progress_locked(current, total, prefix)
+                return
+            eta_seconds = self._get_statistics_locked(total).get("eta_seconds")
+
+        # Outside our lock: the display locks itself
+        self.progress_display.update(self, current, total, eta_seconds)
+
+    def _print_progress_locked(self, current: int, total: int, prefix: str) -> None:
+        """Draw the progress bar while the caller holds the lock."""
         percent = current / total * 100
         bar_length = 50
         filled = int(bar_length * current / total)
         bar = "█" * filled + "░" * (bar_length - filled)
 
-        stats = self.get_statistics(total)
+        stats = self._get_statistics_locked(total)
         eta = stats.get("eta_formatted", "calculating...")
 
         # Use carriage return to overwrite the same line
@@ -297,7 +327,8 @@ class PerformanceMonitor:
         if current >= total:
             print()  # New line when complete
 
-    def _format_duration(self, seconds: float) -> str:
+    @staticmethod
+    def _format_duration(seconds: float) -> str:
         """
         Format duration in seconds to human-readable string.
 
@@ -335,6 +366,154 @@ class PerformanceMonitor:
             return f"{hours}h {minutes}m"
 
 
+class CombinedProgress:
+    """
+    A single progress line for several operations running concurrently.
+
+    Each attached PerformanceMonitor reports here instead of drawing its
+    own bar, which would overwrite the others' on the same terminal line.
+    The line shows every operation's count and ETA, and an overall ETA:
+    the longest of them, since the operations run side by side.
+
+    Example:
+        display = CombinedProgress()
+        display.attach("SCOTUS", scotus_ingester.performance_monitor)
+        display.attach("EO", eo_ingester.performance_monitor)
+        # ... run both ingesters in threads ...
+        # Output: SCOTUS 120/400 ETA 5m 2s | EO 30/90 ETA 1m 0s | All 150/490 ETA 5m 2s
+
+    Python Learning Notes:
+        - Dictionaries keep insertion order, so operations are shown in
+          the order they were attached
+    """
+
+    def __init__(self):
+        """Initialize a display with no operations attached."""
+        self._lock = threading.Lock()
+        self._names: Dict[int, str] = {}
+        self._progress: Dict[str, Tuple[int, int, Optional[float]]] = {}
+        self._finished = False
+
+    def attach(self, name: str, monitor: PerformanceMonitor) -> None:
+        """
+        Route a monitor's progress output to this display.
+
+        Args:
+            name (str): Label of the operation on the progress line
+            monitor (PerformanceMonitor): The operation's monitor
+        """
+        with self._lock:
+            self._names[id(monitor)] = name
+            self._progress[name] = (0, 0, None)
+        monitor.progress_display = self
+
+    def update(
+        self,
+        monitor: PerformanceMonitor,
+        current: int,
+        total: int,
+        eta_seconds: Optional[float],
+    ) -> None:
+        """
+        Record an operation's progress and redraw the line.
+
+        Args:
+            monitor (PerformanceMonitor): The attached monitor reporting
+            current (int): Items processed so far
+            total (int): Items to process
+            eta_seconds (Optional[float]): The operation's own ETA, if known
+        """
+        with self._lock:
+            self._progress[self._names[id(monitor)]] = (current, total, eta_seconds)
+            print("\r" + self._render_locked(), end="", flush=True)
+
+            done = all(t and c >= t for c, t, _ in self._progress.values())
+            if done and not self._finished:
+                print()  # New line when every operation is complete
+            self._finished = done
+
+    def _render_locked(self) -> str:
+        parts = []
+        etas = []
+        for name, (current, total, eta) in self._progress.items():
+            if total and current >= total:
+                parts.append(f"{name} {current}/{total} done")
+                continue
+            parts.append(f"{name} {current}/{total} ETA {self._format_eta(eta)}")
+            etas.append(eta)
+
+        current = sum(c for c, _, _ in self._progress.values())
+        total = sum(t for _, t, _ in self._progress.values())
+        overall = None if None in etas else max(etas, default=0.0)
+        parts.append(f"All {current}/{total} ETA {self._format_eta(overall)}")
+        return " | ".join(parts)
+
+    @staticmethod
+    def _format_eta(eta_seconds: Optional[float]) -> str:
+        if eta_seconds is None:
+            return "calculating..."
+        return PerformanceMonitor._format_duration(eta_seconds)
+
+
+class StageTimer:
+    """
+    Time spent by one document in each ingestion stage, and the tokens it used.
+
+    Stages are timed with stage() blocks, or with lap(), which charges the
+    time since the timer was created (or since the last lap or stage) to a
+    stage whose start the caller does not see. Time a stage shares with
+    other documents, such as a packed embeddings request, is added with
+    add().
+
+    Attributes:
+        stage_ms (Dict[str, float]): Milliseconds per stage name
+        tokens (Dict[str, int]): Token counts by name
+
+    Example:
+        timer = StageTimer()
+        document = fetch(doc_id)
+        timer.lap("fetch")
+        with timer.stage("chunk"):
+            chunks = chunk(document)
+        timer.add_tokens("embedding_tokens", 812)
+        progress_tracker.record_timings(doc_id, timer.stage_ms, timer.tokens)
+
+    Python Learning Notes:
+        - time.perf_counter() is a monotonic clock meant for measuring
+          intervals; time.time() can jump when the system clock is set
+    """
+
+    def __init__(self):
+        """Start timing; the first lap() is measured from here."""
+        self.stage_ms: Dict[str, float] = {}
+        self.tokens: Dict[str, int] = {}
+        self._mark = time.perf_counter()
+
+    def add(self, stage: str, milliseconds: float) -> None:
+        """Add time to a stage."""
+        self.stage_ms[stage] = self.stage_ms.get(stage, 0.0) + milliseconds
+
+    def add_tokens(self, name: str, count: int) -> None:
+        """Add to a token count."""
+        self.tokens[name] = self.tokens.get(name, 0) + count
+
+    def lap(self, stage: str) -> None:
+        """Charge the time since the last lap or stage (or creation) to stage."""
+        now = time.perf_counter()
+        self.add(stage, (now - self._mark) * 1000)
+        self._mark = now
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as (part of) a stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._mark = time.perf_counter()
+            self.add(stage, (self._mark - start) * 1000)
+
+
 def setup_logging(verbose: bool = False) -> None:
     """
     Configure logging for ingestion scripts.
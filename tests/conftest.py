@@ -397,7 +397,10 @@ def reset_singletons():
     """
     # Reset any singleton instances or global state
     # This will be expanded as needed when singletons are identified
-    pass
+    from governmentreporter.apis.rate_limit import reset_rate_limiters
+
+    # Per-host rate limiters are process-wide; start every test with full buckets
+    reset_rate_limiters()
 
 
 # Markers for test categorization
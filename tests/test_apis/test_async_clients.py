@@ -0,0 +1,268 @@
+"""
+Unit tests for the asyncio API clients.
+
+Requests are served by httpx.MockTransport so the tests exercise the real
+AsyncClient, semaphore and retry code paths without touching the network.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from governmentreporter.apis.base import AsyncGovernmentAPIClient, Document
+from governmentreporter.apis.court_listener import AsyncCourtListenerClient
+from governmentreporter.apis.federal_register import AsyncFederalRegisterClient
+from governmentreporter.apis.rate_limit import TokenBucket
+
+
+def _install_transport(client, handler):
+    """Point the client's pooled AsyncClient at a mock transport."""
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client.rate_limiter = TokenBucket(rate=1_000_000, capacity=1_000_000)
+
+
+class TestAsyncGovernmentAPIClient:
+    """Tests for the shared async base class behavior."""
+
+    @pytest.mark.asyncio
+    async def test_semaphore_bounds_in_flight_requests(self):
+        """No more than max_concurrency requests run at the same time."""
+        client = AsyncFederalRegisterClient(max_concurrency=3)
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={})
+
+        _install_transport(client, handler)
+        async with client:
+            await asyncio.gather(
+                *(client._get(f"https://example.test/{i}") for i in range(12))
+            )
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_spaces_request_starts(self):
+        """Once the burst is spent, request starts follow the refill rate."""
+        client = AsyncFederalRegisterClient(max_concurrency=5)
+        starts = []
+
+        async def handler(request):
+            starts.append(asyncio.get_running_loop().time())
+            return httpx.Response(200, json={})
+
+        _install_transport(client, handler)
+        client.rate_limiter = TokenBucket(rate=50, capacity=1)
+        async with client:
+            await asyncio.gather(
+                *(client._get(f"https://example.test/{i}") for i in range(4))
+            )
+
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert all(gap >= 0.015 for gap in gaps)
+
+    @pytest.mark.asyncio
+    async def test_aclose_releases_client(self):
+        """aclose() closes the pooled client and allows a fresh one later."""
+        client = AsyncFederalRegisterClient()
+        http_client = client.http_client
+        assert isinstance(http_client, httpx.AsyncClient)
+        assert client.http_client is http_client
+
+        await client.aclose()
+        assert http_client.is_closed
+        assert client._http_client is None
+
+    def test_is_abstract(self):
+        """The base class cannot be instantiated directly."""
+        with pytest.raises(TypeError):
+            AsyncGovernmentAPIClient()
+
+    def test_validate_date_format_shared(self):
+        """Date validation is inherited from the sync implementation."""
+        client = AsyncFederalRegisterClient()
+        client.validate_date_format("2024-01-15")
+        with pytest.raises(ValueError):
+            client.validate_date_format("2024/01/15")
+
+
+class TestAsyncCourtListenerClient:
+    """Tests for AsyncCourtListenerClient."""
+
+    @pytest.mark.asyncio
+    async def test_get_documents_preserves_order_and_uses_cluster_cache(self):
+        """Opinions are fetched concurrently and returned in input order."""
+        client = AsyncCourtListenerClient(token="test-token")
+        requested = []
+
+        async def handler(request):
+            requested.append(request.url.path)
+            assert request.headers["Authorization"] == "Token test-token"
+            opinion_id = int(request.url.path.rstrip("/").split("/")[-1])
+            # Make earlier IDs respond later to scramble completion order
+            await asyncio.sleep(0.001 * (5 - opinion_id))
+            return httpx.Response(
+                200,
+                json={
+                    "id": opinion_id,
+                    "html_with_citations": f"<p>Opinion {opinion_id}</p>",
+                    "download_url": f"https://example.test/{opinion_id}.pdf",
+                },
+            )
+
+        _install_transport(client, handler)
+        cache = {
+            str(i): {"case_name": f"Case {i}", "date_filed": "2024-06-0" + str(i)}
+            for i in range(1, 5)
+        }
+        async with client:
+            docs = await client.get_documents(["1", "2", "3", "4"], cache)
+
+        assert [d.id for d in docs] == ["1", "2", "3", "4"]
+        assert docs[0].title == "Case 1"
+        assert docs[0].date == "2024-06-01"
+        assert docs[0].content == "Opinion 1"
+        assert docs[0].type == "Supreme Court Opinion"
+        # Cluster data was supplied, so only opinion endpoints were hit
+        assert all("/opinions/" in path for path in requested)
+
+    @pytest.mark.asyncio
+    async def test_get_document_fetches_cluster_when_missing(self):
+        """Without cluster data, the cluster URL from the opinion is fetched."""
+        client = AsyncCourtListenerClient(token="test-token")
+        cluster_url = "https://www.courtlistener.com/api/rest/v4/clusters/99/"
+
+        async def handler(request):
+            if "/clusters/" in request.url.path:
+                return httpx.Response(
+                    200,
+                    json={"case_name": "Roe v. Wade", "date_filed": "1973-01-22"},
+                )
+            return httpx.Response(
+                200,
+                json={"id": 7, "html_with_citations": "", "cluster": cluster_url},
+            )
+
+        _install_transport(client, handler)
+        async with client:
+            doc = await client.get_document("7")
+
+        assert isinstance(doc, Document)
+        assert doc.title == "Roe v. Wade"
+        assert doc.metadata["date_filed"] == "1973-01-22"
+
+    @pytest.mark.asyncio
+    async def test_list_scotus_clusters_paginates_and_retries(self):
+        """Clusters stream across pages and 503s are retried."""
+        client = AsyncCourtListenerClient(token="test-token")
+        calls = {"count": 0}
+
+        async def handler(request):
+            calls["count"] += 1
+            if calls["count"] == 1:
+                return httpx.Response(503)
+            if "cursor=2" in str(request.url):
+                return httpx.Response(200, json={"results": [{"id": 3}], "next": None})
+            assert request.url.params["docket__court"] == "scotus"
+            return httpx.Response(
+                200,
+                json={
+                    "results": [{"id": 1}, {"id": 2}],
+                    "next": "https://www.courtlistener.com/api/rest/v4/clusters/?cursor=2",
+                },
+            )
+
+        _install_transport(client, handler)
+        async with client:
+            clusters = [
+                c
+                async for c in client.list_scotus_clusters(
+                    "2024-01-01", "2024-12-31", retry_delay=0
+                )
+            ]
+
+        assert [c["id"] for c in clusters] == [1, 2, 3]
+        assert calls["count"] == 3
+
+
+class TestAsyncFederalRegisterClient:
+    """Tests for AsyncFederalRegisterClient."""
+
+    @pytest.mark.asyncio
+    async def test_get_document_cleans_raw_text(self):
+        """Metadata and cleaned raw text are combined into a Document."""
+        client = AsyncFederalRegisterClient()
+
+        async def handler(request):
+            if request.url.path.endswith(".txt"):
+                return httpx.Response(
+                    200, text="<html><pre>EXECUTIVE ORDER &amp; TEXT</pre></html>"
+                )
+            return httpx.Response(
+                200,
+                json={
+                    "title": "Test Order",
+                    "signing_date": "2024-01-15",
+                    "raw_text_url": "https://example.test/raw.txt",
+                    "agencies": [{"name": "Executive Office of the President"}],
+                },
+            )
+
+        _install_transport(client, handler)
+        async with client:
+            doc = await client.get_document("2024-01234")
+
+        assert doc.content == "EXECUTIVE ORDER & TEXT"
+        assert doc.date == "2024-01-15"
+        assert doc.metadata["agencies"] == ["Executive Office of the President"]
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_is_retried(self):
+        """429 responses are retried with backoff."""
+        client = AsyncFederalRegisterClient()
+        client.retry_delay = 0
+        attempts = {"count": 0}
+
+        async def handler(request):
+            attempts["count"] += 1
+            if attempts["count"] < 3:
+                return httpx.Response(429)
+            return httpx.Response(200, json={"title": "ok"})
+
+        _install_transport(client, handler)
+        async with client:
+            data = await client.get_executive_order("2024-01234")
+
+        assert data["title"] == "ok"
+        assert attempts["count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_list_executive_orders_paginates(self):
+        """Orders stream across pages until total_pages is reached."""
+        client = AsyncFederalRegisterClient()
+
+        async def handler(request):
+            page = int(request.url.params["page"])
+            return httpx.Response(
+                200,
+                json={
+                    "results": [{"document_number": f"doc-{page}"}],
+                    "total_pages": 2,
+                },
+            )
+
+        _install_transport(client, handler)
+        async with client:
+            orders = [
+                o
+                async for o in client.list_executive_orders("2024-01-01", "2024-12-31")
+            ]
+
+        assert [o["document_number"] for o in orders] == ["doc-1", "doc-2"]
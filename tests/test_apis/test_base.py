@@ -8,6 +8,7 @@ from abc import ABC
 from typing import Any, Dict, Optional
 from unittest.mock import MagicMock, Mock
 
+import httpx
 import pytest
 
 from governmentreporter.apis.base import Document, GovernmentAPIClient
@@ -227,6 +228,54 @@ class TestGovernmentAPIClient:
         assert "abstract" in str(exc_info.value).lower()
 
 
+class TestPooledHTTPClient:
+    """Test suite for the pooled HTTP client lifecycle on GovernmentAPIClient."""
+
+    def test_http_client_created_lazily_and_reused(self):
+        """Test the pooled client is created on first access and then reused."""
+        client = MockGovernmentAPIClient()
+        assert client._http_client is None
+
+        first = client.http_client
+        second = client.http_client
+
+        assert isinstance(first, httpx.Client)
+        assert first is second
+        client.close()
+
+    def test_pool_configuration(self):
+        """Test timeout and pool limits are taken from constructor arguments."""
+        client = MockGovernmentAPIClient()
+        custom = MockGovernmentAPIClient(
+            timeout=5.0, max_connections=3, max_keepalive_connections=2
+        )
+
+        assert client.timeout == GovernmentAPIClient.DEFAULT_TIMEOUT
+        assert custom.timeout == 5.0
+        assert custom.limits.max_connections == 3
+        assert custom.limits.max_keepalive_connections == 2
+
+    def test_close_releases_client(self):
+        """Test close() closes the pool and a new one is created on reuse."""
+        client = MockGovernmentAPIClient()
+        pooled = client.http_client
+
+        client.close()
+
+        assert pooled.is_closed
+        assert client._http_client is None
+        assert client.http_client is not pooled
+        client.close()
+
+    def test_context_manager_closes_client(self):
+        """Test using the client in a with block closes the pool on exit."""
+        with MockGovernmentAPIClient() as client:
+            pooled = client.http_client
+            assert not pooled.is_closed
+
+        assert pooled.is_closed
+
+
 class TestAPIClientIntegration:
     """Integration tests for API client usage patterns."""
 
@@ -0,0 +1,164 @@
+"""
+Unit tests for record/replay cassettes.
+
+Recording runs against an httpx.MockTransport; replay then runs with no
+network transport at all, so any request that escapes the cassette fails.
+"""
+
+import json
+
+import httpx
+import pytest
+
+from governmentreporter.apis.cassette import (
+    RECORD,
+    REPLAY,
+    AsyncCassetteTransport,
+    Cassette,
+    CassetteMissError,
+    CassetteTransport,
+)
+from governmentreporter.apis.court_listener import (
+    AsyncCourtListenerClient,
+    CourtListenerClient,
+)
+from governmentreporter.apis.http_cache import CachingTransport, HTTPCache
+
+OPINION_URL = "https://www.courtlistener.com/api/rest/v4/opinions/1/"
+
+
+def _server(requests):
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "application/json"},
+            json={"id": 1, "plain_text": "opinion text"},
+        )
+
+    return handler
+
+
+class TestCassette:
+    """Tests for Cassette storage."""
+
+    def test_invalid_mode(self, tmp_path):
+        with pytest.raises(ValueError):
+            Cassette(tmp_path, mode="rewind")
+
+    def test_replay_requires_existing_directory(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            Cassette(tmp_path / "missing", mode=REPLAY)
+
+    def test_record_then_replay(self, tmp_path):
+        """A recorded response replays byte-for-byte without the network."""
+        requests = []
+        recorder = httpx.Client(
+            transport=CassetteTransport(
+                Cassette(tmp_path, RECORD), httpx.MockTransport(_server(requests))
+            )
+        )
+        recorded = recorder.get(OPINION_URL, headers={"Authorization": "Token x"})
+
+        cassette = Cassette(tmp_path, REPLAY)
+        replayer = httpx.Client(transport=CassetteTransport(cassette))
+        replayed = replayer.get(OPINION_URL)
+
+        assert len(requests) == 1
+        assert replayed.status_code == 200
+        assert replayed.json() == recorded.json()
+        assert replayed.headers["Content-Type"] == "application/json"
+        assert cassette.stats()["replayed"] == 1
+
+    def test_request_headers_not_written(self, tmp_path):
+        """Credentials in request headers never reach the cassette."""
+        client = httpx.Client(
+            transport=CassetteTransport(
+                Cassette(tmp_path, RECORD), httpx.MockTransport(_server([]))
+            )
+        )
+        client.get(OPINION_URL, headers={"Authorization": "Token secret"})
+
+        (path,) = tmp_path.glob("*.json")
+        assert "secret" not in path.read_text()
+        assert json.loads(path.read_text())["request"]["url"] == OPINION_URL
+
+    def test_replay_miss_raises(self, tmp_path):
+        client = httpx.Client(transport=CassetteTransport(Cassette(tmp_path, REPLAY)))
+        with pytest.raises(CassetteMissError):
+            client.get(OPINION_URL)
+
+    @pytest.mark.asyncio
+    async def test_async_record_then_replay(self, tmp_path):
+        """The async transport reads and writes the same format."""
+        requests = []
+        handler = _server(requests)
+
+        async def async_handler(request):
+            return handler(request)
+
+        transport = AsyncCassetteTransport(
+            Cassette(tmp_path, RECORD), httpx.MockTransport(async_handler)
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get(OPINION_URL)
+
+        transport = AsyncCassetteTransport(Cassette(tmp_path, REPLAY))
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get(OPINION_URL)
+
+        assert response.json()["plain_text"] == "opinion text"
+        assert len(requests) == 1
+
+
+class TestClientIntegration:
+    """Tests for cassettes wired into the API clients."""
+
+    def test_replay_client_stack(self, tmp_path):
+        """A replaying client has no network transport and no rate limit."""
+        client = CourtListenerClient(token="t", cassette=Cassette(tmp_path, REPLAY))
+
+        transport = client.http_client._transport
+        assert isinstance(transport, CassetteTransport)
+        assert transport.transport is None
+        assert client.rate_limiter is not CourtListenerClient(token="t").rate_limiter
+        client.close()
+
+    def test_cassette_wraps_cache(self, tmp_path):
+        """With both enabled, the cassette records what the cache returns."""
+        cache = HTTPCache(tmp_path / "http")
+        client = CourtListenerClient(
+            token="t", http_cache=cache, cassette=Cassette(tmp_path / "tape", RECORD)
+        )
+
+        transport = client.http_client._transport
+        assert isinstance(transport, CassetteTransport)
+        assert isinstance(transport.transport, CachingTransport)
+        client.close()
+        cache.close()
+
+    def test_client_replays_recorded_run(self, tmp_path):
+        """get_document_text() works offline from a recording."""
+        Cassette(tmp_path, RECORD).save(
+            httpx.Request("GET", OPINION_URL),
+            200,
+            [("Content-Type", "application/json")],
+            b'{"id": 1, "plain_text": "opinion text"}',
+        )
+        client = CourtListenerClient(token="t", cassette=Cassette(tmp_path, REPLAY))
+
+        assert client.get_document_text("1") == "opinion text"
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_client_replays_recorded_run(self, tmp_path):
+        Cassette(tmp_path, RECORD).save(
+            httpx.Request("GET", OPINION_URL),
+            200,
+            [("Content-Type", "application/json")],
+            b'{"id": 1, "plain_text": "opinion text"}',
+        )
+        async with AsyncCourtListenerClient(
+            token="t", cassette=Cassette(tmp_path, REPLAY)
+        ) as client:
+            assert await client.get_document_text("1") == "opinion text"
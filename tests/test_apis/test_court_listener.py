@@ -175,6 +175,80 @@ class TestStripHtmlTags:
         assert "Paragraph one" in result
         assert "Paragraph two" in result
         # Should preserve some separation between paragraphs
+        assert "Paragraph one.\n\nParagraph two." in result
+
+    def test_strip_html_block_elements_become_paragraphs(self):
+        """
+        Test that headings and paragraphs are separated by blank lines.
+
+        Verifies that block elements produce paragraph breaks, <br> a line
+        break, and inline elements no break at all.
+        """
+        # Arrange
+        html = (
+            "<h2>Syllabus</h2><p>The <em>Court</em> held:</p>"
+            "<p>first line<br>second line</p>"
+        )
+
+        # Act
+        result = strip_html_tags(html)
+
+        # Assert
+        assert result == "Syllabus\n\nThe Court held:\n\nfirst line\nsecond line"
+
+    def test_strip_html_citation_inside_pre(self):
+        """
+        Test CourtListener's inline <pre> markup around linked citations.
+
+        The typeset text is split into separate <pre class="inline"> elements
+        around each citation; the sentence must be rejoined without extra
+        breaks or spaces, while the <pre> line breaks are kept.
+        """
+        # Arrange
+        html = (
+            '<pre class="inline">    subject only to a cap. </pre>'
+            '<span class="citation no-link">12 U. S. C. \u00a7 5497</span>'
+            '<pre class="inline">(a)(1).\n      In this case,\n\n\n  II\n</pre>'
+        )
+
+        # Act
+        result = strip_html_tags(html)
+
+        # Assert
+        assert result == (
+            "subject only to a cap. 12 U. S. C. \u00a7 5497(a)(1).\nIn this case,\n\nII"
+        )
+
+    def test_strip_html_keeps_escaped_markup(self):
+        """
+        Test that entities are decoded after tags are removed.
+
+        Escaped angle brackets are text, not tags, and must survive.
+        """
+        # Arrange
+        html = "<p>The statute uses &lt;brackets&gt; &amp; a &quot;quote&quot;.</p>"
+
+        # Act
+        result = strip_html_tags(html)
+
+        # Assert
+        assert result == 'The statute uses <brackets> & a "quote".'
+
+    def test_strip_html_skips_scripts_and_comments(self):
+        """
+        Test that script/style content and comments are dropped.
+        """
+        # Arrange
+        html = (
+            "<style>p { color: red; }</style><!-- <p>hidden</p> -->"
+            "<p>Visible</p><script>var x = '<p>';</script>"
+        )
+
+        # Act
+        result = strip_html_tags(html)
+
+        # Assert
+        assert result == "Visible"
 
 
 class TestCourtListenerClient:
@@ -443,7 +517,7 @@ class TestCourtListenerClient:
         """
         # Setup mock HTTP client
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         # Mock the opinion and cluster responses
         opinion_response = MagicMock()
@@ -490,7 +564,7 @@ class TestCourtListenerClient:
         Verifies proper error handling when document doesn't exist.
         """
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         # Mock 404 response
         mock_client_instance.get.side_effect = httpx.HTTPStatusError(
@@ -512,7 +586,7 @@ class TestCourtListenerClient:
         Verifies that get_document_text returns just the plain text content.
         """
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         opinion_response = MagicMock()
         opinion_response.json.return_value = mock_opinion_data
@@ -535,7 +609,7 @@ class TestCourtListenerClient:
         Verifies proper handling of opinions without text content.
         """
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         opinion_data_no_text = {"id": 123456, "plain_text": ""}
         opinion_response = MagicMock()
@@ -558,7 +632,7 @@ class TestCourtListenerClient:
         transforms results into Document objects.
         """
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         # Mock search response
         search_response = MagicMock()
@@ -598,7 +672,7 @@ class TestCourtListenerClient:
         Verifies that date parameters are correctly passed to the API.
         """
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         empty_results = {"count": 0, "results": []}
         search_response = MagicMock()
@@ -632,7 +706,7 @@ class TestCourtListenerClient:
         raw citation data.
         """
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         cluster_response = MagicMock()
         cluster_response.json.return_value = mock_cluster_data
@@ -655,7 +729,7 @@ class TestCourtListenerClient:
         Verifies proper error propagation for different HTTP status codes.
         """
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         # Test 401 Unauthorized
         mock_client_instance.get.side_effect = httpx.HTTPStatusError(
@@ -722,7 +796,7 @@ class TestCourtListenerClient:
         Verifies proper error handling for connection failures.
         """
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         # Simulate network error
         mock_client_instance.get.side_effect = httpx.ConnectError("Connection failed")
@@ -739,7 +813,7 @@ class TestCourtListenerClient:
         Verifies proper error handling for timeout scenarios.
         """
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         # Simulate timeout
         mock_client_instance.get.side_effect = httpx.TimeoutException(
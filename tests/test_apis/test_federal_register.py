@@ -278,7 +278,7 @@ class TestFederalRegisterClient:
         """
         # Setup mock HTTP client
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         # Mock metadata response
         metadata_response = MagicMock()
@@ -334,7 +334,7 @@ class TestFederalRegisterClient:
         Verifies proper error handling when document doesn't exist.
         """
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         mock_client_instance.get.side_effect = httpx.HTTPStatusError(
             "Not Found", request=MagicMock(), response=MagicMock(status_code=404)
@@ -360,7 +360,7 @@ class TestFederalRegisterClient:
         """
         # Setup mock HTTP client
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         # Mock metadata response (to get raw_text_url)
         metadata_response = MagicMock()
@@ -398,7 +398,7 @@ class TestFederalRegisterClient:
         """
         # Setup mock HTTP client
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         # Mock search response
         search_response = MagicMock()
@@ -435,7 +435,7 @@ class TestFederalRegisterClient:
         """
         # Setup mock HTTP client
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         empty_results = {"count": 0, "results": []}
         search_response = MagicMock()
@@ -466,7 +466,7 @@ class TestFederalRegisterClient:
         """
         # Setup mock HTTP client
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         significant_results = {
             "count": 1,
@@ -539,7 +539,7 @@ class TestFederalRegisterClient:
 
         # Setup mock HTTP client
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         response1 = MagicMock()
         response1.json.return_value = page1
@@ -568,7 +568,7 @@ class TestFederalRegisterClient:
         Verifies proper error propagation for connection failures.
         """
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         mock_client_instance.get.side_effect = httpx.ConnectError("Connection failed")
 
@@ -584,7 +584,7 @@ class TestFederalRegisterClient:
         Verifies proper error handling for timeout scenarios.
         """
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         mock_client_instance.get.side_effect = httpx.TimeoutException(
             "Request timed out"
@@ -601,7 +601,7 @@ class TestFederalRegisterClient:
         Verifies proper error handling for 5xx responses.
         """
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         mock_client_instance.get.side_effect = httpx.HTTPStatusError(
             "Internal Server Error",
@@ -643,7 +643,7 @@ class TestFederalRegisterClient:
         """
         # Setup mock HTTP client
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         metadata_response = MagicMock()
         metadata_response.json.return_value = mock_federal_rule_data
@@ -679,7 +679,7 @@ class TestFederalRegisterClient:
         """
         # Setup mock HTTP client
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         empty_results = {"count": 0, "results": []}
 
@@ -703,7 +703,7 @@ class TestFederalRegisterClient:
         """
         # Setup mock HTTP client
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         malformed_response = MagicMock()
         malformed_response.json.side_effect = json.JSONDecodeError(
@@ -734,7 +734,7 @@ class TestFederalRegisterClient:
 
         # Setup mock HTTP client
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         search_results = {"count": 1, "results": [partial_data]}
 
@@ -757,11 +757,12 @@ class TestFederalRegisterClient:
         """
         Test that rate limiting is properly applied.
 
-        Verifies that the client respects rate limits between requests.
+        Requests within the token bucket's burst go out immediately; once the
+        burst is spent the client waits for the bucket to refill.
         """
         # Setup mock HTTP client
         mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
+        mock_httpx_client.return_value = mock_client_instance
 
         # Setup mock responses
         response = MagicMock()
@@ -769,13 +770,104 @@ class TestFederalRegisterClient:
         response.raise_for_status = MagicMock()
         mock_client_instance.get.return_value = response
 
-        # Make multiple requests
-        client.search_documents("test1")
-        client.search_documents("test2")
+        # Idle budget is spent without sleeping
+        for i in range(int(client.rate_limiter.capacity)):
+            client.search_documents(f"test{i}")
+        mock_sleep.assert_not_called()
 
-        # Verify rate limiting delay was applied
-        # The client should sleep between consecutive requests
-        assert mock_sleep.call_count >= 1
-        # Verify the delay matches the configured rate limit
-        if mock_sleep.call_count > 0:
-            mock_sleep.assert_called_with(1.1)
+        # The next request has to wait for a token (at most one delay)
+        client.search_documents("one more")
+        assert mock_sleep.call_count == 1
+        assert 0 < mock_sleep.call_args[0][0] <= 1.1
+
+
+class TestListExecutiveOrdersPrefetch:
+    """Tests for concurrent page prefetch in list_executive_orders()."""
+
+    TOTAL_PAGES = 5
+
+    @pytest.fixture
+    def served_pages(self):
+        """Page numbers requested from the mock server."""
+        return []
+
+    @pytest.fixture
+    def requested_orders(self):
+        """Sort order requested with each page."""
+        return []
+
+    @pytest.fixture
+    def client(self, served_pages, requested_orders):
+        """Client whose transport serves TOTAL_PAGES pages of two orders each."""
+        import threading
+        import time as _time
+
+        from governmentreporter.apis.rate_limit import TokenBucket
+
+        lock = threading.Lock()
+
+        def handler(request):
+            page = int(request.url.params["page"])
+            with lock:
+                served_pages.append(page)
+                requested_orders.append(request.url.params.get("order"))
+            # Later pages answer faster, so completion order != page order
+            _time.sleep(0.01 * (self.TOTAL_PAGES - page))
+            return httpx.Response(
+                200,
+                json={
+                    "total_pages": self.TOTAL_PAGES,
+                    "results": [
+                        {"document_number": f"p{page}-{i}", "agencies": []}
+                        for i in range(2)
+                    ],
+                },
+            )
+
+        client = FederalRegisterClient()
+        client.rate_limiter = TokenBucket(rate=1_000_000, capacity=1_000_000)
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        yield client
+        client.close()
+
+    @staticmethod
+    def _numbers(orders):
+        return [order["document_number"] for order in orders]
+
+    def test_prefetch_preserves_order(self, client, served_pages):
+        """Concurrent fetching yields the same sequence as sequential paging."""
+        sequential = self._numbers(
+            client.list_executive_orders("2020-01-01", "2024-12-31")
+        )
+        served_pages.clear()
+
+        concurrent = self._numbers(
+            client.list_executive_orders(
+                "2020-01-01", "2024-12-31", max_concurrent_pages=4
+            )
+        )
+
+        assert concurrent == sequential
+        assert len(concurrent) == 2 * self.TOTAL_PAGES
+        assert sorted(served_pages) == list(range(1, self.TOTAL_PAGES + 1))
+
+    def test_every_page_requests_a_stable_sort(self, client, requested_orders):
+        """Pages fetched concurrently must be cut from one fixed ordering."""
+        list(
+            client.list_executive_orders(
+                "2020-01-01", "2024-12-31", max_concurrent_pages=4
+            )
+        )
+
+        assert requested_orders == ["oldest"] * self.TOTAL_PAGES
+
+    def test_prefetch_stops_at_max_results(self, client, served_pages):
+        """Reaching max_results stops scheduling further pages."""
+        orders = list(
+            client.list_executive_orders(
+                "2020-01-01", "2024-12-31", max_results=3, max_concurrent_pages=2
+            )
+        )
+
+        assert self._numbers(orders) == ["p1-0", "p1-1", "p2-0"]
+        assert len(served_pages) < self.TOTAL_PAGES
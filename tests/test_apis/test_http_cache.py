@@ -0,0 +1,225 @@
+"""
+Unit tests for the on-disk HTTP response cache.
+
+The caching transports wrap an httpx.MockTransport, so these tests cover real
+request/response handling, conditional revalidation and eviction against a
+temporary SQLite cache.
+"""
+
+import os
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from governmentreporter.apis.court_listener import (
+    AsyncCourtListenerClient,
+    CourtListenerClient,
+)
+from governmentreporter.apis.http_cache import (
+    AsyncCachingTransport,
+    CachingTransport,
+    HTTPCache,
+)
+
+OPINION_URL = "https://www.courtlistener.com/api/rest/v4/opinions/1/"
+LIST_URL = "https://www.courtlistener.com/api/rest/v4/clusters/?page=1"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Fresh cache in a temporary directory."""
+    cache = HTTPCache(tmp_path / "http")
+    yield cache
+    cache.close()
+
+
+class ETagServer:
+    """Mock server that honors If-None-Match for a fixed ETag."""
+
+    def __init__(self, body=b'{"id": 1}', etag='"v1"'):
+        self.body = body
+        self.etag = etag
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if self.etag and request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        headers = {"Content-Type": "application/json"}
+        if self.etag:
+            headers["ETag"] = self.etag
+        return httpx.Response(200, headers=headers, content=self.body)
+
+
+def _client(cache, server, patterns=(r"/opinions/\d+/",)):
+    transport = CachingTransport(httpx.MockTransport(server), cache, patterns)
+    return httpx.Client(transport=transport)
+
+
+class TestHTTPCache:
+    """Tests for HTTPCache storage."""
+
+    def test_construction_touches_no_files(self, tmp_path):
+        """The cache directory is only created on first use."""
+        HTTPCache(tmp_path / "lazy")
+        assert not (tmp_path / "lazy").exists()
+
+    def test_put_get_roundtrip(self, cache):
+        """Stored responses round-trip with validators and headers."""
+        cache.put(
+            "GET", OPINION_URL, 200, [("ETag", '"abc"'), ("X-Test", "1")], b"body"
+        )
+
+        entry = cache.get("GET", OPINION_URL)
+
+        assert entry.content == b"body"
+        assert entry.etag == '"abc"'
+        assert ["X-Test", "1"] in entry.headers
+        assert cache.get("GET", OPINION_URL + "?other") is None
+
+    def test_identical_bodies_stored_once(self, cache):
+        """Bodies are content-addressed, so duplicates share storage."""
+        cache.put("GET", "https://a.test/1", 200, [], b"same body" * 100)
+        size_one = cache.total_size()
+        cache.put("GET", "https://a.test/2", 200, [], b"same body" * 100)
+
+        assert cache.total_size() == size_one
+        assert cache.stats()["entries"] == 2
+
+    def test_lru_eviction(self, tmp_path):
+        """Least recently used entries are evicted past max_size_bytes."""
+        cache = HTTPCache(tmp_path / "small", max_size_bytes=3500)
+        for i in range(3):
+            # Random bytes do not compress, so each body is ~1000 bytes
+            cache.put("GET", f"https://a.test/{i}", 200, [], os.urandom(1000))
+        cache.get("GET", "https://a.test/0")  # Mark 0 as recently used
+
+        cache.put("GET", "https://a.test/3", 200, [], os.urandom(1000))
+
+        assert cache.get("GET", "https://a.test/0") is not None
+        assert cache.get("GET", "https://a.test/1") is None
+        assert cache.total_size() <= 3500
+        assert cache.stats()["evictions"] >= 1
+        cache.close()
+
+
+class TestCachingTransport:
+    """Tests for the sync caching transport."""
+
+    def test_revalidates_with_if_none_match(self, cache):
+        """A cached entry with an ETag turns the refetch into a 304."""
+        server = ETagServer()
+        with _client(cache, server) as client:
+            first = client.get(OPINION_URL)
+            second = client.get(OPINION_URL)
+
+        assert first.json() == {"id": 1}
+        assert second.status_code == 200
+        assert second.json() == {"id": 1}
+        assert server.requests[1].headers["If-None-Match"] == '"v1"'
+        assert cache.stats()["revalidated"] == 1
+
+    def test_entries_without_validators_served_locally(self, cache):
+        """Without ETag/Last-Modified the entry is served with no request."""
+        server = ETagServer(etag=None)
+        with _client(cache, server) as client:
+            client.get(OPINION_URL)
+            response = client.get(OPINION_URL)
+
+        assert response.json() == {"id": 1}
+        assert len(server.requests) == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_max_age_expires_unvalidated_entries(self, tmp_path):
+        """max_age bounds how long validator-less entries are trusted."""
+        cache = HTTPCache(tmp_path / "aged", max_age=0)
+        server = ETagServer(etag=None)
+        with _client(cache, server) as client:
+            client.get(OPINION_URL)
+            client.get(OPINION_URL)
+
+        assert len(server.requests) == 2
+        cache.close()
+
+    def test_non_cacheable_urls_pass_through(self, cache):
+        """Listing endpoints are never cached."""
+        server = ETagServer(etag=None)
+        with _client(cache, server) as client:
+            client.get(LIST_URL)
+            client.get(LIST_URL)
+
+        assert len(server.requests) == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_error_responses_not_stored(self, cache):
+        """Only 200 responses are cached."""
+
+        def server(request):
+            return httpx.Response(500)
+
+        with _client(cache, server) as client:
+            assert client.get(OPINION_URL).status_code == 500
+
+        assert cache.stats()["entries"] == 0
+
+    def test_api_client_uses_cache(self, cache):
+        """CourtListenerClient routes opinion requests through the cache."""
+        server = ETagServer(body=b'{"id": 1, "plain_text": "text"}')
+        client = CourtListenerClient(token="t", http_cache=cache)
+        transport = CachingTransport(
+            httpx.MockTransport(server), cache, client.CACHEABLE_URL_PATTERNS
+        )
+        client._http_client = httpx.Client(transport=transport)
+
+        assert client.get_document_text("1") == "text"
+        assert client.get_document_text("1") == "text"
+        assert cache.stats()["revalidated"] == 1
+        client.close()
+
+    def test_cache_hits_skip_the_rate_limiter(self, cache):
+        """Responses served from the cache do not wait for a rate-limit token."""
+        server = ETagServer(body=b'{"id": 1, "plain_text": "text"}', etag=None)
+        client = CourtListenerClient(token="t", http_cache=cache)
+        transport = CachingTransport(
+            httpx.MockTransport(server), cache, client.CACHEABLE_URL_PATTERNS
+        )
+        client._http_client = httpx.Client(transport=transport)
+        client.rate_limiter = MagicMock()
+
+        assert client.get_document_text("1") == "text"
+        assert client.get_document_text("1") == "text"
+
+        assert len(server.requests) == 1
+        assert client.rate_limiter.acquire.call_count == 1
+        client.close()
+
+    def test_pooled_client_wraps_transport(self, cache):
+        """With http_cache set, the pooled client is built on CachingTransport."""
+        client = CourtListenerClient(token="t", http_cache=cache)
+        assert isinstance(client.http_client._transport, CachingTransport)
+        client.close()
+
+
+class TestAsyncCachingTransport:
+    """Tests for the async caching transport."""
+
+    @pytest.mark.asyncio
+    async def test_async_revalidation(self, cache):
+        """The async transport shares the same cache and policy."""
+        server = ETagServer()
+
+        async def handler(request):
+            return server(request)
+
+        transport = AsyncCachingTransport(
+            httpx.MockTransport(handler),
+            cache,
+            AsyncCourtListenerClient.CACHEABLE_URL_PATTERNS,
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get(OPINION_URL)
+            response = await client.get(OPINION_URL)
+
+        assert response.json() == {"id": 1}
+        assert cache.stats()["revalidated"] == 1
@@ -0,0 +1,190 @@
+"""
+Unit tests for the per-host token-bucket rate limiter.
+
+A fake monotonic clock drives the bucket so the tests are deterministic and
+never actually sleep.
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from governmentreporter.apis import rate_limit
+from governmentreporter.apis.court_listener import (
+    AsyncCourtListenerClient,
+    CourtListenerClient,
+)
+from governmentreporter.apis.rate_limit import (
+    TokenBucket,
+    get_rate_limiter,
+    get_rate_limiter_metrics,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    """Monotonic clock whose sleep() simply advances time."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Install a fake clock into the rate_limit module."""
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(rate_limit.time, "sleep", fake.sleep)
+    return fake
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket accounting."""
+
+    def test_idle_budget_spent_without_waiting(self, clock):
+        """A full bucket admits `capacity` requests immediately."""
+        bucket = TokenBucket(rate=1.0, capacity=3)
+
+        waits = [bucket.acquire() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+        assert clock.sleeps == []
+
+    def test_waits_for_refill_when_empty(self, clock):
+        """Once empty, callers wait exactly until the next token refills."""
+        bucket = TokenBucket(rate=2.0, capacity=1)
+        bucket.acquire()
+
+        wait = bucket.acquire()
+
+        assert wait == pytest.approx(0.5)
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    def test_idle_time_refills_bucket(self, clock):
+        """Time spent idle restores tokens up to capacity."""
+        bucket = TokenBucket(rate=1.0, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+
+        clock.now += 10  # Long idle period; capped at capacity
+        assert bucket.tokens == pytest.approx(2.0)
+
+    def test_penalize_blocks_and_halves_rate(self, clock):
+        """A 429 with Retry-After blocks the bucket and slows it down."""
+        bucket = TokenBucket(rate=4.0, capacity=4)
+
+        bucket.penalize(retry_after=3.0)
+
+        assert bucket.rate == pytest.approx(2.0)
+        assert bucket.wait_time == pytest.approx(3.0 + 1 / 2.0)
+        assert bucket.acquire() == pytest.approx(3.5)
+
+    def test_success_recovers_rate(self, clock):
+        """Successful responses gradually restore the configured rate."""
+        bucket = TokenBucket(rate=10.0, capacity=1)
+        bucket.penalize()
+        assert bucket.rate == pytest.approx(5.0)
+
+        for _ in range(20):
+            bucket.record_success()
+
+        assert bucket.rate == pytest.approx(10.0)
+
+    def test_observe_uses_retry_after_header(self, clock):
+        """observe() penalizes on 429 and reads Retry-After."""
+        bucket = TokenBucket(rate=1.0, capacity=1)
+        response = MagicMock(status_code=429, headers={"Retry-After": "7"})
+
+        bucket.observe(response)
+
+        assert bucket.metrics()["throttled"] == 1
+        assert bucket.wait_time == pytest.approx(7.0 + 1 / 0.5)
+
+    def test_observe_ignores_non_http_objects(self, clock):
+        """Test doubles without an integer status code are ignored."""
+        bucket = TokenBucket(rate=1.0, capacity=1)
+        bucket.observe(MagicMock())
+        assert bucket.metrics()["throttled"] == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_async_shares_accounting(self, clock, monkeypatch):
+        """Async acquisition uses the same budget and sleeps via asyncio."""
+        slept = []
+
+        async def fake_sleep(seconds):
+            slept.append(seconds)
+
+        monkeypatch.setattr(rate_limit.asyncio, "sleep", fake_sleep)
+        bucket = TokenBucket(rate=1.0, capacity=1)
+
+        bucket.acquire()
+        wait = await bucket.acquire_async()
+
+        assert wait == pytest.approx(1.0)
+        assert slept == [pytest.approx(1.0)]
+
+    def test_metrics_snapshot(self, clock):
+        """Metrics report tokens, wait time and counters."""
+        bucket = TokenBucket(rate=1.0, capacity=2, name="example.test")
+        bucket.acquire()
+
+        metrics = bucket.metrics()
+
+        assert metrics["name"] == "example.test"
+        assert metrics["tokens"] == pytest.approx(1.0)
+        assert metrics["wait_time"] == 0.0
+        assert metrics["acquired"] == 1
+
+    def test_invalid_rate(self):
+        """A non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after()."""
+
+    def test_seconds(self):
+        assert parse_retry_after("120") == 120.0
+
+    def test_http_date(self):
+        future = datetime.now(timezone.utc) + timedelta(seconds=60)
+        seconds = parse_retry_after(format_datetime(future, usegmt=True))
+        assert 55 <= seconds <= 60
+
+    @pytest.mark.parametrize("value", [None, "", "soon", MagicMock()])
+    def test_unparseable(self, value):
+        assert parse_retry_after(value) is None
+
+
+class TestRegistry:
+    """Tests for the per-host limiter registry."""
+
+    def test_same_host_shares_bucket(self):
+        """Sync and async clients for one host draw from the same bucket."""
+        sync_client = CourtListenerClient(token="t")
+        async_client = AsyncCourtListenerClient(token="t")
+
+        assert sync_client.rate_limiter is async_client.rate_limiter
+        assert sync_client.rate_limiter.capacity == 10
+        assert sync_client.rate_limiter.base_rate == pytest.approx(10.0)
+
+    def test_metrics_by_host(self):
+        """get_rate_limiter_metrics() reports every registered host."""
+        get_rate_limiter("a.example.test", rate=1.0)
+        get_rate_limiter("b.example.test", rate=2.0)
+
+        metrics = get_rate_limiter_metrics()
+
+        assert set(metrics) == {"a.example.test", "b.example.test"}
+        assert metrics["b.example.test"]["base_rate"] == 2.0
@@ -10,6 +10,7 @@ Python Learning Notes:
     - Progress tracking enables resumable operations
 """
 
+import threading
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
@@ -17,6 +18,7 @@ import pytest
 from click.testing import CliRunner
 
 from governmentreporter.cli.ingest import ingest
+from governmentreporter.utils.concurrency import openai_budget
 
 
 @pytest.fixture
@@ -136,6 +138,70 @@ class TestIngestSCOTUSCommand:
         call_kwargs = mock_ingester_class.call_args[1]
         assert call_kwargs.get("batch_size") == 100
 
+    @patch("governmentreporter.utils.monitoring.setup_logging")
+    @patch("governmentreporter.ingestion.scotus.SCOTUSIngester")
+    def test_scotus_accepts_workers_option(
+        self, mock_ingester_class, mock_setup_logging, cli_runner
+    ):
+        """Test scotus passes --workers to the ingester (default 1)."""
+        args = ["scotus", "--start-date", "2024-01-01", "--end-date", "2024-12-31"]
+
+        cli_runner.invoke(ingest, args)
+        assert mock_ingester_class.call_args[1]["workers"] == 1
+
+        result = cli_runner.invoke(ingest, args + ["--workers", "8"])
+        assert result.exit_code == 0
+        assert mock_ingester_class.call_args[1]["workers"] == 8
+
+    @patch("governmentreporter.utils.monitoring.setup_logging")
+    @patch("governmentreporter.ingestion.scotus.SCOTUSIngester")
+    def test_scotus_pipeline_options(
+        self, mock_ingester_class, mock_setup_logging, cli_runner
+    ):
+        """Test --pipeline/--stage-workers set stage_workers (default None)."""
+        args = ["scotus", "--start-date", "2024-01-01", "--end-date", "2024-12-31"]
+
+        cli_runner.invoke(ingest, args)
+        assert mock_ingester_class.call_args[1]["stage_workers"] is None
+
+        cli_runner.invoke(ingest, args + ["--pipeline"])
+        assert mock_ingester_class.call_args[1]["stage_workers"]["extract"] == 4
+
+        result = cli_runner.invoke(ingest, args + ["--stage-workers", "extract=8"])
+        assert result.exit_code == 0
+        assert mock_ingester_class.call_args[1]["stage_workers"]["extract"] == 8
+
+        result = cli_runner.invoke(ingest, args + ["--stage-workers", "parse=2"])
+        assert result.exit_code == 1
+        assert "Unknown" in result.output or "Invalid" in result.output
+
+    @patch("governmentreporter.utils.monitoring.setup_logging")
+    @patch("governmentreporter.ingestion.scotus.SCOTUSIngester")
+    @patch("governmentreporter.ingestion.scotus.AsyncSCOTUSIngester")
+    def test_scotus_asyncio_options(
+        self, mock_async_class, mock_ingester_class, mock_setup_logging, cli_runner
+    ):
+        """Test --asyncio/--concurrency select the async ingester."""
+        args = ["scotus", "--start-date", "2024-01-01", "--end-date", "2024-12-31"]
+
+        result = cli_runner.invoke(
+            ingest, args + ["--asyncio", "--max-in-flight", "200"]
+        )
+        assert result.exit_code == 0
+        assert mock_async_class.call_args[1]["max_in_flight"] == 200
+        assert mock_async_class.call_args[1]["llm_concurrency"] == 16
+        assert mock_async_class.call_args[1]["discovery_db"].endswith(".discovery.db")
+        assert mock_async_class.call_args[1]["embedding_cache"] is not None
+        mock_ingester_class.assert_not_called()
+
+        result = cli_runner.invoke(ingest, args + ["--concurrency", "llm=32"])
+        assert result.exit_code == 0
+        assert mock_async_class.call_args[1]["llm_concurrency"] == 32
+
+        result = cli_runner.invoke(ingest, args + ["--asyncio", "--workers", "4"])
+        assert result.exit_code == 1
+        assert "cannot be combined" in result.output
+
     @patch("governmentreporter.utils.monitoring.setup_logging")
     @patch("governmentreporter.ingestion.scotus.SCOTUSIngester")
     def test_scotus_accepts_dry_run_flag(
@@ -179,6 +245,187 @@ class TestIngestSCOTUSCommand:
         # Should handle error (exit code or error message)
         assert result.exit_code != 0 or "error" in result.output.lower()
 
+    @patch("governmentreporter.utils.monitoring.setup_logging")
+    @patch("governmentreporter.ingestion.scotus.SCOTUSIngester")
+    def test_scotus_uses_http_cache_by_default(
+        self, mock_ingester_class, mock_setup_logging, cli_runner, tmp_path
+    ):
+        """Test scotus passes an HTTPCache rooted at --cache-dir."""
+        from governmentreporter.apis.http_cache import HTTPCache
+
+        result = cli_runner.invoke(
+            ingest,
+            [
+                "scotus",
+                "--start-date",
+                "2024-01-01",
+                "--end-date",
+                "2024-12-31",
+                "--cache-dir",
+                str(tmp_path / "cache"),
+            ],
+        )
+
+        http_cache = mock_ingester_class.call_args[1].get("http_cache")
+        assert isinstance(http_cache, HTTPCache)
+        assert http_cache.cache_dir == tmp_path / "cache"
+
+    @patch("governmentreporter.utils.monitoring.setup_logging")
+    @patch("governmentreporter.ingestion.scotus.SCOTUSIngester")
+    def test_scotus_no_cache_flag(
+        self, mock_ingester_class, mock_setup_logging, cli_runner
+    ):
+        """Test scotus --no-cache disables the HTTP cache."""
+        result = cli_runner.invoke(
+            ingest,
+            [
+                "scotus",
+                "--start-date",
+                "2024-01-01",
+                "--end-date",
+                "2024-12-31",
+                "--no-cache",
+            ],
+        )
+
+        assert mock_ingester_class.call_args[1].get("http_cache") is None
+
+    @patch("governmentreporter.utils.monitoring.setup_logging")
+    @patch("governmentreporter.ingestion.scotus.SCOTUSIngester")
+    def test_scotus_replay_option(
+        self, mock_ingester_class, mock_setup_logging, cli_runner, tmp_path
+    ):
+        """Test scotus --replay passes a replaying Cassette to the ingester."""
+        result = cli_runner.invoke(
+            ingest,
+            [
+                "scotus",
+                "--start-date",
+                "2024-01-01",
+                "--end-date",
+                "2024-12-31",
+                "--no-cache",
+                "--replay",
+                str(tmp_path),
+            ],
+        )
+
+        cassette = mock_ingester_class.call_args[1].get("cassette")
+        assert cassette.replaying
+        assert cassette.directory == tmp_path
+
+    @patch("governmentreporter.ingestion.scotus.SCOTUSIngester")
+    def test_scotus_record_and_replay_are_exclusive(
+        self, mock_ingester_class, cli_runner, tmp_path
+    ):
+        """Test --record and --replay cannot be combined."""
+        result = cli_runner.invoke(
+            ingest,
+            [
+                "scotus",
+                "--start-date",
+                "2024-01-01",
+                "--end-date",
+                "2024-12-31",
+                "--record",
+                str(tmp_path / "new"),
+                "--replay",
+                str(tmp_path),
+            ],
+        )
+
+        assert result.exit_code != 0
+        mock_ingester_class.assert_not_called()
+
+
+class TestIngestSCOTUSBulkCommand:
+    """Test SCOTUS bulk-dump ingestion command."""
+
+    @patch("governmentreporter.utils.monitoring.setup_logging")
+    @patch("governmentreporter.ingestion.courtlistener_bulk.CourtListenerBulkIngester")
+    def test_scotus_bulk_passes_dump_paths(
+        self, mock_ingester_class, mock_setup_logging, cli_runner, tmp_path
+    ):
+        """Test scotus-bulk passes dump paths and a full-history default range."""
+        paths = {}
+        for name in ("opinions", "clusters", "dockets"):
+            paths[name] = tmp_path / f"{name}.csv.bz2"
+            paths[name].write_bytes(b"")
+
+        result = cli_runner.invoke(
+            ingest,
+            [
+                "scotus-bulk",
+                "--opinions",
+                str(paths["opinions"]),
+                "--clusters",
+                str(paths["clusters"]),
+                "--dockets",
+                str(paths["dockets"]),
+            ],
+        )
+
+        assert result.exit_code == 0
+        call_kwargs = mock_ingester_class.call_args[1]
+        assert call_kwargs["opinions_path"] == str(paths["opinions"])
+        assert call_kwargs["citations_path"] is None
+        assert call_kwargs["start_date"] == "1789-01-01"
+        mock_ingester_class.return_value.run.assert_called_once()
+
+    def test_scotus_bulk_requires_existing_files(self, cli_runner, tmp_path):
+        """Test scotus-bulk rejects missing dump files."""
+        missing = str(tmp_path / "missing.csv.bz2")
+        result = cli_runner.invoke(
+            ingest,
+            [
+                "scotus-bulk",
+                "--opinions",
+                missing,
+                "--clusters",
+                missing,
+                "--dockets",
+                missing,
+            ],
+        )
+
+        assert result.exit_code != 0
+
+
+class TestIngestExecutiveOrdersBulkCommand:
+    """Test Executive Order bulk XML ingestion command."""
+
+    @patch("governmentreporter.utils.monitoring.setup_logging")
+    @patch(
+        "governmentreporter.ingestion.executive_orders_xml.ExecutiveOrderXMLIngester"
+    )
+    def test_eo_bulk_passes_xml_dir(
+        self, mock_ingester_class, mock_setup_logging, cli_runner, tmp_path
+    ):
+        """Test eo-bulk passes the XML directory and the bulk data default range."""
+        result = cli_runner.invoke(ingest, ["eo-bulk", "--xml-dir", str(tmp_path)])
+
+        assert result.exit_code == 0
+        call_kwargs = mock_ingester_class.call_args[1]
+        assert call_kwargs["xml_dir"] == str(tmp_path)
+        assert call_kwargs["start_date"] == "1994-01-01"
+        mock_ingester_class.return_value.run.assert_called_once()
+
+    def test_eo_bulk_rejects_zero_workers(self, cli_runner, tmp_path):
+        """Test --workers must be at least 1."""
+        result = cli_runner.invoke(
+            ingest, ["eo-bulk", "--xml-dir", str(tmp_path), "--workers", "0"]
+        )
+
+        assert result.exit_code != 0
+
+    def test_eo_bulk_requires_existing_directory(self, cli_runner, tmp_path):
+        """Test eo-bulk rejects a missing XML directory."""
+        result = cli_runner.invoke(
+            ingest, ["eo-bulk", "--xml-dir", str(tmp_path / "missing")]
+        )
+
+        assert result.exit_code != 0
+
 
 class TestIngestExecutiveOrdersCommand:
     """Test Executive Orders ingestion command."""
@@ -275,6 +522,77 @@ class TestIngestExecutiveOrdersCommand:
         assert call_kwargs.get("dry_run") is True
 
 
+class TestIngestAllCommand:
+    """Test ingesting SCOTUS opinions and Executive Orders together."""
+
+    @pytest.fixture(autouse=True)
+    def reset_openai_budget(self):
+        yield
+        openai_budget.set_limit(None)
+
+    @patch("governmentreporter.utils.monitoring.setup_logging")
+    @patch("governmentreporter.database.qdrant.QdrantDBClient")
+    @patch("governmentreporter.ingestion.executive_orders.ExecutiveOrderIngester")
+    @patch("governmentreporter.ingestion.scotus.SCOTUSIngester")
+    def test_concurrent_runs_both_at_once(
+        self, mock_scotus, mock_eo, mock_db, mock_setup_logging, cli_runner
+    ):
+        """Each ingester waits for the other, so a sequential run would hang."""
+        both_running = threading.Barrier(2, timeout=5)
+        for mock_class in (mock_scotus, mock_eo):
+            mock_class.return_value.run.side_effect = both_running.wait
+
+        result = cli_runner.invoke(
+            ingest,
+            [
+                "all",
+                "--start-date",
+                "2024-01-01",
+                "--end-date",
+                "2024-12-31",
+                "--concurrent",
+                "--openai-concurrency",
+                "3",
+                "--no-cache",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "ALL INGESTION COMPLETE" in result.output
+        assert openai_budget.limit == 3
+        assert (
+            mock_scotus.return_value.performance_monitor.progress_display
+            is mock_eo.return_value.performance_monitor.progress_display
+        )
+
+    @patch("governmentreporter.utils.monitoring.setup_logging")
+    @patch("governmentreporter.database.qdrant.QdrantDBClient")
+    @patch("governmentreporter.ingestion.executive_orders.ExecutiveOrderIngester")
+    @patch("governmentreporter.ingestion.scotus.SCOTUSIngester")
+    def test_concurrent_failure_does_not_stop_the_other(
+        self, mock_scotus, mock_eo, mock_db, mock_setup_logging, cli_runner
+    ):
+        mock_scotus.return_value.run.side_effect = RuntimeError("API down")
+
+        result = cli_runner.invoke(
+            ingest,
+            [
+                "all",
+                "--start-date",
+                "2024-01-01",
+                "--end-date",
+                "2024-12-31",
+                "--concurrent",
+                "--no-cache",
+            ],
+        )
+
+        assert result.exit_code == 1
+        mock_eo.return_value.run.assert_called_once()
+        assert "SCOTUS ingestion failed: API down" in result.output
+        assert "Executive Orders ingested successfully" in result.output
+
+
 class TestIngestCommandValidation:
     """Test input validation for ingest commands."""
 
@@ -25,7 +25,10 @@ from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
 
-from governmentreporter.database.ingestion import QdrantIngestionClient
+from governmentreporter.database.ingestion import (
+    AsyncQdrantIngestionClient,
+    QdrantIngestionClient,
+)
 from governmentreporter.database.qdrant import Document
 
 
@@ -1490,3 +1493,92 @@ class TestCollectionStatisticsAdvanced:
         # Second attempt should succeed
         stats2 = client.get_collection_stats()
         assert stats2["total_documents"] == 1500
+
+
+class TestAsyncQdrantIngestionClient:
+    """
+    Tests for AsyncQdrantIngestionClient against local on-disk storage.
+
+    Python Learning Notes:
+        - tmp_path gives each test its own directory, so local Qdrant
+          storage locks never collide between tests
+    """
+
+    @staticmethod
+    def _payloads(count):
+        return [
+            {
+                "id": f"doc_chunk_{i}",
+                "text": f"Chunk {i}",
+                "metadata": {"document_id": "doc", "chunk_index": i},
+            }
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_upsert_and_stats(self, tmp_path):
+        """Chunks are stored in sub-batches and counted in the stats."""
+        client = AsyncQdrantIngestionClient("test_async", str(tmp_path))
+        try:
+            await client.create_collection()
+            await client.create_collection()  # idempotent
+
+            successful, failed = await client.batch_upsert_documents(
+                self._payloads(5), [[0.1] * 1536] * 5, batch_size=2
+            )
+            stats = await client.get_collection_stats()
+        finally:
+            await client.close()
+
+        assert (successful, failed) == (5, 0)
+        assert stats["total_documents"] == 5
+        assert stats["vector_size"] == 1536
+
+    @pytest.mark.asyncio
+    async def test_invalid_embeddings_are_counted_as_failed(self, tmp_path):
+        """Wrong-dimension embeddings are skipped, the rest are stored."""
+        client = AsyncQdrantIngestionClient("test_async", str(tmp_path))
+        try:
+            await client.create_collection()
+            successful, failed = await client.batch_upsert_documents(
+                self._payloads(2), [[0.1] * 1536, [0.1] * 3]
+            )
+        finally:
+            await client.close()
+
+        assert (successful, failed) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_length_mismatch_raises(self, tmp_path):
+        """Payloads and embeddings must pair up."""
+        client = AsyncQdrantIngestionClient("test_async", str(tmp_path))
+        try:
+            with pytest.raises(ValueError, match="same length"):
+                await client.batch_upsert_documents(self._payloads(2), [[0.1] * 1536])
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_delete_stale_chunks_keeps_current_chunks(self, tmp_path):
+        """Only chunks at or beyond a document's new chunk count are deleted."""
+        other = [
+            {
+                "id": "other_chunk_4",
+                "text": "Other",
+                "metadata": {"document_id": "other", "chunk_index": 4},
+            }
+        ]
+        client = AsyncQdrantIngestionClient("test_async", str(tmp_path))
+        try:
+            await client.create_collection()
+            await client.batch_upsert_documents(
+                self._payloads(5) + other, [[0.1] * 1536] * 6
+            )
+            assert await client.delete_stale_chunks({"doc": 2})
+            stored = await client.get_payloads(
+                [f"doc_chunk_{i}" for i in range(5)] + ["other_chunk_4"]
+            )
+        finally:
+            await client.close()
+
+        assert sorted(stored) == ["doc_chunk_0", "doc_chunk_1", "other_chunk_4"]
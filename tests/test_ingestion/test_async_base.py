@@ -0,0 +1,297 @@
+"""
+Tests for the asyncio-native document ingester.
+
+The source API, LLM and embedding calls are replaced with coroutines; the
+progress tracker and Qdrant use real local storage in a temporary directory.
+
+Python Learning Notes:
+    - asyncio.sleep(0) inside a fake coroutine yields to the event loop,
+      which lets other document tasks interleave like real network calls
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from qdrant_client import QdrantClient
+
+from governmentreporter.apis.base import Document
+from governmentreporter.apis.rate_limit import get_rate_limiter, reset_rate_limiters
+from governmentreporter.ingestion.async_base import (
+    SERVICE_CONCURRENCY,
+    AsyncDocumentIngester,
+    parse_concurrency,
+)
+from governmentreporter.ingestion.progress import ProgressTracker
+from governmentreporter.processors.build_payloads import DocumentFingerprint
+
+
+class ConcreteAsyncIngester(AsyncDocumentIngester):
+    """Async ingester over a fixed list of pages; "bad" documents fail to fetch."""
+
+    pages = [["doc1", "doc2"], ["doc3", "bad"]]
+
+    def _get_collection_name(self):
+        return "test_collection"
+
+    async def _iter_document_ids(self):
+        for page in self.pages:
+            await asyncio.sleep(0)
+            yield list(page)
+
+    async def _fetch_document(self, doc_id):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if doc_id == "bad":
+                raise ValueError("fetch failed")
+            return Document(
+                id=doc_id,
+                title=f"Title {doc_id}",
+                date="2024-01-01",
+                type="test",
+                source="test",
+                content=f"Content for {doc_id}",
+            )
+        finally:
+            self.in_flight -= 1
+
+
+def _payloads(prepared, doc_metadata):
+    return [
+        {
+            "id": f"{prepared.id}_chunk_0",
+            "text": prepared.content,
+            "metadata": {"chunk_index": 0},
+        }
+    ]
+
+
+@pytest.fixture
+def make_ingester(tmp_path, monkeypatch):
+    """Build ConcreteAsyncIngesters with the OpenAI calls replaced."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+    monkeypatch.setattr(
+        "governmentreporter.ingestion.async_base.prepare_document", lambda doc: doc
+    )
+    monkeypatch.setattr(
+        "governmentreporter.ingestion.async_base.fingerprint_document",
+        lambda prepared, model: DocumentFingerprint("hash", "1", "1", model),
+    )
+    monkeypatch.setattr(
+        "governmentreporter.ingestion.async_base.assemble_payloads", _payloads
+    )
+    monkeypatch.setattr(
+        "governmentreporter.ingestion.async_base.extract_document_metadata_async",
+        AsyncMock(return_value={}),
+    )
+
+    def make(**kwargs):
+        ingester = ConcreteAsyncIngester(
+            start_date="2024-01-01",
+            end_date="2024-12-31",
+            progress_db=str(tmp_path / "progress.db"),
+            qdrant_db_path=str(tmp_path / "qdrant_db"),
+            **kwargs,
+        )
+        ingester.in_flight = 0
+        ingester.peak_in_flight = 0
+        ingester.embedding_generator.generate_batch_embeddings = AsyncMock(
+            side_effect=lambda texts: [[0.1] * 1536 for _ in texts]
+        )
+        return ingester
+
+    return make
+
+
+def _tracker_stats(tmp_path):
+    tracker = ProgressTracker(str(tmp_path / "progress.db"), "generic")
+    try:
+        return tracker.get_statistics()
+    finally:
+        tracker.close()
+
+
+class TestAsyncDocumentIngester:
+    """End-to-end runs of the async ingester."""
+
+    def test_run_stores_documents_and_records_failures(self, make_ingester, tmp_path):
+        ingester = make_ingester(batch_size=2)
+
+        ingester.run()
+
+        stats = _tracker_stats(tmp_path)
+        assert stats["completed"] == 3
+        assert stats["failed"] == 1
+
+        client = QdrantClient(path=str(tmp_path / "qdrant_db"))
+        try:
+            assert client.count("test_collection").count == 3
+        finally:
+            client.close()
+
+    def test_dry_run_does_not_store(self, make_ingester, tmp_path):
+        make_ingester(dry_run=True).run()
+
+        client = QdrantClient(path=str(tmp_path / "qdrant_db"))
+        try:
+            assert client.count("test_collection").count == 0
+        finally:
+            client.close()
+
+    def test_max_in_flight_bounds_concurrent_documents(self, make_ingester):
+        ingester = make_ingester(max_in_flight=2)
+        ingester.pages = [[f"doc{i}" for i in range(10)]]
+
+        ingester.run()
+
+        assert ingester.peak_in_flight == 2
+
+    def test_completed_documents_are_skipped_on_rerun(self, make_ingester):
+        make_ingester().run()
+
+        ingester = make_ingester()
+        ingester.run()
+
+        # Only the failed document is retried
+        assert ingester.embedding_generator.generate_batch_embeddings.await_count == 0
+        assert ingester.peak_in_flight == 1
+
+    def test_progress_tracker_calls_run_off_the_event_loop(self, make_ingester):
+        ingester = make_ingester()
+        tracker = ingester.progress_tracker
+        threads = set()
+        for name in ("claim_documents", "mark_processing", "mark_completed"):
+
+            def spy(*args, _method=getattr(tracker, name), **kwargs):
+                threads.add(threading.get_ident())
+                return _method(*args, **kwargs)
+
+            setattr(tracker, name, spy)
+
+        ingester.run()
+
+        # asyncio.run() runs the event loop on this thread
+        assert threads and threading.get_ident() not in threads
+
+    def test_llm_calls_share_one_client(self, make_ingester):
+        ingester = make_ingester()
+        with patch(
+            "governmentreporter.ingestion.async_base.extract_document_metadata_async",
+            AsyncMock(return_value={}),
+        ) as extract:
+            ingester.run()
+
+        assert extract.await_count == 3
+        clients = {call.kwargs["client"] for call in extract.await_args_list}
+        assert clients == {ingester.llm_client}
+
+    def test_failed_upsert_is_drained_by_next_run(self, make_ingester, tmp_path):
+        ingester = make_ingester()
+        ingester.store_retry_delay = 0
+        ingester.qdrant_client.batch_upsert_documents = AsyncMock(
+            side_effect=ConnectionError("qdrant down")
+        )
+        ingester.run()
+
+        stats = _tracker_stats(tmp_path)
+        assert stats["spooled"] == 3
+        assert stats["completed"] == 0
+
+        ingester = make_ingester()
+        ingester.run()
+
+        assert ingester.embedding_generator.generate_batch_embeddings.await_count == 0
+        assert _tracker_stats(tmp_path)["completed"] == 3
+        assert len(ingester.spool) == 0
+
+    def test_refresh_that_shrinks_documents_deletes_their_extra_chunks(
+        self, make_ingester, tmp_path, monkeypatch
+    ):
+        def rebuild(chunk_count):
+            monkeypatch.setattr(
+                "governmentreporter.ingestion.async_base.fingerprint_document",
+                lambda prepared, model: DocumentFingerprint(
+                    f"hash-{chunk_count}", "1", "1", model
+                ),
+            )
+            monkeypatch.setattr(
+                "governmentreporter.ingestion.async_base.assemble_payloads",
+                lambda prepared, doc_metadata: [
+                    {
+                        "id": f"{prepared.id}_chunk_{i}",
+                        "text": prepared.content,
+                        "metadata": {**doc_metadata, "chunk_index": i},
+                    }
+                    for i in range(chunk_count)
+                ],
+            )
+
+        rebuild(3)
+        make_ingester().run()
+        rebuild(1)
+        make_ingester(refresh=True).run()
+
+        client = QdrantClient(path=str(tmp_path / "qdrant_db"))
+        try:
+            assert client.count("test_collection").count == 3
+        finally:
+            client.close()
+
+    def test_unchanged_documents_record_stage_timings(self, make_ingester, tmp_path):
+        make_ingester().run()
+        make_ingester(refresh=True).run()
+
+        # The refresh cleared the first run's timings of every document
+        tracker = ProgressTracker(str(tmp_path / "progress.db"), "generic")
+        try:
+            assert tracker.get_stage_statistics()["fetch_ms"]["count"] == 3
+        finally:
+            tracker.close()
+
+    def test_final_statistics_show_the_concurrency(self, make_ingester, capsys):
+        make_ingester(llm_concurrency=8).run()
+
+        output = capsys.readouterr().out
+        assert "INGESTION COMPLETE (asyncio)" in output
+        assert "Reused Stored Work" not in output
+        assert "llm_concurrency=8" in output
+
+    def test_final_statistics_show_rate_limiter_waits(self, make_ingester, capsys):
+        reset_rate_limiters()
+        limiter = get_rate_limiter("api.example.test", rate=1000.0)
+        limiter.acquire()
+        limiter.penalize(retry_after=0)
+        try:
+            make_ingester().run()
+        finally:
+            reset_rate_limiters()
+
+        output = capsys.readouterr().out
+        assert "Rate Limiter api.example.test: 1 requests, 1 throttled" in output
+
+    def test_invalid_limit_raises(self, make_ingester):
+        with pytest.raises(ValueError, match="llm_concurrency"):
+            make_ingester(llm_concurrency=0)
+
+
+class TestParseConcurrency:
+    """Parsing of the --concurrency specification."""
+
+    def test_defaults(self):
+        assert parse_concurrency("") == {
+            f"{name}_concurrency": value for name, value in SERVICE_CONCURRENCY.items()
+        }
+
+    def test_overrides(self):
+        limits = parse_concurrency("llm=32, embedding=8")
+        assert limits["llm_concurrency"] == 32
+        assert limits["embedding_concurrency"] == 8
+        assert limits["fetch_concurrency"] == SERVICE_CONCURRENCY["fetch"]
+
+    @pytest.mark.parametrize("spec", ["gpu=2", "llm", "llm=x", "llm=0"])
+    def test_invalid(self, spec):
+        with pytest.raises(ValueError):
+            parse_concurrency(spec)
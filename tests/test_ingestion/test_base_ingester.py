@@ -10,13 +10,17 @@ Python Learning Notes:
     - Testing abstract classes requires creating test implementations
 """
 
+import shutil
 import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
 from governmentreporter.ingestion.base import DocumentIngester
+from governmentreporter.processors.build_payloads import DocumentFingerprint
 
 
 class ConcreteIngester(DocumentIngester):
@@ -184,36 +188,544 @@ class TestDocumentIngesterAbstractMethods:
                 start_date="2024-01-01", end_date="2024-12-31"
             )
 
-    def test_concrete_class_must_implement_fetch_document_ids(self):
-        """Test concrete class must implement _fetch_document_ids."""
+    def test_discovery_and_processing_hooks_are_optional(self, tmp_path):
+        """Test the per-document hooks have defaults naming their alternatives."""
+        from unittest.mock import patch
 
-        class IncompleteIngester2(DocumentIngester):
+        class MinimalIngester(DocumentIngester):
             def _get_collection_name(self):
                 return "test"
 
-            def _process_single_document(self, doc_id, batch_docs, batch_embeds):
-                return True
+        with patch("governmentreporter.ingestion.base.QdrantIngestionClient"):
+            with patch("governmentreporter.ingestion.base.EmbeddingGenerator"):
+                ingester = MinimalIngester(
+                    start_date="2024-01-01",
+                    end_date="2024-12-31",
+                    dry_run=True,
+                    progress_db=str(tmp_path / "progress.db"),
+                )
 
-            # Missing _fetch_document_ids
+        with pytest.raises(NotImplementedError, match="_iter_document_ids"):
+            ingester._fetch_document_ids()
+        with pytest.raises(NotImplementedError, match="_build_payloads"):
+            ingester._process_single_document("doc1", [], [])
 
-        with pytest.raises(TypeError):
-            ingester = IncompleteIngester2(
-                start_date="2024-01-01", end_date="2024-12-31"
+
+class StreamingIngester(ConcreteIngester):
+    """Ingester that discovers documents in pages and records call order."""
+
+    def __init__(self, pages, events, **kwargs):
+        self.pages = pages
+        self.events = events
+        super().__init__(**kwargs)
+
+    def _iter_document_ids(self):
+        for number, page in enumerate(self.pages, start=1):
+            self.events.append(f"page {number}")
+            yield page
+
+    def _process_single_document(self, doc_id, batch_docs, batch_embeds):
+        self.events.append(doc_id)
+        return super()._process_single_document(doc_id, batch_docs, batch_embeds)
+
+
+class TestStreamingRun:
+    """Test that run() processes documents while discovery is paginating."""
+
+    @pytest.fixture
+    def make_ingester(self, tmp_path):
+        from unittest.mock import patch
+
+        patches = [
+            patch("governmentreporter.ingestion.base.QdrantIngestionClient"),
+            patch("governmentreporter.ingestion.base.EmbeddingGenerator"),
+        ]
+        for p in patches:
+            p.start()
+
+        def make(pages, events):
+            return StreamingIngester(
+                pages,
+                events,
+                start_date="2024-01-01",
+                end_date="2024-12-31",
+                batch_size=2,
+                dry_run=True,
+                progress_db=str(tmp_path / "progress.db"),
             )
 
-    def test_concrete_class_must_implement_process_single_document(self):
-        """Test concrete class must implement _process_single_document."""
+        yield make
+        for p in patches:
+            p.stop()
+
+    def test_first_batch_processed_before_later_pages(self, make_ingester):
+        """A full batch is processed as soon as it has been discovered."""
+        events = []
+        make_ingester([["a", "b"], ["c"], ["d"]], events).run()
+
+        assert events == ["page 1", "a", "b", "page 2", "page 3", "c", "d"]
+
+    def test_resumed_run_skips_completed_documents(self, make_ingester):
+        """Completed documents are not reprocessed; leftovers are picked up."""
+        events = []
+        ingester = make_ingester([["a", "b", "c"]], events)
+        ingester.progress_tracker.add_document("a")
+        ingester.progress_tracker.mark_completed("a")
+        ingester.progress_tracker.add_document("old")
+        ingester.run()
+
+        processed = [e for e in events if not e.startswith("page")]
+        assert processed == ["b", "c", "old"]
+
+    def test_documents_leased_by_another_process_are_skipped(
+        self, make_ingester, tmp_path
+    ):
+        """Another ingester's live lease keeps this run off that document."""
+        from governmentreporter.ingestion.progress import ProgressTracker
+
+        other = ProgressTracker(
+            str(tmp_path / "progress.db"), "generic", worker_id="other"
+        )
+        other.add_document("b")
+        assert other.claim_documents(["b"]) == ["b"]
 
-        class IncompleteIngester3(DocumentIngester):
-            def _get_collection_name(self):
-                return "test"
+        events = []
+        make_ingester([["a", "b", "c"]], events).run()
 
-            def _fetch_document_ids(self):
-                return []
+        processed = [e for e in events if not e.startswith("page")]
+        assert processed == ["a", "c"]
+        assert other.get_statistics()["processing"] == 1
+        other.close()
 
-            # Missing _process_single_document
+    def test_interrupted_run_releases_its_leases(self, make_ingester, tmp_path):
+        """Unfinished documents go back to pending for other processes."""
+        from governmentreporter.ingestion.progress import ProgressTracker
 
-        with pytest.raises(TypeError):
-            ingester = IncompleteIngester3(
-                start_date="2024-01-01", end_date="2024-12-31"
-            )
+        events = []
+        ingester = make_ingester([["a", "b", "c", "d"]], events)
+
+        def interrupt(doc_id, batch_docs, batch_embeds):
+            raise KeyboardInterrupt
+
+        ingester._process_single_document = interrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            ingester.run()
+
+        tracker = ProgressTracker(str(tmp_path / "progress.db"), "generic")
+        assert tracker.claim_documents(["a", "b", "c", "d"]) == ["a", "b", "c", "d"]
+        tracker.close()
+
+
+class ConcurrentIngester(ConcreteIngester):
+    """Ingester whose documents only finish once three run at the same time."""
+
+    def __init__(self, **kwargs):
+        self.barrier = threading.Barrier(3, timeout=5)
+        self.stored = []
+        super().__init__(**kwargs)
+
+    def _fetch_document_ids(self):
+        return ["a", "b", "c", "d", "e", "f"]
+
+    def _process_single_document(self, doc_id, batch_docs, batch_embeds):
+        self.barrier.wait()
+        self.progress_tracker.mark_processing(doc_id)
+        super()._process_single_document(doc_id, batch_docs, batch_embeds)
+        self.progress_tracker.mark_completed(doc_id, 1)
+        return doc_id != "e"
+
+    def _store_batch(self, documents, embeddings):
+        self.stored.append([d["id"] for d in documents])
+        return True
+
+
+class TestConcurrentProcessing:
+    """Test processing the documents of a batch on a worker pool."""
+
+    @pytest.fixture
+    def make_ingester(self, tmp_path):
+        from unittest.mock import patch
+
+        with (
+            patch("governmentreporter.ingestion.base.QdrantIngestionClient"),
+            patch("governmentreporter.ingestion.base.EmbeddingGenerator"),
+        ):
+
+            def make(workers):
+                return ConcurrentIngester(
+                    start_date="2024-01-01",
+                    end_date="2024-12-31",
+                    batch_size=3,
+                    progress_db=str(tmp_path / "progress.db"),
+                    workers=workers,
+                )
+
+            yield make
+
+    def test_batch_documents_run_concurrently(self, make_ingester):
+        """Three workers reach the barrier together; payloads keep their order."""
+        ingester = make_ingester(workers=3)
+        ingester.run()
+
+        # The failed document "e" is never stored
+        assert ingester.stored == [["a", "b", "c"], ["d", "f"]]
+        stats = ingester.performance_monitor.get_statistics()
+        assert stats["documents_processed"] == 5
+        assert stats["documents_failed"] == 1
+        assert ingester._executor is None  # Shut down at the end of run()
+
+    def test_worker_threads_share_progress_tracker(self, make_ingester):
+        """Completion written from worker threads is visible to later runs."""
+        make_ingester(workers=3).run()
+
+        tracker = make_ingester(workers=1).progress_tracker
+        assert all(tracker.is_processed(doc_id) for doc_id in "abcdef")
+
+    def test_workers_must_be_positive(self, make_ingester):
+        with pytest.raises(ValueError):
+            make_ingester(workers=0)
+
+
+class StagedIngester(ConcreteIngester):
+    """Ingester that supports the staged pipeline; fetching "bad" fails."""
+
+    def __init__(self, **kwargs):
+        self.stored = []
+        super().__init__(**kwargs)
+
+    def _fetch_document_ids(self):
+        return ["a", "b", "bad", "c", "d"]
+
+    def _fetch_document(self, doc_id):
+        if doc_id == "bad":
+            raise ValueError("not found")
+        return doc_id
+
+    def _store_batch(self, documents, embeddings):
+        self.stored.append([(d["id"], d["document_id"]) for d in documents])
+        return True
+
+
+class TestStagedPipeline:
+    """Test running ingestion as a staged pipeline."""
+
+    @pytest.fixture
+    def make_ingester(self, tmp_path):
+        from unittest.mock import patch
+
+        with (
+            patch("governmentreporter.ingestion.base.QdrantIngestionClient"),
+            patch("governmentreporter.ingestion.base.EmbeddingGenerator"),
+            patch(
+                "governmentreporter.ingestion.base.prepare_document",
+                side_effect=lambda doc: f"prepared-{doc}",
+            ),
+            patch(
+                "governmentreporter.ingestion.base.fingerprint_document",
+                return_value=DocumentFingerprint("hash", "1", "1", "model"),
+            ),
+            patch(
+                "governmentreporter.ingestion.base.extract_document_metadata",
+                return_value={},
+            ),
+            patch(
+                "governmentreporter.ingestion.base.assemble_payloads",
+                side_effect=lambda prepared, meta: [{"id": prepared, "text": "x"}],
+            ),
+        ):
+
+            def make(**kwargs):
+                ingester = StagedIngester(
+                    start_date="2024-01-01",
+                    end_date="2024-12-31",
+                    batch_size=2,
+                    progress_db=str(tmp_path / "progress.db"),
+                    **kwargs,
+                )
+                ingester.embedding_generator.generate_batch_embeddings.side_effect = (
+                    lambda texts: [[0.0] for _ in texts]
+                )
+                return ingester
+
+            yield make
+
+    def test_documents_flow_through_all_stages(self, make_ingester):
+        ingester = make_ingester(stage_workers={"extract": 3})
+        ingester.run()
+
+        stored = sorted(item for batch in ingester.stored for item in batch)
+        assert stored == [(f"prepared-{d}", d) for d in "abcd"]
+        assert all(len(batch) <= 2 for batch in ingester.stored)
+
+        tracker = make_ingester().progress_tracker
+        assert all(tracker.is_processed(doc_id) for doc_id in "abcd")
+        assert tracker.get_statistics()["failed"] == 1
+
+        stats = {row["stage"]: row for row in ingester._pipeline_stats}
+        assert stats["fetch"]["failed"] == 1
+        assert stats["upsert"]["processed"] == 4
+        assert stats["extract"]["workers"] == 3
+        assert ingester._pipeline is None
+
+    def test_dry_run_stores_nothing(self, make_ingester):
+        ingester = make_ingester(stage_workers={}, dry_run=True)
+        ingester.run()
+
+        assert ingester.stored == []
+        assert ingester.performance_monitor.get_statistics()["documents_processed"] == 4
+
+    def test_unknown_stage_rejected(self, make_ingester):
+        with pytest.raises(ValueError):
+            make_ingester(stage_workers={"download": 2})
+
+
+class SpoolingIngester(ConcreteIngester):
+    """Ingester whose Qdrant upserts fail while any document in store_down is sent."""
+
+    store_retry_delay = 0
+
+    def __init__(self, store_down, **kwargs):
+        self.store_down = store_down
+        self.stored = []
+        self.completed_during_store = []
+        super().__init__(**kwargs)
+
+    def _store_batch(self, documents, embeddings):
+        doc_ids = [d["id"] for d in documents]
+        self.completed_during_store.extend(
+            doc_id for doc_id in doc_ids if self.progress_tracker.is_processed(doc_id)
+        )
+        if self.store_down & set(doc_ids):
+            return False
+        self.stored.append(doc_ids)
+        return True
+
+
+class TestPayloadSpool:
+    """Test that processed documents survive failed Qdrant upserts."""
+
+    @pytest.fixture
+    def make_ingester(self, tmp_path):
+        from unittest.mock import patch
+
+        with (
+            patch("governmentreporter.ingestion.base.QdrantIngestionClient"),
+            patch("governmentreporter.ingestion.base.EmbeddingGenerator"),
+        ):
+
+            def make(store_down=frozenset()):
+                return SpoolingIngester(
+                    set(store_down),
+                    start_date="2024-01-01",
+                    end_date="2024-12-31",
+                    batch_size=3,
+                    progress_db=str(tmp_path / "progress.db"),
+                )
+
+            yield make
+
+    def test_documents_complete_only_after_upsert(self, make_ingester):
+        ingester = make_ingester()
+        ingester.run()
+
+        assert ingester.stored == [["doc1", "doc2", "doc3"]]
+        assert ingester.completed_during_store == []
+        assert make_ingester().progress_tracker.get_statistics()["completed"] == 3
+        assert len(ingester.spool) == 0
+
+    def test_failed_upsert_keeps_documents_spooled(self, make_ingester):
+        ingester = make_ingester(store_down={"doc1", "doc2", "doc3"})
+        ingester.run()
+
+        stats = make_ingester().progress_tracker.get_statistics()
+        assert stats["spooled"] == 3
+        assert stats["completed"] == 0
+        assert len(ingester.spool) == 3
+
+    def test_next_run_drains_spool_without_reprocessing(self, make_ingester):
+        make_ingester(store_down={"doc1", "doc2", "doc3"}).run()
+
+        ingester = make_ingester()
+        ingester._process_single_document = MagicMock()
+        ingester.run()
+
+        ingester._process_single_document.assert_not_called()
+        assert ingester.stored == [["doc1", "doc2", "doc3"]]
+        assert make_ingester().progress_tracker.get_statistics()["completed"] == 3
+        assert len(ingester.spool) == 0
+
+    def test_documents_of_a_lost_spool_are_processed_again(self, make_ingester):
+        crashed = make_ingester(store_down={"doc1", "doc2", "doc3"})
+        crashed.progress_tracker.lease_seconds = 0.05
+        crashed.run()
+        # The crashed process's spool directory did not survive it
+        shutil.rmtree(crashed.spool.directory)
+        time.sleep(0.1)
+
+        ingester = make_ingester()
+        ingester.run()
+
+        assert ingester.stored == [["doc1", "doc2", "doc3"]]
+        stats = make_ingester().progress_tracker.get_statistics()
+        assert stats["completed"] == 3
+        assert stats["spooled"] == 0
+
+    def test_one_rejected_document_does_not_hold_back_the_batch(self, make_ingester):
+        ingester = make_ingester(store_down={"doc2"})
+        ingester.run()
+
+        assert ingester.stored == [["doc1"], ["doc3"]]
+        stats = make_ingester().progress_tracker.get_statistics()
+        assert stats["completed"] == 2
+        assert stats["spooled"] == 1
+
+
+class PackingIngester(ConcreteIngester):
+    """Ingester that builds payloads only, so the base class packs embeddings."""
+
+    chunks = {"doc1": 1, "doc2": 3, "doc3": 2}
+
+    def _build_payloads(self, doc_id):
+        if doc_id not in self.chunks:
+            raise ValueError("not found")
+        return [
+            {"id": f"{doc_id}_{i}", "text": doc_id, "document_id": doc_id}
+            for i in range(self.chunks[doc_id])
+        ]
+
+
+class TestPackedEmbeddings:
+    """Test embedding the chunks of a whole batch in shared requests."""
+
+    @pytest.fixture
+    def make_ingester(self, tmp_path):
+        from unittest.mock import patch
+
+        with (
+            patch("governmentreporter.ingestion.base.QdrantIngestionClient"),
+            patch("governmentreporter.ingestion.base.EmbeddingGenerator"),
+        ):
+
+            def make(**kwargs):
+                ingester = PackingIngester(
+                    start_date="2024-01-01",
+                    end_date="2024-12-31",
+                    batch_size=3,
+                    dry_run=True,
+                    progress_db=str(tmp_path / "progress.db"),
+                    **kwargs,
+                )
+                ingester.embedding_generator.generate_packed_embeddings.side_effect = (
+                    lambda texts, **kwargs: [[float(t[-1])] for t in texts]
+                )
+                return ingester
+
+            yield make
+
+    def test_batch_is_embedded_in_one_call(self, make_ingester):
+        ingester = make_ingester(workers=2)
+        spooled = {}
+        ingester._spool_document = lambda doc_id, docs, embeds, ms: spooled.update(
+            {doc_id: (docs, embeds)}
+        )
+        ingester.run()
+
+        generator = ingester.embedding_generator
+        generator.generate_packed_embeddings.assert_called_once()
+        generator.generate_batch_embeddings.assert_not_called()
+        assert spooled["doc2"][1] == [[2.0]] * 3
+        assert spooled["doc3"][1] == [[3.0]] * 2
+        assert [p["id"] for p in spooled["doc2"][0]] == ["doc2_0", "doc2_1", "doc2_2"]
+
+    def test_failed_build_is_left_out_of_the_batch(self, make_ingester):
+        ingester = make_ingester()
+        ingester.chunks = {"doc1": 1, "doc3": 1}
+        ingester.run()
+
+        texts = ingester.embedding_generator.generate_packed_embeddings.call_args[0][0]
+        assert texts == ["doc1", "doc3"]
+        stats = ingester.performance_monitor.get_statistics()
+        assert stats["documents_failed"] == 1
+
+    def test_embedding_error_fails_the_batch(self, make_ingester):
+        ingester = make_ingester()
+        ingester.embedding_generator.generate_packed_embeddings.side_effect = (
+            RuntimeError("openai down")
+        )
+        ingester.run()
+
+        stats = make_ingester().progress_tracker.get_statistics()
+        assert stats["failed"] == 3
+        assert stats["completed"] == 0
+
+
+class RefreshingIngester(ConcreteIngester):
+    """Ingester storing one document with a configurable number of chunks."""
+
+    chunk_count = 3
+
+    def _fetch_document_ids(self):
+        return ["doc1"]
+
+    def _build_payloads(self, doc_id):
+        fingerprint = DocumentFingerprint(
+            f"hash-{self.chunk_count}", "1", "1", "m:1536"
+        )
+        return [
+            {
+                "id": f"{doc_id}_chunk_{i}",
+                "text": f"{doc_id} chunk {i}",
+                "document_id": doc_id,
+                "metadata": {"chunk_index": i, **fingerprint.as_metadata()},
+            }
+            for i in range(self.chunk_count)
+        ]
+
+
+class TestRefreshReplacesChunks:
+    """Test that a rebuilt document's chunks replace the stored ones."""
+
+    @pytest.fixture
+    def make_ingester(self, tmp_path):
+        from unittest.mock import patch
+
+        from governmentreporter.database.qdrant import QdrantDBClient
+
+        db_client = QdrantDBClient(str(tmp_path / "qdrant_db"))
+        with patch("governmentreporter.ingestion.base.EmbeddingGenerator"):
+
+            def make(chunk_count, **kwargs):
+                ingester = RefreshingIngester(
+                    start_date="2024-01-01",
+                    end_date="2024-12-31",
+                    progress_db=str(tmp_path / "progress.db"),
+                    shared_db_client=db_client,
+                    **kwargs,
+                )
+                ingester.chunk_count = chunk_count
+                ingester.embedding_generator.generate_packed_embeddings.side_effect = (
+                    lambda texts, **kwargs: [[0.1] * 1536 for _ in texts]
+                )
+                return ingester
+
+            yield make
+
+    @staticmethod
+    def _stored_chunks(ingester):
+        payloads = ingester.qdrant_client.get_document_payloads("doc1")
+        return [payload["chunk_index"] for payload in payloads]
+
+    def test_refresh_that_shrinks_a_document_deletes_its_extra_chunks(
+        self, make_ingester
+    ):
+        first = make_ingester(chunk_count=3)
+        first.run()
+        assert self._stored_chunks(first) == [0, 1, 2]
+
+        refreshed = make_ingester(chunk_count=1, refresh=True)
+        refreshed.run()
+
+        assert self._stored_chunks(refreshed) == [0]
+        fingerprint = make_ingester(1).progress_tracker.get_fingerprint("doc1")
+        assert fingerprint["content_hash"] == "hash-1"
@@ -0,0 +1,219 @@
+"""
+Unit tests for the CourtListener bulk-data ingester.
+
+Small dump files in the CourtListener CSV format are written to a temporary
+directory (compressed the same way as the real dumps) and streamed through
+the ingester with the embedding and Qdrant dependencies mocked.
+"""
+
+import bz2
+import csv
+import gzip
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from governmentreporter.ingestion.courtlistener_bulk import (
+    CourtListenerBulkIngester,
+    iter_dump_records,
+)
+
+
+def _write_csv(path, rows, opener=bz2.open):
+    """Write rows as a PostgreSQL-style CSV dump (backslash-escaped quotes)."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(
+        buffer,
+        fieldnames=list(rows[0]),
+        quoting=csv.QUOTE_ALL,
+        escapechar="\\",
+        doublequote=False,
+    )
+    writer.writeheader()
+    writer.writerows(rows)
+    with opener(path, "wt", encoding="utf-8") as f:
+        f.write(buffer.getvalue())
+    return str(path)
+
+
+@pytest.fixture
+def dumps(tmp_path):
+    """Dockets, clusters, citations and opinions dumps for two courts."""
+    dockets = _write_csv(
+        tmp_path / "dockets.csv.bz2",
+        [
+            {"id": "1", "court_id": "scotus", "docket_number": "22-451"},
+            {"id": "2", "court_id": "ca9", "docket_number": "21-100"},
+        ],
+    )
+    clusters = _write_csv(
+        tmp_path / "clusters.csv.bz2",
+        [
+            {
+                "id": "10",
+                "docket_id": "1",
+                "case_name": 'Loper Bright "Enterprises" v. Raimondo',
+                "date_filed": "2024-06-28",
+                "judges": "Roberts",
+                "precedential_status": "Published",
+            },
+            {
+                "id": "11",
+                "docket_id": "1",
+                "case_name": "Too Old v. Range",
+                "date_filed": "1999-01-01",
+                "judges": "",
+                "precedential_status": "Published",
+            },
+            {
+                "id": "12",
+                "docket_id": "2",
+                "case_name": "Circuit Case",
+                "date_filed": "2024-03-01",
+                "judges": "",
+                "precedential_status": "Published",
+            },
+        ],
+    )
+    citations = _write_csv(
+        tmp_path / "citations.csv.gz",
+        [{"cluster_id": "10", "volume": "603", "reporter": "U.S.", "page": "369"}],
+        opener=gzip.open,
+    )
+    opinions = _write_csv(
+        tmp_path / "opinions.csv.bz2",
+        [
+            {
+                "id": "100",
+                "cluster_id": "10",
+                "type": "020lead",
+                "author_str": "Roberts",
+                "per_curiam": "f",
+                "plain_text": "",
+                "html_with_citations": "<p>Chevron is overruled.</p>",
+            },
+            {
+                "id": "101",
+                "cluster_id": "10",
+                "type": "040dissent",
+                "author_str": "Kagan",
+                "per_curiam": "f",
+                "plain_text": "I respectfully dissent.",
+                "html_with_citations": "",
+            },
+            {
+                "id": "102",
+                "cluster_id": "11",
+                "type": "010combined",
+                "author_str": "",
+                "per_curiam": "t",
+                "plain_text": "Out of range.",
+                "html_with_citations": "",
+            },
+            {
+                "id": "103",
+                "cluster_id": "12",
+                "type": "010combined",
+                "author_str": "",
+                "per_curiam": "f",
+                "plain_text": "Not SCOTUS.",
+                "html_with_citations": "",
+            },
+        ],
+    )
+    return {
+        "dockets_path": dockets,
+        "clusters_path": clusters,
+        "citations_path": citations,
+        "opinions_path": opinions,
+    }
+
+
+@pytest.fixture
+def make_ingester(tmp_path):
+    """Factory for ingesters with Qdrant and OpenAI mocked out."""
+    with (
+        patch("governmentreporter.ingestion.base.QdrantIngestionClient"),
+        patch("governmentreporter.ingestion.base.EmbeddingGenerator"),
+    ):
+
+        def make(dumps, **kwargs):
+            return CourtListenerBulkIngester(
+                start_date="2020-01-01",
+                end_date="2024-12-31",
+                batch_size=1,
+                dry_run=True,
+                progress_db=str(tmp_path / "progress.db"),
+                **dumps,
+                **kwargs,
+            )
+
+        yield make
+
+
+class TestIterDumpRecords:
+    """Tests for the streaming dump reader."""
+
+    def test_reads_backslash_escaped_csv(self, dumps):
+        """PostgreSQL-style escaped quotes survive the round trip."""
+        clusters = list(iter_dump_records(dumps["clusters_path"]))
+
+        assert clusters[0]["case_name"] == 'Loper Bright "Enterprises" v. Raimondo'
+        assert len(clusters) == 3
+
+    def test_reads_compressed_json_lines(self, tmp_path):
+        path = tmp_path / "opinions.jsonl.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"id": 1}) + "\n\n" + json.dumps({"id": 2}) + "\n")
+
+        assert [r["id"] for r in iter_dump_records(path)] == [1, 2]
+
+
+class TestCourtListenerBulkIngester:
+    """Tests for SCOTUS filtering and document building."""
+
+    def test_streams_only_scotus_opinions_in_range(self, dumps, make_ingester):
+        ingester = make_ingester(dumps)
+
+        batches = list(ingester._iter_document_ids())
+
+        assert batches == [["100"], ["101"]]
+        assert set(ingester.clusters) == {"10"}
+
+    def test_documents_match_api_shape(self, dumps, make_ingester):
+        """Documents carry the cluster metadata SCOTUSIngester would attach."""
+        ingester = make_ingester(dumps)
+        list(ingester._iter_document_ids())
+
+        majority = ingester.pending_documents["100"]
+        dissent = ingester.pending_documents["101"]
+
+        assert majority.type == "Supreme Court Opinion"
+        assert majority.date == "2024-06-28"
+        assert majority.content == "Chevron is overruled."
+        assert majority.metadata["docket_number"] == "22-451"
+        assert majority.metadata["per_curiam"] is False
+        assert majority.metadata["citations"][0]["volume"] == "603"
+        assert dissent.content == "I respectfully dissent."
+
+    @patch("governmentreporter.ingestion.base.DocumentIngester._payloads_from_document")
+    def test_run_records_completion(self, mock_build, dumps, make_ingester):
+        """run() processes each opinion and skips them on a second run."""
+        mock_build.side_effect = lambda doc: [{"text": doc.content}]
+        ingester = make_ingester(dumps)
+        ingester.embedding_generator.generate_packed_embeddings.side_effect = (
+            lambda texts, **kwargs: [[0.0] for _ in texts]
+        )
+        ingester.run()
+
+        tracker = make_ingester(dumps).progress_tracker
+        assert tracker.is_processed("100")
+        assert tracker.is_processed("101")
+        assert mock_build.call_count == 2
+
+        rerun = make_ingester(dumps)
+        rerun.run()
+        assert mock_build.call_count == 2
+        assert rerun.pending_documents == {}
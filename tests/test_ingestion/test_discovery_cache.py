@@ -0,0 +1,97 @@
+"""
+Tests for the persistent discovery cache and its in-memory LRU front.
+
+Python Learning Notes:
+    - A second DiscoveryCache on the same file stands in for a resumed run
+    - max_age=0 makes every record stale as soon as it is written
+"""
+
+import pytest
+
+from governmentreporter.ingestion.discovery_cache import DiscoveryCache, LRUCache
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "discovery" / "scotus.discovery.db"
+
+
+class TestLRUCache:
+    def test_least_recently_used_item_is_evicted(self):
+        cache = LRUCache(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+        cache["c"] = 3
+
+        assert "b" not in cache
+        assert cache["a"] == 1 and cache["c"] == 3
+        assert len(cache) == 2
+
+    def test_rejects_empty_size(self):
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=0)
+
+
+class TestDiscoveryCache:
+    def test_nothing_is_created_until_used(self, db_path):
+        DiscoveryCache(db_path, "clusters")
+
+        assert not db_path.parent.exists()
+
+    def test_records_survive_a_restart(self, db_path):
+        cache = DiscoveryCache(db_path, "clusters")
+        cache["101"] = {"id": 1, "case_name": "A v. B"}
+        cache.update({"102": {"id": 2}, "103": {"id": 3}})
+        cache.close()
+
+        resumed = DiscoveryCache(db_path, "clusters")
+
+        assert resumed["101"] == {"id": 1, "case_name": "A v. B"}
+        assert "103" in resumed
+        assert len(resumed) == 3
+
+    def test_memory_is_bounded(self, db_path):
+        cache = DiscoveryCache(db_path, "clusters", memory_items=2)
+        cache.update((str(i), {"id": i}) for i in range(10))
+
+        assert len(cache._memory) == 2
+        assert cache.get("0") == {"id": 0}
+
+    def test_pop_keeps_the_disk_copy(self, db_path):
+        cache = DiscoveryCache(db_path, "clusters")
+        cache["101"] = {"id": 1}
+
+        assert cache.pop("101") == {"id": 1}
+        assert "101" not in cache._memory
+        assert cache.get("101") == {"id": 1}
+        assert cache.pop("missing") is None
+
+    def test_namespaces_are_separate(self, db_path):
+        clusters = DiscoveryCache(db_path, "clusters")
+        orders = DiscoveryCache(db_path, "orders")
+        clusters["1"] = "cluster"
+
+        assert orders.get("1") is None
+        with pytest.raises(KeyError):
+            orders["1"]
+
+    def test_listings_roundtrip(self, db_path):
+        cache = DiscoveryCache(db_path, "clusters")
+        assert cache.get_listing("2024-01-01:2024-12-31") is None
+
+        cache.put_listing("2024-01-01:2024-12-31", ["3", "1", "2"])
+
+        resumed = DiscoveryCache(db_path, "clusters")
+        assert resumed.get_listing("2024-01-01:2024-12-31") == ["3", "1", "2"]
+
+    def test_stale_entries_are_ignored(self, db_path):
+        DiscoveryCache(db_path, "clusters").put_listing("range", ["1"])
+        writer = DiscoveryCache(db_path, "clusters")
+        writer["1"] = {"id": 1}
+
+        stale = DiscoveryCache(db_path, "clusters", max_age=0)
+
+        assert stale.get_listing("range") is None
+        assert stale.get("1") is None
+        assert len(stale) == 0
@@ -0,0 +1,174 @@
+"""
+Unit tests for the Federal Register bulk XML Executive Order ingester.
+
+A trimmed daily issue in the GPO Federal Register XML schema is written to a
+temporary directory; the embedding and Qdrant dependencies are mocked.
+"""
+
+import zipfile
+from unittest.mock import patch
+
+import pytest
+
+from governmentreporter.apis.federal_register import FederalRegisterClient
+from governmentreporter.ingestion.executive_orders_xml import (
+    ExecutiveOrderXMLIngester,
+    iter_issue_files,
+    iter_issue_orders,
+    president_for_date,
+)
+
+ISSUE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<FEDREG>
+  <VOL>88</VOL>
+  <NO>210</NO>
+  <DATE>Wednesday, November 1, 2023</DATE>
+  <RULES>
+    <RULE><PREAMB><AGENCY>Department of Example</AGENCY></PREAMB>
+      <PRTPAGE P="75189"/>
+      <FRDOC>[FR Doc. 2023-11111 Filed 10-31-23; 8:45 am]</FRDOC>
+    </RULE>
+  </RULES>
+  <PRESDOCS>
+    <PRESDOCU>
+      <EXECORD>
+        <PRTPAGE P="75191"/>
+        <TITLE3>Title 3&#x2014;</TITLE3>
+        <PRES>The President</PRES>
+        <EXECORDR>Executive Order 14110 of October 30, 2023</EXECORDR>
+        <HD SOURCE="HED">Safe, Secure, and Trustworthy Development and Use of
+          Artificial Intelligence</HD>
+        <FP>By the authority vested in me as President by the Constitution
+          and the laws of the United States of America, it is hereby ordered:</FP>
+        <P><E T="04">Section 1.</E> <E T="03">Purpose.</E> Artificial
+          intelligence holds extraordinary potential.</P>
+        <PRTPAGE P="75192"/>
+        <P><E T="04">Sec. 2.</E> Policy and principles.</P>
+        <GPH SPAN="1" DEEP="80"><GID>ED01NO23.000</GID></GPH>
+        <PLACE>THE WHITE HOUSE,</PLACE>
+        <DATE>October 30, 2023.</DATE>
+        <FRDOC>[FR Doc. 2023-24283 </FRDOC>
+        <FILED>Filed 10-31-23; 11:15 am]</FILED>
+        <BILCOD>Billing code 3395-F4-P</BILCOD>
+      </EXECORD>
+    </PRESDOCU>
+  </PRESDOCS>
+</FEDREG>
+"""
+
+
+@pytest.fixture
+def xml_dir(tmp_path):
+    """Directory holding one issue as plain XML."""
+    issue_dir = tmp_path / "2023" / "11"
+    issue_dir.mkdir(parents=True)
+    (issue_dir / "FR-2023-11-01.xml").write_text(ISSUE_XML, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def make_ingester(tmp_path):
+    """Factory for XML ingesters with Qdrant and OpenAI mocked out."""
+    with (
+        patch("governmentreporter.ingestion.base.QdrantIngestionClient"),
+        patch("governmentreporter.ingestion.base.EmbeddingGenerator"),
+    ):
+
+        def make(xml_dir, **kwargs):
+            return ExecutiveOrderXMLIngester(
+                xml_dir=str(xml_dir),
+                start_date=kwargs.pop("start_date", "2023-01-01"),
+                end_date=kwargs.pop("end_date", "2023-12-31"),
+                dry_run=True,
+                progress_db=str(tmp_path / "progress.db"),
+                **kwargs,
+            )
+
+        yield make
+
+
+class TestIterIssueOrders:
+    """Tests for extracting executive orders from an issue."""
+
+    def test_extracts_api_shaped_metadata(self, xml_dir):
+        path = xml_dir / "2023" / "11" / "FR-2023-11-01.xml"
+        ((order, text),) = list(iter_issue_orders(path))
+
+        assert order["document_number"] == "2023-24283"
+        assert order["executive_order_number"] == 14110
+        assert order["signing_date"] == "2023-10-30"
+        assert order["publication_date"] == "2023-11-01"
+        assert order["title"].startswith("Safe, Secure, and Trustworthy")
+        assert order["citation"] == "88 FR 75191"
+        assert (order["start_page"], order["end_page"]) == (75191, 75192)
+        assert order["president"]["name"] == "Joseph R. Biden Jr."
+
+    def test_text_excludes_layout_and_filing_elements(self, xml_dir):
+        path = xml_dir / "2023" / "11" / "FR-2023-11-01.xml"
+        ((_, text),) = list(iter_issue_orders(path, "2023-11-01"))
+
+        assert "Section 1. Purpose. Artificial intelligence holds" in text
+        assert "THE WHITE HOUSE," in text
+        assert "FR Doc" not in text
+        assert "Billing code" not in text
+        assert "ED01NO23" not in text
+
+    def test_extract_basic_metadata_matches_api_fields(self, xml_dir):
+        """FederalRegisterClient.extract_basic_metadata() accepts the order as-is."""
+        path = xml_dir / "2023" / "11" / "FR-2023-11-01.xml"
+        ((order, _),) = list(iter_issue_orders(path))
+
+        metadata = FederalRegisterClient().extract_basic_metadata(order)
+
+        assert metadata["president"] == "Joseph R. Biden Jr."
+        assert metadata["agencies"] == ["Executive Office of the President"]
+        assert metadata["raw_text_url"].endswith("/2023/11/01/2023-24283.txt")
+        assert metadata["subtype"] == "Executive Order"
+
+    def test_president_for_date(self):
+        assert president_for_date("2009-01-19")["name"] == "George W. Bush"
+        assert president_for_date("2009-01-20")["name"] == "Barack Obama"
+        assert president_for_date("1980-01-01") is None
+
+    def test_finds_issue_files_and_packages(self, xml_dir):
+        with zipfile.ZipFile(xml_dir / "FR-2023-11-02.zip", "w") as package:
+            package.writestr("FR-2023-11-02.xml", ISSUE_XML)
+        (xml_dir / "notes.xml").write_text("<x/>")
+
+        dates = [date for date, _ in iter_issue_files(xml_dir)]
+
+        assert dates == ["2023-11-01", "2023-11-02"]
+
+
+class TestExecutiveOrderXMLIngester:
+    """Tests for discovery and processing without any API requests."""
+
+    def test_fetch_document_ids_filters_by_signing_date(self, xml_dir, make_ingester):
+        assert make_ingester(xml_dir)._fetch_document_ids() == ["2023-24283"]
+        assert (
+            make_ingester(xml_dir, start_date="2023-10-31")._fetch_document_ids() == []
+        )
+
+    def test_reprinted_orders_are_deduplicated(self, xml_dir, make_ingester):
+        with zipfile.ZipFile(xml_dir / "FR-2023-11-02.zip", "w") as package:
+            package.writestr("FR-2023-11-02.xml", ISSUE_XML)
+
+        assert make_ingester(xml_dir)._fetch_document_ids() == ["2023-24283"]
+
+    @patch("governmentreporter.ingestion.base.DocumentIngester._payloads_from_document")
+    def test_process_uses_xml_text(self, mock_build, xml_dir, make_ingester):
+        """Processing never calls the Federal Register API for text."""
+        ingester = make_ingester(xml_dir)
+        ingester.api_client = None
+        mock_build.return_value = [{"text": "chunk"}]
+        ingester.embedding_generator.generate_batch_embeddings.return_value = [[0.0]]
+        doc_id = ingester._fetch_document_ids()[0]
+
+        documents, embeddings = [], []
+        assert ingester._process_single_document(doc_id, documents, embeddings)
+
+        document = mock_build.call_args[0][0]
+        assert document.content.startswith("Title 3")
+        assert document.metadata["executive_order_number"] == 14110
+        assert [d["document_id"] for d in documents] == [doc_id]
+        assert embeddings == [[0.0]]
@@ -0,0 +1,134 @@
+"""
+Unit tests for the staged ingestion pipeline.
+"""
+
+import threading
+import time
+
+import pytest
+
+from governmentreporter.ingestion.pipeline import (
+    DEFAULT_STAGE_WORKERS,
+    PipelineStage,
+    StagedPipeline,
+    format_stage_stats,
+    parse_stage_workers,
+)
+
+
+class TestParseStageWorkers:
+    """Tests for the --stage-workers specification parser."""
+
+    def test_overrides_defaults(self):
+        workers = parse_stage_workers("extract=8, embed=3")
+
+        assert workers["extract"] == 8
+        assert workers["embed"] == 3
+        assert workers["fetch"] == DEFAULT_STAGE_WORKERS["fetch"]
+
+    def test_empty_spec_uses_defaults(self):
+        assert parse_stage_workers("") == DEFAULT_STAGE_WORKERS
+
+    @pytest.mark.parametrize("spec", ["download=2", "extract", "extract=x", "embed=0"])
+    def test_invalid_spec(self, spec):
+        with pytest.raises(ValueError):
+            parse_stage_workers(spec)
+
+
+class TestStagedPipeline:
+    """Tests for StagedPipeline."""
+
+    def test_items_pass_through_every_stage(self):
+        results = []
+        pipeline = StagedPipeline(
+            [
+                PipelineStage("double", lambda x: x * 2, workers=2),
+                PipelineStage("add", lambda x: x + 1),
+                PipelineStage("collect", results.append),
+            ]
+        )
+        pipeline.start()
+        for i in range(20):
+            pipeline.submit(i)
+        pipeline.close()
+
+        assert sorted(results) == [i * 2 + 1 for i in range(20)]
+        assert [row["processed"] for row in pipeline.stats()] == [20, 20, 20]
+
+    def test_stages_overlap(self):
+        """The first stage handles item 1 while the second handles item 0."""
+        second_started = threading.Event()
+        overlapped = []
+
+        def first(item):
+            if item == 1:
+                overlapped.append(second_started.wait(timeout=5))
+            return item
+
+        def second(item):
+            second_started.set()
+            time.sleep(0.05)
+            return item
+
+        pipeline = StagedPipeline(
+            [PipelineStage("first", first), PipelineStage("second", second)]
+        )
+        pipeline.start()
+        pipeline.submit(0)
+        pipeline.submit(1)
+        pipeline.close()
+
+        assert overlapped == [True]
+
+    def test_queues_are_bounded(self):
+        """A slow stage holds back upstream stages instead of buffering."""
+
+        def slow(item):
+            time.sleep(0.01)
+
+        pipeline = StagedPipeline(
+            [PipelineStage("fast", lambda x: x), PipelineStage("slow", slow)],
+            queue_size=2,
+        )
+        pipeline.start()
+        for i in range(15):
+            pipeline.submit(i)
+        pipeline.close()
+
+        fast, slow_row = pipeline.stats()
+        assert slow_row["queue_max"] <= 2
+        assert slow_row["utilization"] > fast["utilization"]
+        assert "<- bottleneck" in format_stage_stats(pipeline.stats())[2]
+
+    def test_failures_are_reported_and_dropped(self):
+        errors = []
+        results = []
+
+        def check(item):
+            if item == 2:
+                raise ValueError("bad item")
+            return item
+
+        pipeline = StagedPipeline(
+            [PipelineStage("check", check), PipelineStage("collect", results.append)],
+            on_error=lambda stage, item, e: errors.append((stage, item, str(e))),
+        )
+        pipeline.start()
+        for i in range(4):
+            pipeline.submit(i)
+        pipeline.close()
+
+        assert sorted(results) == [0, 1, 3]
+        assert errors == [("check", 2, "bad item")]
+        assert pipeline.stats()[0]["failed"] == 1
+
+    def test_abort_stops_blocked_workers(self):
+        release = threading.Event()
+        pipeline = StagedPipeline(
+            [PipelineStage("wait", lambda x: release.wait(timeout=0.2))], queue_size=1
+        )
+        pipeline.start()
+        pipeline.submit(0)
+        pipeline.abort()
+
+        assert not any(t.is_alive() for t in pipeline._threads[0])
@@ -0,0 +1,353 @@
+"""
+Tests for ProgressTracker document leases.
+
+Each tracker instance stands in for one ingestion process; trackers opened
+on the same file share its documents the way separate processes would.
+
+Python Learning Notes:
+    - Separate sqlite3 connections on one file behave like separate processes
+    - lease_seconds is tiny in these tests so leases can expire quickly
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from governmentreporter.ingestion.progress import ProgressTracker
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "progress.db")
+
+
+@pytest.fixture
+def open_tracker(db_path):
+    """Open trackers on the shared database and close them after the test."""
+    trackers = []
+
+    def open_(worker_id, lease_seconds=60.0):
+        tracker = ProgressTracker(
+            db_path, "scotus", worker_id=worker_id, lease_seconds=lease_seconds
+        )
+        trackers.append(tracker)
+        return tracker
+
+    yield open_
+    for tracker in trackers:
+        tracker.close()
+
+
+def _add(tracker, doc_ids):
+    for doc_id in doc_ids:
+        tracker.add_document(doc_id)
+
+
+class TestClaimDocuments:
+    def test_claims_are_exclusive(self, open_tracker):
+        a, b = open_tracker("a"), open_tracker("b")
+        _add(a, ["1", "2", "3"])
+
+        assert a.claim_documents(["1", "2"]) == ["1", "2"]
+        assert b.claim_documents(["1", "2", "3"]) == ["3"]
+
+    def test_completed_documents_are_not_claimed(self, open_tracker):
+        a = open_tracker("a")
+        _add(a, ["1", "2"])
+        a.claim_documents(["1"])
+        a.mark_completed("1")
+
+        assert a.claim_documents(["2", "1"]) == ["2"]
+
+    def test_failed_documents_can_be_retried(self, open_tracker):
+        a, b = open_tracker("a"), open_tracker("b")
+        _add(a, ["1"])
+        a.claim_documents(["1"])
+        a.mark_failed("1", "boom")
+
+        assert b.claim_documents(["1"]) == ["1"]
+
+    def test_expired_lease_is_reclaimed(self, open_tracker):
+        crashed = open_tracker("crashed", lease_seconds=0.05)
+        _add(crashed, ["1"])
+        crashed.claim_documents(["1"])
+        other = open_tracker("other")
+
+        assert other.claim_documents(["1"]) == []
+        time.sleep(0.1)
+        assert other.get_pending_documents() == ["1"]
+        assert other.claim_documents(["1"]) == ["1"]
+
+    def test_concurrent_claims_never_overlap(self, open_tracker):
+        doc_ids = [str(i) for i in range(300)]
+        _add(open_tracker("setup"), doc_ids)
+        trackers = [open_tracker(f"w{i}") for i in range(4)]
+        results = {}
+
+        def claim(tracker):
+            results[tracker.worker_id] = tracker.claim_documents(doc_ids)
+
+        threads = [threading.Thread(target=claim, args=(t,)) for t in trackers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        claimed = [doc_id for ids in results.values() for doc_id in ids]
+        assert sorted(claimed, key=int) == doc_ids
+
+
+class TestLeaseLifecycle:
+    def test_heartbeat_keeps_lease_alive(self, open_tracker):
+        a = open_tracker("a", lease_seconds=0.2)
+        _add(a, ["1"])
+        a.claim_documents(["1"])
+        b = open_tracker("b")
+
+        for _ in range(3):
+            time.sleep(0.1)
+            assert a.heartbeat() == 1
+        assert b.claim_documents(["1"]) == []
+
+    def test_background_heartbeat(self, open_tracker):
+        a = open_tracker("a", lease_seconds=0.2)
+        _add(a, ["1"])
+        a.claim_documents(["1"])
+        b = open_tracker("b")
+
+        a.start_heartbeat(interval=0.05)
+        time.sleep(0.3)
+        assert b.claim_documents(["1"]) == []
+
+        a.stop_heartbeat()
+        time.sleep(0.25)
+        assert b.claim_documents(["1"]) == ["1"]
+
+    def test_release_returns_unfinished_documents(self, open_tracker):
+        a, b = open_tracker("a"), open_tracker("b")
+        _add(a, ["1", "2"])
+        a.claim_documents(["1", "2"])
+        a.mark_completed("1")
+
+        assert a.release_leases() == 1
+        assert b.claim_documents(["1", "2"]) == ["2"]
+
+    def test_reset_keeps_live_leases(self, open_tracker):
+        a = open_tracker("a")
+        _add(a, ["1"])
+        a.claim_documents(["1"])
+
+        # A second process starting up must not steal document 1
+        b = open_tracker("b")
+        b.reset_processing_status()
+
+        assert b.get_statistics()["processing"] == 1
+        assert b.claim_documents(["1"]) == []
+
+    def test_reset_recovers_expired_leases(self, open_tracker):
+        a = open_tracker("a", lease_seconds=0.01)
+        _add(a, ["1"])
+        a.claim_documents(["1"])
+        time.sleep(0.05)
+
+        b = open_tracker("b")
+        b.reset_processing_status()
+
+        assert b.get_statistics()["pending"] == 1
+
+
+def test_database_without_lease_columns_is_upgraded(db_path, open_tracker):
+    legacy_schema = """
+        CREATE TABLE document_progress (
+            document_id TEXT NOT NULL,
+            document_type TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            error_message TEXT,
+            metadata TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            processing_time_ms INTEGER,
+            PRIMARY KEY (document_id, document_type)
+        )
+    """
+    conn = sqlite3.connect(db_path)
+    conn.execute(legacy_schema)
+    conn.execute(
+        "INSERT INTO document_progress (document_id, document_type, status) "
+        "VALUES ('1', 'scotus', 'processing')"
+    )
+    conn.commit()
+    conn.close()
+
+    tracker = open_tracker("a")
+
+    # A 'processing' row without a lease was left by a run that is gone
+    assert tracker.claim_documents(["1"]) == ["1"]
+
+
+def test_spooled_documents_are_neither_pending_nor_completed(open_tracker):
+    a = open_tracker("a")
+    _add(a, ["1"])
+    a.claim_documents(["1"])
+    a.mark_spooled("1", processing_time_ms=120)
+
+    assert a.get_statistics()["spooled"] == 1
+    assert not a.is_processed("1")
+    assert a.get_pending_documents() == []
+    assert open_tracker("b").claim_documents(["1"]) == []
+
+    a.mark_completed("1")
+    stats = a.get_statistics()
+    assert stats["completed"] == 1
+    assert stats["avg_processing_time_ms"] == 120
+
+
+def test_lost_spooled_documents_are_released_once_their_lease_expires(open_tracker):
+    crashed = open_tracker("crashed", lease_seconds=0.05)
+    _add(crashed, ["1", "2", "3"])
+    crashed.claim_documents(["1", "2", "3"])
+    for doc_id in ["1", "2", "3"]:
+        crashed.mark_spooled(doc_id)
+    survivor = open_tracker("survivor")
+
+    # The lease is still live: the spooling process may yet drain its spool
+    assert survivor.release_lost_spooled(local_document_ids=[]) == []
+
+    time.sleep(0.1)
+    # "2" still has a segment in the local spool, so the drain completes it
+    assert survivor.release_lost_spooled(local_document_ids=["2"]) == ["1", "3"]
+    assert survivor.claim_documents(["1", "2", "3"]) == ["1", "3"]
+    assert survivor.get_statistics()["spooled"] == 1
+
+
+def test_refresh_claims_completed_documents_and_keeps_fingerprint(open_tracker):
+    a = open_tracker("a")
+    _add(a, ["1"])
+    a.claim_documents(["1"])
+    fingerprint = {"content_hash": "abc", "embedding_model": "m:1536"}
+    a.mark_completed("1", fingerprint=fingerprint)
+
+    assert a.get_fingerprint("1") == fingerprint
+    assert a.claim_documents(["1"]) == []
+    assert a.claim_documents(["1"], include_completed=True) == ["1"]
+
+    # An unchanged document is completed again without a new fingerprint
+    a.mark_completed("1")
+    assert a.get_fingerprint("1") == fingerprint
+    assert a.get_fingerprint("missing") is None
+
+
+class TestBatchedBookkeeping:
+    def test_add_documents_ignores_duplicates(self, open_tracker):
+        a = open_tracker("a")
+        a.add_documents(["1", "2"])
+        a.mark_failed("2", "boom")
+
+        a.add_documents(["2", "3", "3"])
+
+        stats = a.get_statistics()
+        assert stats["total"] == 3
+        assert stats["failed"] == 1
+
+    def test_database_uses_wal_journal(self, open_tracker):
+        a = open_tracker("a")
+        mode = a.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_pending_documents_are_paginated_in_insertion_order(self, open_tracker):
+        a = open_tracker("a")
+        a.add_documents([str(i) for i in range(25)])
+        a.claim_documents(["3", "17"])
+
+        pending = list(a.iter_pending_documents(page_size=10))
+
+        assert pending == [str(i) for i in range(25) if i not in (3, 17)]
+        assert a.get_pending_documents(limit=2) == ["0", "1"]
+
+    def test_buffered_updates_are_visible_to_own_reads(self, db_path, open_tracker):
+        buffered = ProgressTracker(db_path, "scotus", flush_interval=60.0)
+        buffered.add_documents(["1", "2"])
+        buffered.claim_documents(["1", "2"])
+        buffered.mark_completed("1")
+        buffered.mark_failed("2", "boom")
+
+        # Not written yet, but this tracker's own reads flush first
+        other = open_tracker("other")
+        assert other.get_statistics()["completed"] == 0
+        assert buffered.get_statistics()["completed"] == 1
+        assert other.get_statistics()["failed"] == 1
+
+        buffered.mark_completed("2")
+        buffered.close()
+        assert other.get_statistics()["completed"] == 2
+
+    def test_buffered_updates_are_flushed_on_a_timer(self, db_path, open_tracker):
+        buffered = ProgressTracker(db_path, "scotus", flush_interval=0.05)
+        buffered.add_documents(["1"])
+        buffered.mark_completed("1")
+        other = open_tracker("other")
+
+        deadline = time.time() + 5
+        while other.get_statistics()["completed"] == 0 and time.time() < deadline:
+            time.sleep(0.02)
+
+        assert other.get_statistics()["completed"] == 1
+        buffered.close()
+
+
+class TestStageTimings:
+    def test_timings_accumulate_and_reset_on_reprocessing(self, open_tracker):
+        a = open_tracker("a")
+        a.add_documents(["1"])
+        a.mark_processing("1")
+        a.record_timings("1", {"fetch": 100.4, "llm": 900}, {"embedding_tokens": 40})
+        a.record_timings("1", {"store": 30}, {"embedding_tokens": 2})
+
+        stats = a.get_stage_statistics()
+        assert stats["fetch_ms"]["total"] == 100
+        assert stats["store_ms"]["total"] == 30
+        assert stats["embedding_tokens"]["total"] == 42
+        assert "chunk_ms" not in stats
+
+        a.mark_processing("1")
+        assert a.get_stage_statistics() == {}
+
+    def test_unknown_stage_is_rejected(self, open_tracker):
+        with pytest.raises(ValueError, match="Unknown stage metrics"):
+            open_tracker("a").record_timings("1", {"parse": 5})
+
+    def test_percentiles_over_documents(self, open_tracker):
+        a = open_tracker("a")
+        doc_ids = [str(i) for i in range(1, 101)]
+        a.add_documents(doc_ids)
+        for doc_id in doc_ids:
+            a.mark_processing(doc_id)
+            a.record_timings(doc_id, {"embed": int(doc_id)})
+
+        embed = a.get_stage_statistics()["embed_ms"]
+
+        assert embed["count"] == 100
+        assert (embed["p50"], embed["p95"], embed["p99"]) == (50, 95, 99)
+
+    def test_run_totals_cover_documents_the_run_processed(self, open_tracker):
+        a = open_tracker("a")
+        a.add_documents(["1", "2", "3"])
+        first = a.start_run("2024-01-01", "2024-12-31")
+        for doc_id in ("1", "2"):
+            a.mark_processing(doc_id)
+            a.record_timings(doc_id, {"fetch": 10}, {"llm_prompt_tokens": 5})
+        a.end_run(first)
+
+        second = a.start_run("2024-01-01", "2024-12-31")
+        a.mark_processing("3")
+        a.record_timings("3", {"fetch": 7})
+        a.end_run(second)
+
+        runs = {run["run_id"]: run for run in a.get_run_history()}
+        assert runs[first]["fetch_ms"] == 20
+        assert runs[first]["llm_prompt_tokens"] == 10
+        assert runs[second]["fetch_ms"] == 7
+        assert runs[second]["llm_prompt_tokens"] is None
+        assert a.get_stage_statistics(run_id=second)["fetch_ms"]["count"] == 1
@@ -0,0 +1,124 @@
+"""
+Tests for reprocessing documents whose LLM metadata extraction failed.
+
+Chunks are stored in a real local Qdrant database in a temporary directory;
+the LLM extraction is replaced with a stub.
+
+Python Learning Notes:
+    - with_vectors=True on retrieve() returns the stored vector, which shows
+      that a payload-only update left it untouched
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from governmentreporter.database.qdrant import QdrantDBClient, point_id
+from governmentreporter.ingestion.reprocess import (
+    MetadataReprocessor,
+    rebuild_prepared_document,
+)
+
+COLLECTION = "supreme_court_opinions"
+
+
+def _payloads(doc_id, flagged, labels=("Syllabus", "Majority Opinion")):
+    metadata = {"document_id": doc_id, "title": f"Case {doc_id}"}
+    if flagged:
+        metadata.update(
+            document_summary="Unable to generate summary.",
+            llm_extraction_failed=True,
+            requires_reprocessing=True,
+        )
+    else:
+        metadata["document_summary"] = "A good summary."
+    return [
+        {
+            "id": f"{doc_id}_chunk_{i}",
+            "text": f"{label} text of {doc_id}",
+            "metadata": {**metadata, "chunk_index": i, "section_label": label},
+        }
+        for i, label in enumerate(labels)
+    ]
+
+
+@pytest.fixture
+def reprocessor(tmp_path):
+    db_client = QdrantDBClient(db_path=str(tmp_path / "qdrant_db"))
+    reprocessor = MetadataReprocessor(COLLECTION, shared_db_client=db_client)
+    payloads = _payloads("1", flagged=True) + _payloads("2", flagged=False)
+    reprocessor.qdrant_client.batch_upsert_documents(
+        payloads, [[0.5] * 1536 for _ in payloads]
+    )
+    yield reprocessor
+    db_client.client.close()
+
+
+def _stored(reprocessor, chunk_id):
+    return reprocessor.qdrant_client.client.client.retrieve(
+        collection_name=COLLECTION, ids=[point_id(chunk_id)], with_vectors=True
+    )[0]
+
+
+def test_finds_only_flagged_documents(reprocessor):
+    assert reprocessor.find_flagged_documents() == ["1"]
+
+
+def test_rebuilds_text_and_syllabus_from_chunks(reprocessor):
+    stored = reprocessor.qdrant_client.get_document_payloads("1")
+
+    prepared = rebuild_prepared_document("1", "scotus", stored)
+
+    assert prepared.document.content == (
+        "Syllabus text of 1\n\nMajority Opinion text of 1"
+    )
+    assert prepared.syllabus == "Syllabus text of 1"
+    assert prepared.doc_metadata == {}
+
+
+def test_repair_updates_every_chunk_without_reembedding(reprocessor):
+    fields = {"document_summary": "Repaired summary."}
+    with patch(
+        "governmentreporter.ingestion.reprocess.extract_document_metadata",
+        return_value=fields,
+    ) as extract:
+        counts = reprocessor.run()
+
+    assert extract.call_count == 1
+    assert counts["flagged"] == 1 and counts["repaired"] == 1
+    untouched = _stored(reprocessor, "2_chunk_0")
+    for chunk_id in ("1_chunk_0", "1_chunk_1"):
+        point = _stored(reprocessor, chunk_id)
+        assert point.payload["document_summary"] == "Repaired summary."
+        assert "requires_reprocessing" not in point.payload
+        assert "llm_extraction_failed" not in point.payload
+        assert point.payload["text"].endswith("text of 1")
+        assert point.vector == pytest.approx(untouched.vector)
+    assert reprocessor.find_flagged_documents() == []
+
+
+def test_failing_again_keeps_the_flag(reprocessor):
+    with patch(
+        "governmentreporter.ingestion.reprocess.extract_document_metadata",
+        return_value={"requires_reprocessing": True, "llm_extraction_failed": True},
+    ):
+        counts = reprocessor.run()
+
+    assert counts["still failing"] == 1
+    assert reprocessor.find_flagged_documents() == ["1"]
+
+
+def test_dry_run_only_counts(reprocessor):
+    reprocessor.dry_run = True
+    with patch(
+        "governmentreporter.ingestion.reprocess.extract_document_metadata"
+    ) as extract:
+        counts = reprocessor.run()
+
+    assert counts["flagged"] == 1
+    extract.assert_not_called()
+
+
+def test_unknown_collection_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Cannot reprocess"):
+        MetadataReprocessor("other", qdrant_db_path=str(tmp_path / "qdrant_db"))
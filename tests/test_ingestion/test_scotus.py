@@ -14,11 +14,13 @@ Test Categories:
     - Cluster caching behavior
 """
 
+import asyncio
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from governmentreporter.ingestion.scotus import SCOTUSIngester
+from governmentreporter.ingestion.discovery_cache import DiscoveryCache
+from governmentreporter.ingestion.scotus import AsyncSCOTUSIngester, SCOTUSIngester
 
 
 class TestSCOTUSIngester:
@@ -111,164 +113,180 @@ class TestSCOTUSIngester:
         assert isinstance(ingester.cluster_cache, dict)
         assert len(ingester.cluster_cache) == 0
 
-    @patch("httpx.Client")
-    def test_fetch_document_ids_from_scotus_clusters(
-        self,
-        mock_httpx_client,
-        ingester,
-        mock_scotus_cluster_data,
-        mock_scotus_docket_data,
-    ):
+    @staticmethod
+    def _clusters_page(cluster_id, opinion_id, next_url):
+        """Build a mocked clusters page response with one cluster."""
+        response = MagicMock()
+        response.json.return_value = {
+            "results": [
+                {
+                    "id": cluster_id,
+                    "sub_opinions": [
+                        f"https://www.courtlistener.com/api/rest/v4/opinions/{opinion_id}/"
+                    ],
+                }
+            ],
+            "next": next_url,
+        }
+        return response
+
+    def test_iter_document_ids_streams_pages_and_persists_cursor(self, ingester):
         """
-        Test that _fetch_document_ids fetches SCOTUS clusters via API filter.
+        Test that discovery yields page by page and saves the next-page URL.
 
-        Verifies that the method:
-        1. Fetches clusters from the API using docket__court=scotus filter
-        2. Extracts opinion IDs from clusters (API filter ensures SCOTUS only)
-        3. Caches cluster data for later use
+        The cursor for a page is only saved after the consumer has taken the
+        previous page, and is cleared when pagination completes.
         """
-        # Mock HTTP client
-        mock_client_instance = MagicMock()
-        mock_httpx_client.return_value.__enter__.return_value = mock_client_instance
-
-        # Mock clusters response - API filter ensures SCOTUS only
-        clusters_response = MagicMock()
-        clusters_response.json.return_value = {
-            "results": [mock_scotus_cluster_data],
-            "next": None,
-        }
-        clusters_response.raise_for_status = MagicMock()
-
-        mock_client_instance.get.return_value = clusters_response
-
-        # Call the method
-        opinion_ids = ingester._fetch_document_ids()
-
-        # Verify results
-        assert len(opinion_ids) == 2
-        assert "123456" in opinion_ids
-        assert "123457" in opinion_ids
-
-        # Verify cluster data was cached
-        assert len(ingester.cluster_cache) == 2
-        assert ingester.cluster_cache["123456"] == mock_scotus_cluster_data
-        assert ingester.cluster_cache["123457"] == mock_scotus_cluster_data
-
-        # Verify API was called with correct filter
-        call_args = mock_client_instance.get.call_args
-        assert call_args is not None
-        # Check that docket__court=scotus filter is in params
-        if "params" in call_args.kwargs:
-            params = call_args.kwargs["params"]
-            assert params.get("docket__court") == "scotus"
-
-    @patch("governmentreporter.ingestion.scotus.build_payloads_from_document")
-    def test_process_single_document_uses_cached_cluster_data(
-        self, mock_build_payloads, ingester, mock_scotus_cluster_data
+        next_url = "https://www.courtlistener.com/api/rest/v4/clusters/?cursor=abc"
+        tracker = ingester.progress_tracker
+        tracker.get_discovery_cursor.return_value = None
+        ingester.api_client.http_client.get.side_effect = [
+            self._clusters_page(1, "101", next_url),
+            self._clusters_page(2, "202", None),
+        ]
+
+        pages = ingester._iter_document_ids()
+
+        assert next(pages) == ["101"]
+        tracker.save_discovery_cursor.assert_not_called()
+        assert next(pages) == ["202"]
+        tracker.save_discovery_cursor.assert_called_once_with(
+            "clusters:2024-01-01:2024-12-31", next_url
+        )
+        assert list(pages) == []
+        tracker.clear_discovery_cursor.assert_called_once()
+
+        # The first page filters on the court; next-page URLs carry their
+        # own query string
+        first_call = ingester.api_client.http_client.get.call_args_list[0]
+        assert first_call.kwargs["params"]["docket__court"] == "scotus"
+        second_call = ingester.api_client.http_client.get.call_args_list[1]
+        assert second_call.args[0] == next_url
+        assert second_call.kwargs["params"] is None
+
+    def test_iter_document_ids_resumes_from_saved_cursor(self, ingester):
+        """Test that an interrupted discovery resumes at the saved page."""
+        saved_url = "https://www.courtlistener.com/api/rest/v4/clusters/?cursor=xyz"
+        ingester.progress_tracker.get_discovery_cursor.return_value = saved_url
+        ingester.api_client.http_client.get.return_value = self._clusters_page(
+            3, "303", None
+        )
+
+        assert list(ingester._iter_document_ids()) == [["303"]]
+
+        first_call = ingester.api_client.http_client.get.call_args_list[0]
+        assert first_call.args[0] == saved_url
+        assert first_call.kwargs["params"] is None
+
+    def test_completed_discovery_is_reused_from_discovery_cache(
+        self, ingester, tmp_path
+    ):
+        """Test that a later run replays a cached discovery without the API."""
+        cache = DiscoveryCache(tmp_path / "discovery.db", "scotus_clusters")
+        ingester.discovery_cache = ingester.cluster_cache = cache
+        ingester.progress_tracker.get_discovery_cursor.return_value = None
+        http_get = ingester.api_client.http_client.get
+        http_get.side_effect = [
+            self._clusters_page(1, "101", "https://example.test/next"),
+            self._clusters_page(2, "202", None),
+        ]
+        assert list(ingester._iter_document_ids()) == [["101"], ["202"]]
+
+        # A resumed run: memory is gone, discovery must not hit the API again
+        http_get.reset_mock()
+        resumed = DiscoveryCache(tmp_path / "discovery.db", "scotus_clusters")
+        ingester.discovery_cache = ingester.cluster_cache = resumed
+
+        assert list(ingester._iter_document_ids()) == [["101", "202"]]
+        http_get.assert_not_called()
+        assert resumed.pop("202")["id"] == 2
+
+    def test_fetch_document_uses_cached_cluster_data(
+        self, ingester, mock_scotus_cluster_data
     ):
         """
-        Test that _process_single_document uses cached cluster data.
+        Test that _fetch_document uses cached cluster data.
 
-        Verifies that the processing step retrieves cluster data from cache
-        instead of making redundant API calls.
+        Verifies that the fetch step retrieves cluster data from the cache
+        filled by discovery instead of making redundant API calls, and
+        releases the cached entry afterwards.
         """
-        # Pre-populate cluster cache (simulating _fetch_document_ids behavior)
         ingester.cluster_cache["123456"] = mock_scotus_cluster_data
 
-        # Mock API client
         mock_document = MagicMock()
         mock_document.title = "Test Case v. United States"
         ingester.api_client.get_document.return_value = mock_document
 
-        # Mock build_payloads to return empty list (we're just testing cache usage)
-        mock_build_payloads.return_value = [
-            {
-                "text": "test chunk",
-                "chunk_index": 0,
-                "opinion_type": "majority",
-            }
-        ]
+        assert ingester._fetch_document("123456") is mock_document
 
-        # Mock embedding generator
-        ingester.embedding_generator.generate_batch_embeddings.return_value = [
-            [0.1] * 1536
-        ]
-
-        # Mock progress tracker
-        ingester.progress_tracker.mark_processing = Mock()
-        ingester.progress_tracker.mark_completed = Mock()
-
-        batch_documents = []
-        batch_embeddings = []
-
-        result = ingester._process_single_document(
-            "123456", batch_documents, batch_embeddings
+        ingester.api_client.get_document.assert_called_once_with(
+            "123456", cluster_data=mock_scotus_cluster_data
         )
+        assert "123456" not in ingester.cluster_cache
 
-        # Should succeed
-        assert result is True
-
-        # Verify get_document was called with cluster_data parameter
-        call_args = ingester.api_client.get_document.call_args
-        assert call_args is not None
-        assert call_args[0][0] == "123456"  # document_id
-        # Check if cluster_data was passed via keyword argument
-        if len(call_args) > 1:
-            assert call_args[1].get("cluster_data") == mock_scotus_cluster_data
-        else:
-            # Check kwargs
-            assert call_args.kwargs.get("cluster_data") == mock_scotus_cluster_data
-
-    @patch("governmentreporter.ingestion.scotus.build_payloads_from_document")
-    def test_process_single_document_handles_missing_cache(
-        self, mock_build_payloads, ingester
-    ):
+    def test_fetch_document_handles_missing_cache(self, ingester):
         """
-        Test that _process_single_document handles missing cluster cache gracefully.
+        Test that _fetch_document handles missing cluster cache gracefully.
 
-        Verifies that if cluster data is not in cache (edge case), the method
-        logs a warning but continues processing by fetching cluster data from API.
+        Verifies that if cluster data is not in cache (e.g. an opinion left
+        pending by an earlier run), the opinion is still fetched and the
+        client looks the cluster up itself.
         """
-        # DO NOT populate cluster cache - simulate cache miss
-
-        # Mock API client
         mock_document = MagicMock()
         mock_document.title = "Test Case v. United States"
         ingester.api_client.get_document.return_value = mock_document
 
-        # Mock build_payloads
-        mock_build_payloads.return_value = [
-            {
-                "text": "test chunk",
-                "chunk_index": 0,
-                "opinion_type": "majority",
-            }
-        ]
+        assert ingester._fetch_document("123456") is mock_document
 
-        # Mock embedding generator
-        ingester.embedding_generator.generate_batch_embeddings.return_value = [
-            [0.1] * 1536
-        ]
+        ingester.api_client.get_document.assert_called_once_with(
+            "123456", cluster_data=None
+        )
+
+
+class TestAsyncSCOTUSIngesterDiscovery:
+    """Test the async ingester's use of the persistent discovery cache."""
 
-        # Mock progress tracker
-        ingester.progress_tracker.mark_processing = Mock()
-        ingester.progress_tracker.mark_completed = Mock()
+    @staticmethod
+    def _make(tmp_path, run, clusters):
+        ingester = AsyncSCOTUSIngester(
+            start_date="2024-01-01",
+            end_date="2024-12-31",
+            dry_run=True,
+            progress_db=str(tmp_path / "progress.db"),
+            # One store per run: local Qdrant storage is locked by its client
+            qdrant_db_path=str(tmp_path / f"qdrant_{run}"),
+            discovery_db=str(tmp_path / "discovery.db"),
+        )
 
-        batch_documents = []
-        batch_embeddings = []
+        async def list_scotus_clusters(start_date, end_date):
+            for cluster in clusters:
+                yield cluster
 
-        result = ingester._process_single_document(
-            "123456", batch_documents, batch_embeddings
+        ingester.api_client.list_scotus_clusters = MagicMock(
+            side_effect=list_scotus_clusters
         )
+        return ingester
+
+    @staticmethod
+    def _discover(ingester):
+        async def collect():
+            return [page async for page in ingester._iter_document_ids()]
+
+        return asyncio.run(collect())
+
+    def test_completed_discovery_is_replayed_from_cache(self, tmp_path, monkeypatch):
+        """A second run reuses the listing and cluster data of the first."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        monkeypatch.setenv("COURT_LISTENER_API_TOKEN", "test-token")
+        clusters = [
+            {"id": 1, "sub_opinions": ["https://x/api/rest/v4/opinions/101/"]},
+            {"id": 2, "sub_opinions": ["https://x/api/rest/v4/opinions/202/"]},
+        ]
+
+        first = self._make(tmp_path, "first", clusters)
+        assert self._discover(first) == [["101", "202"]]
 
-        # Should still succeed (falls back to API fetch)
-        assert result is True
-
-        # Verify get_document was called with cluster_data=None
-        call_args = ingester.api_client.get_document.call_args
-        assert call_args is not None
-        # When cluster_data is None, it will fetch from API
-        if len(call_args) > 1 and "cluster_data" in call_args[1]:
-            assert call_args[1]["cluster_data"] is None
-        elif "cluster_data" in call_args.kwargs:
-            assert call_args.kwargs["cluster_data"] is None
+        second = self._make(tmp_path, "second", [])
+        assert self._discover(second) == [["101", "202"]]
+        second.api_client.list_scotus_clusters.assert_not_called()
+        assert second.cluster_cache.pop("202")["id"] == 2
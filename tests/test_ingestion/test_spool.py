@@ -0,0 +1,73 @@
+"""
+Tests for the on-disk payload spool.
+
+Python Learning Notes:
+    - tmp_path is a fresh pytest-provided directory for each test
+    - float32 keeps about 7 significant digits, hence pytest.approx below
+"""
+
+import pytest
+
+from governmentreporter.ingestion.spool import PayloadSpool
+
+
+@pytest.fixture
+def spool(tmp_path):
+    return PayloadSpool(tmp_path / "spool")
+
+
+class TestPayloadSpool:
+    def test_roundtrip(self, spool):
+        payloads = [{"id": "1_chunk_0", "text": "a"}, {"id": "1_chunk_1", "text": "b"}]
+        path = spool.write("1", payloads, [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]])
+
+        segment = spool.read(path)
+
+        assert segment.document_id == "1"
+        assert segment.payloads == payloads
+        assert segment.embeddings[0] == pytest.approx([0.1, 0.2, 0.3])
+        assert segment.embeddings[1] == pytest.approx([0.4, 0.5, 0.6])
+
+    def test_embeddings_are_stored_as_float32(self, spool):
+        path = spool.write("1", [{"id": "x"}], [[0.0] * 1536])
+
+        assert path.with_suffix(".f32").stat().st_size == 1536 * 4
+
+    def test_segments_are_listed_oldest_first(self, spool):
+        paths = [spool.write(str(i), [], []) for i in range(5)]
+
+        assert spool.segments() == paths
+        assert [spool.read(p).document_id for p in paths] == ["0", "1", "2", "3", "4"]
+
+    def test_document_ids(self, spool):
+        assert spool.document_ids() == set()
+        paths = [spool.write(doc_id, [], []) for doc_id in ["1", "2", "2"]]
+        spool.remove(paths[0])
+
+        assert spool.document_ids() == {"2"}
+
+    def test_remove_is_idempotent(self, spool):
+        path = spool.write("1", [{"id": "x"}], [[1.0]])
+
+        spool.remove(path)
+        spool.remove(path)
+
+        assert len(spool) == 0
+        assert list(spool.directory.iterdir()) == []
+        with pytest.raises(FileNotFoundError):
+            spool.read(path)
+
+    def test_directory_is_created_on_first_write(self, tmp_path):
+        spool = PayloadSpool(tmp_path / "missing")
+
+        assert spool.segments() == []
+        assert not spool.directory.exists()
+        spool.write("1", [], [])
+        assert spool.directory.is_dir()
+
+    @pytest.mark.parametrize(
+        "embeddings", [[[1.0]], [[1.0], [2.0, 3.0]]], ids=["count", "dimension"]
+    )
+    def test_mismatched_embeddings_are_rejected(self, spool, embeddings):
+        with pytest.raises(ValueError):
+            spool.write("1", [{"id": "a"}, {"id": "b"}], embeddings)
@@ -17,6 +17,7 @@ Python Learning Notes:
     - Validation of complex data transformations
 """
 
+import dataclasses
 from datetime import datetime
 from typing import Any, Dict, List
 from unittest.mock import MagicMock, Mock, call, patch
@@ -25,10 +26,14 @@ import pytest
 
 from governmentreporter.apis.base import Document
 from governmentreporter.processors.build_payloads import (
+    DocumentFingerprint,
+    PreparedDocument,
     build_payloads_from_document,
     extract_year_from_date,
+    fingerprint_document,
     normalize_eo_metadata,
     normalize_scotus_metadata,
+    stored_document_metadata,
     validate_payload,
 )
 
@@ -509,6 +514,83 @@ class TestBuildPayloadsFromDocument:
             mock_logger.warning.assert_called()
 
 
+class TestDocumentFingerprint:
+    """
+    Test suite for change detection between stored and fetched documents.
+
+    Python Learning Notes:
+        - dataclasses.replace() copies a frozen dataclass with fields changed
+    """
+
+    @staticmethod
+    def _prepared(content, doc_metadata=None):
+        document = Document(
+            id="fp-1",
+            title="Fingerprint v. Test",
+            date="2024-01-15",
+            type="scotus_opinion",
+            source="courtlistener",
+            content=content,
+        )
+        return PreparedDocument(
+            document=document,
+            doc_type="scotus",
+            doc_metadata=doc_metadata or {"case_name": "Fingerprint v. Test"},
+            chunks=[],
+        )
+
+    def test_whitespace_changes_do_not_change_the_hash(self):
+        a = fingerprint_document(self._prepared("The  Court\nheld."), "m:1536")
+        b = fingerprint_document(self._prepared("The Court held.  "), "m:1536")
+
+        assert a == b
+        assert a.stages_to_redo(b) == set()
+
+    def test_fallback_year_is_not_hashed(self):
+        undated = {"case_name": "Fingerprint v. Test", "publication_date": None}
+        a = fingerprint_document(
+            self._prepared("The Court held.", {**undated, "year": 2025}), "m:1536"
+        )
+        b = fingerprint_document(
+            self._prepared("The Court held.", {**undated, "year": 2026}), "m:1536"
+        )
+
+        assert a == b
+
+    def test_content_or_metadata_change_redoes_everything(self):
+        stored = fingerprint_document(self._prepared("The Court held."), "m:1536")
+        edited = fingerprint_document(self._prepared("The Court ruled."), "m:1536")
+        renamed = fingerprint_document(
+            self._prepared("The Court held.", {"case_name": "Renamed"}), "m:1536"
+        )
+
+        assert edited.stages_to_redo(stored) == {"chunk", "extract", "embed"}
+        assert renamed.stages_to_redo(stored) == {"chunk", "extract", "embed"}
+        assert edited.stages_to_redo(None) == {"chunk", "extract", "embed"}
+
+    def test_prompt_and_model_changes_redo_only_their_stage(self):
+        stored = fingerprint_document(self._prepared("The Court held."), "m:1536")
+
+        new_prompt = dataclasses.replace(stored, prompt_version="2:gpt")
+        new_model = dataclasses.replace(stored, embedding_model="m:3072")
+
+        assert new_prompt.stages_to_redo(stored) == {"extract"}
+        assert new_model.stages_to_redo(stored) == {"embed"}
+
+    def test_round_trips_through_payload_metadata(self):
+        fingerprint = fingerprint_document(self._prepared("Text."), "m:1536")
+        metadata = {"document_summary": "S", **fingerprint.as_metadata()}
+
+        assert DocumentFingerprint.from_metadata(metadata) == fingerprint
+        assert DocumentFingerprint.from_metadata({"document_summary": "S"}) is None
+        assert DocumentFingerprint.from_metadata(None) is None
+
+    def test_stored_document_metadata_drops_chunk_fields(self):
+        stored = {"original_id": "x_chunk_0", "text": "chunk", "title": "T"}
+
+        assert stored_document_metadata(stored) == {"title": "T"}
+
+
 # Test fixtures for build_payloads tests
 @pytest.fixture
 def sample_scotus_document():
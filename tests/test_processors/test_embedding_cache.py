@@ -0,0 +1,82 @@
+"""
+Unit tests for the persistent embedding cache.
+
+The cache is a real SQLite database in a temporary directory; vectors are
+small so sizes are easy to reason about (4 bytes per dimension).
+"""
+
+import pytest
+
+from governmentreporter.processors.embedding_cache import EmbeddingCache
+
+MODEL = "text-embedding-3-small"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Fresh cache in a temporary directory."""
+    cache = EmbeddingCache(tmp_path / "embeddings")
+    yield cache
+    cache.close()
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache storage."""
+
+    def test_round_trip_as_float32(self, cache):
+        cache.put_many(MODEL, 3, ["a", "b"], [[0.5, 0.25, 1.0], [0.1, 0.2, 0.3]])
+
+        a, missing, b = cache.get_many(MODEL, 3, ["a", "c", "b"])
+
+        assert a == [0.5, 0.25, 1.0]
+        assert missing is None
+        assert b == pytest.approx([0.1, 0.2, 0.3], rel=1e-6)
+        assert cache.stats()["size_bytes"] == 2 * 3 * 4
+
+    def test_keyed_by_model_and_dimension(self, cache):
+        cache.put_many(MODEL, 2, ["a"], [[1.0, 2.0]])
+
+        assert cache.get_many("other-model", 2, ["a"]) == [None]
+        assert cache.get_many(MODEL, 3, ["a"]) == [None]
+        assert cache.get_many(MODEL, 2, ["a"]) == [[1.0, 2.0]]
+
+    def test_counts_hits_and_misses(self, cache):
+        cache.put_many(MODEL, 1, ["a"], [[1.0]])
+        cache.get_many(MODEL, 1, ["a", "a", "b"])
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["stores"]) == (2, 1, 1)
+        assert stats["entries"] == 1
+
+    def test_zero_vectors_are_not_stored(self, cache):
+        cache.put_many(MODEL, 2, ["failed"], [[0.0, 0.0]])
+
+        assert cache.get_many(MODEL, 2, ["failed"]) == [None]
+        assert cache.stats()["entries"] == 0
+
+    def test_least_recently_used_vectors_are_evicted(self, tmp_path):
+        # Room for three 1-dimension vectors (12 bytes) but not four
+        cache = EmbeddingCache(tmp_path / "small", max_size_bytes=14)
+        cache.put_many(MODEL, 1, ["a", "b", "c"], [[1.0], [2.0], [3.0]])
+        cache.get_many(MODEL, 1, ["a"])  # "b" is now least recently used
+
+        cache.put_many(MODEL, 1, ["d"], [[4.0]])
+
+        assert cache.get_many(MODEL, 1, ["a", "b", "c", "d"]) == [
+            [1.0],
+            None,
+            [3.0],
+            [4.0],
+        ]
+        assert cache.stats()["evictions"] == 1
+        assert cache.total_size() == 12
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        first = EmbeddingCache(tmp_path / "shared")
+        first.put_many(MODEL, 1, ["a"], [[1.0]])
+        first.close()
+
+        second = EmbeddingCache(tmp_path / "shared")
+        assert second.get_many(MODEL, 1, ["a"]) == [[1.0]]
+        second.close()
@@ -18,15 +18,28 @@ Python Learning Notes:
 """
 
 import logging
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from openai import APIError, OpenAI, RateLimitError
 
+from governmentreporter.processors.embedding_cache import EmbeddingCache
 from governmentreporter.processors.embeddings import (
+    MAX_TOKENS_PER_INPUT,
+    AsyncEmbeddingGenerator,
+    EmbeddingAggregator,
     EmbeddingGenerator,
+    combine_embeddings,
     generate_embedding,
+    pack_requests,
+    split_oversized,
 )
+from governmentreporter.utils.concurrency import RateLimitPacer
+
+
+def _raw_response(response, headers=None):
+    """Wrap a response the way embeddings.with_raw_response.create() returns it."""
+    return MagicMock(headers=headers or {}, parse=Mock(return_value=response))
 
 
 class TestEmbeddingGenerator:
@@ -254,7 +267,8 @@ class TestEmbeddingGenerator:
 
         mock_response = MagicMock()
         mock_response.data = [MagicMock(embedding=emb) for emb in mock_embeddings]
-        mock_client.embeddings.create.return_value = mock_response
+        raw_create = mock_client.embeddings.with_raw_response.create
+        raw_create.return_value = _raw_response(mock_response)
 
         generator = EmbeddingGenerator(api_key="test-key")
 
@@ -264,9 +278,7 @@ class TestEmbeddingGenerator:
         # Assert
         assert len(results) == 3
         assert results == mock_embeddings
-        mock_client.embeddings.create.assert_called_once_with(
-            model="text-embedding-3-small", input=texts
-        )
+        raw_create.assert_called_once_with(model="text-embedding-3-small", input=texts)
 
     @patch("governmentreporter.processors.embeddings.OpenAI")
     def test_generate_batch_embeddings_empty_list(self, mock_openai_class):
@@ -290,9 +302,13 @@ class TestEmbeddingGenerator:
         # Assert
         assert results == []
         mock_client.embeddings.create.assert_not_called()
+        mock_client.embeddings.with_raw_response.create.assert_not_called()
 
+    @patch("governmentreporter.processors.embeddings.time.sleep")
     @patch("governmentreporter.processors.embeddings.OpenAI")
-    def test_generate_batch_embeddings_partial_failure(self, mock_openai_class):
+    def test_generate_batch_embeddings_partial_failure(
+        self, mock_openai_class, mock_sleep
+    ):
         """
         Test batch embedding with partial failure handling.
 
@@ -301,6 +317,7 @@ class TestEmbeddingGenerator:
 
         Args:
             mock_openai_class: Mock OpenAI class
+            mock_sleep: Mock time.sleep for the packed request's backoff
         """
         # Arrange
         mock_client = MagicMock()
@@ -308,10 +325,13 @@ class TestEmbeddingGenerator:
 
         texts = ["Valid text", "Another valid text"]
 
-        # First attempt fails, fallback to individual processing
+        # Every packed attempt fails, fallback to individual processing
         mock_request = MagicMock()
+        raw_create = mock_client.embeddings.with_raw_response.create
+        raw_create.side_effect = APIError(
+            "Batch processing failed", request=mock_request, body=None
+        )
         mock_client.embeddings.create.side_effect = [
-            APIError("Batch processing failed", request=mock_request, body=None),
             MagicMock(data=[MagicMock(embedding=[0.1] * 1536)]),
             MagicMock(data=[MagicMock(embedding=[0.2] * 1536)]),
         ]
@@ -323,7 +343,367 @@ class TestEmbeddingGenerator:
 
         # Assert
         assert len(results) == 2
-        assert mock_client.embeddings.create.call_count == 3  # 1 batch + 2 individual
+        assert raw_create.call_count == 3  # 1 batch, retried twice
+        assert mock_client.embeddings.create.call_count == 2  # 2 individual
+
+
+class TestPackedEmbeddings:
+    """
+    Test packing chunks from many documents into few embedding requests.
+
+    Python Learning Notes:
+        - len is used as the token counter so tests never load tiktoken data
+    """
+
+    @staticmethod
+    def _echo_client(mock_openai_class, headers=None):
+        """Client whose embeddings are [len(text)] for each input."""
+        mock_client = MagicMock()
+        mock_client.embeddings.with_raw_response.create.side_effect = (
+            lambda input, model: _raw_response(
+                MagicMock(
+                    data=[MagicMock(embedding=[float(len(text))]) for text in input]
+                ),
+                headers,
+            )
+        )
+        mock_openai_class.return_value = mock_client
+        return mock_client
+
+    def test_pack_requests_respects_input_limit(self):
+        assert pack_requests([1] * 5, max_inputs=2) == [(0, 2), (2, 4), (4, 5)]
+
+    def test_pack_requests_respects_token_limit(self):
+        bounds = pack_requests([300, 300, 300, 100], max_tokens=600)
+        assert bounds == [(0, 2), (2, 4)]
+
+    def test_pack_requests_oversized_input_gets_own_request(self):
+        assert pack_requests([10, 900, 10], max_tokens=100) == [(0, 1), (1, 2), (2, 3)]
+
+    def test_pack_requests_empty(self):
+        assert pack_requests([]) == []
+
+    @patch("governmentreporter.processors.embeddings.OpenAI")
+    def test_aggregator_packs_documents_into_one_request(self, mock_openai_class):
+        mock_client = self._echo_client(mock_openai_class)
+        aggregator = EmbeddingAggregator(
+            EmbeddingGenerator(api_key="test-key"), token_counter=len
+        )
+
+        aggregator.add("eo", ["a", "bb", "ccc"])
+        aggregator.add("opinion", ["dddd"] * 30)
+        aggregator.add("empty", [])
+        result = aggregator.embed()
+
+        assert mock_client.embeddings.with_raw_response.create.call_count == 1
+        assert result["eo"] == [[1.0], [2.0], [3.0]]
+        assert result["opinion"] == [[4.0]] * 30
+        assert result["empty"] == []
+        assert aggregator.token_counts == {"eo": 6, "opinion": 120, "empty": 0}
+        assert len(aggregator) == 0
+
+    @patch("governmentreporter.processors.embeddings.OpenAI")
+    def test_packed_embeddings_split_at_token_limit(self, mock_openai_class):
+        mock_client = self._echo_client(mock_openai_class)
+        generator = EmbeddingGenerator(api_key="test-key")
+
+        results = generator.generate_packed_embeddings(
+            ["x" * 40] * 5, token_counter=len, max_tokens=100
+        )
+
+        assert results == [[40.0]] * 5
+        calls = mock_client.embeddings.with_raw_response.create.call_args_list
+        assert [len(c.kwargs["input"]) for c in calls] == [2, 2, 1]
+
+    @patch("governmentreporter.processors.embeddings.OpenAI")
+    def test_batch_size_caps_texts_per_request(self, mock_openai_class):
+        mock_client = self._echo_client(mock_openai_class)
+        generator = EmbeddingGenerator(api_key="test-key")
+
+        generator.generate_batch_embeddings(["a"] * 5, batch_size=2)
+
+        calls = mock_client.embeddings.with_raw_response.create.call_args_list
+        assert [len(c.kwargs["input"]) for c in calls] == [2, 2, 1]
+
+    def test_split_oversized_halves_at_whitespace(self):
+        assert split_oversized("short", token_counter=len) == [("short", 5)]
+        assert split_oversized("aaaa bbbb", token_counter=len, max_tokens=5) == [
+            ("aaaa", 4),
+            (" bbbb", 5),
+        ]
+        pieces = split_oversized("x" * 10, token_counter=len, max_tokens=3)
+        assert "".join(piece for piece, _ in pieces) == "x" * 10
+        assert all(count <= 3 for _, count in pieces)
+
+    def test_combine_embeddings_weighted_and_normalized(self):
+        combined = combine_embeddings([[1.0, 0.0], [0.0, 1.0]], [3, 1])
+
+        assert combined == pytest.approx([0.9487, 0.3162], abs=1e-4)
+        assert combine_embeddings([[0.5, 0.5]], [7]) == [0.5, 0.5]
+        assert combine_embeddings([[1.0, 0.0], [0.0, 0.0]], [1, 1]) == [0.0, 0.0]
+
+    @patch("governmentreporter.processors.embeddings.OpenAI")
+    def test_oversized_text_is_split_instead_of_failing(self, mock_openai_class):
+        mock_client = self._echo_client(mock_openai_class)
+        generator = EmbeddingGenerator(api_key="test-key")
+        long_text = "word " * (MAX_TOKENS_PER_INPUT // 4)
+
+        results = generator.generate_packed_embeddings(
+            ["short", long_text], token_counter=len
+        )
+
+        # 1-dimension pieces combine into a unit vector
+        assert results == [[5.0], [1.0]]
+        inputs = mock_client.embeddings.with_raw_response.create.call_args.kwargs[
+            "input"
+        ]
+        assert len(inputs) == 3
+        assert "".join(inputs[1:]) == long_text
+
+    @patch("governmentreporter.processors.embeddings.time.sleep")
+    @patch("governmentreporter.processors.embeddings.OpenAI")
+    def test_failed_packed_request_is_retried_before_splitting(
+        self, mock_openai_class, mock_sleep
+    ):
+        mock_client = self._echo_client(mock_openai_class)
+        raw_create = mock_client.embeddings.with_raw_response.create
+        echo = raw_create.side_effect
+        failures = [Exception("rate limited")]
+
+        def flaky(input, model):
+            if failures:
+                raise failures.pop()
+            return echo(input=input, model=model)
+
+        raw_create.side_effect = flaky
+        generator = EmbeddingGenerator(api_key="test-key")
+
+        results = generator.generate_packed_embeddings(["a", "bb", "ccc"])
+
+        # The whole request is resent once; nothing falls back to single texts
+        assert results == [[1.0], [2.0], [3.0]]
+        assert raw_create.call_count == 2
+        mock_client.embeddings.create.assert_not_called()
+        mock_sleep.assert_called_once_with(1.0)
+
+    @patch("governmentreporter.processors.embeddings.OpenAI")
+    def test_requests_are_paced_by_rate_limit_headers(self, mock_openai_class):
+        headers = {
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-reset-requests": "2s",
+        }
+        self._echo_client(mock_openai_class, headers)
+        generator = EmbeddingGenerator(api_key="test-key")
+        pacer = RateLimitPacer()
+
+        with (
+            patch("governmentreporter.processors.embeddings.openai_rate_limits", pacer),
+            patch("governmentreporter.utils.concurrency.time.sleep") as sleep,
+        ):
+            generator.generate_packed_embeddings(
+                ["x" * 40] * 3, token_counter=len, max_tokens=40
+            )
+
+        # No wait before the first request; each later one waits for the reset
+        assert sleep.call_count == 2
+        assert sleep.call_args.args[0] == pytest.approx(2.0, abs=0.1)
+
+
+class TestEmbeddingGeneratorCache:
+    """Tests for EmbeddingGenerator with a persistent EmbeddingCache."""
+
+    @patch("governmentreporter.processors.embeddings.OpenAI")
+    def test_only_misses_are_sent(self, mock_openai_class, tmp_path):
+        mock_client = TestPackedEmbeddings._echo_client(mock_openai_class)
+        cache = EmbeddingCache(tmp_path / "embeddings")
+        generator = EmbeddingGenerator(api_key="test-key", cache=cache)
+
+        first = generator.generate_batch_embeddings(["a", "bb", "a"])
+        second = generator.generate_batch_embeddings(["bb", "ccc"])
+
+        assert first == [[1.0], [2.0], [1.0]]
+        assert second == [[2.0], [3.0]]
+        calls = mock_client.embeddings.with_raw_response.create.call_args_list
+        inputs = [c.kwargs["input"] for c in calls]
+        assert inputs == [["a", "bb"], ["ccc"]]
+        assert cache.stats()["hits"] == 1
+        cache.close()
+
+    @patch("governmentreporter.processors.embeddings.OpenAI")
+    def test_single_embedding_uses_cache(self, mock_openai_class, tmp_path):
+        mock_client = TestPackedEmbeddings._echo_client(mock_openai_class)
+        cache = EmbeddingCache(tmp_path / "embeddings")
+        generator = EmbeddingGenerator(api_key="test-key", cache=cache)
+
+        packed = generator.generate_packed_embeddings(["abc"], token_counter=len)
+
+        assert packed == [[3.0]]
+        assert generator.generate_embedding("abc") == [3.0]
+        assert mock_client.embeddings.with_raw_response.create.call_count == 1
+        mock_client.embeddings.create.assert_not_called()
+        cache.close()
+
+
+class TestAsyncEmbeddingGenerator:
+    """
+    Tests for the AsyncOpenAI-based embedding generator.
+
+    Python Learning Notes:
+        - pytest.mark.asyncio runs a coroutine test on an event loop
+    """
+
+    @staticmethod
+    def _response(count):
+        response = MagicMock()
+        response.data = [MagicMock(embedding=[float(i)] * 1536) for i in range(count)]
+        return response
+
+    @pytest.mark.asyncio
+    async def test_batches_keep_input_order(self):
+        """Batches run concurrently but results follow the input order."""
+        generator = AsyncEmbeddingGenerator(api_key="test-api-key")
+        generator.client = MagicMock()
+        generator.client.embeddings.create = AsyncMock(
+            side_effect=lambda input, model: self._response(len(input))
+        )
+
+        embeddings = await generator.generate_batch_embeddings(
+            [f"text {i}" for i in range(5)], batch_size=2
+        )
+
+        assert len(embeddings) == 5
+        assert generator.client.embeddings.create.await_count == 3
+        assert [e[0] for e in embeddings] == [0.0, 1.0, 0.0, 1.0, 0.0]
+
+    @pytest.mark.asyncio
+    @patch("governmentreporter.processors.embeddings.asyncio.sleep")
+    async def test_failed_batch_falls_back_to_zero_vectors(self, mock_sleep):
+        """Texts that cannot be embedded get zero vectors."""
+        generator = AsyncEmbeddingGenerator(api_key="test-api-key")
+        generator.client = MagicMock()
+        generator.client.embeddings.create = AsyncMock(
+            side_effect=Exception("service unavailable")
+        )
+
+        embeddings = await generator.generate_batch_embeddings(["a", "b"])
+
+        assert embeddings == [[0.0] * 1536, [0.0] * 1536]
+        # 3 attempts of the batch, then 3 of each text
+        assert generator.client.embeddings.create.await_count == 9
+
+    @pytest.mark.asyncio
+    @patch("governmentreporter.processors.embeddings.asyncio.sleep")
+    async def test_failed_batch_is_retried_before_splitting(self, mock_sleep):
+        generator = AsyncEmbeddingGenerator(api_key="test-api-key")
+        generator.client = MagicMock()
+        generator.client.embeddings.create = AsyncMock(
+            side_effect=[Exception("rate limited"), self._response(3)]
+        )
+
+        embeddings = await generator.generate_batch_embeddings(["a", "bb", "ccc"])
+
+        # The whole request is resent once; nothing falls back to single texts
+        assert [e[0] for e in embeddings] == [0.0, 1.0, 2.0]
+        calls = generator.client.embeddings.create.await_args_list
+        assert [c.kwargs["input"] for c in calls] == [["a", "bb", "ccc"]] * 2
+        mock_sleep.assert_awaited_once_with(1.0)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """No more than max_concurrency requests are in flight."""
+        import asyncio
+
+        generator = AsyncEmbeddingGenerator(api_key="test-api-key", max_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def create(input, model):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return self._response(len(input))
+
+        generator.client = MagicMock()
+        generator.client.embeddings.create = create
+
+        await generator.generate_batch_embeddings(["t"] * 10, batch_size=1)
+
+        assert peak == 2
+
+    @staticmethod
+    def _echo(generator):
+        """Make the generator's embeddings [len(text)] for each input."""
+        generator.client = MagicMock()
+        generator.client.embeddings.create = AsyncMock(
+            side_effect=lambda input, model: MagicMock(
+                data=[MagicMock(embedding=[float(len(text))]) for text in input]
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_oversized_text_is_split_and_order_kept(self):
+        generator = AsyncEmbeddingGenerator(api_key="test-api-key", token_counter=len)
+        self._echo(generator)
+        long_text = "word " * (MAX_TOKENS_PER_INPUT // 4)
+
+        embeddings = await generator.generate_batch_embeddings(
+            ["a", long_text, "bb"], batch_size=1
+        )
+
+        assert embeddings == [[1.0], [1.0], [2.0]]
+        assert generator.client.embeddings.create.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_requests_wait_for_tokens_per_minute_budget(self):
+        # 6000 tokens per minute refill at 100 per second
+        generator = AsyncEmbeddingGenerator(
+            api_key="test-api-key", tokens_per_minute=6000, token_counter=len
+        )
+        self._echo(generator)
+
+        embeddings = await generator.generate_batch_embeddings(
+            ["x" * 6000, "y" * 10], batch_size=1
+        )
+
+        assert embeddings == [[6000.0], [10.0]]
+        # The first request spent the whole budget; the second waited ~0.1 s
+        assert generator.rate_budget.waited == pytest.approx(0.1, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_single_requests_spend_tokens_per_minute_budget(self):
+        generator = AsyncEmbeddingGenerator(
+            api_key="test-api-key", tokens_per_minute=6000, token_counter=len
+        )
+        generator.client = MagicMock()
+        generator.client.embeddings.create = AsyncMock(return_value=self._response(1))
+
+        await generator.generate_embedding("x" * 6000)
+        await generator.generate_embedding("y" * 10)
+
+        # The first text spent the whole budget; the second waited ~0.1 s
+        assert generator.rate_budget.waited == pytest.approx(0.1, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_only_cache_misses_are_sent(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "embeddings")
+        generator = AsyncEmbeddingGenerator(
+            api_key="test-api-key", token_counter=len, cache=cache
+        )
+        self._echo(generator)
+
+        first = await generator.generate_batch_embeddings(["a", "bb", "a"])
+        second = await generator.generate_batch_embeddings(["bb", "ccc"])
+        single = await generator.generate_embedding("ccc")
+
+        assert first == [[1.0], [2.0], [1.0]]
+        assert second == [[2.0], [3.0]]
+        assert single == [3.0]
+        calls = generator.client.embeddings.create.await_args_list
+        assert [c.kwargs["input"] for c in calls] == [["a", "bb"], ["ccc"]]
+        assert cache.stats()["hits"] == 2
+        cache.close()
 
 
 class TestGenerateEmbeddingFunction:
@@ -431,7 +811,9 @@ class TestEmbeddingIntegration:
 
         mock_response = MagicMock()
         mock_response.data = [MagicMock(embedding=emb) for emb in mock_embeddings]
-        mock_client.embeddings.create.return_value = mock_response
+        mock_client.embeddings.with_raw_response.create.return_value = _raw_response(
+            mock_response
+        )
 
         generator = EmbeddingGenerator(api_key="test-key")
 
@@ -18,14 +18,16 @@ Python Learning Notes:
 """
 
 import json
-from unittest.mock import MagicMock, Mock, call, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
 
 import pytest
 from openai import APIError, OpenAI, RateLimitError
 
 from governmentreporter.processors.llm_extraction import (
     generate_eo_llm_fields,
+    generate_eo_llm_fields_async,
     generate_scotus_llm_fields,
+    generate_scotus_llm_fields_async,
 )
 
 
@@ -454,6 +456,64 @@ class TestGenerateEOLLMFields:
 # Their functionality is tested indirectly through the main extraction functions.
 
 
+class TestAsyncLLMFields:
+    """
+    Tests for the AsyncOpenAI variants used by the asyncio ingester.
+
+    Python Learning Notes:
+        - AsyncMock returns an awaitable, like the real async client methods
+    """
+
+    @pytest.mark.asyncio
+    async def test_scotus_fields_async_uses_same_request(self, mock_openai_response):
+        """The async call sends the same request as the sync one."""
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
+
+        result = await generate_scotus_llm_fields_async(
+            "Opinion text", syllabus="Held: ...", client=client
+        )
+
+        assert result["topics_or_policy_areas"] == ["test topic"]
+        kwargs = client.chat.completions.create.await_args.kwargs
+        assert kwargs["model"] == "gpt-5-mini"
+        assert kwargs["response_format"] == {"type": "json_object"}
+        assert "Held: ..." in kwargs["messages"][1]["content"]
+
+    @pytest.mark.asyncio
+    @patch("governmentreporter.processors.llm_extraction.asyncio.sleep")
+    async def test_eo_fields_async_retries_rate_limit(
+        self, mock_sleep, mock_openai_response
+    ):
+        """Rate limits are retried with a non-blocking sleep."""
+        rate_limit = RateLimitError(
+            "Rate limit exceeded", response=MagicMock(status_code=429), body=None
+        )
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(
+            side_effect=[rate_limit, mock_openai_response]
+        )
+
+        result = await generate_eo_llm_fields_async("Order text", client=client)
+
+        assert "test topic" in result["topics_or_policy_areas"]
+        assert client.chat.completions.create.await_count == 2
+        mock_sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_eo_fields_async_fallback_on_bad_json(self):
+        """Unparseable responses fall back to the default fields."""
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content="not json"))]
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=response)
+
+        result = await generate_eo_llm_fields_async("Order text", client=client)
+
+        assert result["document_summary"] == "Unable to generate summary."
+        assert result["agencies_impacted"] == []
+
+
 class TestLLMExtractionIntegration:
     """
     Integration tests for LLM extraction functionality.
@@ -13,6 +13,7 @@ from governmentreporter.apis.base import Document
 from governmentreporter.apis.court_listener import CourtListenerClient
 from governmentreporter.apis.federal_register import FederalRegisterClient
 from governmentreporter.server.resources import (
+    close_api_clients,
     format_document_resource,
     get_api_client,
     list_available_resources,
@@ -68,6 +69,21 @@ class TestGetApiClient:
         with pytest.raises(ValueError, match="No client available"):
             get_api_client("invalid_type")
 
+    def test_get_client_reuses_shared_instance(self):
+        """Test repeated lookups return the same pooled client instance."""
+        first = get_api_client("executive_order")
+        second = get_api_client("executive_order")
+
+        assert first is second
+
+    def test_close_api_clients_releases_shared_instances(self):
+        """Test close_api_clients closes clients and clears the registry."""
+        first = get_api_client("executive_order")
+
+        close_api_clients()
+
+        assert get_api_client("executive_order") is not first
+
 
 class TestFormatDocumentResource:
     """Test document formatting for MCP responses."""
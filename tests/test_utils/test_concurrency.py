@@ -0,0 +1,177 @@
+"""
+Unit tests for process-wide concurrency budgets.
+
+Python Learning Notes:
+    - threading.Barrier makes several threads reach a point together, so
+      the test can check how many of them got past the budget at once
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from governmentreporter.utils.concurrency import (
+    ConcurrencyBudget,
+    RateBudget,
+    RateLimitPacer,
+    parse_duration,
+)
+
+
+class TestConcurrencyBudget:
+    def test_limit_bounds_calls_in_flight(self):
+        budget = ConcurrencyBudget(limit=2)
+
+        def call():
+            with budget:
+                time.sleep(0.05)
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert budget.peak == 2
+        assert budget.in_flight == 0
+
+    def test_unlimited_by_default(self):
+        budget = ConcurrencyBudget()
+        barrier = threading.Barrier(4, timeout=5)
+
+        def call():
+            with budget:
+                barrier.wait()
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert budget.peak == 4
+
+    def test_raising_the_limit_wakes_waiting_callers(self):
+        budget = ConcurrencyBudget(limit=1)
+        budget.acquire()
+        acquired = threading.Event()
+
+        def call():
+            with budget:
+                acquired.set()
+
+        thread = threading.Thread(target=call)
+        thread.start()
+        assert not acquired.wait(0.05)
+
+        budget.set_limit(2)
+        assert acquired.wait(5)
+        thread.join()
+        budget.release()
+
+    def test_release_on_exception(self):
+        budget = ConcurrencyBudget(limit=1)
+        with pytest.raises(RuntimeError):
+            with budget:
+                raise RuntimeError("request failed")
+
+        assert budget.in_flight == 0
+
+    def test_invalid_limit(self):
+        with pytest.raises(ValueError):
+            ConcurrencyBudget(limit=0)
+
+
+class TestRateLimitPacer:
+    @pytest.mark.parametrize(
+        "value, seconds",
+        [
+            ("1s", 1.0),
+            ("6m0s", 360.0),
+            ("1h2m3.5s", 3723.5),
+            ("20ms", 0.02),
+            ("", None),
+            (None, None),
+            ("soon", None),
+        ],
+    )
+    def test_parse_duration(self, value, seconds):
+        assert parse_duration(value) == seconds
+
+    def test_no_wait_without_observed_limits(self):
+        pacer = RateLimitPacer()
+        with patch("governmentreporter.utils.concurrency.time.sleep") as sleep:
+            assert pacer.wait(tokens=10_000) == 0.0
+        sleep.assert_not_called()
+
+    def test_waits_when_tokens_would_not_fit(self):
+        pacer = RateLimitPacer()
+        pacer.observe(
+            {
+                "x-ratelimit-remaining-requests": "100",
+                "x-ratelimit-remaining-tokens": "1000",
+                "x-ratelimit-reset-tokens": "3s",
+            }
+        )
+
+        with patch("governmentreporter.utils.concurrency.time.sleep") as sleep:
+            assert pacer.wait(tokens=600) == 0.0
+            # The first request reserved 600 of the 1000 tokens
+            waited = pacer.wait(tokens=600)
+
+        assert waited == pytest.approx(3.0, abs=0.1)
+        sleep.assert_called_once()
+        assert pacer.waited == waited
+
+    def test_reset_window_is_not_waited_for(self):
+        pacer = RateLimitPacer()
+        pacer.observe(
+            {"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "0s"}
+        )
+
+        with patch("governmentreporter.utils.concurrency.time.sleep") as sleep:
+            assert pacer.wait() == 0.0
+        sleep.assert_not_called()
+
+    def test_malformed_headers_are_ignored(self):
+        pacer = RateLimitPacer()
+        pacer.observe({"x-ratelimit-remaining-requests": "many"})
+
+        assert pacer.remaining_requests is None
+
+
+class TestRateBudget:
+    @pytest.mark.asyncio
+    async def test_unlimited_never_waits(self):
+        budget = RateBudget()
+        for _ in range(1000):
+            await budget.acquire(tokens=1_000_000)
+
+        assert budget.waited == 0.0
+
+    @pytest.mark.asyncio
+    async def test_requests_per_minute(self):
+        # A full bucket of 600 requests, refilling at 10 per second
+        budget = RateBudget(requests_per_minute=600)
+        for _ in range(600):
+            await budget.acquire()
+        assert budget.waited == 0.0
+
+        await budget.acquire()
+
+        assert budget.waited == pytest.approx(0.1, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_request_larger_than_budget_takes_whole_bucket(self):
+        budget = RateBudget(tokens_per_minute=600)
+
+        await budget.acquire(tokens=10_000)
+        await budget.acquire(tokens=1)
+
+        assert budget.waited == pytest.approx(0.1, abs=0.05)
+
+    def test_invalid_budget(self):
+        with pytest.raises(ValueError, match="tokens_per_minute"):
+            RateBudget(tokens_per_minute=0)
@@ -26,7 +26,11 @@ from unittest.mock import MagicMock, call, patch
 
 import pytest
 
-from governmentreporter.utils.monitoring import PerformanceMonitor, setup_logging
+from governmentreporter.utils.monitoring import (
+    CombinedProgress,
+    PerformanceMonitor,
+    setup_logging,
+)
 
 
 class TestDocumentRecording:
@@ -63,6 +67,43 @@ class TestDocumentRecording:
         assert monitor.documents_failed == 2
         assert monitor.processing_times == [100.0, 150.0, 200.0]
 
+    def test_record_documents_from_threads(self):
+        """
+        Test recording from many worker threads at once.
+
+        No increment may be lost when ingestion workers record concurrently.
+
+        Python Learning Notes:
+            - sys.setswitchinterval() makes thread switches more frequent,
+              so unsynchronized += would lose updates
+        """
+        # Arrange: Started monitor and frequent thread switching
+        import threading
+
+        monitor = PerformanceMonitor()
+        monitor.start()
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        def record():
+            for i in range(1000):
+                monitor.record_document(processing_time_ms=1.0, failed=i % 10 == 0)
+
+        # Act: Record from eight threads
+        try:
+            threads = [threading.Thread(target=record) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        # Assert: Every record counted
+        assert monitor.documents_processed == 7200
+        assert monitor.documents_failed == 800
+        assert len(monitor.processing_times) == 7200
+
 
 class TestStatisticsCalculation:
     """
@@ -468,6 +509,64 @@ class TestProgressDisplay:
         assert output.count("\n") == 0  # No newlines until complete
 
 
+class TestCombinedProgress:
+    """
+    Test suite for one progress line shared by concurrent operations.
+
+    Python Learning Notes:
+        - Each update redraws the whole line after a carriage return
+    """
+
+    @staticmethod
+    def _attached(display, name):
+        monitor = PerformanceMonitor()
+        monitor.start()
+        display.attach(name, monitor)
+        return monitor
+
+    def test_line_shows_every_operation(self):
+        display = CombinedProgress()
+        scotus = self._attached(display, "SCOTUS")
+        eo = self._attached(display, "EO")
+
+        captured_output = io.StringIO()
+        with patch("sys.stdout", captured_output):
+            scotus.print_progress(10, 40)
+            eo.print_progress(3, 9)
+
+        last_line = captured_output.getvalue().split("\r")[-1]
+        assert last_line.startswith("SCOTUS 10/40 ETA")
+        assert "| EO 3/9 ETA" in last_line
+        assert "| All 13/49 ETA" in last_line
+        assert "█" not in captured_output.getvalue()  # No per-monitor bar
+
+    def test_overall_eta_is_the_longest(self):
+        display = CombinedProgress()
+        scotus = self._attached(display, "SCOTUS")
+        eo = self._attached(display, "EO")
+
+        with patch("sys.stdout", io.StringIO()):
+            display.update(scotus, 10, 40, 300.0)
+            display.update(eo, 3, 9, 60.0)
+
+        assert display._render_locked().endswith("All 13/49 ETA 5m 0s")
+
+    def test_new_line_once_all_complete(self):
+        display = CombinedProgress()
+        scotus = self._attached(display, "SCOTUS")
+        eo = self._attached(display, "EO")
+
+        captured_output = io.StringIO()
+        with patch("sys.stdout", captured_output):
+            display.update(scotus, 4, 4, 0.0)
+            assert "\n" not in captured_output.getvalue()
+            display.update(eo, 2, 2, 0.0)
+
+        output = captured_output.getvalue()
+        assert output.endswith("\n")
+        assert "SCOTUS 4/4 done | EO 2/2 done" in output
+
+
 class TestPerformanceMonitorIntegration:
     """
     Integration tests for PerformanceMonitor in realistic scenarios.